@@ -21,6 +21,9 @@ from typing import List, Dict, Optional, Tuple
 from botocore.exceptions import ClientError, NoCredentialsError
 import logging
 
+from credential_broker import get_credential_broker
+from region_activity import RegionActivityProber
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -43,6 +46,8 @@ class AccountDiscovery:
         self.management_creds = management_account_credentials or {}
         self.org_client = None
         self.sts_client = None
+        self.base_session = None
+        self.credential_broker = get_credential_broker()
         self.cached_accounts = None
         self.cache_timestamp = None
         self.cache_ttl = timedelta(hours=1)
@@ -106,26 +111,44 @@ class AccountDiscovery:
             logger.error(f"Failed to create Organizations client: {e}")
             raise
     
-    def _get_sts_client(self):
-        """Get STS client for role assumption"""
-        if self.sts_client:
-            return self.sts_client
+    def _get_base_session(self):
+        """Get the session holding the base credentials used for role assumption"""
+        if self.base_session:
+            return self.base_session
         
         # Try to get credentials from Streamlit secrets first
-        sts_kwargs = {}
+        session_kwargs = {}
         try:
             if hasattr(st, 'secrets') and 'aws' in st.secrets:
-                sts_kwargs['aws_access_key_id'] = st.secrets['aws']['access_key_id']
-                sts_kwargs['aws_secret_access_key'] = st.secrets['aws']['secret_access_key']
+                session_kwargs['aws_access_key_id'] = st.secrets['aws']['access_key_id']
+                session_kwargs['aws_secret_access_key'] = st.secrets['aws']['secret_access_key']
                 if 'default_region' in st.secrets['aws']:
-                    sts_kwargs['region_name'] = st.secrets['aws']['default_region']
+                    session_kwargs['region_name'] = st.secrets['aws']['default_region']
                 logger.info("Using credentials from Streamlit secrets for STS")
         except Exception as e:
             logger.info(f"Streamlit secrets not available, using default credentials: {e}")
-            
-        self.sts_client = boto3.client('sts', **sts_kwargs)
+        
+        self.base_session = boto3.Session(**session_kwargs)
+        return self.base_session
+    
+    def _get_sts_client(self):
+        """Get STS client for role assumption"""
+        if self.sts_client:
+            return self.sts_client
+        
+        self.sts_client = self._get_base_session().client('sts')
         return self.sts_client
     
+    def _get_account_session(self, account_id: str, role_name: str, force_refresh: bool = False):
+        """Get a cached assumed-role session for a member account"""
+        return self.credential_broker.get_account_session(
+            account_id,
+            role_name,
+            base_session=self._get_base_session(),
+            session_name=f"WAFAdvisor-Discovery-{account_id}",
+            force_refresh=force_refresh
+        )
+    
     def discover_from_organizations(
         self,
         include_suspended: bool = False,
@@ -270,23 +293,9 @@ class AccountDiscovery:
             List of region names
         """
         try:
-            # Assume role in target account
-            sts = self._get_sts_client()
-            role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
-            
-            response = sts.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName=f"WAFAdvisor-RegionDiscovery-{account_id}"
-            )
-            
-            # Create EC2 client with assumed role
-            ec2 = boto3.client(
-                'ec2',
-                aws_access_key_id=response['Credentials']['AccessKeyId'],
-                aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                aws_session_token=response['Credentials']['SessionToken'],
-                region_name='us-east-1'  # Global endpoint
-            )
+            # Assumed-role session for the target account (cached by the broker)
+            session = self._get_account_session(account_id, role_name)
+            ec2 = session.client('ec2', region_name='us-east-1')  # Global endpoint
             
             # Get enabled regions
             regions_response = ec2.describe_regions(
@@ -311,48 +320,35 @@ class AccountDiscovery:
     def discover_active_regions_for_account(
         self,
         account_id: str,
-        role_name: str = "OrganizationAccountAccessRole"
+        role_name: str = "OrganizationAccountAccessRole",
+        force_refresh: bool = False
     ) -> List[str]:
         """
         Discover regions with actual resources (more accurate but slower)
         
+        All enabled regions are probed in parallel for EC2 instances, Lambda
+        functions, RDS instances, ECS clusters and non-default VPCs. Results
+        are kept in the on-disk region index, so repeat calls within its TTL
+        skip the probes entirely.
+        
         Args:
             account_id: AWS account ID
             role_name: IAM role name
+            force_refresh: Ignore the region index and probe every region
             
         Returns:
             List of regions with resources
         """
         enabled_regions = self.discover_regions_for_account(account_id, role_name)
-        active_regions = []
         
-        for region in enabled_regions:
-            try:
-                # Check if region has any EC2 instances (quick check)
-                sts = self._get_sts_client()
-                role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
-                
-                response = sts.assume_role(
-                    RoleArn=role_arn,
-                    RoleSessionName=f"WAFAdvisor-ActiveCheck-{account_id}"
-                )
-                
-                ec2 = boto3.client(
-                    'ec2',
-                    aws_access_key_id=response['Credentials']['AccessKeyId'],
-                    aws_secret_access_key=response['Credentials']['SecretAccessKey'],
-                    aws_session_token=response['Credentials']['SessionToken'],
-                    region_name=region
-                )
-                
-                # Quick check for any instances
-                instances = ec2.describe_instances(MaxResults=5)
-                if instances['Reservations']:
-                    active_regions.append(region)
-                    
-            except Exception as e:
-                logger.warning(f"Error checking region {region}: {e}")
-                continue
+        try:
+            session = self._get_account_session(account_id, role_name)
+            active_regions = RegionActivityProber().discover_active_regions(
+                session, account_id, enabled_regions, force_refresh=force_refresh
+            )
+        except Exception as e:
+            logger.warning(f"Error probing regions for {account_id}: {e}")
+            active_regions = []
         
         # If no active regions found, return enabled regions
         return active_regions if active_regions else enabled_regions
@@ -381,14 +377,9 @@ class AccountDiscovery:
             Tuple of (success: bool, error_message: Optional[str])
         """
         try:
-            sts = self._get_sts_client()
-            role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
-            
-            sts.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName=f"WAFAdvisor-Validation-{account_id}",
-                DurationSeconds=900  # 15 minutes minimum
-            )
+            # Always call AssumeRole so a revoked trust policy is caught now,
+            # and leave the fresh credentials cached for the scan that follows
+            self._get_account_session(account_id, role_name, force_refresh=True)
             
             return True, None
             
@@ -13,6 +13,7 @@ Features:
 import streamlit as st
 from typing import Dict, List, Tuple
 import json
+from llm_gateway import create_message
 
 def generate_comprehensive_insights(assessment: Dict, questions: List) -> Dict:
     """
@@ -61,7 +62,7 @@ def generate_comprehensive_insights(assessment: Dict, questions: List) -> Dict:
     
     # Generate insights using Claude
     try:
-        response = client.messages.create(
+        response = create_message(client,
             model="claude-sonnet-4-20250514",
             max_tokens=4000,
             messages=[{
@@ -24,6 +24,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 import json
 import os
+from llm_gateway import create_message
 
 # Optional imports
 try:
@@ -912,7 +913,7 @@ class AILensRecommender:
         context = self._prepare_context(inventory, findings, assessment_responses)
         
         try:
-            response = self.client.messages.create(
+            response = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=4000,
                 messages=[{
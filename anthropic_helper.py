@@ -6,6 +6,7 @@ Provides AnthropicHelper class and convenience functions
 from typing import Any, Dict, List, Optional
 import streamlit as st
 import json
+from llm_gateway import create_message
 
 class AnthropicHelper:
     """Helper class for Anthropic Claude AI integration"""
@@ -73,7 +74,7 @@ class AnthropicHelper:
                 full_prompt = prompt
             
             # Call Claude API
-            message = self.client.messages.create(
+            message = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 messages=[
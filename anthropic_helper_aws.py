@@ -6,6 +6,7 @@ AI assistance tailored for AWS services, architecture, and best practices
 from typing import Any, Dict, List, Optional
 import streamlit as st
 import json
+from llm_gateway import create_message
 
 class AWSAnthropicHelper:
     """AWS-specific AI helper with Claude integration"""
@@ -74,7 +75,7 @@ Provide practical, production-ready guidance specific to AWS services and patter
                 full_prompt = prompt
             
             # Call Claude API with AWS-specific system prompt
-            message = self.client.messages.create(
+            message = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 system=system_prompt,
@@ -226,9 +226,7 @@ def enhance_scan_results(results):
         
         for finding in findings:
             # Add compliance mappings
-            finding['compliance_frameworks'] = compliance_mapper.get_compliance_mappings(
-                finding.get('title', '')
-            )
+            finding['compliance_frameworks'] = compliance_mapper.get_finding_mappings(finding)
             
             # Add cost impact
             finding['cost_impact'] = cost_calculator.calculate_finding_impact(finding)
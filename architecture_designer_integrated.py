@@ -16,6 +16,7 @@ from datetime import datetime
 from enum import Enum
 import json
 import hashlib
+from llm_gateway import create_message
 
 # ============================================================================
 # ENUMS & CONSTANTS
@@ -549,7 +550,7 @@ Focus on:
 5. Security hardening"""
 
         try:
-            response = self.ai_client.messages.create(
+            response = create_message(self.ai_client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=1000,
                 messages=[{"role": "user", "content": prompt}]
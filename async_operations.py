@@ -6,13 +6,20 @@ Provides async/await functionality for parallel multi-account AWS scanning.
 This module enables:
 - Concurrent scanning of multiple AWS accounts
 - Parallel region scanning within accounts
-- Async AWS API calls with proper throttling
+- Async AWS API calls with adaptive per-endpoint throttling
+- A dedicated scan thread pool sized from configuration
 - Progress tracking for async operations
+
+Usage:
+    scanner = AsyncScanner(AsyncConfig.from_app_config())
+    session = ThrottledSession(boto3_session, scanner.throttler)
+    results = run_async(scanner.run_jobs([(name, fn) for name, fn in jobs]))
+    scanner.shutdown()
 """
 
 import asyncio
 import time
-from typing import Dict, List, Optional, Any, Callable, Coroutine
+from typing import Dict, List, Optional, Any, Callable, Coroutine, Tuple, Hashable
 from dataclasses import dataclass, field
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
@@ -38,16 +45,242 @@ logger = get_logger(__name__)
 # CONFIGURATION
 # ============================================================================
 
+# Error codes AWS returns when a caller exceeds an API rate limit
+THROTTLING_ERROR_CODES = frozenset({
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestLimitExceeded',
+    'RequestThrottled',
+    'RequestThrottledException',
+    'TooManyRequestsException',
+    'SlowDown',
+})
+
+
 @dataclass
 class AsyncConfig:
     """Configuration for async operations"""
     max_concurrent_accounts: int = 5
     max_concurrent_regions: int = 10
     max_concurrent_services: int = 20
-    api_call_delay: float = 0.1  # Delay between API calls to avoid throttling
+    api_call_delay: float = 0.1  # Legacy fixed delay - superseded by the token buckets below
     timeout_seconds: int = 300
     retry_failed: bool = True
     progress_callback: Optional[Callable[[str, float], None]] = None
+    
+    # Dedicated scan thread pool
+    max_workers: int = 16
+    
+    # Per-endpoint (service, region) token buckets
+    requests_per_second: float = 10.0  # Starting refill rate
+    burst_size: int = 20  # Bucket capacity
+    min_requests_per_second: float = 0.5
+    max_requests_per_second: float = 50.0
+    throttle_backoff: float = 0.5  # Rate multiplier applied on each throttling error
+    rate_increase: float = 0.2  # Requests/second added back per successful call
+    endpoint_rates: Dict[str, float] = field(default_factory=dict)  # Starting rate by service name
+    
+    @classmethod
+    def from_app_config(cls, **overrides) -> 'AsyncConfig':
+        """
+        Build an AsyncConfig from the application configuration.
+        
+        Falls back to the defaults when production_config is unavailable.
+        Keyword arguments override individual fields.
+        """
+        values: Dict[str, Any] = {}
+        try:
+            from production_config import get_config
+            app_config = get_config()
+            values = {
+                'max_workers': app_config.aws.scan_max_workers,
+                'requests_per_second': app_config.aws.api_requests_per_second,
+                'burst_size': app_config.aws.api_burst_size,
+                'timeout_seconds': app_config.app.scan_timeout_seconds,
+            }
+        except Exception as e:
+            logger.debug(f"Using default async config: {e}")
+        
+        values.update({k: v for k, v in overrides.items() if v is not None})
+        return cls(**values)
+
+
+# ============================================================================
+# ADAPTIVE THROTTLING
+# ============================================================================
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with additive-increase / multiplicative-decrease.
+    
+    Callers block in acquire() until a token is available. A throttling
+    response cuts the refill rate and drains the bucket; each successful
+    call nudges the rate back up, so the bucket settles just under the
+    limit AWS is actually enforcing.
+    """
+    
+    def __init__(self, rate: float, capacity: int, min_rate: float, max_rate: float):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, rate)
+        self.throttle_count = 0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def acquire(self) -> float:
+        """Take one token, blocking until available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+    
+    def on_throttle(self, backoff: float):
+        """Multiplicative decrease after a throttling error"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * backoff)
+            self._tokens = min(self._tokens, 0.0)
+            self.throttle_count += 1
+    
+    def on_success(self, increase: float):
+        """Additive increase after a successful call"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + increase)
+
+
+class AdaptiveThrottler:
+    """
+    Per-API-endpoint rate limiter for boto3 clients.
+    
+    Buckets are keyed by (service, region). instrument() hooks a client's
+    botocore events so that every HTTP attempt - including botocore's own
+    retries - takes a token, and every throttling response backs the
+    endpoint off.
+    """
+    
+    def __init__(self, config: AsyncConfig = None):
+        self.config = config or AsyncConfig()
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._instrumented: List[Any] = []
+        self._send_id = f"adaptive-throttle-send-{id(self)}"
+        self._retry_id = f"adaptive-throttle-retry-{id(self)}"
+    
+    def bucket(self, service: str, region: Optional[str]) -> TokenBucket:
+        """Return the bucket for an endpoint, creating it on first use"""
+        key = (service, region or 'global')
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(
+                    rate=self.config.endpoint_rates.get(service, self.config.requests_per_second),
+                    capacity=self.config.burst_size,
+                    min_rate=self.config.min_requests_per_second,
+                    max_rate=self.config.max_requests_per_second,
+                )
+            return self._buckets[key]
+    
+    def record(self, service: str, region: Optional[str], error_code: Optional[str] = None):
+        """Feed a call outcome back into the endpoint's bucket"""
+        bucket = self.bucket(service, region)
+        if error_code in THROTTLING_ERROR_CODES:
+            bucket.on_throttle(self.config.throttle_backoff)
+            logger.debug(f"Throttled by {service}/{region or 'global'} - rate now {bucket.rate:.2f}/s")
+        elif error_code is None:
+            bucket.on_success(self.config.rate_increase)
+    
+    def instrument(self, client):
+        """Attach token-bucket throttling to a boto3 client and return it"""
+        service = client.meta.service_model.service_name
+        region = client.meta.region_name
+        bucket = self.bucket(service, region)
+        
+        def before_send(**kwargs):
+            bucket.acquire()
+        
+        def needs_retry(response=None, **kwargs):
+            if response is not None:
+                error_code = response[1].get('Error', {}).get('Code')
+                self.record(service, region, error_code)
+        
+        # Clients may be shared by concurrent scans (see credential_broker), so
+        # handlers are registered per throttler and removed again by release()
+        events = client.meta.events
+        events.unregister('before-send', unique_id=self._send_id)
+        events.unregister('needs-retry', unique_id=self._retry_id)
+        events.register('before-send', before_send, unique_id=self._send_id)
+        events.register('needs-retry', needs_retry, unique_id=self._retry_id)
+        with self._lock:
+            self._instrumented.append(client)
+        return client
+    
+    def release(self):
+        """Detach this throttler's handlers from every client it instrumented"""
+        with self._lock:
+            clients, self._instrumented = self._instrumented, []
+        for client in clients:
+            client.meta.events.unregister('before-send', unique_id=self._send_id)
+            client.meta.events.unregister('needs-retry', unique_id=self._retry_id)
+    
+    def call(self, service: str, region: Optional[str], func: Callable, *args, **kwargs) -> Any:
+        """Run a single rate-limited call for clients that are not instrumented"""
+        self.bucket(service, region).acquire()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            error_code = getattr(e, 'response', {}).get('Error', {}).get('Code', type(e).__name__)
+            self.record(service, region, error_code)
+            raise
+        self.record(service, region)
+        return result
+    
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Current rate and throttle count per endpoint"""
+        with self._lock:
+            return {
+                f"{service}/{region}": {'rate': bucket.rate, 'throttles': bucket.throttle_count}
+                for (service, region), bucket in self._buckets.items()
+            }
+
+
+class ThrottledSession:
+    """
+    Wraps a boto3 Session shared by concurrent scan tasks.
+    
+    boto3 clients are thread-safe but Session.client() is not, so client
+    creation is serialized. Every client handed out is instrumented with
+    the throttler; everything else is delegated unchanged.
+    """
+    
+    def __init__(self, session, throttler: AdaptiveThrottler):
+        self._session = session
+        self._throttler = throttler
+        self._lock = threading.Lock()
+    
+    def client(self, *args, **kwargs):
+        with self._lock:
+            client = self._session.client(*args, **kwargs)
+        return self._throttler.instrument(client)
+    
+    def resource(self, *args, **kwargs):
+        with self._lock:
+            resource = self._session.resource(*args, **kwargs)
+        self._throttler.instrument(resource.meta.client)
+        return resource
+    
+    def __getattr__(self, name):
+        return getattr(self._session, name)
 
 
 # ============================================================================
@@ -121,17 +354,39 @@ class AsyncScanner:
     
     Provides:
     - Concurrent execution with configurable limits
+    - A dedicated thread pool for blocking boto3 calls
     - Progress tracking
     - Error handling and retry logic
-    - Rate limiting to avoid AWS throttling
+    - Adaptive per-endpoint rate limiting to avoid AWS throttling
     """
     
     def __init__(self, config: AsyncConfig = None):
         """Initialize async scanner"""
         self.config = config or AsyncConfig()
         self.progress = ScanProgress()
+        self.throttler = AdaptiveThrottler(self.config)
         self._lock = threading.Lock()
         self._semaphore: Optional[asyncio.Semaphore] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.config.max_workers),
+            thread_name_prefix='async-scan'
+        )
+    
+    def shutdown(self, wait: bool = True):
+        """Release the scan thread pool and unhook instrumented clients"""
+        self._executor.shutdown(wait=wait)
+        self.throttler.release()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.shutdown()
+    
+    async def _run_blocking(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking callable on the scan thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(*args, **kwargs))
     
     async def _init_semaphores(self):
         """Initialize semaphores for concurrency control"""
@@ -158,11 +413,49 @@ class AsyncScanner:
             self.progress.errors.append(error)
     
     async def _rate_limited_call(self, coro: Coroutine) -> Any:
-        """Execute a coroutine with rate limiting"""
+        """Execute a coroutine within the service concurrency limit"""
         async with self._service_semaphore:
-            await asyncio.sleep(self.config.api_call_delay)
             return await coro
     
+    async def run_jobs(
+        self,
+        jobs: List[Tuple[Hashable, Callable[[], Any]]],
+        on_complete: Optional[Callable[[Hashable, Any, Optional[BaseException]], None]] = None
+    ) -> Dict[Hashable, Any]:
+        """
+        Run blocking jobs on the scan thread pool.
+        
+        Args:
+            jobs: (key, zero-argument callable) pairs
+            on_complete: Optional callback(key, result, error) invoked on the
+                event loop's thread as each job finishes - safe for UI updates
+                when run_async() is called from the UI thread
+            
+        Returns:
+            Results keyed by job key; failed jobs map to their exception
+        """
+        await self._init_semaphores()
+        self.progress.total_services += len(jobs)
+        
+        async def run_one(key, func):
+            async with self._service_semaphore:
+                try:
+                    return key, await self._run_blocking(func), None
+                except Exception as e:
+                    logger.error(f"Error running scan job {key}: {e}")
+                    self._add_error({'job': str(key), 'error': str(e), 'type': type(e).__name__})
+                    return key, e, e
+        
+        results: Dict[Hashable, Any] = {}
+        for next_done in asyncio.as_completed([run_one(key, func) for key, func in jobs]):
+            key, result, error = await next_done
+            results[key] = result
+            self._update_progress('completed_services')
+            if on_complete:
+                on_complete(key, None if error else result, error)
+        
+        return results
+    
     async def scan_accounts(
         self,
         accounts: List[Dict[str, Any]],
@@ -242,12 +535,8 @@ class AsyncScanner:
                 if asyncio.iscoroutinefunction(scan_function):
                     result = await scan_function(account, **kwargs)
                 else:
-                    # Run sync function in thread pool
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None, 
-                        lambda: scan_function(account, **kwargs)
-                    )
+                    # Run sync function on the scan thread pool
+                    result = await self._run_blocking(scan_function, account, **kwargs)
                 
                 self._update_progress('completed_accounts')
                 return result
@@ -293,6 +582,8 @@ class MultiRegionAsyncScanner(AsyncScanner):
         await self._init_semaphores()
         
         self.progress.total_regions = len(regions)
+        if not isinstance(session, ThrottledSession):
+            session = ThrottledSession(session, self.throttler)
         
         tasks = [
             self._scan_region_wrapper(session, region, scan_function, **kwargs)
@@ -327,11 +618,7 @@ class MultiRegionAsyncScanner(AsyncScanner):
                 if asyncio.iscoroutinefunction(scan_function):
                     result = await scan_function(session, region, **kwargs)
                 else:
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None,
-                        lambda: scan_function(session, region, **kwargs)
-                    )
+                    result = await self._run_blocking(scan_function, session, region, **kwargs)
                 
                 self._update_progress('completed_regions')
                 return result
@@ -374,6 +661,8 @@ class ServiceAsyncScanner(AsyncScanner):
         await self._init_semaphores()
         
         self.progress.total_services = len(services)
+        if not isinstance(session, ThrottledSession):
+            session = ThrottledSession(session, self.throttler)
         
         tasks = []
         for service in services:
@@ -406,17 +695,11 @@ class ServiceAsyncScanner(AsyncScanner):
     ) -> Any:
         """Wrapper for scanning a single service"""
         async with self._service_semaphore:
-            await asyncio.sleep(self.config.api_call_delay)
-            
             try:
                 if asyncio.iscoroutinefunction(scan_function):
                     result = await scan_function(session, region, **kwargs)
                 else:
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None,
-                        lambda: scan_function(session, region, **kwargs)
-                    )
+                    result = await self._run_blocking(scan_function, session, region, **kwargs)
                 
                 self._update_progress('completed_services')
                 return result
@@ -518,7 +801,11 @@ def async_aws_call(max_concurrent: int = 10, delay: float = 0.1):
 # ============================================================================
 
 __all__ = [
+    'THROTTLING_ERROR_CODES',
     'AsyncConfig',
+    'TokenBucket',
+    'AdaptiveThrottler',
+    'ThrottledSession',
     'ScanProgress',
     'AsyncScanner',
     'MultiRegionAsyncScanner',
@@ -275,10 +275,13 @@ Supports AWS Organizations with multi-account aggregation
 """
 
 import boto3
+import numpy as np
 from typing import Dict, List
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 
+from metrics_engine import get_metrics_engine
+
 # Regional carbon intensity (gCO2e/kWh) - AWS published data
 CARBON_INTENSITY = {
     'us-east-1': 415.755,      # US East (N. Virginia)
@@ -317,6 +320,9 @@ EC2_POWER_CONSUMPTION = {
     'default': 50  # Default for unknown types
 }
 
+# Share of full-load power an idle instance still draws; the rest scales with CPU
+IDLE_POWER_FRACTION = 0.3
+
 
 class CarbonFootprintCalculator:
     """Calculate carbon emissions from AWS resource usage"""
@@ -328,47 +334,55 @@ class CarbonFootprintCalculator:
     
     @st.cache_data(ttl=600)
     def calculate_ec2_emissions(self, region: str = 'us-east-1', days: int = 30) -> Dict:
-        """Calculate CO2 emissions from EC2 instances"""
+        """Calculate CO2 emissions from EC2 instances, scaled by measured CPU utilization"""
         try:
             ec2_client = self.session.client('ec2', region_name=region)
-            cloudwatch = self.session.client('cloudwatch', region_name=region)
             
             # Get all running instances
-            response = ec2_client.describe_instances(
+            instances = []
+            paginator = ec2_client.get_paginator('describe_instances')
+            for page in paginator.paginate(
                 Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
-            )
+            ):
+                for reservation in page['Reservations']:
+                    instances.extend(reservation['Instances'])
             
-            total_emissions_kg = 0
-            instance_details = []
+            instance_ids = [i['InstanceId'] for i in instances]
+            instance_types = [i['InstanceType'] for i in instances]
             
-            for reservation in response['Reservations']:
-                for instance in reservation['Instances']:
-                    instance_type = instance['InstanceType']
-                    instance_id = instance['InstanceId']
-                    
-                    # Get power consumption for this instance type
-                    power_watts = EC2_POWER_CONSUMPTION.get(instance_type, 
-                                                            EC2_POWER_CONSUMPTION['default'])
-                    
-                    # Calculate emissions
-                    # Power (W) * Hours * Carbon Intensity / 1000 / 1000 = kg CO2
-                    hours = days * 24
-                    kwh = (power_watts * hours) / 1000
-                    carbon_intensity = CARBON_INTENSITY.get(region, 400)  # gCO2e/kWh
-                    emissions_kg = (kwh * carbon_intensity) / 1000
-                    
-                    total_emissions_kg += emissions_kg
-                    
-                    instance_details.append({
-                        'instance_id': instance_id,
-                        'instance_type': instance_type,
-                        'region': region,
-                        'emissions_kg': emissions_kg
-                    })
+            # Average CPU per instance over the window, batched through GetMetricData
+            cpu_avg = np.full(len(instances), np.nan)
+            if instances:
+                try:
+                    cpu_avg = get_metrics_engine(self.session, region).mean_utilization(
+                        'AWS/EC2', 'CPUUtilization', 'InstanceId', instance_ids, days=days
+                    )
+                except ClientError:
+                    pass  # No CloudWatch access - assume full load below
+            
+            # Power (W): idle draw plus a share proportional to CPU; full load when unmeasured
+            full_power = np.array([EC2_POWER_CONSUMPTION.get(t, EC2_POWER_CONSUMPTION['default'])
+                                   for t in instance_types], dtype=np.float64)
+            load = np.where(np.isnan(cpu_avg), 1.0, np.clip(cpu_avg, 0, 100) / 100)
+            power_watts = full_power * (IDLE_POWER_FRACTION + (1 - IDLE_POWER_FRACTION) * load)
+            
+            # Power (W) * Hours * Carbon Intensity / 1000 / 1000 = kg CO2
+            hours = days * 24
+            carbon_intensity = CARBON_INTENSITY.get(region, 400)  # gCO2e/kWh
+            emissions_kg = power_watts * hours / 1000 * carbon_intensity / 1000
+            
+            instance_details = [{
+                'instance_id': instance_id,
+                'instance_type': instance_type,
+                'region': region,
+                'avg_cpu_percent': None if np.isnan(cpu) else float(cpu),
+                'emissions_kg': float(emissions)
+            } for instance_id, instance_type, cpu, emissions
+                in zip(instance_ids, instance_types, cpu_avg, emissions_kg)]
             
             return {
                 'success': True,
-                'total_emissions_kg': total_emissions_kg,
+                'total_emissions_kg': float(emissions_kg.sum()),
                 'instance_count': len(instance_details),
                 'details': instance_details,
                 'region': region
@@ -7,12 +7,14 @@ import streamlit as st
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from core_account_manager import get_account_manager
+from metrics_engine import MetricQuery, MetricSeries, get_metrics_engine
 
 class CloudWatchManager:
     """AWS CloudWatch Monitoring and Logging"""
     
     def __init__(self, session):
         """Initialize CloudWatch manager with boto3 session"""
+        self.session = session
         self.cloudwatch = session.client('cloudwatch')
         self.logs = session.client('logs')
         self.events = session.client('events')
@@ -84,6 +86,16 @@ class CloudWatchManager:
             st.error(f"Error getting metric statistics: {str(e)}")
             return {'label': '', 'datapoints': []}
     
+    def get_metric_data(self, queries: List[MetricQuery], start_time: datetime,
+                        end_time: Optional[datetime] = None) -> Dict[MetricQuery, MetricSeries]:
+        """Get many metric series at once (batched GetMetricData, cached per time bucket)"""
+        try:
+            engine = get_metrics_engine(self.session, self.cloudwatch.meta.region_name)
+            return engine.fetch(queries, start_time, end_time)
+        except Exception as e:
+            st.error(f"Error getting metric data: {str(e)}")
+            return {}
+    
     def put_metric_data(self, namespace: str, metric_name: str, 
                        value: float, unit: str = 'None',
                        dimensions: List[Dict] = None) -> Dict[str, Any]:
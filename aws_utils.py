@@ -8,7 +8,7 @@ Provides standardized AWS operations with:
 - Rate limiting support
 
 Usage:
-    from aws_utils import AWSClient, retry_with_backoff, paginate_aws_call
+    from aws_utils import AWSClient, retry_with_backoff, paginate_aws_call, iter_paginated
 """
 
 import time
@@ -16,6 +16,7 @@ import functools
 from typing import Dict, List, Optional, Any, Callable, Generator
 from dataclasses import dataclass
 import boto3
+import jmespath
 from botocore.exceptions import ClientError, BotoCoreError, EndpointConnectionError
 from botocore.config import Config
 
@@ -210,6 +211,43 @@ def paginate_with_marker(
             break
 
 
+def iter_paginated(
+    client,
+    operation: str,
+    result_key: str,
+    **kwargs
+) -> Generator[Any, None, None]:
+    """
+    Stream items from an AWS list/describe operation across every page.
+
+    Uses the boto3 paginator when the operation has one, and falls back to a
+    single call otherwise. Items are yielded as each page arrives, so memory
+    stays flat regardless of account size.
+
+    Args:
+        client: boto3 client
+        operation: Client method name (e.g. 'describe_instances')
+        result_key: Response key or JMESPath expression selecting the items
+                    (e.g. 'Users' or 'Reservations[].Instances[]')
+        **kwargs: Arguments to pass to the API call
+
+    Usage:
+        for instance in iter_paginated(ec2, 'describe_instances',
+                                       'Reservations[].Instances[]'):
+            process(instance)
+    """
+    if client.can_paginate(operation):
+        pages = client.get_paginator(operation).paginate(**kwargs)
+        for item in pages.search(result_key):
+            if item is not None:
+                yield item
+        return
+
+    response = getattr(client, operation)(**kwargs)
+    for item in jmespath.search(result_key, response) or []:
+        yield item
+
+
 # ============================================================================
 # AWS CLIENT WRAPPER
 # ============================================================================
@@ -443,6 +481,7 @@ __all__ = [
     'retry_with_backoff',
     'paginate_aws_call',
     'paginate_with_marker',
+    'iter_paginated',
     'AWSClient',
     'AWSClientConfig',
     'handle_aws_error',
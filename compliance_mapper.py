@@ -4,9 +4,95 @@ Compliance Framework Mapper
 Maps AWS WAF findings to industry compliance frameworks
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import json
+import re
+
+
+# Security Hub control IDs are prefixed with their source service
+# (S3.8, IAM.6, ...), so they identify a check without looking at the title.
+CONTROL_ID_MAPPING_KEYS = {
+    'S3.1': 's3_public_access',
+    'S3.2': 's3_public_access',
+    'S3.3': 's3_public_access',
+    'S3.8': 's3_public_access',
+    'S3.4': 's3_no_encryption',
+    'S3.14': 's3_no_versioning',
+    'S3.9': 's3_no_logging',
+    'CLOUDTRAIL.1': 'cloudtrail_not_enabled',
+    'IAM.6': 'iam_root_no_mfa',
+    'IAM.9': 'iam_root_no_mfa',
+    'IAM.5': 'iam_user_no_mfa',
+    'IAM.19': 'iam_user_no_mfa',
+    'IAM.8': 'iam_inactive_credentials',
+    'IAM.22': 'iam_inactive_credentials',
+    'EC2.13': 'security_group_unrestricted_ingress',
+    'EC2.14': 'security_group_unrestricted_ingress',
+    'EC2.18': 'security_group_unrestricted_ingress',
+    'EC2.19': 'security_group_unrestricted_ingress',
+    'RDS.3': 'rds_no_encryption',
+    'RDS.2': 'rds_public_access',
+    'RDS.11': 'rds_no_backup',
+    'EC2.3': 'ebs_unencrypted',
+    'EC2.7': 'ebs_unencrypted',
+    'KMS.4': 'kms_key_rotation_disabled',
+    'EC2.6': 'vpc_flow_logs_disabled',
+    'CONFIG.1': 'config_not_enabled',
+}
+
+_CONTROL_ID_PATTERN = re.compile(r'([A-Za-z0-9]+\.\d+)$')
+
+# Title rules, first match wins: (any of scope terms, all of [any of terms], key)
+TITLE_RULES: Tuple[Tuple[Tuple[str, ...], Tuple[Tuple[str, ...], ...], str], ...] = (
+    (('s3',), (('public', 'block public access'),), 's3_public_access'),
+    (('s3',), (('encrypt',), ('not enabled',)), 's3_no_encryption'),
+    (('s3',), (('versioning',),), 's3_no_versioning'),
+    (('s3',), (('logging', 'access log'),), 's3_no_logging'),
+    (('cloudtrail',), (('not enabled', 'disabled'),), 'cloudtrail_not_enabled'),
+    (('iam', 'root'), (('root',), ('mfa',)), 'iam_root_no_mfa'),
+    (('iam', 'root'), (('mfa',),), 'iam_user_no_mfa'),
+    (('iam', 'root'), (('inactive', 'unused'),), 'iam_inactive_credentials'),
+    (('security group',), (('0.0.0.0/0', 'unrestricted'),), 'security_group_unrestricted_ingress'),
+    (('rds',), (('encrypt',),), 'rds_no_encryption'),
+    (('rds',), (('public',),), 'rds_public_access'),
+    (('rds',), (('backup',),), 'rds_no_backup'),
+    (('ebs',), (('encrypt',),), 'ebs_unencrypted'),
+    (('kms',), (('rotation',),), 'kms_key_rotation_disabled'),
+    (('vpc',), (('flow log',),), 'vpc_flow_logs_disabled'),
+    (('config',), (('not enabled',),), 'config_not_enabled'),
+)
+
+# One scan of the title finds every rule term. The lookahead makes matches
+# zero-width, so terms that overlap (e.g. "block public access" / "public")
+# are all reported, giving plain substring semantics.
+_TITLE_TERMS = sorted({term for scope, groups, _ in TITLE_RULES
+                       for term in scope + tuple(t for group in groups for t in group)},
+                      key=len, reverse=True)
+_TITLE_TERM_PATTERN = re.compile('(?=(' + '|'.join(re.escape(t) for t in _TITLE_TERMS) + '))')
+
+
+@lru_cache(maxsize=65536)
+def match_title(title: str) -> str:
+    """Map a free-text finding title to a mapping key ('unknown' if none)"""
+    present = set(_TITLE_TERM_PATTERN.findall(title.lower()))
+    if not present:
+        return 'unknown'
+    for scope, groups, key in TITLE_RULES:
+        if present.intersection(scope) and all(present.intersection(group) for group in groups):
+            return key
+    return 'unknown'
+
+
+def finding_control_id(finding: Dict) -> Optional[str]:
+    """Stable check identifier of a finding (e.g. 'S3.8'), if it carries one"""
+    control_id = finding.get('control_id') or finding.get('check_id')
+    if not control_id:
+        generator_id = finding.get('generator_id', '')
+        match = _CONTROL_ID_PATTERN.search(generator_id) if generator_id else None
+        control_id = match.group(1) if match else None
+    return control_id.upper() if control_id else None
 
 
 @dataclass
@@ -23,6 +109,7 @@ class ComplianceMapper:
     
     def __init__(self):
         self.mappings = self._initialize_mappings()
+        self._build_index()
     
     def _initialize_mappings(self) -> Dict[str, Dict[str, List[ComplianceRequirement]]]:
         """Initialize comprehensive compliance mappings"""
@@ -654,19 +741,24 @@ class ComplianceMapper:
         
         return mappings
     
+    def _build_index(self):
+        """Flatten the mappings into per-key lookups used on every finding"""
+        self._requirements_by_key: Dict[str, List[ComplianceRequirement]] = {}
+        self._frameworks_by_key: Dict[str, Tuple[str, ...]] = {}
+        for key, frameworks in self.mappings.items():
+            self._requirements_by_key[key] = [req for reqs in frameworks.values() for req in reqs]
+            self._frameworks_by_key[key] = tuple(fw for fw, reqs in frameworks.items() if reqs)
+
     def get_compliance_mappings(self, finding_title: str) -> List[ComplianceRequirement]:
         """Get all compliance mappings for a finding"""
         
-        # Normalize finding title to mapping key
         finding_key = self._normalize_finding_title(finding_title)
+        return list(self._requirements_by_key.get(finding_key, []))
+    
+    def get_finding_mappings(self, finding: Dict) -> List[ComplianceRequirement]:
+        """Get all compliance mappings for a finding dict (control ID first, then title)"""
         
-        all_requirements = []
-        
-        if finding_key in self.mappings:
-            for framework_reqs in self.mappings[finding_key].values():
-                all_requirements.extend(framework_reqs)
-        
-        return all_requirements
+        return list(self._requirements_by_key.get(self._finding_key(finding), []))
     
     def get_compliance_by_framework(self, finding_title: str, framework: str) -> List[ComplianceRequirement]:
         """Get compliance mappings for specific framework"""
@@ -681,102 +773,48 @@ class ComplianceMapper:
     def _normalize_finding_title(self, title: str) -> str:
         """Convert finding title to mapping key"""
         
-        title_lower = title.lower()
-        
-        # S3 mappings
-        if 's3' in title_lower:
-            if 'public' in title_lower or 'block public access' in title_lower:
-                return 's3_public_access'
-            elif 'encrypt' in title_lower and 'not enabled' in title_lower:
-                return 's3_no_encryption'
-            elif 'versioning' in title_lower:
-                return 's3_no_versioning'
-            elif 'logging' in title_lower or 'access log' in title_lower:
-                return 's3_no_logging'
-        
-        # CloudTrail mappings
-        if 'cloudtrail' in title_lower:
-            if 'not enabled' in title_lower or 'disabled' in title_lower:
-                return 'cloudtrail_not_enabled'
-        
-        # IAM mappings
-        if 'iam' in title_lower or 'root' in title_lower:
-            if 'root' in title_lower and 'mfa' in title_lower:
-                return 'iam_root_no_mfa'
-            elif 'mfa' in title_lower:
-                return 'iam_user_no_mfa'
-            elif 'inactive' in title_lower or 'unused' in title_lower:
-                return 'iam_inactive_credentials'
-        
-        # Security Group mappings
-        if 'security group' in title_lower:
-            if '0.0.0.0/0' in title_lower or 'unrestricted' in title_lower:
-                return 'security_group_unrestricted_ingress'
-        
-        # RDS mappings
-        if 'rds' in title_lower:
-            if 'encrypt' in title_lower:
-                return 'rds_no_encryption'
-            elif 'public' in title_lower:
-                return 'rds_public_access'
-            elif 'backup' in title_lower:
-                return 'rds_no_backup'
-        
-        # EBS mappings
-        if 'ebs' in title_lower:
-            if 'encrypt' in title_lower:
-                return 'ebs_unencrypted'
-        
-        # KMS mappings
-        if 'kms' in title_lower:
-            if 'rotation' in title_lower:
-                return 'kms_key_rotation_disabled'
-        
-        # VPC mappings
-        if 'vpc' in title_lower:
-            if 'flow log' in title_lower:
-                return 'vpc_flow_logs_disabled'
-        
-        # Config mappings
-        if 'config' in title_lower:
-            if 'not enabled' in title_lower:
-                return 'config_not_enabled'
-        
-        return 'unknown'
+        return match_title(title or '')
     
-    def get_framework_coverage(self, findings: List[Dict]) -> Dict[str, int]:
-        """Get count of findings per compliance framework"""
-        
-        coverage = {
+    def _finding_key(self, finding: Dict) -> str:
+        """Mapping key for a finding, preferring its stable control ID"""
+        
+        control_id = finding_control_id(finding)
+        if control_id:
+            key = CONTROL_ID_MAPPING_KEYS.get(control_id)
+            if key:
+                return key
+        return match_title(finding.get('title', '') or '')
+    
+    @staticmethod
+    def _empty_coverage() -> Dict[str, int]:
+        return {
             'CIS_AWS_FOUNDATIONS': 0,
             'PCI_DSS': 0,
             'HIPAA': 0,
             'SOC2': 0,
             'NIST_CSF': 0
         }
+    
+    def get_framework_coverage(self, findings: List[Dict]) -> Dict[str, int]:
+        """Get count of findings per compliance framework"""
+        
+        coverage = self._empty_coverage()
         
         for finding in findings:
-            title = finding.get('title', '')
-            mappings = self.get_compliance_mappings(title)
-            
-            frameworks_seen = set()
-            for req in mappings:
-                if req.framework not in frameworks_seen:
-                    framework_key = req.framework.replace(' ', '_').replace('-', '_').replace('.', '').upper()
-                    if framework_key in coverage:
-                        coverage[framework_key] += 1
-                    frameworks_seen.add(req.framework)
+            for framework_key in self._frameworks_by_key.get(self._finding_key(finding), ()):
+                if framework_key in coverage:
+                    coverage[framework_key] += 1
         
         return coverage
     
     def generate_compliance_report(self, findings: List[Dict]) -> Dict:
-        """Generate comprehensive compliance report"""
+        """Generate comprehensive compliance report in a single pass over the findings"""
         
         report = {
             'total_findings': len(findings),
             'frameworks': {},
             'critical_compliance_gaps': [],
-            'coverage_summary': {}
+            'coverage_summary': self._empty_coverage()
         }
         
         for framework in ['CIS AWS Foundations', 'PCI-DSS v4.0', 'HIPAA', 'SOC 2', 'NIST CSF']:
@@ -789,48 +827,49 @@ class ComplianceMapper:
                 'requirements': []
             }
         
+        frameworks = report['frameworks']
+        coverage = report['coverage_summary']
+        critical_gaps = report['critical_compliance_gaps']
+        severity_buckets = {'CRITICAL': 'critical', 'HIGH': 'high', 'MEDIUM': 'medium'}
+        
         for finding in findings:
+            finding_key = self._finding_key(finding)
+            requirements = self._requirements_by_key.get(finding_key)
+            if not requirements:
+                continue
+            
             title = finding.get('title', '')
             severity = finding.get('severity', 'MEDIUM')
+            bucket = severity_buckets.get(severity, 'low')
             
-            mappings = self.get_compliance_mappings(title)
-            
-            for req in mappings:
-                framework_data = report['frameworks'].get(req.framework, {})
+            for req in requirements:
+                framework_data = frameworks.get(req.framework)
                 if framework_data:
                     framework_data['total_violations'] += 1
+                    framework_data[bucket] += 1
                     framework_data['requirements'].append({
                         'requirement_id': req.requirement_id,
                         'description': req.description,
                         'finding_title': title,
                         'severity': severity
                     })
-                    
-                    # Count by severity
-                    if severity == 'CRITICAL':
-                        framework_data['critical'] += 1
-                        report['critical_compliance_gaps'].append({
+                    if bucket == 'critical':
+                        critical_gaps.append({
                             'framework': req.framework,
                             'requirement': req.requirement_id,
                             'finding': title
                         })
-                    elif severity == 'HIGH':
-                        framework_data['high'] += 1
-                    elif severity == 'MEDIUM':
-                        framework_data['medium'] += 1
-                    else:
-                        framework_data['low'] += 1
-        
-        # Coverage summary
-        report['coverage_summary'] = self.get_framework_coverage(findings)
+            
+            for framework_key in self._frameworks_by_key[finding_key]:
+                if framework_key in coverage:
+                    coverage[framework_key] += 1
         
         return report
     
     def format_compliance_section(self, finding: Dict) -> str:
         """Format compliance mappings for display"""
         
-        title = finding.get('title', '')
-        mappings = self.get_compliance_mappings(title)
+        mappings = self.get_finding_mappings(finding)
         
         if not mappings:
             return "No specific compliance mappings identified"
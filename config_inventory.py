@@ -0,0 +1,565 @@
+"""
+Config Inventory Module
+=======================
+Org-wide landscape inventory from an AWS Config aggregator.
+
+Instead of per-service describe calls in every account and region, each
+resource type is read with one SelectAggregateResourceConfig query
+across the whole aggregator. Count-only types use COUNT(*) grouped by
+account and region, so they return a handful of rows whatever the fleet
+size. Types with checks (RDS, S3, security groups, EBS, Elastic IPs)
+select just the attributes the checks need. Queries are paged and run
+concurrently, and results fill the same ResourceInventory / Finding
+structures as AWSLandscapeScanner, per region and overall.
+
+Data is as fresh as Config's recording, and checks that need non-Config
+APIs (IAM MFA, KMS rotation, GuardDuty, ...) are not covered; use the
+per-service scanner for those.
+
+Usage:
+    from config_inventory import ConfigInventoryScanner
+
+    scanner = ConfigInventoryScanner(session, 'org-aggregator', region='us-east-1')
+    assessment = scanner.run_scan(progress_callback=lambda p, m: print(p, m))
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+from aws_utils import iter_paginated
+from landscape_scanner import (
+    AWSLandscapeScanner, Finding, LandscapeAssessment, ResourceInventory,
+    GLOBAL_REGION_KEY, merge_inventory
+)
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# QUERY CATALOG
+# ============================================================================
+
+# Resource types counted with COUNT(*) ... GROUP BY accountId, awsRegion
+COUNT_QUERIES: Dict[str, Tuple[str, ...]] = {
+    'AWS::Lambda::Function': ('lambda_functions',),
+    'AWS::ECS::Cluster': ('ecs_clusters',),
+    'AWS::ECS::Service': ('ecs_services',),
+    'AWS::EKS::Cluster': ('eks_clusters',),
+    'AWS::AutoScaling::AutoScalingGroup': ('autoscaling_groups',),
+    'AWS::DynamoDB::Table': ('dynamodb_tables',),
+    'AWS::ElastiCache::CacheCluster': ('elasticache_clusters',),
+    'AWS::EFS::FileSystem': ('efs_filesystems',),
+    'AWS::EC2::VPC': ('vpcs',),
+    'AWS::EC2::Subnet': ('subnets',),
+    'AWS::EC2::NetworkAcl': ('nacls',),
+    'AWS::EC2::NatGateway': ('nat_gateways',),
+    'AWS::EC2::VPCEndpoint': ('vpc_endpoints',),
+    'AWS::EC2::TransitGateway': ('transit_gateways',),
+    'AWS::ElasticLoadBalancingV2::LoadBalancer': ('load_balancers',),
+    'AWS::ElasticLoadBalancing::LoadBalancer': ('load_balancers', 'load_balancers_classic'),
+    'AWS::CloudFront::Distribution': ('cloudfront_distributions',),
+    'AWS::Route53::HostedZone': ('route53_zones',),
+    'AWS::IAM::User': ('iam_users',),
+    'AWS::IAM::Role': ('iam_roles',),
+    'AWS::IAM::Policy': ('iam_policies',),
+    'AWS::KMS::Key': ('kms_keys',),
+    'AWS::SecretsManager::Secret': ('secrets_manager_secrets',),
+    'AWS::WAFv2::WebACL': ('waf_webacls',),
+    'AWS::CloudWatch::Alarm': ('cloudwatch_alarms',),
+    'AWS::SNS::Topic': ('sns_topics',),
+    'AWS::SQS::Queue': ('sqs_queues',),
+    'AWS::Backup::BackupVault': ('backup_vaults',),
+    'AWS::Backup::BackupPlan': ('backup_plans',),
+    'AWS::SageMaker::NotebookInstance': ('sagemaker_notebooks',),
+    'AWS::SageMaker::Endpoint': ('sagemaker_endpoints',),
+    'AWS::SageMaker::Model': ('sagemaker_models',),
+}
+
+# Account-wide services the landscape scanner files under the "global" key
+GLOBAL_RESOURCE_TYPES = {
+    'AWS::IAM::User', 'AWS::IAM::Role', 'AWS::IAM::Policy',
+    'AWS::S3::Bucket', 'AWS::CloudFront::Distribution', 'AWS::Route53::HostedZone',
+}
+
+AIML_RESOURCE_TYPES = {
+    'AWS::SageMaker::NotebookInstance': 'SageMaker',
+    'AWS::SageMaker::Endpoint': 'SageMaker',
+    'AWS::SageMaker::Model': 'SageMaker',
+}
+
+
+@dataclass
+class ConfigQuery:
+    """One aggregator query and the handler that folds its rows into a scanner"""
+    name: str
+    resource_type: str
+    expression: str
+    handler: Callable[['ConfigInventoryScanner', Dict[str, Any]], None]
+
+
+def _path(item: Dict[str, Any], path: str, default: Any = None) -> Any:
+    """Read a dotted property from a Config query result row"""
+    if path in item:
+        return item[path]
+    value = item
+    for part in path.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return default
+        value = value[part]
+    return value
+
+
+def _truthy(value: Any) -> bool:
+    return value is True or str(value).lower() == 'true'
+
+
+# ============================================================================
+# SCANNER
+# ============================================================================
+
+class ConfigInventoryScanner(AWSLandscapeScanner):
+    """
+    Landscape scanner backed by an AWS Config aggregator.
+
+    Shares scoring and result shapes with AWSLandscapeScanner; only the
+    data collection differs.
+    """
+
+    PAGE_SIZE = 100
+
+    def __init__(self, session, aggregator_name: str, region: str = 'us-east-1',
+                 max_workers: int = 8):
+        super().__init__(session)
+        self.aggregator_name = aggregator_name
+        self.region = region
+        self.max_workers = max_workers
+        self.accounts: set = set()
+        self._row_context: Tuple[str, str] = ('', GLOBAL_REGION_KEY)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _queries(self) -> List[ConfigQuery]:
+        queries = [
+            ConfigQuery(
+                resource_type, resource_type,
+                "SELECT accountId, awsRegion, COUNT(*) "
+                f"WHERE resourceType = '{resource_type}' GROUP BY accountId, awsRegion",
+                lambda scanner, item, resource_type=resource_type, counters=counters:
+                    scanner._add_counts(item, resource_type, counters)
+            )
+            for resource_type, counters in COUNT_QUERIES.items()
+        ]
+        queries += [
+            ConfigQuery(
+                'AWS::EC2::Instance', 'AWS::EC2::Instance',
+                "SELECT accountId, awsRegion, configuration.state.name, COUNT(*) "
+                "WHERE resourceType = 'AWS::EC2::Instance' "
+                "GROUP BY accountId, awsRegion, configuration.state.name",
+                ConfigInventoryScanner._handle_ec2_counts
+            ),
+            ConfigQuery(
+                'AWS::EC2::Volume', 'AWS::EC2::Volume',
+                "SELECT accountId, awsRegion, resourceId, configuration.state.value, "
+                "configuration.encrypted, configuration.volumeType, configuration.size "
+                "WHERE resourceType = 'AWS::EC2::Volume'",
+                ConfigInventoryScanner._handle_volume
+            ),
+            ConfigQuery(
+                'AWS::EC2::EIP', 'AWS::EC2::EIP',
+                "SELECT accountId, awsRegion, resourceId, configuration.publicIp, "
+                "configuration.associationId, configuration.allocationId "
+                "WHERE resourceType = 'AWS::EC2::EIP'",
+                ConfigInventoryScanner._handle_eip
+            ),
+            ConfigQuery(
+                'AWS::EC2::SecurityGroup', 'AWS::EC2::SecurityGroup',
+                "SELECT accountId, awsRegion, resourceId, resourceName, configuration.ipPermissions "
+                "WHERE resourceType = 'AWS::EC2::SecurityGroup'",
+                ConfigInventoryScanner._handle_security_group
+            ),
+            ConfigQuery(
+                'AWS::RDS::DBInstance', 'AWS::RDS::DBInstance',
+                "SELECT accountId, awsRegion, resourceId, resourceName, configuration.multiAZ, "
+                "configuration.storageEncrypted, configuration.backupRetentionPeriod, "
+                "configuration.publiclyAccessible, configuration.dBInstanceClass "
+                "WHERE resourceType = 'AWS::RDS::DBInstance'",
+                ConfigInventoryScanner._handle_rds
+            ),
+            ConfigQuery(
+                'AWS::S3::Bucket', 'AWS::S3::Bucket',
+                "SELECT accountId, awsRegion, resourceName, "
+                "supplementaryConfiguration.PublicAccessBlockConfiguration, "
+                "supplementaryConfiguration.ServerSideEncryptionConfiguration, "
+                "supplementaryConfiguration.BucketVersioningConfiguration "
+                "WHERE resourceType = 'AWS::S3::Bucket'",
+                ConfigInventoryScanner._handle_s3
+            ),
+        ]
+        return queries
+
+    def _run_query(self, query: ConfigQuery) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """All result rows of one query across pages"""
+        config = self.session.client('config', region_name=self.region)
+        try:
+            rows = [json.loads(item) for item in iter_paginated(
+                config, 'select_aggregate_resource_config', 'Results[]',
+                Expression=query.expression,
+                ConfigurationAggregatorName=self.aggregator_name,
+                Limit=self.PAGE_SIZE
+            )]
+            return rows, None
+        except Exception as e:
+            return [], str(e)
+
+    # ------------------------------------------------------------------
+    # Row handlers
+    # ------------------------------------------------------------------
+
+    def _inventory_for(self, item: Dict[str, Any], resource_type: str) -> ResourceInventory:
+        """Per-region inventory a row counts towards (tracks the org's accounts too)"""
+        account_id = item.get('accountId', '')
+        region = GLOBAL_REGION_KEY if resource_type in GLOBAL_RESOURCE_TYPES else (
+            item.get('awsRegion') or GLOBAL_REGION_KEY)
+        if account_id:
+            self.accounts.add(account_id)
+        self._row_context = (account_id, region)
+        return self.region_inventories.setdefault(region, ResourceInventory())
+
+    def _add_finding(self, finding: Finding):
+        account_id, region = self._row_context
+        finding.account_id = account_id
+        finding.region = region
+        if finding.id in self._finding_ids:
+            finding.id = f"{finding.id}-{account_id}-{region}"
+        self._finding_ids.add(finding.id)
+        self.findings.append(finding)
+
+    def _add_counts(self, item: Dict[str, Any], resource_type: str, counters: Tuple[str, ...]):
+        count = int(item.get('COUNT(*)', 0))
+        inventory = self._inventory_for(item, resource_type)
+        for counter in counters:
+            setattr(inventory, counter, getattr(inventory, counter) + count)
+        service = AIML_RESOURCE_TYPES.get(resource_type)
+        if service and count:
+            inventory.has_ai_ml_workloads = True
+            if service not in inventory.ai_ml_services_detected:
+                inventory.ai_ml_services_detected.append(service)
+
+    def _handle_ec2_counts(self, item: Dict[str, Any]):
+        count = int(item.get('COUNT(*)', 0))
+        inventory = self._inventory_for(item, 'AWS::EC2::Instance')
+        inventory.ec2_instances += count
+        state = _path(item, 'configuration.state.name')
+        if state == 'running':
+            inventory.ec2_running += count
+        elif state == 'stopped':
+            inventory.ec2_stopped += count
+
+    def _handle_volume(self, item: Dict[str, Any]):
+        inventory = self._inventory_for(item, 'AWS::EC2::Volume')
+        vol_id = item.get('resourceId', '')
+        inventory.ebs_volumes += 1
+        if _path(item, 'configuration.state.value') == 'available':
+            inventory.ebs_unattached += 1
+            size = _path(item, 'configuration.size', 0) or 0
+            self._add_finding(Finding(
+                id=f"ebs-unattached-{vol_id[:12]}",
+                title=f"Unattached EBS Volume: {vol_id}",
+                description=f"{size}GB volume not attached to any instance",
+                severity='MEDIUM',
+                pillar='Cost Optimization',
+                source_service="EC2",
+                affected_resources=[vol_id],
+                recommendation="Delete or snapshot unused volumes",
+                effort="Low",
+                estimated_savings=size * 0.10
+            ))
+        if _path(item, 'configuration.volumeType') == 'gp2':
+            size = _path(item, 'configuration.size', 0) or 0
+            self._add_finding(Finding(
+                id=f"ebs-gp2-{vol_id[:12]}",
+                title=f"EBS Volume Using gp2: {vol_id}",
+                description="Upgrade to gp3 for 20% cost savings",
+                severity='LOW',
+                pillar='Performance Efficiency',
+                source_service="EC2",
+                affected_resources=[vol_id],
+                recommendation="Migrate to gp3 volume type",
+                effort="Low",
+                estimated_savings=size * 0.02
+            ))
+        if not _truthy(_path(item, 'configuration.encrypted')):
+            inventory.ebs_unencrypted += 1
+            self._add_finding(Finding(
+                id=f"ebs-noenc-{vol_id[:12]}",
+                title=f"Unencrypted EBS Volume: {vol_id}",
+                description="EBS volume is not encrypted at rest",
+                severity='HIGH',
+                pillar='Security',
+                source_service="EC2",
+                affected_resources=[vol_id],
+                recommendation="Snapshot and re-create with encryption",
+                effort="Medium",
+                compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
+            ))
+
+    def _handle_eip(self, item: Dict[str, Any]):
+        inventory = self._inventory_for(item, 'AWS::EC2::EIP')
+        inventory.elastic_ips += 1
+        if not _path(item, 'configuration.associationId'):
+            inventory.elastic_ips_unattached += 1
+            allocation_id = _path(item, 'configuration.allocationId') or item.get('resourceId', '')
+            self._add_finding(Finding(
+                id=f"eip-unattached-{allocation_id[:12]}",
+                title=f"Unattached Elastic IP: {_path(item, 'configuration.publicIp', 'N/A')}",
+                description="Elastic IP not associated with a running instance",
+                severity='LOW',
+                pillar='Cost Optimization',
+                source_service="EC2",
+                affected_resources=[allocation_id],
+                recommendation="Release unused Elastic IPs",
+                effort="Low",
+                estimated_savings=3.65
+            ))
+
+    def _handle_security_group(self, item: Dict[str, Any]):
+        inventory = self._inventory_for(item, 'AWS::EC2::SecurityGroup')
+        inventory.security_groups += 1
+        group_id = item.get('resourceId', '')
+        group_name = item.get('resourceName') or group_id
+        for rule in _path(item, 'configuration.ipPermissions', []) or []:
+            ranges = rule.get('ipv4Ranges') or rule.get('ipRanges') or []
+            cidrs = [r.get('cidrIp', r) if isinstance(r, dict) else r for r in ranges]
+            if '0.0.0.0/0' in cidrs:
+                inventory.security_groups_open += 1
+                from_port = rule.get('fromPort', 'all')
+                self._add_finding(Finding(
+                    id=f"sg-open-{group_id[:12]}-{from_port}",
+                    title=f"Security Group Open to Internet: {group_name}",
+                    description=f"Allows inbound traffic on port {from_port} from 0.0.0.0/0",
+                    severity='CRITICAL' if from_port in [22, 3389] else 'HIGH',
+                    pillar='Security',
+                    source_service="EC2",
+                    affected_resources=[group_id],
+                    recommendation="Restrict to specific IP ranges",
+                    effort="Medium",
+                    compliance_frameworks=["CIS AWS", "PCI-DSS"]
+                ))
+                break
+
+    def _handle_rds(self, item: Dict[str, Any]):
+        inventory = self._inventory_for(item, 'AWS::RDS::DBInstance')
+        inventory.rds_instances += 1
+        db_id = item.get('resourceName') or item.get('resourceId', '')
+
+        if _truthy(_path(item, 'configuration.multiAZ')):
+            inventory.rds_multi_az += 1
+        else:
+            instance_class = _path(item, 'configuration.dBInstanceClass', '') or ''
+            self._add_finding(Finding(
+                id=f"rds-singleaz-{db_id[:20]}",
+                title=f"RDS Instance Not Multi-AZ: {db_id}",
+                description="Database is deployed in single AZ",
+                severity='MEDIUM' if instance_class.startswith('db.t') else 'HIGH',
+                pillar='Reliability',
+                source_service="RDS",
+                affected_resources=[db_id],
+                recommendation="Enable Multi-AZ for production databases",
+                effort="Low"
+            ))
+
+        if _truthy(_path(item, 'configuration.storageEncrypted')):
+            inventory.rds_encrypted += 1
+        else:
+            self._add_finding(Finding(
+                id=f"rds-noenc-{db_id[:20]}",
+                title=f"RDS Instance Not Encrypted: {db_id}",
+                description="Database storage is not encrypted at rest",
+                severity='CRITICAL',
+                pillar='Security',
+                source_service="RDS",
+                affected_resources=[db_id],
+                recommendation="Create encrypted snapshot and restore",
+                effort="High",
+                compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
+            ))
+
+        if int(_path(item, 'configuration.backupRetentionPeriod', 0) or 0) > 0:
+            inventory.rds_backup_enabled += 1
+        else:
+            self._add_finding(Finding(
+                id=f"rds-nobackup-{db_id[:20]}",
+                title=f"RDS Without Automated Backups: {db_id}",
+                description="Automated backups are not configured",
+                severity='HIGH',
+                pillar='Reliability',
+                source_service="RDS",
+                affected_resources=[db_id],
+                recommendation="Enable automated backups with 7+ day retention",
+                effort="Low",
+                compliance_frameworks=["SOC2", "ISO27001"]
+            ))
+
+        if _truthy(_path(item, 'configuration.publiclyAccessible')):
+            self._add_finding(Finding(
+                id=f"rds-public-{db_id[:20]}",
+                title=f"RDS Instance Publicly Accessible: {db_id}",
+                description="Database is accessible from the internet",
+                severity='CRITICAL',
+                pillar='Security',
+                source_service="RDS",
+                affected_resources=[db_id],
+                recommendation="Disable public accessibility",
+                effort="Low",
+                compliance_frameworks=["CIS AWS", "PCI-DSS"]
+            ))
+
+    def _handle_s3(self, item: Dict[str, Any]):
+        inventory = self._inventory_for(item, 'AWS::S3::Bucket')
+        inventory.s3_buckets += 1
+        bucket_name = item.get('resourceName', '')
+        supplementary = item.get('supplementaryConfiguration', {}) or {}
+
+        public_block = supplementary.get('PublicAccessBlockConfiguration')
+        if isinstance(public_block, str):
+            public_block = json.loads(public_block)
+        flags = ('blockPublicAcls', 'blockPublicPolicy', 'ignorePublicAcls', 'restrictPublicBuckets')
+        if not public_block or not all(public_block.get(flag) for flag in flags):
+            inventory.s3_public += 1
+            self._add_finding(Finding(
+                id=f"s3-public-{bucket_name[:20]}",
+                title=f"S3 Bucket May Have Public Access: {bucket_name}",
+                description=f"Bucket {bucket_name} does not have all public access blocks enabled",
+                severity='CRITICAL',
+                pillar='Security',
+                source_service="S3",
+                affected_resources=[bucket_name],
+                recommendation="Enable Block All Public Access unless specifically required",
+                effort="Low",
+                compliance_frameworks=["CIS AWS", "PCI-DSS", "HIPAA", "GDPR"]
+            ))
+
+        if not supplementary.get('ServerSideEncryptionConfiguration'):
+            inventory.s3_unencrypted += 1
+            self._add_finding(Finding(
+                id=f"s3-noenc-{bucket_name[:20]}",
+                title=f"S3 Bucket Without Encryption: {bucket_name}",
+                description=f"Bucket {bucket_name} does not have default encryption enabled",
+                severity='HIGH',
+                pillar='Security',
+                source_service="S3",
+                affected_resources=[bucket_name],
+                recommendation="Enable default encryption with SSE-KMS or SSE-S3",
+                effort="Low",
+                compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
+            ))
+
+        versioning = supplementary.get('BucketVersioningConfiguration')
+        if isinstance(versioning, str):
+            versioning = json.loads(versioning)
+        if (versioning or {}).get('status') == 'Enabled':
+            inventory.s3_versioning_enabled += 1
+
+    # ------------------------------------------------------------------
+    # Scan
+    # ------------------------------------------------------------------
+
+    def run_scan(self, regions: List[str] = None, progress_callback: Callable = None,
+                 **kwargs) -> LandscapeAssessment:
+        """
+        Inventory the whole aggregator with one query per resource type.
+
+        Args:
+            regions: Only keep rows from these regions (default: all);
+                account-wide services are always kept
+            progress_callback: Optional callback(progress, message)
+
+        Returns:
+            LandscapeAssessment with org-wide and per-region inventories
+        """
+        start_time = datetime.now()
+        queries = self._queries()
+        wanted = set(regions) if regions else None
+
+        completed = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._run_query, query): query for query in queries}
+            for future in as_completed(futures):
+                query = futures[future]
+                rows, error = future.result()
+                for row in rows:
+                    region = row.get('awsRegion')
+                    if (wanted is not None and query.resource_type not in GLOBAL_RESOURCE_TYPES
+                            and region not in wanted):
+                        continue
+                    query.handler(self, row)
+                self.scan_status[query.name] = error is None
+                if error is not None:
+                    self.scan_errors[query.name] = error
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed / len(queries), f"Queried {query.name} ({completed}/{len(queries)})...")
+
+        # Org-wide totals are the sum of the per-region inventories
+        self.inventory = ResourceInventory()
+        for inventory in self.region_inventories.values():
+            merge_inventory(self.inventory, inventory)
+        self.inventory.config_enabled = True
+
+        if progress_callback:
+            progress_callback(1.0, "Calculating scores...")
+
+        pillar_scores = self._calculate_pillar_scores()
+        overall_score = self._calculate_overall_score(pillar_scores)
+        aiml_health = self._calculate_aiml_health_score()
+        aiml_findings = [f for f in self.findings if f.source_service in
+                         ['SageMaker', 'Bedrock', 'Rekognition', 'Comprehend', 'Lex', 'Kendra', 'Personalize']]
+        regions_scanned = sorted(r for r in self.region_inventories if r != GLOBAL_REGION_KEY)
+
+        return LandscapeAssessment(
+            assessment_id=f"config-scan-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
+            timestamp=datetime.now(),
+            accounts_scanned=sorted(self.accounts),
+            regions_scanned=regions_scanned,
+            overall_score=overall_score,
+            overall_risk=self._determine_risk(overall_score),
+            inventory=self.inventory,
+            pillar_scores=pillar_scores,
+            findings=self.findings,
+            services_scanned=self.scan_status,
+            scan_errors=self.scan_errors,
+            scan_duration_seconds=(datetime.now() - start_time).total_seconds(),
+            aiml_health_score=aiml_health,
+            aiml_findings=aiml_findings,
+            region_inventories=self.region_inventories
+        )
+
+
+def list_aggregators(session, region: str = 'us-east-1') -> List[str]:
+    """Names of the Config aggregators visible from a region"""
+    config = session.client('config', region_name=region)
+    return [a['ConfigurationAggregatorName'] for a in iter_paginated(
+        config, 'describe_configuration_aggregators', 'ConfigurationAggregators')]
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'ConfigInventoryScanner',
+    'ConfigQuery',
+    'COUNT_QUERIES',
+    'list_aggregators',
+]
@@ -7,81 +7,41 @@ from typing import Dict, Optional
 from datetime import datetime
 import json
 
+from price_catalog import get_price_catalog
+
 
 class CostImpactCalculator:
     """Calculate cost impact of security and optimization findings"""
     
-    def __init__(self):
+    def __init__(self, region: str = 'us-east-1'):
+        self.region = region
+        # Without ingested regional prices the catalog serves us-east-1 list prices
+        self.pricing_fallback = not get_price_catalog().has_prices('AmazonEC2', region)
         self.pricing = self._load_aws_pricing()
         self.risk_multipliers = self._load_risk_multipliers()
     
     def _load_aws_pricing(self) -> Dict:
-        """Load AWS pricing data (simplified - in production, use AWS Price List API)"""
+        """Load AWS pricing data from the local price catalog"""
+        catalog = get_price_catalog()
         return {
-            # EC2 pricing (USD/month for us-east-1)
-            'ec2': {
-                't3.nano': 3.80,
-                't3.micro': 7.59,
-                't3.small': 15.18,
-                't3.medium': 30.37,
-                't3.large': 60.74,
-                't3.xlarge': 121.47,
-                't3.2xlarge': 242.94,
-                'm5.large': 69.35,
-                'm5.xlarge': 138.70,
-                'm5.2xlarge': 277.39,
-                'm5.4xlarge': 554.78,
-                'c5.large': 61.58,
-                'c5.xlarge': 123.16,
-                'c5.2xlarge': 246.33,
-                'r5.large': 90.54,
-                'r5.xlarge': 181.07,
-                'r5.2xlarge': 362.14,
-            },
-            
-            # S3 pricing (USD/GB/month)
-            's3': {
-                'standard': 0.023,
-                'intelligent_tiering': 0.023,
-                'standard_ia': 0.0125,
-                'one_zone_ia': 0.01,
-                'glacier_instant': 0.004,
-                'glacier_flexible': 0.0036,
-                'glacier_deep': 0.00099,
-            },
+            # EC2 and RDS pricing (USD/month)
+            'ec2': catalog.monthly_table('AmazonEC2', self.region),
+            'rds': catalog.monthly_table('AmazonRDS', self.region),
             
-            # RDS pricing (USD/month for db.t3 instances)
-            'rds': {
-                'db.t3.micro': 12.41,
-                'db.t3.small': 24.82,
-                'db.t3.medium': 49.64,
-                'db.t3.large': 99.28,
-                'db.t3.xlarge': 198.56,
-                'db.m5.large': 116.80,
-                'db.m5.xlarge': 233.60,
-                'db.r5.large': 151.20,
-                'db.r5.xlarge': 302.40,
-            },
-            
-            # EBS pricing (USD/GB/month)
-            'ebs': {
-                'gp3': 0.08,
-                'gp2': 0.10,
-                'io2': 0.125,
-                'st1': 0.045,
-                'sc1': 0.015,
-            },
+            # S3 and EBS pricing (USD/GB/month)
+            's3': catalog.monthly_table('AmazonS3', self.region),
+            'ebs': catalog.monthly_table('AmazonEBS', self.region),
             
             # NAT Gateway pricing (USD/month)
             'nat_gateway': {
-                'hourly': 0.045 * 730,  # $0.045/hour
-                'data_processing_gb': 0.045,
+                'hourly': catalog.monthly('AmazonVPC', 'nat_gateway', self.region),
+                'data_processing_gb': catalog.price('AmazonVPC', 'nat_gateway_data', self.region),
             },
             
             # Load Balancer pricing
             'load_balancer': {
-                'alb_monthly': 0.0225 * 730,  # $0.0225/hour
-                'nlb_monthly': 0.0225 * 730,
+                'alb_monthly': catalog.monthly('ElasticLoadBalancing', 'alb', self.region),
+                'nlb_monthly': catalog.monthly('ElasticLoadBalancing', 'nlb', self.region),
             }
         }
     
@@ -128,7 +88,8 @@ class CostImpactCalculator:
             'risk_cost': 0.0,
             'total_impact': 0.0,
             'breakdown': {},
-            'recommendations': []
+            'recommendations': [],
+            'pricing_fallback': self.pricing_fallback
         }
         
         # Calculate waste costs
@@ -397,7 +358,8 @@ class CostImpactCalculator:
                 'MEDIUM': {'count': 0, 'waste': 0.0, 'risk': 0.0},
                 'LOW': {'count': 0, 'waste': 0.0, 'risk': 0.0},
             },
-            'top_opportunities': []
+            'top_opportunities': [],
+            'pricing_fallback': self.pricing_fallback
         }
         
         finding_impacts = []
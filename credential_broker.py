@@ -0,0 +1,367 @@
+"""
+Credential Broker Module
+========================
+Caches AssumeRole credentials per (base identity, role, external ID) and
+hands out boto3 sessions that refresh them shortly before they expire.
+
+Each brokered session also caches its clients per (service, region), so
+repeated scans of the same account reuse both the STS credentials and the
+botocore clients instead of paying an AssumeRole round trip and a client
+build every time.
+
+Cache keys include a keyed digest of the secret key, never the secret
+itself, so a caller presenting a known access key ID with a different
+secret cannot pick up someone else's session. Static keys are checked
+with STS before their session is cached. Rotating base credentials
+(instance profiles, ECS task roles) produce new cache keys, so every cache
+is an LRU bounded by MAX_CACHED_SESSIONS.
+
+Usage:
+    from credential_broker import get_credential_broker
+
+    broker = get_credential_broker()
+    session = broker.get_session(role_arn, external_id=external_id, base_session=base)
+    ec2 = session.client('ec2', region_name='eu-west-1')   # shared per session
+"""
+
+import hashlib
+import hmac
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple, Any
+
+import boto3
+import botocore.session
+from botocore.credentials import RefreshableCredentials
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_ROLE_SESSION_NAME = "WAFScan"
+DEFAULT_DURATION_SECONDS = 3600
+DEFAULT_REFRESH_MARGIN_SECONDS = 300   # Refresh this long before expiry
+MANDATORY_REFRESH_SECONDS = 60         # Block callers on refresh inside this window
+MAX_CACHED_SESSIONS = 256              # Per cache; least recently used entries are evicted
+
+# Per-process key for secret digests - digests are never comparable across processes
+_SECRET_DIGEST_KEY = os.urandom(32)
+
+
+def credential_digest(secret_key: Optional[str], session_token: Optional[str] = None) -> Optional[str]:
+    """Keyed digest of a secret key (and session token) for use in cache keys"""
+    if secret_key is None:
+        return None
+    material = f"{secret_key}\0{session_token or ''}".encode('utf-8')
+    return hmac.new(_SECRET_DIGEST_KEY, material, hashlib.sha256).hexdigest()
+
+
+# ============================================================================
+# BROKERED SESSION
+# ============================================================================
+
+class BrokeredSession(boto3.Session):
+    """
+    boto3 Session whose clients are created once and shared.
+
+    Clients requested with only a service name and region are cached;
+    calls with extra arguments (custom Config, endpoint URL, ...) get a
+    fresh client as usual. boto3 clients are thread-safe, client creation
+    is not, so creation is serialized.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._client_lock = threading.Lock()
+
+    def client(self, service_name, region_name=None, *args, **kwargs):
+        with self._client_lock:
+            if args or kwargs:
+                return super().client(service_name, region_name, *args, **kwargs)
+            key = (service_name, region_name or self.region_name)
+            if key not in self._clients:
+                self._clients[key] = super().client(service_name, region_name=region_name)
+            return self._clients[key]
+
+    def resource(self, *args, **kwargs):
+        with self._client_lock:
+            return super().resource(*args, **kwargs)
+
+
+# ============================================================================
+# CREDENTIAL BROKER
+# ============================================================================
+
+class CredentialBroker:
+    """
+    Process-wide cache of assumed-role and static-key sessions.
+
+    AssumeRole credentials are wrapped in botocore RefreshableCredentials,
+    so a cached session keeps working across the role's expiry: the next
+    API call inside the refresh margin re-assumes the role transparently.
+    """
+
+    def __init__(self, duration_seconds: int = DEFAULT_DURATION_SECONDS,
+                 refresh_margin_seconds: int = DEFAULT_REFRESH_MARGIN_SECONDS):
+        self.duration_seconds = duration_seconds
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._sessions: 'OrderedDict[Tuple, BrokeredSession]' = OrderedDict()
+        self._credentials: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self._sts_clients: 'OrderedDict[Tuple, Any]' = OrderedDict()
+        self._key_locks: 'OrderedDict[Tuple, threading.Lock]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.assume_role_calls = 0
+
+    @staticmethod
+    def _lookup(cache: OrderedDict, key: Tuple) -> Any:
+        """Get a cache entry and mark it recently used (caller holds _lock)"""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key: Tuple, value: Any) -> Any:
+        """Store a cache entry, evicting the least recently used (caller holds _lock)"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > MAX_CACHED_SESSIONS:
+            cache.popitem(last=False)
+        return value
+
+    def _key_lock(self, credentials_key: Tuple) -> threading.Lock:
+        """Lock serializing the first fetch for credentials_key (caller holds _lock)"""
+        return (self._lookup(self._key_locks, credentials_key)
+                or self._remember(self._key_locks, credentials_key, threading.Lock()))
+
+    @staticmethod
+    def _base_identity(base_session) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Identify the caller's base credentials without exposing the secret"""
+        credentials = base_session.get_credentials() if base_session else None
+        frozen = credentials.get_frozen_credentials() if credentials else None
+        if frozen is None:
+            return None, None, getattr(base_session, 'region_name', None)
+        return (frozen.access_key, credential_digest(frozen.secret_key, frozen.token),
+                getattr(base_session, 'region_name', None))
+
+    def _sts_client(self, base_session):
+        key = self._base_identity(base_session)
+        with self._lock:
+            return (self._lookup(self._sts_clients, key)
+                    or self._remember(self._sts_clients, key, base_session.client('sts')))
+
+    def _assume_role_fetcher(self, base_session, role_arn: str, external_id: Optional[str],
+                             session_name: str):
+        """Build the refresh callback used by RefreshableCredentials"""
+        def fetch() -> Dict[str, str]:
+            params = {
+                'RoleArn': role_arn,
+                'RoleSessionName': session_name,
+                'DurationSeconds': self.duration_seconds,
+            }
+            if external_id:
+                params['ExternalId'] = external_id
+
+            response = self._sts_client(base_session).assume_role(**params)
+            with self._lock:
+                self.assume_role_calls += 1
+            credentials = response['Credentials']
+            logger.debug(f"Assumed {role_arn} until {credentials['Expiration']}")
+            return {
+                'access_key': credentials['AccessKeyId'],
+                'secret_key': credentials['SecretAccessKey'],
+                'token': credentials['SessionToken'],
+                'expiry_time': credentials['Expiration'].astimezone(timezone.utc).isoformat(),
+            }
+        return fetch
+
+    def get_session(self, role_arn: str, external_id: Optional[str] = None,
+                    region_name: Optional[str] = None, base_session=None,
+                    session_name: str = DEFAULT_ROLE_SESSION_NAME,
+                    force_refresh: bool = False) -> BrokeredSession:
+        """
+        Return a cached session for role_arn, assuming the role on first use.
+
+        With force_refresh the role is assumed again even when credentials
+        are cached, so a revoked trust policy is noticed at once. The fresh
+        credentials replace the cached ones for every region; if AssumeRole
+        fails, the cached ones are dropped.
+
+        Args:
+            role_arn: ARN of the role to assume
+            external_id: External ID required by the role's trust policy
+            region_name: Default region for the returned session
+            base_session: Session holding the caller's base credentials
+                (default credential chain when omitted)
+            session_name: RoleSessionName passed to AssumeRole
+            force_refresh: Call AssumeRole now instead of using the cache
+
+        Raises:
+            botocore.exceptions.ClientError: If the initial (or forced) AssumeRole fails
+        """
+        base_session = base_session or boto3.Session()
+        credentials_key = ('role', self._base_identity(base_session), role_arn, external_id)
+        key = credentials_key + (region_name,)
+
+        with self._lock:
+            session = self._lookup(self._sessions, key)
+            key_lock = self._key_lock(credentials_key)
+        if session is not None and not force_refresh:
+            return session
+
+        # One AssumeRole per role even when many threads and regions ask at once
+        with key_lock:
+            if force_refresh:
+                with self._lock:
+                    self._forget(credentials_key)
+            with self._lock:
+                session = self._lookup(self._sessions, key)
+                credentials = self._lookup(self._credentials, credentials_key)
+            if session is not None:
+                return session
+
+            if credentials is None:
+                fetch = self._assume_role_fetcher(base_session, role_arn, external_id, session_name)
+                credentials = RefreshableCredentials.create_from_metadata(
+                    metadata=fetch(),
+                    refresh_using=fetch,
+                    method='sts-assume-role',
+                )
+                credentials._advisory_refresh_timeout = self.refresh_margin_seconds
+                credentials._mandatory_refresh_timeout = min(MANDATORY_REFRESH_SECONDS,
+                                                             self.refresh_margin_seconds)
+
+            botocore_session = botocore.session.get_session()
+            botocore_session._credentials = credentials
+            session = BrokeredSession(botocore_session=botocore_session, region_name=region_name)
+
+            with self._lock:
+                self._remember(self._credentials, credentials_key, credentials)
+                self._remember(self._sessions, key, session)
+            return session
+
+    def get_account_session(self, account_id: str, role_name: str,
+                            region_name: Optional[str] = None, base_session=None,
+                            external_id: Optional[str] = None,
+                            session_name: str = DEFAULT_ROLE_SESSION_NAME,
+                            force_refresh: bool = False) -> BrokeredSession:
+        """Convenience wrapper building the role ARN from an account ID and role name"""
+        return self.get_session(
+            f"arn:aws:iam::{account_id}:role/{role_name}",
+            external_id=external_id,
+            region_name=region_name,
+            base_session=base_session,
+            session_name=session_name,
+            force_refresh=force_refresh,
+        )
+
+    def get_static_session(self, access_key_id: str, secret_access_key: str,
+                           region_name: Optional[str] = None,
+                           session_token: Optional[str] = None) -> BrokeredSession:
+        """
+        Return a cached session for long-lived access keys.
+
+        A session is cached only once its own credentials have passed
+        sts:GetCallerIdentity, so a rejected key pair is never reused.
+
+        Raises:
+            botocore.exceptions.ClientError: If STS rejects the credentials
+        """
+        credentials_key = ('static', access_key_id, credential_digest(secret_access_key, session_token))
+        key = credentials_key + (region_name,)
+
+        with self._lock:
+            session = self._lookup(self._sessions, key)
+            key_lock = self._key_lock(credentials_key)
+        if session is not None:
+            return session
+
+        with key_lock:
+            with self._lock:
+                session = self._lookup(self._sessions, key)
+                validated = self._lookup(self._credentials, credentials_key) is not None
+            if session is not None:
+                return session
+
+            session = BrokeredSession(
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                aws_session_token=session_token,
+                region_name=region_name,
+            )
+            if not validated:
+                session.client('sts').get_caller_identity()
+
+            with self._lock:
+                self._remember(self._credentials, credentials_key, session.get_credentials())
+                self._remember(self._sessions, key, session)
+            return session
+
+    def _forget(self, credentials_key: Tuple):
+        """Drop the credentials and every region's session for one key (caller holds _lock)"""
+        self._credentials.pop(credentials_key, None)
+        for key in [k for k in self._sessions if k[:-1] == credentials_key]:
+            del self._sessions[key]
+
+    def invalidate(self, role_arn: Optional[str] = None):
+        """Drop cached sessions - all of them, or only those for role_arn"""
+        with self._lock:
+            if role_arn is None:
+                self._sessions.clear()
+                self._credentials.clear()
+            else:
+                for cache in (self._sessions, self._credentials):
+                    for key in [k for k in cache if k[0] == 'role' and k[2] == role_arn]:
+                        del cache[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache statistics for diagnostics"""
+        with self._lock:
+            return {
+                'sessions': len(self._sessions),
+                'assume_role_calls': self.assume_role_calls,
+                'checked_at': datetime.now().isoformat(),
+            }
+
+
+# ============================================================================
+# SINGLETON INSTANCE
+# ============================================================================
+
+_broker: Optional[CredentialBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_credential_broker() -> CredentialBroker:
+    """Get or create the process-wide credential broker"""
+    global _broker
+
+    with _broker_lock:
+        if _broker is None:
+            _broker = CredentialBroker()
+        return _broker
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'BrokeredSession',
+    'CredentialBroker',
+    'credential_digest',
+    'get_credential_broker',
+    'MAX_CACHED_SESSIONS',
+]
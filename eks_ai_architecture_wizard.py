@@ -26,6 +26,7 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 import hashlib
 import re
+from llm_gateway import create_message
 
 # ============================================================================
 # ENUMS AND CONSTANTS
@@ -322,7 +323,7 @@ Return a JSON object with the following structure:
 Be specific and practical. If information is not provided, make reasonable enterprise assumptions."""
 
         try:
-            response = self.anthropic_client.messages.create(
+            response = create_message(self.anthropic_client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=4096,
                 system=system_prompt,
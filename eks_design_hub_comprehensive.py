@@ -24,6 +24,7 @@ from dataclasses import dataclass, field
 import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
+from llm_gateway import create_message
 
 # Try to import Anthropic (optional for AI features)
 ANTHROPIC_AVAILABLE = False
@@ -1048,7 +1049,7 @@ Respond in JSON format:
 }}"""
         
         try:
-            response = self.client.messages.create(
+            response = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=4000,
                 messages=[{"role": "user", "content": prompt}]
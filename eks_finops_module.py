@@ -23,62 +23,63 @@ from enum import Enum
 from datetime import datetime, timedelta
 import os
 
+from price_catalog import get_price_catalog
+
 # ============================================================================
 # FINOPS CONSTANTS AND PRICING DATA
 # ============================================================================
 
-# AWS EC2 Pricing (On-Demand, us-east-1, hourly rates)
-# Prices are approximate and should be updated or fetched from AWS Pricing API
+# EC2 instance specs (prices come from the local price catalog)
 EC2_PRICING = {
     # General Purpose - Intel
-    "m6i.large": {"vcpu": 2, "memory": 8, "price": 0.096, "category": "general"},
-    "m6i.xlarge": {"vcpu": 4, "memory": 16, "price": 0.192, "category": "general"},
-    "m6i.2xlarge": {"vcpu": 8, "memory": 32, "price": 0.384, "category": "general"},
-    "m6i.4xlarge": {"vcpu": 16, "memory": 64, "price": 0.768, "category": "general"},
-    "m6i.8xlarge": {"vcpu": 32, "memory": 128, "price": 1.536, "category": "general"},
+    "m6i.large": {"vcpu": 2, "memory": 8, "category": "general"},
+    "m6i.xlarge": {"vcpu": 4, "memory": 16, "category": "general"},
+    "m6i.2xlarge": {"vcpu": 8, "memory": 32, "category": "general"},
+    "m6i.4xlarge": {"vcpu": 16, "memory": 64, "category": "general"},
+    "m6i.8xlarge": {"vcpu": 32, "memory": 128, "category": "general"},
     
     # General Purpose - AMD
-    "m6a.large": {"vcpu": 2, "memory": 8, "price": 0.0864, "category": "general"},
-    "m6a.xlarge": {"vcpu": 4, "memory": 16, "price": 0.1728, "category": "general"},
-    "m6a.2xlarge": {"vcpu": 8, "memory": 32, "price": 0.3456, "category": "general"},
+    "m6a.large": {"vcpu": 2, "memory": 8, "category": "general"},
+    "m6a.xlarge": {"vcpu": 4, "memory": 16, "category": "general"},
+    "m6a.2xlarge": {"vcpu": 8, "memory": 32, "category": "general"},
     
     # General Purpose - Graviton
-    "m6g.large": {"vcpu": 2, "memory": 8, "price": 0.077, "category": "general"},
-    "m6g.xlarge": {"vcpu": 4, "memory": 16, "price": 0.154, "category": "general"},
-    "m6g.2xlarge": {"vcpu": 8, "memory": 32, "price": 0.308, "category": "general"},
-    "m7g.large": {"vcpu": 2, "memory": 8, "price": 0.0816, "category": "general"},
-    "m7g.xlarge": {"vcpu": 4, "memory": 16, "price": 0.1632, "category": "general"},
+    "m6g.large": {"vcpu": 2, "memory": 8, "category": "general"},
+    "m6g.xlarge": {"vcpu": 4, "memory": 16, "category": "general"},
+    "m6g.2xlarge": {"vcpu": 8, "memory": 32, "category": "general"},
+    "m7g.large": {"vcpu": 2, "memory": 8, "category": "general"},
+    "m7g.xlarge": {"vcpu": 4, "memory": 16, "category": "general"},
     
     # Compute Optimized - Intel
-    "c6i.large": {"vcpu": 2, "memory": 4, "price": 0.085, "category": "compute"},
-    "c6i.xlarge": {"vcpu": 4, "memory": 8, "price": 0.17, "category": "compute"},
-    "c6i.2xlarge": {"vcpu": 8, "memory": 16, "price": 0.34, "category": "compute"},
-    "c6i.4xlarge": {"vcpu": 16, "memory": 32, "price": 0.68, "category": "compute"},
+    "c6i.large": {"vcpu": 2, "memory": 4, "category": "compute"},
+    "c6i.xlarge": {"vcpu": 4, "memory": 8, "category": "compute"},
+    "c6i.2xlarge": {"vcpu": 8, "memory": 16, "category": "compute"},
+    "c6i.4xlarge": {"vcpu": 16, "memory": 32, "category": "compute"},
     
     # Compute Optimized - Graviton
-    "c6g.large": {"vcpu": 2, "memory": 4, "price": 0.068, "category": "compute"},
-    "c6g.xlarge": {"vcpu": 4, "memory": 8, "price": 0.136, "category": "compute"},
-    "c7g.large": {"vcpu": 2, "memory": 4, "price": 0.0725, "category": "compute"},
-    "c7g.xlarge": {"vcpu": 4, "memory": 8, "price": 0.145, "category": "compute"},
+    "c6g.large": {"vcpu": 2, "memory": 4, "category": "compute"},
+    "c6g.xlarge": {"vcpu": 4, "memory": 8, "category": "compute"},
+    "c7g.large": {"vcpu": 2, "memory": 4, "category": "compute"},
+    "c7g.xlarge": {"vcpu": 4, "memory": 8, "category": "compute"},
     
     # Memory Optimized
-    "r6i.large": {"vcpu": 2, "memory": 16, "price": 0.126, "category": "memory"},
-    "r6i.xlarge": {"vcpu": 4, "memory": 32, "price": 0.252, "category": "memory"},
-    "r6i.2xlarge": {"vcpu": 8, "memory": 64, "price": 0.504, "category": "memory"},
-    "r6g.large": {"vcpu": 2, "memory": 16, "price": 0.1008, "category": "memory"},
-    "r6g.xlarge": {"vcpu": 4, "memory": 32, "price": 0.2016, "category": "memory"},
+    "r6i.large": {"vcpu": 2, "memory": 16, "category": "memory"},
+    "r6i.xlarge": {"vcpu": 4, "memory": 32, "category": "memory"},
+    "r6i.2xlarge": {"vcpu": 8, "memory": 64, "category": "memory"},
+    "r6g.large": {"vcpu": 2, "memory": 16, "category": "memory"},
+    "r6g.xlarge": {"vcpu": 4, "memory": 32, "category": "memory"},
     
     # GPU Instances
-    "g5.xlarge": {"vcpu": 4, "memory": 16, "gpu": 1, "price": 1.006, "category": "gpu"},
-    "g5.2xlarge": {"vcpu": 8, "memory": 32, "gpu": 1, "price": 1.212, "category": "gpu"},
-    "g5.4xlarge": {"vcpu": 16, "memory": 64, "gpu": 1, "price": 1.624, "category": "gpu"},
-    "g4dn.xlarge": {"vcpu": 4, "memory": 16, "gpu": 1, "price": 0.526, "category": "gpu"},
-    "g4dn.2xlarge": {"vcpu": 8, "memory": 32, "gpu": 1, "price": 0.752, "category": "gpu"},
-    "p4d.24xlarge": {"vcpu": 96, "memory": 1152, "gpu": 8, "price": 32.77, "category": "gpu"},
+    "g5.xlarge": {"vcpu": 4, "memory": 16, "gpu": 1, "category": "gpu"},
+    "g5.2xlarge": {"vcpu": 8, "memory": 32, "gpu": 1, "category": "gpu"},
+    "g5.4xlarge": {"vcpu": 16, "memory": 64, "gpu": 1, "category": "gpu"},
+    "g4dn.xlarge": {"vcpu": 4, "memory": 16, "gpu": 1, "category": "gpu"},
+    "g4dn.2xlarge": {"vcpu": 8, "memory": 32, "gpu": 1, "category": "gpu"},
+    "p4d.24xlarge": {"vcpu": 96, "memory": 1152, "gpu": 8, "category": "gpu"},
     
     # Inference
-    "inf2.xlarge": {"vcpu": 4, "memory": 16, "inferentia": 1, "price": 0.758, "category": "inference"},
-    "inf2.8xlarge": {"vcpu": 32, "memory": 128, "inferentia": 1, "price": 1.968, "category": "inference"},
+    "inf2.xlarge": {"vcpu": 4, "memory": 16, "inferentia": 1, "category": "inference"},
+    "inf2.8xlarge": {"vcpu": 32, "memory": 128, "inferentia": 1, "category": "inference"},
 }
 
 # Spot pricing discount (percentage of on-demand)
@@ -90,24 +91,6 @@ SPOT_DISCOUNT = {
     "inference": 0.45,  # 55% discount
 }
 
-# EKS Pricing
-EKS_CONTROL_PLANE_HOURLY = 0.10  # $0.10 per hour per cluster
-
-# AWS Services Pricing (monthly estimates)
-AWS_SERVICES_PRICING = {
-    "nat_gateway": 32.40,  # per NAT Gateway per month (base)
-    "nat_gateway_per_gb": 0.045,  # per GB processed
-    "vpc_endpoint": 7.30,  # per endpoint per month
-    "alb": 16.20,  # Application Load Balancer base
-    "alb_lcu": 0.008,  # per LCU-hour
-    "ebs_gp3_gb": 0.08,  # per GB-month
-    "ebs_iops": 0.005,  # per provisioned IOPS
-    "ecr_storage_gb": 0.10,  # per GB-month
-    "cloudwatch_logs_ingestion_gb": 0.50,  # per GB
-    "cloudwatch_logs_storage_gb": 0.03,  # per GB-month
-}
-
-
 # ============================================================================
 # FINOPS DATA CLASSES
 # ============================================================================
@@ -192,6 +175,11 @@ class EKSCostCalculator:
         self.region = region
         self.hours_per_month = 730
         self.hours_per_year = 8760
+        self.catalog = get_price_catalog()
+    
+    def _price(self, service: str, item: str) -> float:
+        """Catalog unit price in this calculator's region"""
+        return self.catalog.price(service, item, self.region, default=0.0)
     
     def calculate_cluster_cost(self, cluster_config: Dict) -> ClusterCostEstimate:
         """
@@ -218,7 +206,7 @@ class EKSCostCalculator:
             estimate.total_memory_gb += ng_estimate.memory_total_gb
         
         # EKS control plane cost
-        estimate.control_plane_monthly = EKS_CONTROL_PLANE_HOURLY * self.hours_per_month
+        estimate.control_plane_monthly = self._price("AmazonEKS", "cluster") * self.hours_per_month
         
         # Networking costs
         network = cluster_config.get("network", {})
@@ -267,11 +255,12 @@ class EKSCostCalculator:
         
         # Get instance pricing
         instance_info = EC2_PRICING.get(instance_type, {
-            "vcpu": 4, "memory": 16, "price": 0.192, "category": "general"
+            "vcpu": 4, "memory": 16, "category": "general"
         })
-        
+        on_demand_price = self.catalog.hourly("AmazonEC2", instance_type, self.region, default=0.192)
+
         # Calculate hourly cost
-        hourly_price = instance_info["price"]
+        hourly_price = on_demand_price
         if capacity_type == "SPOT":
             discount = SPOT_DISCOUNT.get(instance_info["category"], 0.40)
             hourly_price *= discount
@@ -301,7 +290,7 @@ class EKSCostCalculator:
         # Calculate potential savings and recommendations
         if capacity_type == "ON_DEMAND":
             # Spot savings potential
-            spot_price = instance_info["price"] * SPOT_DISCOUNT.get(instance_info["category"], 0.40)
+            spot_price = on_demand_price * SPOT_DISCOUNT.get(instance_info["category"], 0.40)
             spot_monthly = spot_price * instance_count * self.hours_per_month
             estimate.potential_savings = monthly_cost - spot_monthly
             
@@ -312,9 +301,9 @@ class EKSCostCalculator:
         # Graviton recommendation
         if instance_type.startswith(("m6i", "c6i", "r6i")):
             graviton_type = instance_type.replace("6i", "6g")
-            if graviton_type in EC2_PRICING:
-                graviton_price = EC2_PRICING[graviton_type]["price"]
-                savings_pct = (instance_info["price"] - graviton_price) / instance_info["price"] * 100
+            graviton_price = self.catalog.hourly("AmazonEC2", graviton_type, self.region)
+            if graviton_type in EC2_PRICING and graviton_price is not None:
+                savings_pct = (on_demand_price - graviton_price) / on_demand_price * 100
                 estimate.savings_recommendations.append(
                     f"Consider Graviton ({graviton_type}) for ~{savings_pct:.0f}% savings"
                 )
@@ -326,22 +315,22 @@ class EKSCostCalculator:
         nat_count = network.get("nat_gateways", 3)
         estimated_data_gb = 500  # Assume 500 GB/month data processing
         
-        base_cost = nat_count * AWS_SERVICES_PRICING["nat_gateway"]
-        data_cost = estimated_data_gb * AWS_SERVICES_PRICING["nat_gateway_per_gb"]
+        base_cost = nat_count * self._price("AmazonVPC", "nat_gateway") * self.hours_per_month
+        data_cost = estimated_data_gb * self._price("AmazonVPC", "nat_gateway_data")
         
         return base_cost + data_cost
     
     def _calculate_vpc_endpoint_cost(self, network: Dict) -> float:
         """Calculate VPC Endpoint costs"""
         endpoints = network.get("vpc_endpoints", [])
-        return len(endpoints) * AWS_SERVICES_PRICING["vpc_endpoint"]
+        return len(endpoints) * self._price("AmazonVPC", "vpc_endpoint") * self.hours_per_month
     
     def _calculate_load_balancer_cost(self, config: Dict) -> float:
         """Calculate Load Balancer costs"""
         # Assume 1 ALB with moderate traffic
-        alb_base = AWS_SERVICES_PRICING["alb"]
+        alb_base = self._price("ElasticLoadBalancing", "alb") * self.hours_per_month
         estimated_lcu_hours = 100 * self.hours_per_month  # 100 LCUs average
-        lcu_cost = estimated_lcu_hours * AWS_SERVICES_PRICING["alb_lcu"]
+        lcu_cost = estimated_lcu_hours * self._price("ElasticLoadBalancing", "alb_lcu")
         
         return alb_base + lcu_cost
     
@@ -351,8 +340,8 @@ class EKSCostCalculator:
         node_count = sum(ng.get("desired_size", 1) for ng in config.get("node_groups", []))
         estimated_gb = node_count * 100  # 100 GB per node per month
         
-        # Inter-AZ transfer at $0.01/GB
-        return estimated_gb * 0.01
+        # Inter-AZ transfer
+        return estimated_gb * self._price("AmazonVPC", "inter_az_transfer")
     
     def _calculate_storage_cost(self, config: Dict) -> float:
         """Calculate EBS storage costs"""
@@ -367,7 +356,7 @@ class EKSCostCalculator:
         node_count = sum(ng.get("desired_size", 1) for ng in config.get("node_groups", []))
         total_storage_gb += node_count * 50  # 50 GB per node
         
-        return total_storage_gb * AWS_SERVICES_PRICING["ebs_gp3_gb"]
+        return total_storage_gb * self._price("AmazonEBS", "gp3")
     
     def _calculate_observability_cost(self, observability: Dict) -> float:
         """Calculate CloudWatch and observability costs"""
@@ -380,8 +369,8 @@ class EKSCostCalculator:
         if observability.get("enable_logging", True):
             # Log ingestion and storage
             estimated_logs_gb = 100  # 100 GB/month
-            cost += estimated_logs_gb * AWS_SERVICES_PRICING["cloudwatch_logs_ingestion_gb"]
-            cost += estimated_logs_gb * AWS_SERVICES_PRICING["cloudwatch_logs_storage_gb"]
+            cost += estimated_logs_gb * self._price("AmazonCloudWatch", "logs_ingestion")
+            cost += estimated_logs_gb * self._price("AmazonCloudWatch", "logs_storage")
         
         return cost
     
@@ -11,6 +11,7 @@ import boto3
 import json
 from datetime import datetime, timedelta
 from typing import Dict, Optional
+from llm_gateway import create_message
 
 # ============================================================================
 # REAL AWS PRICING INTEGRATION
@@ -354,7 +355,7 @@ class AnthropicAIValidator:
             prompt = self._create_validation_prompt(config)
             
             # Call Claude API
-            response = self.client.messages.create(
+            response = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=2048,
                 messages=[{
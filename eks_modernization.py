@@ -19,13 +19,15 @@ Features:
 import streamlit as st
 import boto3
 import json
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 import pandas as pd
 from anthropic import Anthropic
 import plotly.graph_objects as go
 import plotly.express as px
+from llm_gateway import create_message
+from metrics_engine import MetricQuery, get_metrics_engine
 
 # ============================================================================
 # DATA MODELS
@@ -153,7 +155,6 @@ class EKSClusterAnalyzer:
         try:
             eks = self.session.client('eks', region_name=region)
             ec2 = self.session.client('ec2', region_name=region)
-            cloudwatch = self.session.client('cloudwatch', region_name=region)
             
             # Get cluster info
             cluster_info = eks.describe_cluster(name=cluster_name)['cluster']
@@ -192,11 +193,8 @@ class EKSClusterAnalyzer:
             node_count = sum(ng.get('scalingConfig', {}).get('desiredSize', 0) for ng in node_groups)
             
             # Get CloudWatch metrics
-            cpu_util = self._get_cluster_metric(
-                cloudwatch, cluster_name, 'cluster_cpu_utilization', region
-            )
-            memory_util = self._get_cluster_metric(
-                cloudwatch, cluster_name, 'cluster_memory_utilization', region
+            cpu_util, memory_util = self._get_cluster_metrics(
+                cluster_name, ['cluster_cpu_utilization', 'cluster_memory_utilization'], region
             )
             
             # Calculate costs
@@ -230,26 +228,18 @@ class EKSClusterAnalyzer:
             st.error(f"Error analyzing cluster {cluster_name}: {e}")
             return None
     
-    def _get_cluster_metric(self, cloudwatch, cluster_name: str, metric_name: str, region: str) -> float:
-        """Get CloudWatch Container Insights metric"""
+    def _get_cluster_metrics(self, cluster_name: str, metric_names: List[str], region: str) -> List[float]:
+        """Get CloudWatch Container Insights metrics (last hour average) in one request"""
         try:
-            response = cloudwatch.get_metric_statistics(
-                Namespace='ContainerInsights',
-                MetricName=metric_name,
-                Dimensions=[
-                    {'Name': 'ClusterName', 'Value': cluster_name}
-                ],
-                StartTime=datetime.now() - timedelta(hours=1),
-                EndTime=datetime.now(),
-                Period=3600,
-                Statistics=['Average']
-            )
-            datapoints = response.get('Datapoints', [])
-            if datapoints:
-                return datapoints[0]['Average']
-            return 0.0
+            engine = get_metrics_engine(self.session, region)
+            queries = [
+                MetricQuery.for_resource('ContainerInsights', metric_name, 'ClusterName', cluster_name)
+                for metric_name in metric_names
+            ]
+            series = engine.fetch(queries, datetime.now(timezone.utc) - timedelta(hours=1))
+            return [series[q].mean() for q in queries]
         except:
-            return 0.0
+            return [0.0] * len(metric_names)
     
     def _calculate_cluster_cost(self, cluster_info: Dict, node_groups: List, fargate_profiles: List) -> float:
         """Calculate estimated monthly cluster cost"""
@@ -1553,7 +1543,7 @@ Provide 5-10 prioritized recommendations in JSON format:
 Focus on practical, implementable actions with clear business value."""
         
         try:
-            response = self.client.messages.create(
+            response = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=4000,
                 messages=[{
@@ -1617,7 +1607,7 @@ Provide complete YAML configurations that follow best practices for:
 Return only valid YAML configurations."""
         
         try:
-            response = self.client.messages.create(
+            response = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=3000,
                 messages=[{"role": "user", "content": prompt}]
@@ -1650,7 +1640,7 @@ Output:
 Provide analysis in structured JSON format."""
         
         try:
-            response = self.client.messages.create(
+            response = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 messages=[{"role": "user", "content": prompt}]
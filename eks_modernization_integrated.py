@@ -15,6 +15,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import json
+from llm_gateway import create_message
 
 # ============================================================================
 # ENUMS & CONSTANTS  
@@ -580,7 +581,7 @@ Provide recommendations in this format:
 Focus on Kubernetes best practices, security hardening, and operational efficiency."""
 
         try:
-            response = self.ai_client.messages.create(
+            response = create_message(self.ai_client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=1000,
                 messages=[{"role": "user", "content": prompt}]
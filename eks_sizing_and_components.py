@@ -14,6 +14,8 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import math
 
+from price_catalog import get_price_catalog, HOURS_PER_MONTH
+
 # ============================================================================
 # EKS SIZING FRAMEWORK
 # ============================================================================
@@ -571,25 +573,25 @@ def render_formula_based_sizing():
 def recommend_instance_type(cpu_cores: float, memory_gb: float) -> Dict:
     """Recommend AWS instance type based on requirements"""
     
-    # Instance type catalog with pricing
+    # Candidate instance types (prices come from the price catalog)
     instances = [
-        {'type': 't3.medium', 'vcpu': 2, 'memory': 4, 'price': 0.0416},
-        {'type': 't3.large', 'vcpu': 2, 'memory': 8, 'price': 0.0832},
-        {'type': 't3.xlarge', 'vcpu': 4, 'memory': 16, 'price': 0.1664},
-        {'type': 't3.2xlarge', 'vcpu': 8, 'memory': 32, 'price': 0.3328},
-        {'type': 'm5.large', 'vcpu': 2, 'memory': 8, 'price': 0.096},
-        {'type': 'm5.xlarge', 'vcpu': 4, 'memory': 16, 'price': 0.192},
-        {'type': 'm5.2xlarge', 'vcpu': 8, 'memory': 32, 'price': 0.384},
-        {'type': 'm5.4xlarge', 'vcpu': 16, 'memory': 64, 'price': 0.768},
-        {'type': 'm6i.large', 'vcpu': 2, 'memory': 8, 'price': 0.096},
-        {'type': 'm6i.xlarge', 'vcpu': 4, 'memory': 16, 'price': 0.192},
-        {'type': 'm6i.2xlarge', 'vcpu': 8, 'memory': 32, 'price': 0.384},
-        {'type': 'c5.large', 'vcpu': 2, 'memory': 4, 'price': 0.085},
-        {'type': 'c5.xlarge', 'vcpu': 4, 'memory': 8, 'price': 0.17},
-        {'type': 'c5.2xlarge', 'vcpu': 8, 'memory': 16, 'price': 0.34},
-        {'type': 'r5.large', 'vcpu': 2, 'memory': 16, 'price': 0.126},
-        {'type': 'r5.xlarge', 'vcpu': 4, 'memory': 32, 'price': 0.252},
-        {'type': 'r5.2xlarge', 'vcpu': 8, 'memory': 64, 'price': 0.504},
+        {'type': 't3.medium', 'vcpu': 2, 'memory': 4},
+        {'type': 't3.large', 'vcpu': 2, 'memory': 8},
+        {'type': 't3.xlarge', 'vcpu': 4, 'memory': 16},
+        {'type': 't3.2xlarge', 'vcpu': 8, 'memory': 32},
+        {'type': 'm5.large', 'vcpu': 2, 'memory': 8},
+        {'type': 'm5.xlarge', 'vcpu': 4, 'memory': 16},
+        {'type': 'm5.2xlarge', 'vcpu': 8, 'memory': 32},
+        {'type': 'm5.4xlarge', 'vcpu': 16, 'memory': 64},
+        {'type': 'm6i.large', 'vcpu': 2, 'memory': 8},
+        {'type': 'm6i.xlarge', 'vcpu': 4, 'memory': 16},
+        {'type': 'm6i.2xlarge', 'vcpu': 8, 'memory': 32},
+        {'type': 'c5.large', 'vcpu': 2, 'memory': 4},
+        {'type': 'c5.xlarge', 'vcpu': 4, 'memory': 8},
+        {'type': 'c5.2xlarge', 'vcpu': 8, 'memory': 16},
+        {'type': 'r5.large', 'vcpu': 2, 'memory': 16},
+        {'type': 'r5.xlarge', 'vcpu': 4, 'memory': 32},
+        {'type': 'r5.2xlarge', 'vcpu': 8, 'memory': 64},
     ]
     
     # Calculate CPU-to-memory ratio
@@ -615,13 +617,14 @@ def recommend_instance_type(cpu_cores: float, memory_gb: float) -> Dict:
         # Find instance with minimum nodes needed
         if nodes_needed < min_nodes:
             min_nodes = nodes_needed
+            hourly_price = get_price_catalog().hourly('AmazonEC2', instance['type'], default=0.192)
             best_instance = {
                 'instance_type': instance['type'],
                 'vcpu': instance['vcpu'],
                 'memory_gb': instance['memory'],
                 'node_count': nodes_needed,
-                'hourly_price': instance['price'],
-                'monthly_price': instance['price'] * 730  # hours per month
+                'hourly_price': hourly_price,
+                'monthly_price': hourly_price * HOURS_PER_MONTH
             }
     
     return best_instance
@@ -629,17 +632,8 @@ def recommend_instance_type(cpu_cores: float, memory_gb: float) -> Dict:
 def calculate_cost_estimate(instance_type: str, node_count: int, spot_percentage: float) -> Dict:
     """Calculate estimated monthly cost"""
     
-    # Get instance pricing (simplified)
-    pricing = {
-        't3.medium': 0.0416, 't3.large': 0.0832, 't3.xlarge': 0.1664, 't3.2xlarge': 0.3328,
-        'm5.large': 0.096, 'm5.xlarge': 0.192, 'm5.2xlarge': 0.384, 'm5.4xlarge': 0.768,
-        'm6i.large': 0.096, 'm6i.xlarge': 0.192, 'm6i.2xlarge': 0.384,
-        'c5.large': 0.085, 'c5.xlarge': 0.17, 'c5.2xlarge': 0.34,
-        'r5.large': 0.126, 'r5.xlarge': 0.252, 'r5.2xlarge': 0.504,
-    }
-    
-    hourly_price = pricing.get(instance_type, 0.192)  # Default to m5.xlarge
-    hours_per_month = 730
+    hourly_price = get_price_catalog().hourly('AmazonEC2', instance_type, default=0.192)  # Default to m5.xlarge
+    hours_per_month = HOURS_PER_MONTH
     
     # Calculate costs
     base_monthly = hourly_price * hours_per_month * node_count
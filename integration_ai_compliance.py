@@ -25,6 +25,7 @@ from typing import Dict, List, Optional, Any, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import hashlib
+from llm_gateway import create_message, invoke_model
 
 # ============================================================================
 # CONSTANTS & ENUMS
@@ -177,7 +178,7 @@ class AILensService:
         
         try:
             if self.anthropic_client:
-                response = self.anthropic_client.messages.create(
+                response = create_message(self.anthropic_client,
                     model="claude-sonnet-4-20250514",
                     max_tokens=4096,
                     system=system,
@@ -186,7 +187,7 @@ class AILensService:
                 return response.content[0].text
             
             elif self.bedrock_client:
-                response = self.bedrock_client.invoke_model(
+                response = invoke_model(self.bedrock_client,
                     modelId="anthropic.claude-3-sonnet-20240229-v1:0",
                     body=json.dumps({
                         "anthropic_version": "bedrock-2023-05-31",
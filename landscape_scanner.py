@@ -16,32 +16,123 @@ Features:
 
 import streamlit as st
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any, Callable
-from dataclasses import dataclass, field
+from typing import Optional, Dict, List, Any, Callable, Tuple
+from dataclasses import dataclass, field, fields
+from enum import StrEnum
+import threading
 import json
 
+from aws_utils import iter_paginated
+from async_operations import AsyncConfig, AsyncScanner, ThrottledSession, run_async
+from region_activity import RegionActivityProber
+from scoring_engine import FindingsTable
+from resource_fingerprints import (
+    IncrementalScanState, run_incremental_check, config_changed_resources
+)
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+class Severity(StrEnum):
+    """Finding severity (compares equal to its string value)"""
+    CRITICAL = "CRITICAL"
+    HIGH = "HIGH"
+    MEDIUM = "MEDIUM"
+    LOW = "LOW"
+    INFO = "INFO"
+
+class Pillar(StrEnum):
+    """WAF pillar (compares equal to its string value)"""
+    SECURITY = "Security"
+    RELIABILITY = "Reliability"
+    PERFORMANCE_EFFICIENCY = "Performance Efficiency"
+    COST_OPTIMIZATION = "Cost Optimization"
+    OPERATIONAL_EXCELLENCE = "Operational Excellence"
+    SUSTAINABILITY = "Sustainability"
+
+class SharedText:
+    """
+    Registry of recommendation text and step / framework lists.
+
+    Scanners emit the same static recommendation and remediation steps
+    for every resource a check flags; interning them means thousands of
+    findings point at one shared string or tuple instead of each holding
+    a copy. Bounded so per-resource text cannot grow it without limit.
+    """
+    
+    def __init__(self, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self._entries: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+    
+    def intern(self, value):
+        shared = self._entries.get(value)
+        if shared is not None:
+            return shared
+        with self._lock:
+            if len(self._entries) < self.max_entries:
+                return self._entries.setdefault(value, value)
+        return value
+    
+    def intern_tuple(self, values) -> Tuple[str, ...]:
+        if not values:
+            return ()
+        return self.intern(tuple(values))
+
+SHARED_TEXT = SharedText()
+
+@dataclass(slots=True)
 class Finding:
-    """Represents a WAF-related finding"""
+    """
+    Represents a WAF-related finding.
+    
+    Slotted, with severity / pillar coerced to Severity / Pillar (values
+    outside those enums are kept as given) and recommendation,
+    remediation_steps and compliance_frameworks shared through
+    SHARED_TEXT. to_dict() / from_dict() round-trip the plain dict shape.
+    """
     id: str
     title: str
     description: str
-    severity: str  # CRITICAL, HIGH, MEDIUM, LOW, INFO
-    pillar: str
+    severity: Severity  # CRITICAL, HIGH, MEDIUM, LOW, INFO
+    pillar: Pillar
     source_service: str
     affected_resources: List[str] = field(default_factory=list)
     recommendation: str = ""
-    remediation_steps: List[str] = field(default_factory=list)
+    remediation_steps: Tuple[str, ...] = ()
     account_id: str = ""
     region: str = ""
     estimated_savings: float = 0.0
     effort: str = "Medium"
     aws_doc_link: str = ""
-    compliance_frameworks: List[str] = field(default_factory=list)
+    compliance_frameworks: Tuple[str, ...] = ()
+    
+    def __post_init__(self):
+        self.severity = Severity._value2member_map_.get(self.severity, self.severity)
+        self.pillar = Pillar._value2member_map_.get(self.pillar, self.pillar)
+        self.recommendation = SHARED_TEXT.intern(self.recommendation)
+        self.remediation_steps = SHARED_TEXT.intern_tuple(self.remediation_steps)
+        self.compliance_frameworks = SHARED_TEXT.intern_tuple(self.compliance_frameworks)
+        self.effort = SHARED_TEXT.intern(self.effort)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict with string severity / pillar and list fields"""
+        data = {name: getattr(self, name) for name in _FINDING_FIELDS}
+        if isinstance(self.severity, Severity):
+            data['severity'] = self.severity.value
+        if isinstance(self.pillar, Pillar):
+            data['pillar'] = self.pillar.value
+        data['affected_resources'] = list(self.affected_resources)
+        data['remediation_steps'] = list(self.remediation_steps)
+        data['compliance_frameworks'] = list(self.compliance_frameworks)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Finding':
+        return cls(**{name: data[name] for name in _FINDING_FIELDS if name in data})
+
+_FINDING_FIELDS = tuple(f.name for f in fields(Finding))
 
 @dataclass
 class ResourceInventory:
@@ -174,6 +265,12 @@ class LandscapeAssessment:
     # AI/ML Assessment (NEW)
     aiml_health_score: int = 0
     aiml_findings: List[Finding] = field(default_factory=list)
+    # Per-region inventory breakdown ("global" holds account-wide services)
+    region_inventories: Dict[str, ResourceInventory] = field(default_factory=dict)
+    # Requested regions skipped because the region index showed them empty
+    skipped_regions: List[str] = field(default_factory=list)
+    # Incremental scan counters ({'checked': n, 'carried_forward': n}), empty for full scans
+    incremental_stats: Dict[str, int] = field(default_factory=dict)
 
 # ============================================================================
 # DEMO DATA GENERATOR
@@ -754,6 +851,74 @@ def generate_demo_assessment() -> LandscapeAssessment:
         aiml_findings=aiml_findings
     )
 
+# ============================================================================
+# CONCURRENT SCAN SUPPORT
+# ============================================================================
+
+# Scan scopes: regional services are scanned in every requested region,
+# global services once per account, and home-region services once in the
+# first requested region (account-wide settings read through a regional API).
+SCOPE_REGIONAL = "regional"
+SCOPE_GLOBAL = "global"
+SCOPE_HOME = "home"
+
+GLOBAL_REGION_KEY = "global"
+
+
+@dataclass
+class ScanTask:
+    """One service scan, optionally bound to a region"""
+    name: str
+    label: str
+    func: Callable
+    args: tuple = ()
+    region: Optional[str] = None
+
+# Scan tasks that hit the same AWS API share one concurrency limit so that a
+# concurrent scan does not trip per-service request throttling.
+SCAN_TASK_API_FAMILY = {
+    "EC2": "ec2",
+    "EBS": "ec2",
+    "VPC": "ec2",
+    "Transit Gateway": "ec2",
+    "IAM": "iam",
+    "S3": "s3",
+    "Trusted Advisor": "support",
+    "Budgets": "billing",
+    "Cost Anomaly Detection": "billing",
+    "Cost Explorer": "billing",
+}
+
+SERVICE_CONCURRENCY_LIMITS = {
+    "ec2": 3,
+    "iam": 2,
+    "s3": 2,
+    "support": 1,
+    "billing": 1,
+}
+DEFAULT_SERVICE_CONCURRENCY = 2
+
+
+def merge_inventory(target: ResourceInventory, delta: ResourceInventory) -> ResourceInventory:
+    """
+    Merge a partial inventory into target in place.
+
+    Counters are summed, flags are OR-ed and list fields are unioned in
+    first-seen order, so partial inventories built from an empty
+    ResourceInventory combine into the same totals as a single pass.
+    """
+    for f in fields(ResourceInventory):
+        current = getattr(target, f.name)
+        value = getattr(delta, f.name)
+        if isinstance(current, bool):
+            setattr(target, f.name, current or value)
+        elif isinstance(current, (int, float)):
+            setattr(target, f.name, current + value)
+        elif isinstance(current, list):
+            current.extend(v for v in value if v not in current)
+    return target
+
+
 # ============================================================================
 # AWS SCANNER CLASS
 # ============================================================================
@@ -768,309 +933,355 @@ class AWSLandscapeScanner:
         self.inventory = ResourceInventory()
         self.scan_status = {}
         self.scan_errors = {}
+        self.region_inventories: Dict[str, ResourceInventory] = {}
+        self._finding_ids = set()
+        self._incremental: Optional[IncrementalScanState] = None
         
         try:
             sts = session.client('sts')
             self.account_id = sts.get_caller_identity()['Account']
         except:
             pass
-    
+
+    def _fork(self, session=None) -> 'AWSLandscapeScanner':
+        """Create an empty scanner for one task, sharing session and account"""
+        shard = AWSLandscapeScanner.__new__(AWSLandscapeScanner)
+        shard.session = session or self.session
+        shard.account_id = self.account_id
+        shard.findings = []
+        shard.inventory = ResourceInventory()
+        shard.scan_status = {}
+        shard.scan_errors = {}
+        shard.region_inventories = {}
+        shard._finding_ids = set()
+        shard._incremental = self._incremental
+        return shard
+
+    def _merge_shard(self, shard: 'AWSLandscapeScanner'):
+        """Fold a task scanner's findings, inventory and errors into this one"""
+        self.findings.extend(shard.findings)
+        merge_inventory(self.inventory, shard.inventory)
+        self.scan_errors.update(shard.scan_errors)
+
+    def _check_resource(self, resource_type: str, resource_id: str, region: Optional[str],
+                        config: Any, check: Callable[[List[Finding]], None], check_name: str = ''):
+        """
+        Run check(findings) for one resource.
+
+        On incremental scans an unchanged resource's previous findings and
+        inventory counts are replayed instead of calling its APIs again.
+        Pass check_name when more than one scan checks the same resource.
+        """
+        run_incremental_check(
+            self._incremental, self.findings, resource_type, resource_id,
+            region or GLOBAL_REGION_KEY, config, check,
+            counters=self.inventory,
+            to_dict=Finding.to_dict,
+            from_dict=Finding.from_dict,
+            check_name=check_name,
+        )
+
     def _scan_iam(self):
         """Enhanced IAM scanning with MFA, console access, and key rotation checks"""
         iam = self.session.client('iam')
         
-        users = iam.list_users()['Users']
-        self.inventory.iam_users = len(users)
-        
-        for user in users[:50]:  # Check more users
+        for user in iter_paginated(iam, 'list_users', 'Users'):
+            self.inventory.iam_users += 1
             username = user['UserName']
-            
-            try:
-                # Check MFA
-                mfa = iam.list_mfa_devices(UserName=username)['MFADevices']
-                if not mfa:
-                    # Check if user has console access
-                    try:
-                        login_profile = iam.get_login_profile(UserName=username)
-                        self.inventory.iam_users_console_access += 1
-                        self.inventory.iam_users_no_mfa += 1
+
+            def check(findings):
+                try:
+                    # Check MFA
+                    mfa = iam.list_mfa_devices(UserName=username)['MFADevices']
+                    if not mfa:
+                        # Check if user has console access
+                        try:
+                            login_profile = iam.get_login_profile(UserName=username)
+                            self.inventory.iam_users_console_access += 1
+                            self.inventory.iam_users_no_mfa += 1
                         
-                        self.findings.append(Finding(
-                            id=f"iam-nomfa-{username}",
-                            title=f"IAM User Without MFA: {username}",
-                            description=f"User {username} has console access but no MFA enabled",
-                            severity='HIGH',
-                            pillar='Security',
-                            source_service="IAM",
-                            affected_resources=[username],
-                            recommendation="Enable MFA for all users with console access",
-                            remediation_steps=[
-                                "Sign in as the user",
-                                "Go to Security Credentials",
-                                "Activate MFA with virtual or hardware device"
-                            ],
-                            effort="Low",
-                            compliance_frameworks=["CIS AWS", "NIST", "ISO27001", "PCI-DSS"]
-                        ))
-                    except:
-                        pass
-                
-                # Check for old access keys
-                keys = iam.list_access_keys(UserName=username)['AccessKeyMetadata']
-                for key in keys:
-                    if key['Status'] == 'Active':
-                        age = (datetime.now(key['CreateDate'].tzinfo) - key['CreateDate']).days
-                        if age > 90:
-                            self.findings.append(Finding(
-                                id=f"iam-oldkey-{username}-{key['AccessKeyId'][:8]}",
-                                title=f"Old IAM Access Key: {username}",
-                                description=f"Access key is {age} days old (>90 days)",
-                                severity='MEDIUM',
+                            findings.append(Finding(
+                                id=f"iam-nomfa-{username}",
+                                title=f"IAM User Without MFA: {username}",
+                                description=f"User {username} has console access but no MFA enabled",
+                                severity='HIGH',
                                 pillar='Security',
                                 source_service="IAM",
                                 affected_resources=[username],
-                                recommendation="Rotate access keys every 90 days",
+                                recommendation="Enable MFA for all users with console access",
+                                remediation_steps=[
+                                    "Sign in as the user",
+                                    "Go to Security Credentials",
+                                    "Activate MFA with virtual or hardware device"
+                                ],
                                 effort="Low",
-                                compliance_frameworks=["CIS AWS", "PCI-DSS"]
+                                compliance_frameworks=["CIS AWS", "NIST", "ISO27001", "PCI-DSS"]
                             ))
-            except:
-                pass
+                        except:
+                            pass
+                
+                    # Check for old access keys
+                    for key in iter_paginated(iam, 'list_access_keys', 'AccessKeyMetadata',
+                                              UserName=username):
+                        if key['Status'] == 'Active':
+                            age = (datetime.now(key['CreateDate'].tzinfo) - key['CreateDate']).days
+                            if age > 90:
+                                findings.append(Finding(
+                                    id=f"iam-oldkey-{username}-{key['AccessKeyId'][:8]}",
+                                    title=f"Old IAM Access Key: {username}",
+                                    description=f"Access key is {age} days old (>90 days)",
+                                    severity='MEDIUM',
+                                    pillar='Security',
+                                    source_service="IAM",
+                                    affected_resources=[username],
+                                    recommendation="Rotate access keys every 90 days",
+                                    effort="Low",
+                                    compliance_frameworks=["CIS AWS", "PCI-DSS"]
+                                ))
+                except:
+                    pass
+
+            self._check_resource('AWS::IAM::User', username, GLOBAL_REGION_KEY, user, check)
         
-        self.inventory.iam_roles = len(iam.list_roles()['Roles'])
-        self.inventory.iam_policies = len(iam.list_policies(Scope='Local')['Policies'])
+        self.inventory.iam_roles = sum(1 for _ in iter_paginated(iam, 'list_roles', 'Roles'))
+        self.inventory.iam_policies = sum(
+            1 for _ in iter_paginated(iam, 'list_policies', 'Policies', Scope='Local')
+        )
     
     def _scan_s3(self):
         """Enhanced S3 scanning with encryption, public access, versioning, and logging checks"""
         s3 = self.session.client('s3')
-        buckets = s3.list_buckets()['Buckets']
-        self.inventory.s3_buckets = len(buckets)
-        
-        for bucket in buckets[:100]:  # Limit to avoid throttling
+        for bucket in iter_paginated(s3, 'list_buckets', 'Buckets'):
+            self.inventory.s3_buckets += 1
             bucket_name = bucket['Name']
-            
-            try:
-                # Check public access
+
+            def check(findings):
                 try:
-                    public_block = s3.get_public_access_block(Bucket=bucket_name)
-                    config = public_block['PublicAccessBlockConfiguration']
-                    if not all([config['BlockPublicAcls'], config['BlockPublicPolicy'], 
-                               config['IgnorePublicAcls'], config['RestrictPublicBuckets']]):
-                        self.inventory.s3_public += 1
+                    # Check public access
+                    try:
+                        public_block = s3.get_public_access_block(Bucket=bucket_name)
+                        config = public_block['PublicAccessBlockConfiguration']
+                        if not all([config['BlockPublicAcls'], config['BlockPublicPolicy'], 
+                                   config['IgnorePublicAcls'], config['RestrictPublicBuckets']]):
+                            self.inventory.s3_public += 1
                         
-                        self.findings.append(Finding(
-                            id=f"s3-public-{bucket_name[:20]}",
-                            title=f"S3 Bucket May Have Public Access: {bucket_name}",
-                            description=f"Bucket {bucket_name} does not have all public access blocks enabled",
-                            severity='CRITICAL',
+                            findings.append(Finding(
+                                id=f"s3-public-{bucket_name[:20]}",
+                                title=f"S3 Bucket May Have Public Access: {bucket_name}",
+                                description=f"Bucket {bucket_name} does not have all public access blocks enabled",
+                                severity='CRITICAL',
+                                pillar='Security',
+                                source_service="S3",
+                                affected_resources=[bucket_name],
+                                recommendation="Enable Block All Public Access unless specifically required",
+                                remediation_steps=[
+                                    "Go to S3 console",
+                                    "Select bucket",
+                                    "Go to Permissions tab",
+                                    "Edit Block Public Access settings",
+                                    "Enable all four settings"
+                                ],
+                                effort="Low",
+                                compliance_frameworks=["CIS AWS", "PCI-DSS", "HIPAA", "GDPR"]
+                            ))
+                    except s3.exceptions.NoSuchPublicAccessBlockConfiguration:
+                        self.inventory.s3_public += 1
+                
+                    # Check encryption
+                    try:
+                        encryption = s3.get_bucket_encryption(Bucket=bucket_name)
+                    except s3.exceptions.ServerSideEncryptionConfigurationNotFoundError:
+                        self.inventory.s3_unencrypted += 1
+                    
+                        findings.append(Finding(
+                            id=f"s3-noenc-{bucket_name[:20]}",
+                            title=f"S3 Bucket Without Encryption: {bucket_name}",
+                            description=f"Bucket {bucket_name} does not have default encryption enabled",
+                            severity='HIGH',
                             pillar='Security',
                             source_service="S3",
                             affected_resources=[bucket_name],
-                            recommendation="Enable Block All Public Access unless specifically required",
+                            recommendation="Enable default encryption with SSE-KMS or SSE-S3",
                             remediation_steps=[
                                 "Go to S3 console",
                                 "Select bucket",
-                                "Go to Permissions tab",
-                                "Edit Block Public Access settings",
-                                "Enable all four settings"
+                                "Go to Properties",
+                                "Enable Default Encryption",
+                                "Choose SSE-KMS (recommended) or SSE-S3"
                             ],
                             effort="Low",
-                            compliance_frameworks=["CIS AWS", "PCI-DSS", "HIPAA", "GDPR"]
+                            compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
                         ))
-                except s3.exceptions.NoSuchPublicAccessBlockConfiguration:
-                    self.inventory.s3_public += 1
                 
-                # Check encryption
-                try:
-                    encryption = s3.get_bucket_encryption(Bucket=bucket_name)
-                except s3.exceptions.ServerSideEncryptionConfigurationNotFoundError:
-                    self.inventory.s3_unencrypted += 1
-                    
-                    self.findings.append(Finding(
-                        id=f"s3-noenc-{bucket_name[:20]}",
-                        title=f"S3 Bucket Without Encryption: {bucket_name}",
-                        description=f"Bucket {bucket_name} does not have default encryption enabled",
-                        severity='HIGH',
-                        pillar='Security',
-                        source_service="S3",
-                        affected_resources=[bucket_name],
-                        recommendation="Enable default encryption with SSE-KMS or SSE-S3",
-                        remediation_steps=[
-                            "Go to S3 console",
-                            "Select bucket",
-                            "Go to Properties",
-                            "Enable Default Encryption",
-                            "Choose SSE-KMS (recommended) or SSE-S3"
-                        ],
-                        effort="Low",
-                        compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
-                    ))
+                    # Check versioning
+                    try:
+                        versioning = s3.get_bucket_versioning(Bucket=bucket_name)
+                        if versioning.get('Status') == 'Enabled':
+                            self.inventory.s3_versioning_enabled += 1
+                    except:
+                        pass
                 
-                # Check versioning
-                try:
-                    versioning = s3.get_bucket_versioning(Bucket=bucket_name)
-                    if versioning.get('Status') == 'Enabled':
-                        self.inventory.s3_versioning_enabled += 1
-                except:
+                except Exception as e:
                     pass
-                
-            except Exception as e:
-                pass
+
+            self._check_resource('AWS::S3::Bucket', bucket_name, GLOBAL_REGION_KEY,
+                                 bucket, check)
     
     def _scan_ec2(self, region: str):
         """Enhanced EC2 scanning with stopped instances and security group checks"""
         ec2 = self.session.client('ec2', region_name=region)
         
         # Instances
-        for reservation in ec2.describe_instances()['Reservations']:
-            for instance in reservation['Instances']:
-                self.inventory.ec2_instances += 1
+        for instance in iter_paginated(ec2, 'describe_instances', 'Reservations[].Instances[]'):
+            self.inventory.ec2_instances += 1
+
+            def check(findings):
                 state = instance['State']['Name']
-                
+
                 if state == 'running':
                     self.inventory.ec2_running += 1
                 elif state == 'stopped':
                     self.inventory.ec2_stopped += 1
-        
-        # Volumes
-        volumes = ec2.describe_volumes()['Volumes']
-        for vol in volumes:
-            self.inventory.ebs_volumes += 1
-            if vol['State'] == 'available':
-                self.inventory.ebs_unattached += 1
-            if not vol.get('Encrypted'):
-                self.inventory.ebs_unencrypted += 1
-        
-        # VPCs and security groups
-        self.inventory.vpcs = len(ec2.describe_vpcs()['Vpcs'])
-        
+
+            self._check_resource('AWS::EC2::Instance', instance['InstanceId'], region,
+                                 instance, check)
+
+        # Volume, VPC and security group counts are owned by the EBS and VPC
+        # scans so that merged inventories do not count them twice.
+
         # Security groups - check for overly permissive rules
-        sgs = ec2.describe_security_groups()['SecurityGroups']
-        self.inventory.security_groups = len(sgs)
-        
-        for sg in sgs[:50]:
-            for rule in sg.get('IpPermissions', []):
-                for ip_range in rule.get('IpRanges', []):
-                    if ip_range.get('CidrIp') == '0.0.0.0/0':
-                        self.inventory.security_groups_open += 1
+        for sg in iter_paginated(ec2, 'describe_security_groups', 'SecurityGroups'):
+
+            def check(findings):
+                for rule in sg.get('IpPermissions', []):
+                    for ip_range in rule.get('IpRanges', []):
+                        if ip_range.get('CidrIp') == '0.0.0.0/0':
+                            self.inventory.security_groups_open += 1
                         
-                        from_port = rule.get('FromPort', 'all')
-                        severity = 'CRITICAL' if from_port in [22, 3389] else 'HIGH'
+                            from_port = rule.get('FromPort', 'all')
+                            severity = 'CRITICAL' if from_port in [22, 3389] else 'HIGH'
                         
-                        self.findings.append(Finding(
-                            id=f"sg-open-{sg['GroupId'][:12]}-{from_port}",
-                            title=f"Security Group Open to Internet: {sg['GroupName']}",
-                            description=f"Allows inbound traffic on port {from_port} from 0.0.0.0/0",
-                            severity=severity,
-                            pillar='Security',
-                            source_service="EC2",
-                            affected_resources=[sg['GroupId']],
-                            recommendation="Restrict to specific IP ranges",
-                            effort="Medium",
-                            compliance_frameworks=["CIS AWS", "PCI-DSS"]
-                        ))
-                        break
+                            findings.append(Finding(
+                                id=f"sg-open-{sg['GroupId'][:12]}-{from_port}",
+                                title=f"Security Group Open to Internet: {sg['GroupName']}",
+                                description=f"Allows inbound traffic on port {from_port} from 0.0.0.0/0",
+                                severity=severity,
+                                pillar='Security',
+                                source_service="EC2",
+                                affected_resources=[sg['GroupId']],
+                                recommendation="Restrict to specific IP ranges",
+                                effort="Medium",
+                                compliance_frameworks=["CIS AWS", "PCI-DSS"]
+                            ))
+                            break
+
+            self._check_resource('AWS::EC2::SecurityGroup', sg['GroupId'], region, sg, check,
+                                 check_name='ec2')
     
     def _scan_rds(self, region: str):
         """Enhanced RDS scanning with encryption, backups, and public access checks"""
         try:
             rds = self.session.client('rds', region_name=region)
-            dbs = rds.describe_db_instances()['DBInstances']
-            
-            for db in dbs:
+            for db in iter_paginated(rds, 'describe_db_instances', 'DBInstances'):
                 self.inventory.rds_instances += 1
                 db_id = db['DBInstanceIdentifier']
                 
-                # Check Multi-AZ
-                if db.get('MultiAZ'):
-                    self.inventory.rds_multi_az += 1
-                else:
-                    severity = 'MEDIUM' if db.get('DBInstanceClass', '').startswith('db.t') else 'HIGH'
+                def check(findings):
+                    # Check Multi-AZ
+                    if db.get('MultiAZ'):
+                        self.inventory.rds_multi_az += 1
+                    else:
+                        severity = 'MEDIUM' if db.get('DBInstanceClass', '').startswith('db.t') else 'HIGH'
                     
-                    self.findings.append(Finding(
-                        id=f"rds-singleaz-{db_id[:20]}",
-                        title=f"RDS Instance Not Multi-AZ: {db_id}",
-                        description="Database is deployed in single AZ",
-                        severity=severity,
-                        pillar='Reliability',
-                        source_service="RDS",
-                        affected_resources=[db_id],
-                        recommendation="Enable Multi-AZ for production databases",
-                        remediation_steps=[
-                            "Plan maintenance window",
-                            "Modify RDS instance",
-                            "Enable Multi-AZ deployment",
-                            "Test failover"
-                        ],
-                        effort="Low"
-                    ))
+                        findings.append(Finding(
+                            id=f"rds-singleaz-{db_id[:20]}",
+                            title=f"RDS Instance Not Multi-AZ: {db_id}",
+                            description="Database is deployed in single AZ",
+                            severity=severity,
+                            pillar='Reliability',
+                            source_service="RDS",
+                            affected_resources=[db_id],
+                            recommendation="Enable Multi-AZ for production databases",
+                            remediation_steps=[
+                                "Plan maintenance window",
+                                "Modify RDS instance",
+                                "Enable Multi-AZ deployment",
+                                "Test failover"
+                            ],
+                            effort="Low"
+                        ))
                 
-                # Check encryption
-                if db.get('StorageEncrypted'):
-                    self.inventory.rds_encrypted += 1
-                else:
-                    self.findings.append(Finding(
-                        id=f"rds-noenc-{db_id[:20]}",
-                        title=f"RDS Instance Not Encrypted: {db_id}",
-                        description="Database storage is not encrypted at rest",
-                        severity='CRITICAL',
-                        pillar='Security',
-                        source_service="RDS",
-                        affected_resources=[db_id],
-                        recommendation="Create encrypted snapshot and restore",
-                        effort="High",
-                        compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
-                    ))
+                    # Check encryption
+                    if db.get('StorageEncrypted'):
+                        self.inventory.rds_encrypted += 1
+                    else:
+                        findings.append(Finding(
+                            id=f"rds-noenc-{db_id[:20]}",
+                            title=f"RDS Instance Not Encrypted: {db_id}",
+                            description="Database storage is not encrypted at rest",
+                            severity='CRITICAL',
+                            pillar='Security',
+                            source_service="RDS",
+                            affected_resources=[db_id],
+                            recommendation="Create encrypted snapshot and restore",
+                            effort="High",
+                            compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
+                        ))
                 
-                # Check backups
-                if db.get('BackupRetentionPeriod', 0) > 0:
-                    self.inventory.rds_backup_enabled += 1
-                else:
-                    self.findings.append(Finding(
-                        id=f"rds-nobackup-{db_id[:20]}",
-                        title=f"RDS Without Automated Backups: {db_id}",
-                        description="Automated backups are not configured",
-                        severity='HIGH',
-                        pillar='Reliability',
-                        source_service="RDS",
-                        affected_resources=[db_id],
-                        recommendation="Enable automated backups with 7+ day retention",
-                        remediation_steps=[
-                            "Modify DB instance",
-                            "Set backup retention period to 7-35 days",
-                            "Configure backup window",
-                            "Verify backups are being created"
-                        ],
-                        effort="Low",
-                        compliance_frameworks=["SOC2", "ISO27001"]
-                    ))
+                    # Check backups
+                    if db.get('BackupRetentionPeriod', 0) > 0:
+                        self.inventory.rds_backup_enabled += 1
+                    else:
+                        findings.append(Finding(
+                            id=f"rds-nobackup-{db_id[:20]}",
+                            title=f"RDS Without Automated Backups: {db_id}",
+                            description="Automated backups are not configured",
+                            severity='HIGH',
+                            pillar='Reliability',
+                            source_service="RDS",
+                            affected_resources=[db_id],
+                            recommendation="Enable automated backups with 7+ day retention",
+                            remediation_steps=[
+                                "Modify DB instance",
+                                "Set backup retention period to 7-35 days",
+                                "Configure backup window",
+                                "Verify backups are being created"
+                            ],
+                            effort="Low",
+                            compliance_frameworks=["SOC2", "ISO27001"]
+                        ))
                 
-                # Check public accessibility
-                if db.get('PubliclyAccessible'):
-                    self.findings.append(Finding(
-                        id=f"rds-public-{db_id[:20]}",
-                        title=f"RDS Instance Publicly Accessible: {db_id}",
-                        description="Database is accessible from the internet",
-                        severity='CRITICAL',
-                        pillar='Security',
-                        source_service="RDS",
-                        affected_resources=[db_id],
-                        recommendation="Disable public accessibility",
-                        effort="Low",
-                        compliance_frameworks=["CIS AWS", "PCI-DSS"]
-                    ))
+                    # Check public accessibility
+                    if db.get('PubliclyAccessible'):
+                        findings.append(Finding(
+                            id=f"rds-public-{db_id[:20]}",
+                            title=f"RDS Instance Publicly Accessible: {db_id}",
+                            description="Database is accessible from the internet",
+                            severity='CRITICAL',
+                            pillar='Security',
+                            source_service="RDS",
+                            affected_resources=[db_id],
+                            recommendation="Disable public accessibility",
+                            effort="Low",
+                            compliance_frameworks=["CIS AWS", "PCI-DSS"]
+                        ))
+
+                self._check_resource('AWS::RDS::DBInstance', db_id, region, db, check)
         except:
             pass
     
     def _scan_vpc(self, region: str):
         """Scan VPC"""
         ec2 = self.session.client('ec2', region_name=region)
-        self.inventory.security_groups = len(ec2.describe_security_groups()['SecurityGroups'])
+        self.inventory.security_groups = sum(
+            1 for _ in iter_paginated(ec2, 'describe_security_groups', 'SecurityGroups')
+        )
     
     def _scan_cloudtrail(self, region: str):
         """Enhanced CloudTrail scanning with multi-region and validation checks"""
         try:
             ct = self.session.client('cloudtrail', region_name=region)
-            trails = ct.describe_trails()['trailList']
+            trails = list(iter_paginated(ct, 'describe_trails', 'trailList'))
             
             has_multiregion = any(t.get('IsMultiRegionTrail') for t in trails)
             
@@ -1115,63 +1326,62 @@ class AWSLandscapeScanner:
 # ADD THESE METHODS TO THE AWSLandscapeScanner CLASS
 # Insert after the existing _scan_cloudtrail method
 
-    def _scan_kms(self):
+    def _scan_kms(self, region: str = None):
         """Scan KMS keys for rotation"""
         try:
-            kms = self.session.client('kms')
-            keys = kms.list_keys()['Keys']
-            
-            for key in keys[:50]:  # Limit to avoid throttling
+            kms = self.session.client('kms', region_name=region)
+            for key in iter_paginated(kms, 'list_keys', 'Keys'):
                 key_id = key['KeyId']
-                
-                try:
-                    metadata = kms.describe_key(KeyId=key_id)['KeyMetadata']
+
+                def check(findings):
+                    try:
+                        metadata = kms.describe_key(KeyId=key_id)['KeyMetadata']
                     
-                    # Skip AWS managed keys
-                    if metadata['KeyManager'] == 'AWS':
-                        continue
+                        # Skip AWS managed keys
+                        if metadata['KeyManager'] == 'AWS':
+                            return
                     
-                    self.inventory.kms_keys += 1
+                        self.inventory.kms_keys += 1
                     
-                    # Check key rotation
-                    try:
-                        rotation = kms.get_key_rotation_status(KeyId=key_id)
-                        if not rotation['KeyRotationEnabled']:
-                            self.inventory.kms_keys_no_rotation += 1
+                        # Check key rotation
+                        try:
+                            rotation = kms.get_key_rotation_status(KeyId=key_id)
+                            if not rotation['KeyRotationEnabled']:
+                                self.inventory.kms_keys_no_rotation += 1
                             
-                            self.findings.append(Finding(
-                                id=f"kms-norot-{key_id[:8]}",
-                                title=f"KMS Key Without Rotation: {metadata.get('Description', key_id[:16])}",
-                                description="Automatic key rotation is not enabled",
-                                severity='MEDIUM',
-                                pillar='Security',
-                                source_service="KMS",
-                                affected_resources=[key_id],
-                                recommendation="Enable automatic key rotation",
-                                remediation_steps=[
-                                    "Go to KMS console",
-                                    "Select the key",
-                                    "Go to Key rotation tab",
-                                    "Enable automatic key rotation"
-                                ],
-                                effort="Low",
-                                compliance_frameworks=["PCI-DSS", "HIPAA", "ISO27001"]
-                            ))
+                                findings.append(Finding(
+                                    id=f"kms-norot-{key_id[:8]}",
+                                    title=f"KMS Key Without Rotation: {metadata.get('Description', key_id[:16])}",
+                                    description="Automatic key rotation is not enabled",
+                                    severity='MEDIUM',
+                                    pillar='Security',
+                                    source_service="KMS",
+                                    affected_resources=[key_id],
+                                    recommendation="Enable automatic key rotation",
+                                    remediation_steps=[
+                                        "Go to KMS console",
+                                        "Select the key",
+                                        "Go to Key rotation tab",
+                                        "Enable automatic key rotation"
+                                    ],
+                                    effort="Low",
+                                    compliance_frameworks=["PCI-DSS", "HIPAA", "ISO27001"]
+                                ))
+                        except:
+                            pass
                     except:
                         pass
-                except:
-                    pass
+
+                self._check_resource('AWS::KMS::Key', key_id, region, key, check)
         except:
             pass
     
-    def _scan_secrets_manager(self):
+    def _scan_secrets_manager(self, region: str = None):
         """Scan Secrets Manager for rotation"""
         try:
-            sm = self.session.client('secretsmanager')
-            secrets = sm.list_secrets()['SecretList']
-            self.inventory.secrets_manager_secrets = len(secrets)
-            
-            for secret in secrets[:50]:
+            sm = self.session.client('secretsmanager', region_name=region)
+            for secret in iter_paginated(sm, 'list_secrets', 'SecretList'):
+                self.inventory.secrets_manager_secrets += 1
                 if not secret.get('RotationEnabled'):
                     self.findings.append(Finding(
                         id=f"sm-norot-{secret['Name'][:20]}",
@@ -1192,7 +1402,7 @@ class AWSLandscapeScanner:
         """Scan GuardDuty for threat detection"""
         try:
             gd = self.session.client('guardduty', region_name=region)
-            detectors = gd.list_detectors()['DetectorIds']
+            detectors = list(iter_paginated(gd, 'list_detectors', 'DetectorIds'))
             
             if detectors:
                 self.inventory.guardduty_enabled = True
@@ -1278,8 +1488,8 @@ class AWSLandscapeScanner:
                     
                     # Check compliance
                     try:
-                        rules = config.describe_compliance_by_config_rule()
-                        for rule in rules.get('ComplianceByConfigRules', [])[:20]:
+                        for rule in iter_paginated(config, 'describe_compliance_by_config_rule',
+                                                   'ComplianceByConfigRules'):
                             if rule['Compliance']['ComplianceType'] == 'NON_COMPLIANT':
                                 self.findings.append(Finding(
                                     id=f"config-nc-{rule['ConfigRuleName'][:20]}",
@@ -1341,44 +1551,45 @@ class AWSLandscapeScanner:
         try:
             lmb = self.session.client('lambda', region_name=region)
             
-            functions = lmb.list_functions()['Functions']
-            self.inventory.lambda_functions = len(functions)
-            
-            for func in functions[:50]:
+            for func in iter_paginated(lmb, 'list_functions', 'Functions'):
+                self.inventory.lambda_functions += 1
                 func_name = func['FunctionName']
                 
-                # Check for DLQ
-                if 'DeadLetterConfig' not in func or not func.get('DeadLetterConfig', {}).get('TargetArn'):
-                    self.findings.append(Finding(
-                        id=f"lambda-nodlq-{func_name[:20]}",
-                        title=f"Lambda Without DLQ: {func_name}",
-                        description="No Dead Letter Queue configured for failed invocations",
-                        severity='MEDIUM',
-                        pillar='Reliability',
-                        source_service="Lambda",
-                        affected_resources=[func_name],
-                        recommendation="Configure SQS or SNS Dead Letter Queue",
-                        effort="Low"
-                    ))
+                def check(findings):
+                    # Check for DLQ
+                    if 'DeadLetterConfig' not in func or not func.get('DeadLetterConfig', {}).get('TargetArn'):
+                        findings.append(Finding(
+                            id=f"lambda-nodlq-{func_name[:20]}",
+                            title=f"Lambda Without DLQ: {func_name}",
+                            description="No Dead Letter Queue configured for failed invocations",
+                            severity='MEDIUM',
+                            pillar='Reliability',
+                            source_service="Lambda",
+                            affected_resources=[func_name],
+                            recommendation="Configure SQS or SNS Dead Letter Queue",
+                            effort="Low"
+                        ))
                 
-                # Check for secrets in environment variables
-                if 'Environment' in func:
-                    env_vars = func['Environment'].get('Variables', {})
-                    for key in env_vars.keys():
-                        if any(word in key.lower() for word in ['password', 'secret', 'key', 'token', 'api']):
-                            self.findings.append(Finding(
-                                id=f"lambda-envsecret-{func_name[:20]}",
-                                title=f"Potential Secret in Environment: {func_name}",
-                                description=f"Environment variable '{key}' may contain sensitive data",
-                                severity='HIGH',
-                                pillar='Security',
-                                source_service="Lambda",
-                                affected_resources=[func_name],
-                                recommendation="Use AWS Secrets Manager or Parameter Store",
-                                effort="Medium",
-                                compliance_frameworks=["SOC2", "ISO27001"]
-                            ))
-                            break
+                    # Check for secrets in environment variables
+                    if 'Environment' in func:
+                        env_vars = func['Environment'].get('Variables', {})
+                        for key in env_vars.keys():
+                            if any(word in key.lower() for word in ['password', 'secret', 'key', 'token', 'api']):
+                                findings.append(Finding(
+                                    id=f"lambda-envsecret-{func_name[:20]}",
+                                    title=f"Potential Secret in Environment: {func_name}",
+                                    description=f"Environment variable '{key}' may contain sensitive data",
+                                    severity='HIGH',
+                                    pillar='Security',
+                                    source_service="Lambda",
+                                    affected_resources=[func_name],
+                                    recommendation="Use AWS Secrets Manager or Parameter Store",
+                                    effort="Medium",
+                                    compliance_frameworks=["SOC2", "ISO27001"]
+                                ))
+                                break
+
+                self._check_resource('AWS::Lambda::Function', func_name, region, func, check)
         except:
             pass
     
@@ -1387,38 +1598,41 @@ class AWSLandscapeScanner:
         try:
             ddb = self.session.client('dynamodb', region_name=region)
             
-            tables = ddb.list_tables()['TableNames']
-            self.inventory.dynamodb_tables = len(tables)
-            
-            for table_name in tables[:20]:
-                try:
-                    table = ddb.describe_table(TableName=table_name)['Table']
+            for table_name in iter_paginated(ddb, 'list_tables', 'TableNames'):
+                self.inventory.dynamodb_tables += 1
+
+                def check(findings):
+                    try:
+                        table = ddb.describe_table(TableName=table_name)['Table']
                     
-                    # Check billing mode
-                    if table.get('BillingModeSummary', {}).get('BillingMode') == 'PAY_PER_REQUEST':
-                        self.inventory.dynamodb_on_demand += 1
+                        # Check billing mode
+                        if table.get('BillingModeSummary', {}).get('BillingMode') == 'PAY_PER_REQUEST':
+                            self.inventory.dynamodb_on_demand += 1
                     
-                    # Check backups
-                    try:
-                        backup_desc = ddb.describe_continuous_backups(TableName=table_name)
-                        pitr_status = backup_desc.get('ContinuousBackupsDescription', {}).get('PointInTimeRecoveryDescription', {}).get('PointInTimeRecoveryStatus')
+                        # Check backups
+                        try:
+                            backup_desc = ddb.describe_continuous_backups(TableName=table_name)
+                            pitr_status = backup_desc.get('ContinuousBackupsDescription', {}).get('PointInTimeRecoveryDescription', {}).get('PointInTimeRecoveryStatus')
                         
-                        if pitr_status != 'ENABLED':
-                            self.findings.append(Finding(
-                                id=f"ddb-nopitr-{table_name[:20]}",
-                                title=f"DynamoDB Table Without PITR: {table_name}",
-                                description="Point-in-time recovery is not enabled",
-                                severity='MEDIUM',
-                                pillar='Reliability',
-                                source_service="DynamoDB",
-                                affected_resources=[table_name],
-                                recommendation="Enable point-in-time recovery",
-                                effort="Low"
-                            ))
+                            if pitr_status != 'ENABLED':
+                                findings.append(Finding(
+                                    id=f"ddb-nopitr-{table_name[:20]}",
+                                    title=f"DynamoDB Table Without PITR: {table_name}",
+                                    description="Point-in-time recovery is not enabled",
+                                    severity='MEDIUM',
+                                    pillar='Reliability',
+                                    source_service="DynamoDB",
+                                    affected_resources=[table_name],
+                                    recommendation="Enable point-in-time recovery",
+                                    effort="Low"
+                                ))
+                        except:
+                            pass
                     except:
                         pass
-                except:
-                    pass
+
+                self._check_resource('AWS::DynamoDB::Table', table_name, region,
+                                     table_name, check)
         except:
             pass
     
@@ -1427,10 +1641,8 @@ class AWSLandscapeScanner:
         try:
             ec = self.session.client('elasticache', region_name=region)
             
-            clusters = ec.describe_cache_clusters()['CacheClusters']
-            self.inventory.elasticache_clusters = len(clusters)
-            
-            for cluster in clusters[:20]:
+            for cluster in iter_paginated(ec, 'describe_cache_clusters', 'CacheClusters'):
+                self.inventory.elasticache_clusters += 1
                 if not cluster.get('AtRestEncryptionEnabled'):
                     self.findings.append(Finding(
                         id=f"ec-noenc-{cluster['CacheClusterId'][:20]}",
@@ -1452,12 +1664,11 @@ class AWSLandscapeScanner:
         try:
             ecs = self.session.client('ecs', region_name=region)
             
-            clusters = ecs.list_clusters()['clusterArns']
-            self.inventory.ecs_clusters = len(clusters)
-            
-            for cluster_arn in clusters:
-                services = ecs.list_services(cluster=cluster_arn)['serviceArns']
-                self.inventory.ecs_services += len(services)
+            for cluster_arn in iter_paginated(ecs, 'list_clusters', 'clusterArns'):
+                self.inventory.ecs_clusters += 1
+                self.inventory.ecs_services += sum(
+                    1 for _ in iter_paginated(ecs, 'list_services', 'serviceArns', cluster=cluster_arn)
+                )
         except:
             pass
     
@@ -1466,10 +1677,8 @@ class AWSLandscapeScanner:
         try:
             eks = self.session.client('eks', region_name=region)
             
-            clusters = eks.list_clusters()['clusters']
-            self.inventory.eks_clusters = len(clusters)
-            
-            for cluster_name in clusters:
+            for cluster_name in iter_paginated(eks, 'list_clusters', 'clusters'):
+                self.inventory.eks_clusters += 1
                 try:
                     cluster = eks.describe_cluster(name=cluster_name)['cluster']
                     
@@ -1511,10 +1720,8 @@ class AWSLandscapeScanner:
         try:
             asg = self.session.client('autoscaling', region_name=region)
             
-            groups = asg.describe_auto_scaling_groups()['AutoScalingGroups']
-            self.inventory.autoscaling_groups = len(groups)
-            
-            for group in groups[:20]:
+            for group in iter_paginated(asg, 'describe_auto_scaling_groups', 'AutoScalingGroups'):
+                self.inventory.autoscaling_groups += 1
                 if group.get('HealthCheckType') == 'EC2':
                     self.findings.append(Finding(
                         id=f"asg-hc-{group['AutoScalingGroupName'][:20]}",
@@ -1535,90 +1742,92 @@ class AWSLandscapeScanner:
         ec2 = self.session.client('ec2', region_name=region)
         
         try:
-            volumes = ec2.describe_volumes()['Volumes']
-            
-            for vol in volumes:
+            for vol in iter_paginated(ec2, 'describe_volumes', 'Volumes'):
                 self.inventory.ebs_volumes += 1
                 vol_id = vol['VolumeId']
                 size = vol['Size']
                 vol_type = vol['VolumeType']
-                
-                # Unattached volumes
-                if vol['State'] == 'available':
-                    self.inventory.ebs_unattached += 1
+
+                def check(findings):
+                    # Unattached volumes
+                    if vol['State'] == 'available':
+                        self.inventory.ebs_unattached += 1
                     
-                    cost_per_gb = 0.10
-                    monthly_cost = size * cost_per_gb
+                        cost_per_gb = 0.10
+                        monthly_cost = size * cost_per_gb
                     
-                    self.findings.append(Finding(
-                        id=f"ebs-unattached-{vol_id[:12]}",
-                        title=f"Unattached EBS Volume: {vol_id}",
-                        description=f"{size}GB volume not attached to any instance",
-                        severity='MEDIUM',
-                        pillar='Cost Optimization',
-                        source_service="EC2",
-                        affected_resources=[vol_id],
-                        recommendation="Delete or snapshot unused volumes",
-                        effort="Low",
-                        estimated_savings=monthly_cost
-                    ))
+                        findings.append(Finding(
+                            id=f"ebs-unattached-{vol_id[:12]}",
+                            title=f"Unattached EBS Volume: {vol_id}",
+                            description=f"{size}GB volume not attached to any instance",
+                            severity='MEDIUM',
+                            pillar='Cost Optimization',
+                            source_service="EC2",
+                            affected_resources=[vol_id],
+                            recommendation="Delete or snapshot unused volumes",
+                            effort="Low",
+                            estimated_savings=monthly_cost
+                        ))
                 
-                # gp2 to gp3 migration
-                if vol_type == 'gp2':
-                    savings = size * 0.02
+                    # gp2 to gp3 migration
+                    if vol_type == 'gp2':
+                        savings = size * 0.02
                     
-                    self.findings.append(Finding(
-                        id=f"ebs-gp2-{vol_id[:12]}",
-                        title=f"EBS Volume Using gp2: {vol_id}",
-                        description="Upgrade to gp3 for 20% cost savings",
-                        severity='LOW',
-                        pillar='Performance Efficiency',
-                        source_service="EC2",
-                        affected_resources=[vol_id],
-                        recommendation="Migrate to gp3 volume type",
-                        effort="Low",
-                        estimated_savings=savings
-                    ))
+                        findings.append(Finding(
+                            id=f"ebs-gp2-{vol_id[:12]}",
+                            title=f"EBS Volume Using gp2: {vol_id}",
+                            description="Upgrade to gp3 for 20% cost savings",
+                            severity='LOW',
+                            pillar='Performance Efficiency',
+                            source_service="EC2",
+                            affected_resources=[vol_id],
+                            recommendation="Migrate to gp3 volume type",
+                            effort="Low",
+                            estimated_savings=savings
+                        ))
                 
-                # Unencrypted volumes
-                if not vol.get('Encrypted'):
-                    self.inventory.ebs_unencrypted += 1
+                    # Unencrypted volumes
+                    if not vol.get('Encrypted'):
+                        self.inventory.ebs_unencrypted += 1
                     
-                    self.findings.append(Finding(
-                        id=f"ebs-noenc-{vol_id[:12]}",
-                        title=f"Unencrypted EBS Volume: {vol_id}",
-                        description="EBS volume is not encrypted at rest",
-                        severity='HIGH',
-                        pillar='Security',
-                        source_service="EC2",
-                        affected_resources=[vol_id],
-                        recommendation="Snapshot and re-create with encryption",
-                        effort="Medium",
-                        compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
-                    ))
+                        findings.append(Finding(
+                            id=f"ebs-noenc-{vol_id[:12]}",
+                            title=f"Unencrypted EBS Volume: {vol_id}",
+                            description="EBS volume is not encrypted at rest",
+                            severity='HIGH',
+                            pillar='Security',
+                            source_service="EC2",
+                            affected_resources=[vol_id],
+                            recommendation="Snapshot and re-create with encryption",
+                            effort="Medium",
+                            compliance_frameworks=["HIPAA", "PCI-DSS", "GDPR"]
+                        ))
+
+                self._check_resource('AWS::EC2::Volume', vol_id, region, vol, check)
             
             # Old snapshots
-            snapshots = ec2.describe_snapshots(OwnerIds=['self'])['Snapshots']
-            self.inventory.ebs_snapshots = len(snapshots)
-            
-            old_snapshots = []
-            for snap in snapshots:
+            old_snapshot_count = 0
+            old_snapshot_sample = []
+            for snap in iter_paginated(ec2, 'describe_snapshots', 'Snapshots', OwnerIds=['self']):
+                self.inventory.ebs_snapshots += 1
                 age = (datetime.now(snap['StartTime'].tzinfo) - snap['StartTime']).days
                 if age > 90:
-                    old_snapshots.append(snap['SnapshotId'])
+                    old_snapshot_count += 1
+                    if len(old_snapshot_sample) < 5:
+                        old_snapshot_sample.append(snap['SnapshotId'])
             
-            if len(old_snapshots) > 10:
+            if old_snapshot_count > 10:
                 self.findings.append(Finding(
                     id="ebs-oldsnaps",
-                    title=f"{len(old_snapshots)} Old EBS Snapshots",
+                    title=f"{old_snapshot_count} Old EBS Snapshots",
                     description=f"Snapshots older than 90 days may no longer be needed",
                     severity='MEDIUM',
                     pillar='Cost Optimization',
                     source_service="EC2",
-                    affected_resources=old_snapshots[:5],
+                    affected_resources=old_snapshot_sample,
                     recommendation="Review and delete unnecessary old snapshots",
                     effort="Low",
-                    estimated_savings=len(old_snapshots) * 5
+                    estimated_savings=old_snapshot_count * 5
                 ))
         except:
             pass
@@ -1628,9 +1837,7 @@ class AWSLandscapeScanner:
         try:
             ec2 = self.session.client('ec2', region_name=region)
             
-            eips = ec2.describe_addresses()['Addresses']
-            
-            for eip in eips:
+            for eip in iter_paginated(ec2, 'describe_addresses', 'Addresses'):
                 self.inventory.elastic_ips += 1
                 
                 if 'InstanceId' not in eip:
@@ -1656,10 +1863,8 @@ class AWSLandscapeScanner:
         try:
             # Classic Load Balancers
             elb = self.session.client('elb', region_name=region)
-            classic_lbs = elb.describe_load_balancers()['LoadBalancerDescriptions']
-            self.inventory.load_balancers_classic = len(classic_lbs)
-            
-            for lb in classic_lbs:
+            for lb in iter_paginated(elb, 'describe_load_balancers', 'LoadBalancerDescriptions'):
+                self.inventory.load_balancers_classic += 1
                 lb_name = lb['LoadBalancerName']
                 
                 if not lb.get('Instances'):
@@ -1678,8 +1883,8 @@ class AWSLandscapeScanner:
             
             # Modern Load Balancers
             elbv2 = self.session.client('elbv2', region_name=region)
-            modern_lbs = elbv2.describe_load_balancers()['LoadBalancers']
-            self.inventory.load_balancers = len(classic_lbs) + len(modern_lbs)
+            modern_lbs = sum(1 for _ in iter_paginated(elbv2, 'describe_load_balancers', 'LoadBalancers'))
+            self.inventory.load_balancers = self.inventory.load_balancers_classic + modern_lbs
         except:
             pass
     
@@ -1690,14 +1895,13 @@ class AWSLandscapeScanner:
             logs = self.session.client('logs', region_name=region)
             
             # Alarms
-            alarms = cw.describe_alarms()['MetricAlarms']
-            self.inventory.cloudwatch_alarms = len(alarms)
+            self.inventory.cloudwatch_alarms = sum(
+                1 for _ in iter_paginated(cw, 'describe_alarms', 'MetricAlarms')
+            )
             
             # Log Groups
-            log_groups = logs.describe_log_groups()['logGroups']
-            self.inventory.cloudwatch_log_groups = len(log_groups)
-            
-            for lg in log_groups[:50]:
+            for lg in iter_paginated(logs, 'describe_log_groups', 'logGroups'):
+                self.inventory.cloudwatch_log_groups += 1
                 if 'retentionInDays' not in lg:
                     self.findings.append(Finding(
                         id=f"cw-noret-{lg['logGroupName'][:20]}",
@@ -1721,8 +1925,8 @@ class AWSLandscapeScanner:
             
             # Check compliance
             try:
-                compliance = ssm.list_resource_compliance_summaries()
-                for item in compliance.get('ResourceComplianceSummaryItems', [])[:20]:
+                for item in iter_paginated(ssm, 'list_resource_compliance_summaries',
+                                           'ResourceComplianceSummaryItems'):
                     if item.get('Status') == 'COMPLIANT':
                         self.inventory.systems_manager_compliant += 1
                     else:
@@ -1737,8 +1941,7 @@ class AWSLandscapeScanner:
         try:
             eb = self.session.client('events', region_name=region)
             
-            rules = eb.list_rules()['Rules']
-            self.inventory.eventbridge_rules = len(rules)
+            self.inventory.eventbridge_rules = sum(1 for _ in iter_paginated(eb, 'list_rules', 'Rules'))
         except:
             pass
     
@@ -1747,8 +1950,7 @@ class AWSLandscapeScanner:
         try:
             sns = self.session.client('sns', region_name=region)
             
-            topics = sns.list_topics()['Topics']
-            self.inventory.sns_topics = len(topics)
+            self.inventory.sns_topics = sum(1 for _ in iter_paginated(sns, 'list_topics', 'Topics'))
         except:
             pass
     
@@ -1757,13 +1959,14 @@ class AWSLandscapeScanner:
         try:
             backup = self.session.client('backup', region_name=region)
             
-            vaults = backup.list_backup_vaults()['BackupVaultList']
-            self.inventory.backup_vaults = len(vaults)
-            
-            plans = backup.list_backup_plans()['BackupPlansList']
-            self.inventory.backup_plans = len(plans)
+            self.inventory.backup_vaults = sum(
+                1 for _ in iter_paginated(backup, 'list_backup_vaults', 'BackupVaultList')
+            )
+            self.inventory.backup_plans = sum(
+                1 for _ in iter_paginated(backup, 'list_backup_plans', 'BackupPlansList')
+            )
             
-            if len(plans) == 0:
+            if self.inventory.backup_plans == 0:
                 self.findings.append(Finding(
                     id="backup-noplans",
                     title="No AWS Backup Plans Configured",
@@ -1784,10 +1987,8 @@ class AWSLandscapeScanner:
         try:
             efs = self.session.client('efs', region_name=region)
             
-            filesystems = efs.describe_file_systems()['FileSystems']
-            self.inventory.efs_filesystems = len(filesystems)
-            
-            for fs in filesystems:
+            for fs in iter_paginated(efs, 'describe_file_systems', 'FileSystems'):
+                self.inventory.efs_filesystems += 1
                 if not fs.get('Encrypted'):
                     self.findings.append(Finding(
                         id=f"efs-noenc-{fs['FileSystemId'][:12]}",
@@ -1809,24 +2010,21 @@ class AWSLandscapeScanner:
         try:
             cf = self.session.client('cloudfront')
             
-            distributions = cf.list_distributions()
-            if 'DistributionList' in distributions and 'Items' in distributions['DistributionList']:
-                distros = distributions['DistributionList']['Items']
-                self.inventory.cloudfront_distributions = len(distros)
-                
-                for distro in distros[:20]:
-                    if not distro.get('Logging', {}).get('Enabled'):
-                        self.findings.append(Finding(
-                            id=f"cf-nolog-{distro['Id'][:12]}",
-                            title=f"CloudFront Without Logging: {distro['Id']}",
-                            description="Access logging is not enabled",
-                            severity='LOW',
-                            pillar='Operational Excellence',
-                            source_service="CloudFront",
-                            affected_resources=[distro['Id']],
-                            recommendation="Enable access logging to S3",
-                            effort="Low"
-                        ))
+            for distro in iter_paginated(cf, 'list_distributions', 'DistributionList.Items[]'):
+                self.inventory.cloudfront_distributions += 1
+
+                if not distro.get('Logging', {}).get('Enabled'):
+                    self.findings.append(Finding(
+                        id=f"cf-nolog-{distro['Id'][:12]}",
+                        title=f"CloudFront Without Logging: {distro['Id']}",
+                        description="Access logging is not enabled",
+                        severity='LOW',
+                        pillar='Operational Excellence',
+                        source_service="CloudFront",
+                        affected_resources=[distro['Id']],
+                        recommendation="Enable access logging to S3",
+                        effort="Low"
+                    ))
         except:
             pass
     
@@ -1835,8 +2033,7 @@ class AWSLandscapeScanner:
         try:
             r53 = self.session.client('route53')
             
-            zones = r53.list_hosted_zones()['HostedZones']
-            self.inventory.route53_zones = len(zones)
+            self.inventory.route53_zones = sum(1 for _ in iter_paginated(r53, 'list_hosted_zones', 'HostedZones'))
         except:
             pass
 
@@ -1851,11 +2048,9 @@ class AWSLandscapeScanner:
             
             # Notebooks
             try:
-                notebooks = sm.list_notebook_instances()
-                self.inventory.sagemaker_notebooks = len(notebooks.get('NotebookInstances', []))
-                
                 # Check notebook security
-                for nb in notebooks.get('NotebookInstances', [])[:10]:
+                for nb in iter_paginated(sm, 'list_notebook_instances', 'NotebookInstances'):
+                    self.inventory.sagemaker_notebooks += 1
                     nb_name = nb.get('NotebookInstanceName', '')
                     
                     # Check if in VPC
@@ -1891,8 +2086,9 @@ class AWSLandscapeScanner:
             
             # Endpoints
             try:
-                endpoints = sm.list_endpoints()
-                self.inventory.sagemaker_endpoints = len(endpoints.get('Endpoints', []))
+                self.inventory.sagemaker_endpoints = sum(
+                    1 for _ in iter_paginated(sm, 'list_endpoints', 'Endpoints')
+                )
                 
                 if self.inventory.sagemaker_endpoints > 0:
                     self.inventory.ai_ml_services_detected.append('sagemaker')
@@ -1915,15 +2111,17 @@ class AWSLandscapeScanner:
             
             # Models
             try:
-                models = sm.list_models()
-                self.inventory.sagemaker_models = len(models.get('Models', []))
+                self.inventory.sagemaker_models = sum(
+                    1 for _ in iter_paginated(sm, 'list_models', 'Models')
+                )
             except:
                 pass
             
             # Pipelines
             try:
-                pipelines = sm.list_pipelines()
-                self.inventory.sagemaker_pipelines = len(pipelines.get('PipelineSummaries', []))
+                self.inventory.sagemaker_pipelines = sum(
+                    1 for _ in iter_paginated(sm, 'list_pipelines', 'PipelineSummaries')
+                )
             except:
                 pass
                 
@@ -2069,9 +2267,7 @@ class AWSLandscapeScanner:
         """Scan AWS Certificate Manager for certificate issues"""
         try:
             acm = self.session.client('acm', region_name=region)
-            certs = acm.list_certificates().get('CertificateSummaryList', [])
-            
-            for cert in certs:
+            for cert in iter_paginated(acm, 'list_certificates', 'CertificateSummaryList'):
                 cert_arn = cert['CertificateArn']
                 try:
                     details = acm.describe_certificate(CertificateArn=cert_arn)['Certificate']
@@ -2100,9 +2296,7 @@ class AWSLandscapeScanner:
         """Scan API Gateway for security configurations"""
         try:
             apigw = self.session.client('apigateway', region_name=region)
-            apis = apigw.get_rest_apis().get('items', [])
-            
-            for api in apis:
+            for api in iter_paginated(apigw, 'get_rest_apis', 'items'):
                 api_id = api['id']
                 api_name = api['name']
                 
@@ -2130,9 +2324,7 @@ class AWSLandscapeScanner:
         """Scan Cognito user pools for security settings"""
         try:
             cognito = self.session.client('cognito-idp', region_name=region)
-            pools = cognito.list_user_pools(MaxResults=60).get('UserPools', [])
-            
-            for pool in pools:
+            for pool in iter_paginated(cognito, 'list_user_pools', 'UserPools', MaxResults=60):
                 pool_id = pool['Id']
                 try:
                     pool_details = cognito.describe_user_pool(UserPoolId=pool_id)['UserPool']
@@ -2233,10 +2425,8 @@ class AWSLandscapeScanner:
         """Scan SQS queues for security"""
         try:
             sqs = self.session.client('sqs', region_name=region)
-            queues = sqs.list_queues().get('QueueUrls', [])
-            self.inventory.sqs_queues = len(queues)
-            
-            for queue_url in queues[:20]:
+            for queue_url in iter_paginated(sqs, 'list_queues', 'QueueUrls'):
+                self.inventory.sqs_queues += 1
                 try:
                     attrs = sqs.get_queue_attributes(QueueUrl=queue_url, AttributeNames=['All'])['Attributes']
                     
@@ -2262,9 +2452,7 @@ class AWSLandscapeScanner:
         """Scan Step Functions"""
         try:
             sfn = self.session.client('stepfunctions', region_name=region)
-            machines = sfn.list_state_machines().get('stateMachines', [])
-            
-            for machine in machines:
+            for machine in iter_paginated(sfn, 'list_state_machines', 'stateMachines'):
                 try:
                     details = sfn.describe_state_machine(stateMachineArn=machine['stateMachineArn'])
                     logging_config = details.get('loggingConfiguration', {})
@@ -2334,9 +2522,8 @@ class AWSLandscapeScanner:
         try:
             support = self.session.client('support', region_name='us-east-1')
             
-            checks = support.describe_trusted_advisor_checks(language='en')['checks']
-            
-            for check in checks[:20]:
+            for check in iter_paginated(support, 'describe_trusted_advisor_checks', 'checks',
+                                        language='en'):
                 try:
                     result = support.describe_trusted_advisor_check_result(checkId=check['id'])['result']
                     if result['status'] in ['warning', 'error']:
@@ -2411,8 +2598,9 @@ class AWSLandscapeScanner:
         """Scan Transit Gateways"""
         try:
             ec2 = self.session.client('ec2', region_name=region)
-            tgws = ec2.describe_transit_gateways().get('TransitGateways', [])
-            self.inventory.transit_gateways = len(tgws)
+            self.inventory.transit_gateways = sum(
+                1 for _ in iter_paginated(ec2, 'describe_transit_gateways', 'TransitGateways')
+            )
         except Exception as e:
             self.scan_errors['Transit Gateway'] = str(e)
 
@@ -2420,7 +2608,7 @@ class AWSLandscapeScanner:
         """Scan Direct Connect connections"""
         try:
             dx = self.session.client('directconnect', region_name=region)
-            connections = dx.describe_connections().get('connections', [])
+            connections = list(iter_paginated(dx, 'describe_connections', 'connections'))
             
             for conn in connections:
                 if conn.get('connectionState') == 'available':
@@ -2466,9 +2654,7 @@ class AWSLandscapeScanner:
         """Scan CodePipeline"""
         try:
             cp = self.session.client('codepipeline', region_name=region)
-            pipelines = cp.list_pipelines().get('pipelines', [])
-            
-            for pipeline in pipelines:
+            for pipeline in iter_paginated(cp, 'list_pipelines', 'pipelines'):
                 try:
                     details = cp.get_pipeline(name=pipeline['name'])['pipeline']
                     has_approval = any(
@@ -2498,9 +2684,7 @@ class AWSLandscapeScanner:
         """Scan CodeBuild projects"""
         try:
             cb = self.session.client('codebuild', region_name=region)
-            projects = cb.list_projects().get('projects', [])
-            
-            for project_name in projects[:20]:
+            for project_name in iter_paginated(cb, 'list_projects', 'projects'):
                 try:
                     project = cb.batch_get_projects(names=[project_name])['projects'][0]
                     
@@ -2527,48 +2711,51 @@ class AWSLandscapeScanner:
             ec2 = self.session.client('ec2', region_name=region)
             
             # VPCs
-            vpcs = ec2.describe_vpcs().get('Vpcs', [])
-            self.inventory.vpcs = len(vpcs)
+            self.inventory.vpcs = sum(1 for _ in iter_paginated(ec2, 'describe_vpcs', 'Vpcs'))
             
             # Subnets
-            subnets = ec2.describe_subnets().get('Subnets', [])
-            self.inventory.subnets = len(subnets)
+            self.inventory.subnets = sum(1 for _ in iter_paginated(ec2, 'describe_subnets', 'Subnets'))
             
             # Security Groups
-            sgs = ec2.describe_security_groups().get('SecurityGroups', [])
-            self.inventory.security_groups = len(sgs)
-            
-            for sg in sgs:
-                for rule in sg.get('IpPermissions', []):
-                    for ip_range in rule.get('IpRanges', []):
-                        if ip_range.get('CidrIp') == '0.0.0.0/0':
-                            port = rule.get('FromPort', 'All')
-                            if port in [22, 3389, 3306, 5432, 1433, 27017]:
-                                self.inventory.security_groups_open += 1
-                                self.findings.append(Finding(
-                                    id=f"sg-open-{sg['GroupId'][:10]}-{port}",
-                                    title=f"Security Group Open to Internet: {sg.get('GroupName', sg['GroupId'])} (Port {port})",
-                                    description=f"Port {port} is accessible from 0.0.0.0/0",
-                                    severity='CRITICAL' if port in [22, 3389] else 'HIGH',
-                                    pillar='Security',
-                                    source_service="VPC",
-                                    affected_resources=[sg.get('GroupName', sg['GroupId'])],
-                                    recommendation=f"Restrict port {port} access to specific IP ranges",
-                                    effort="Low",
-                                    compliance_frameworks=["CIS AWS", "PCI-DSS"]
-                                ))
+            for sg in iter_paginated(ec2, 'describe_security_groups', 'SecurityGroups'):
+                self.inventory.security_groups += 1
+
+                def check(findings):
+                    for rule in sg.get('IpPermissions', []):
+                        for ip_range in rule.get('IpRanges', []):
+                            if ip_range.get('CidrIp') == '0.0.0.0/0':
+                                port = rule.get('FromPort', 'All')
+                                if port in [22, 3389, 3306, 5432, 1433, 27017]:
+                                    self.inventory.security_groups_open += 1
+                                    findings.append(Finding(
+                                        id=f"sg-open-{sg['GroupId'][:10]}-{port}",
+                                        title=f"Security Group Open to Internet: {sg.get('GroupName', sg['GroupId'])} (Port {port})",
+                                        description=f"Port {port} is accessible from 0.0.0.0/0",
+                                        severity='CRITICAL' if port in [22, 3389] else 'HIGH',
+                                        pillar='Security',
+                                        source_service="VPC",
+                                        affected_resources=[sg.get('GroupName', sg['GroupId'])],
+                                        recommendation=f"Restrict port {port} access to specific IP ranges",
+                                        effort="Low",
+                                        compliance_frameworks=["CIS AWS", "PCI-DSS"]
+                                    ))
+
+                self._check_resource('AWS::EC2::SecurityGroup', sg['GroupId'], region, sg, check,
+                                     check_name='vpc')
             
             # NACLs
-            nacls = ec2.describe_network_acls().get('NetworkAcls', [])
-            self.inventory.nacls = len(nacls)
+            self.inventory.nacls = sum(1 for _ in iter_paginated(ec2, 'describe_network_acls', 'NetworkAcls'))
             
             # VPC Endpoints
-            endpoints = ec2.describe_vpc_endpoints().get('VpcEndpoints', [])
-            self.inventory.vpc_endpoints = len(endpoints)
+            self.inventory.vpc_endpoints = sum(
+                1 for _ in iter_paginated(ec2, 'describe_vpc_endpoints', 'VpcEndpoints')
+            )
             
             # NAT Gateways
-            nat_gws = ec2.describe_nat_gateways().get('NatGateways', [])
-            self.inventory.nat_gateways = len([n for n in nat_gws if n.get('State') == 'available'])
+            self.inventory.nat_gateways = sum(
+                1 for n in iter_paginated(ec2, 'describe_nat_gateways', 'NatGateways')
+                if n.get('State') == 'available'
+            )
             
         except Exception as e:
             self.scan_errors['VPC Detailed'] = str(e)
@@ -2580,15 +2767,13 @@ class AWSLandscapeScanner:
             logs = self.session.client('logs', region_name=region)
             
             # Alarms
-            alarms = cw.describe_alarms().get('MetricAlarms', [])
-            self.inventory.cloudwatch_alarms = len(alarms)
-            
-            # Log Groups
-            log_groups = logs.describe_log_groups().get('logGroups', [])
-            self.inventory.cloudwatch_log_groups = len(log_groups)
+            self.inventory.cloudwatch_alarms = sum(
+                1 for _ in iter_paginated(cw, 'describe_alarms', 'MetricAlarms')
+            )
             
-            # Check for log groups without retention
-            for lg in log_groups[:30]:
+            # Log Groups - check for log groups without retention
+            for lg in iter_paginated(logs, 'describe_log_groups', 'logGroups'):
+                self.inventory.cloudwatch_log_groups += 1
                 if not lg.get('retentionInDays'):
                     self.findings.append(Finding(
                         id=f"cwl-noretention-{lg['logGroupName'][:20]}",
@@ -2625,9 +2810,7 @@ class AWSLandscapeScanner:
         """Scan DAX clusters"""
         try:
             dax = self.session.client('dax', region_name=region)
-            clusters = dax.describe_clusters().get('Clusters', [])
-            
-            for cluster in clusters:
+            for cluster in iter_paginated(dax, 'describe_clusters', 'Clusters'):
                 if not cluster.get('SSEDescription', {}).get('Status') == 'ENABLED':
                     self.findings.append(Finding(
                         id=f"dax-nosse-{cluster['ClusterName'][:15]}",
@@ -2648,9 +2831,7 @@ class AWSLandscapeScanner:
         """Scan CloudFormation stacks"""
         try:
             cfn = self.session.client('cloudformation', region_name=region)
-            stacks = cfn.describe_stacks().get('Stacks', [])
-            
-            for stack in stacks:
+            for stack in iter_paginated(cfn, 'describe_stacks', 'Stacks'):
                 if stack.get('EnableTerminationProtection') == False:
                     self.findings.append(Finding(
                         id=f"cfn-noprotect-{stack['StackName'][:15]}",
@@ -2679,9 +2860,7 @@ class AWSLandscapeScanner:
         """Scan FSx file systems"""
         try:
             fsx = self.session.client('fsx', region_name=region)
-            filesystems = fsx.describe_file_systems().get('FileSystems', [])
-            
-            for fs in filesystems:
+            for fs in iter_paginated(fsx, 'describe_file_systems', 'FileSystems'):
                 if not fs.get('KmsKeyId'):
                     self.findings.append(Finding(
                         id=f"fsx-noenc-{fs['FileSystemId'][:15]}",
@@ -2786,9 +2965,7 @@ class AWSLandscapeScanner:
         """Scan Parameter Store"""
         try:
             ssm = self.session.client('ssm', region_name=region)
-            params = ssm.describe_parameters(MaxResults=50).get('Parameters', [])
-            
-            for param in params:
+            for param in iter_paginated(ssm, 'describe_parameters', 'Parameters'):
                 if param.get('Type') != 'SecureString' and 'password' in param.get('Name', '').lower():
                     self.findings.append(Finding(
                         id=f"ssm-insecure-{param['Name'][:15]}",
@@ -2808,7 +2985,7 @@ class AWSLandscapeScanner:
         """Scan IAM Access Analyzer"""
         try:
             aa = self.session.client('accessanalyzer', region_name=region)
-            analyzers = aa.list_analyzers().get('analyzers', [])
+            analyzers = list(iter_paginated(aa, 'list_analyzers', 'analyzers'))
             
             if not analyzers:
                 self.findings.append(Finding(
@@ -2825,17 +3002,22 @@ class AWSLandscapeScanner:
             else:
                 # Check for active findings
                 for analyzer in analyzers:
-                    findings_list = aa.list_findings(analyzerArn=analyzer['arn']).get('findings', [])
-                    active = [f for f in findings_list if f.get('status') == 'ACTIVE']
-                    if len(active) > 5:
+                    active_count = 0
+                    active_sample = []
+                    for f in iter_paginated(aa, 'list_findings', 'findings', analyzerArn=analyzer['arn']):
+                        if f.get('status') == 'ACTIVE':
+                            active_count += 1
+                            if len(active_sample) < 5:
+                                active_sample.append(f['resource'])
+                    if active_count > 5:
                         self.findings.append(Finding(
-                            id=f"aa-findings-{len(active)}",
-                            title=f"IAM Access Analyzer: {len(active)} Active Findings",
+                            id=f"aa-findings-{active_count}",
+                            title=f"IAM Access Analyzer: {active_count} Active Findings",
                             description="Multiple external access findings detected",
                             severity='HIGH',
                             pillar='Security',
                             source_service="IAM Access Analyzer",
-                            affected_resources=[f['resource'] for f in active[:5]],
+                            affected_resources=active_sample,
                             recommendation="Review and remediate Access Analyzer findings",
                             effort="Medium"
                         ))
@@ -2846,105 +3028,181 @@ class AWSLandscapeScanner:
 # COMPREHENSIVE run_scan METHOD - 50+ Services
 # =============================================================================
 
-    def run_scan(self, regions: List[str], progress_callback: Callable = None) -> LandscapeAssessment:
-        """Run comprehensive scan with 60+ AWS services - ENHANCED VERSION"""
-        start_time = datetime.now()
-        
+    def _scan_catalog(self) -> List[Tuple[str, Callable, str]]:
+        """(name, scan method, scope) for every service the scanner covers"""
         # COMPREHENSIVE SCAN TASKS - 60+ services for complete WAF coverage
-        scan_tasks = [
+        return [
             # ===== SECURITY (18 services) =====
-            ("IAM", self._scan_iam),
-            ("KMS", self._scan_kms),
-            ("Secrets Manager", self._scan_secrets_manager),
-            ("GuardDuty", lambda: self._scan_guardduty(regions[0])),
-            ("Security Hub", lambda: self._scan_securityhub(regions[0])),
-            ("Config", lambda: self._scan_config(regions[0])),
-            ("CloudTrail", lambda: self._scan_cloudtrail(regions[0])),
-            ("WAF", lambda: self._scan_waf(regions[0])),
-            ("ACM", lambda: self._scan_acm(regions[0])),
-            ("Inspector", lambda: self._scan_inspector(regions[0])),
-            ("Macie", lambda: self._scan_macie(regions[0])),
-            ("Organizations", self._scan_organizations),
-            ("Cognito", lambda: self._scan_cognito(regions[0])),
-            ("Shield", lambda: self._scan_shield(regions[0])),
-            ("IAM Access Analyzer", lambda: self._scan_iam_access_analyzer(regions[0])),
-            ("Parameter Store", lambda: self._scan_parameter_store(regions[0])),
+            ("IAM", self._scan_iam, SCOPE_GLOBAL),
+            ("KMS", self._scan_kms, SCOPE_REGIONAL),
+            ("Secrets Manager", self._scan_secrets_manager, SCOPE_REGIONAL),
+            ("GuardDuty", self._scan_guardduty, SCOPE_REGIONAL),
+            ("Security Hub", self._scan_securityhub, SCOPE_REGIONAL),
+            ("Config", self._scan_config, SCOPE_REGIONAL),
+            ("CloudTrail", self._scan_cloudtrail, SCOPE_HOME),
+            ("WAF", self._scan_waf, SCOPE_REGIONAL),
+            ("ACM", self._scan_acm, SCOPE_REGIONAL),
+            ("Inspector", self._scan_inspector, SCOPE_REGIONAL),
+            ("Macie", self._scan_macie, SCOPE_REGIONAL),
+            ("Organizations", self._scan_organizations, SCOPE_GLOBAL),
+            ("Cognito", self._scan_cognito, SCOPE_REGIONAL),
+            ("Shield", self._scan_shield, SCOPE_HOME),
+            ("IAM Access Analyzer", self._scan_iam_access_analyzer, SCOPE_REGIONAL),
+            ("Parameter Store", self._scan_parameter_store, SCOPE_REGIONAL),
             
             # ===== COMPUTE (6 services) =====
-            ("EC2", lambda: self._scan_ec2(regions[0])),
-            ("Lambda", lambda: self._scan_lambda(regions[0])),
-            ("ECS", lambda: self._scan_ecs(regions[0])),
-            ("EKS", lambda: self._scan_eks(regions[0])),
-            ("Auto Scaling", lambda: self._scan_autoscaling(regions[0])),
+            ("EC2", self._scan_ec2, SCOPE_REGIONAL),
+            ("Lambda", self._scan_lambda, SCOPE_REGIONAL),
+            ("ECS", self._scan_ecs, SCOPE_REGIONAL),
+            ("EKS", self._scan_eks, SCOPE_REGIONAL),
+            ("Auto Scaling", self._scan_autoscaling, SCOPE_REGIONAL),
             
             # ===== STORAGE (5 services) =====
-            ("S3", self._scan_s3),
-            ("EBS", lambda: self._scan_ebs_volumes(regions[0])),
-            ("EFS", lambda: self._scan_efs(regions[0])),
-            ("FSx", lambda: self._scan_fsx(regions[0])),
-            ("Glacier", lambda: self._scan_glacier(regions[0])),
+            ("S3", self._scan_s3, SCOPE_GLOBAL),
+            ("EBS", self._scan_ebs_volumes, SCOPE_REGIONAL),
+            ("EFS", self._scan_efs, SCOPE_REGIONAL),
+            ("FSx", self._scan_fsx, SCOPE_REGIONAL),
+            ("Glacier", self._scan_glacier, SCOPE_REGIONAL),
             
             # ===== DATABASE (4 services) =====
-            ("RDS", lambda: self._scan_rds(regions[0])),
-            ("DynamoDB", lambda: self._scan_dynamodb(regions[0])),
-            ("ElastiCache", lambda: self._scan_elasticache(regions[0])),
-            ("DAX", lambda: self._scan_dax(regions[0])),
+            ("RDS", self._scan_rds, SCOPE_REGIONAL),
+            ("DynamoDB", self._scan_dynamodb, SCOPE_REGIONAL),
+            ("ElastiCache", self._scan_elasticache, SCOPE_REGIONAL),
+            ("DAX", self._scan_dax, SCOPE_REGIONAL),
             
             # ===== NETWORKING (9 services) =====
-            ("VPC", lambda: self._scan_vpc_detailed(regions[0])),
-            ("ELB", lambda: self._scan_elb(regions[0])),
-            ("CloudFront", self._scan_cloudfront),
-            ("Route 53", self._scan_route53),
-            ("API Gateway", lambda: self._scan_api_gateway(regions[0])),
-            ("Transit Gateway", lambda: self._scan_transit_gateway(regions[0])),
-            ("Direct Connect", lambda: self._scan_direct_connect(regions[0])),
-            ("Global Accelerator", self._scan_global_accelerator),
-            ("App Mesh", lambda: self._scan_app_mesh(regions[0])),
+            ("VPC", self._scan_vpc_detailed, SCOPE_REGIONAL),
+            ("ELB", self._scan_elb, SCOPE_REGIONAL),
+            ("CloudFront", self._scan_cloudfront, SCOPE_GLOBAL),
+            ("Route 53", self._scan_route53, SCOPE_GLOBAL),
+            ("API Gateway", self._scan_api_gateway, SCOPE_REGIONAL),
+            ("Transit Gateway", self._scan_transit_gateway, SCOPE_REGIONAL),
+            ("Direct Connect", self._scan_direct_connect, SCOPE_REGIONAL),
+            ("Global Accelerator", self._scan_global_accelerator, SCOPE_GLOBAL),
+            ("App Mesh", self._scan_app_mesh, SCOPE_REGIONAL),
             
             # ===== MONITORING & OPS (12 services) =====
-            ("CloudWatch", lambda: self._scan_cloudwatch_detailed(regions[0])),
-            ("Systems Manager", lambda: self._scan_systems_manager(regions[0])),
-            ("EventBridge", lambda: self._scan_eventbridge(regions[0])),
-            ("SNS", lambda: self._scan_sns(regions[0])),
-            ("SQS", lambda: self._scan_sqs(regions[0])),
-            ("X-Ray", lambda: self._scan_xray(regions[0])),
-            ("Step Functions", lambda: self._scan_step_functions(regions[0])),
-            ("CloudFormation", lambda: self._scan_cloudformation(regions[0])),
-            ("DevOps Guru", lambda: self._scan_devops_guru(regions[0])),
-            ("FIS", lambda: self._scan_fis(regions[0])),
-            ("Service Health Dashboard", self._scan_service_health),
+            ("CloudWatch", self._scan_cloudwatch_detailed, SCOPE_REGIONAL),
+            ("Systems Manager", self._scan_systems_manager, SCOPE_REGIONAL),
+            ("EventBridge", self._scan_eventbridge, SCOPE_REGIONAL),
+            ("SNS", self._scan_sns, SCOPE_REGIONAL),
+            ("SQS", self._scan_sqs, SCOPE_REGIONAL),
+            ("X-Ray", self._scan_xray, SCOPE_REGIONAL),
+            ("Step Functions", self._scan_step_functions, SCOPE_REGIONAL),
+            ("CloudFormation", self._scan_cloudformation, SCOPE_REGIONAL),
+            ("DevOps Guru", self._scan_devops_guru, SCOPE_REGIONAL),
+            ("FIS", self._scan_fis, SCOPE_REGIONAL),
+            ("Service Health Dashboard", self._scan_service_health, SCOPE_GLOBAL),
             
             # ===== CI/CD (3 services) =====
-            ("CodePipeline", lambda: self._scan_codepipeline(regions[0])),
-            ("CodeBuild", lambda: self._scan_codebuild(regions[0])),
+            ("CodePipeline", self._scan_codepipeline, SCOPE_REGIONAL),
+            ("CodeBuild", self._scan_codebuild, SCOPE_REGIONAL),
             
             # ===== COST (5 services) =====
-            ("AWS Backup", lambda: self._scan_backup(regions[0])),
-            ("Budgets", self._scan_budgets),
-            ("Cost Anomaly Detection", self._scan_cost_anomaly),
-            ("Compute Optimizer", lambda: self._scan_compute_optimizer(regions[0])),
-            ("Trusted Advisor", self._scan_trusted_advisor),
-            ("Cost Explorer", self._scan_cost_explorer),
+            ("AWS Backup", self._scan_backup, SCOPE_REGIONAL),
+            ("Budgets", self._scan_budgets, SCOPE_GLOBAL),
+            ("Cost Anomaly Detection", self._scan_cost_anomaly, SCOPE_GLOBAL),
+            ("Compute Optimizer", self._scan_compute_optimizer, SCOPE_REGIONAL),
+            ("Trusted Advisor", self._scan_trusted_advisor, SCOPE_GLOBAL),
+            ("Cost Explorer", self._scan_cost_explorer, SCOPE_GLOBAL),
             
             # ===== AI/ML (3 services) =====
-            ("SageMaker", lambda: self._scan_sagemaker(regions[0])),
-            ("Bedrock", lambda: self._scan_bedrock(regions[0])),
-            ("AI Services", lambda: self._scan_ai_services(regions[0])),
+            ("SageMaker", self._scan_sagemaker, SCOPE_REGIONAL),
+            ("Bedrock", self._scan_bedrock, SCOPE_REGIONAL),
+            ("AI Services", self._scan_ai_services, SCOPE_REGIONAL),
         ]
-        
-        # Execute scans
-        total_tasks = len(scan_tasks)
-        
-        for idx, (name, func) in enumerate(scan_tasks):
+
+    def _build_scan_tasks(self, regions: List[str]) -> List[ScanTask]:
+        """
+        Expand the service catalog into scan tasks for the requested regions.
+
+        Regional services get one task per region, global services run once
+        and home-region services run once in the first region.
+        """
+        multi_region = len(regions) > 1
+        tasks = []
+        for name, func, scope in self._scan_catalog():
+            if scope == SCOPE_GLOBAL:
+                tasks.append(ScanTask(name, name, func, (), None))
+            elif scope == SCOPE_HOME:
+                tasks.append(ScanTask(name, name, func, (regions[0],), regions[0]))
+            else:
+                for region in regions:
+                    label = f"{name} ({region})" if multi_region else name
+                    tasks.append(ScanTask(name, label, func, (region,), region))
+        return tasks
+
+    def run_scan(self, regions: List[str], progress_callback: Callable = None,
+                 concurrent: bool = False,
+                 max_workers: Optional[int] = None,
+                 skip_inactive_regions: bool = False,
+                 incremental: bool = False,
+                 use_config_changes: bool = False,
+                 fingerprint_db=None) -> LandscapeAssessment:
+        """
+        Run comprehensive scan with 60+ AWS services - ENHANCED VERSION
+
+        Regional services are scanned in every requested region; global
+        services (IAM, S3, CloudFront, Route 53, Organizations, ...) run once.
+        Per-region inventories are returned in region_inventories.
+
+        Args:
+            regions: Regions to scan
+            progress_callback: Optional callback(progress, message)
+            concurrent: Run scan tasks on a bounded worker pool
+            max_workers: Worker pool size when concurrent is enabled
+                (defaults to the configured scan pool size)
+            skip_inactive_regions: Drop regions the region activity index
+                (probed on demand) shows as empty. The first region is always
+                kept, since home-region services are scanned there.
+            incremental: Reuse findings for resources whose fingerprint
+                is unchanged since the last incremental scan (security
+                groups, EC2 instances, EBS volumes, RDS instances, Lambda
+                functions; KMS keys and DynamoDB tables when AWS Config
+                reports them unchanged)
+            use_config_changes: On incremental scans, ask AWS Config which
+                resources changed since the last scan
+            fingerprint_db: WAFDatabase holding resource fingerprints
+                (defaults to the local scanner database)
+        """
+        start_time = datetime.now()
+        if not regions:
+            regions = [getattr(self.session, 'region_name', None) or 'us-east-1']
+        skipped_regions: List[str] = []
+        if skip_inactive_regions and len(regions) > 1 and self.account_id:
             if progress_callback:
-                progress_callback(idx / total_tasks, f"Scanning {name}...")
-            
-            try:
-                func()
-                self.scan_status[name] = True
-            except Exception as e:
-                self.scan_status[name] = False
-                self.scan_errors[name] = str(e)
+                progress_callback(0.0, "Checking region activity...")
+            active = set(RegionActivityProber().discover_active_regions(
+                self.session, self.account_id, regions
+            ))
+            skipped_regions = [r for r in regions[1:] if r not in active]
+            regions = [r for r in regions if r not in skipped_regions]
+        if incremental and self.account_id:
+            if fingerprint_db is None:
+                from waf_database import WAFDatabase
+                fingerprint_db = WAFDatabase()
+            self._incremental = IncrementalScanState.load(fingerprint_db, 'landscape', self.account_id)
+            since = self._incremental.last_scan_time
+            if use_config_changes and since:
+                if progress_callback:
+                    progress_callback(0.0, "Reading AWS Config changes...")
+                self._incremental.set_change_feed(
+                    config_changed_resources(self.session, regions, since), regions
+                )
+        scan_tasks = self._build_scan_tasks(regions)
+        multi_region = len(regions) > 1
+
+        # Execute scans
+        if concurrent and (max_workers is None or max_workers > 1):
+            self._execute_tasks_concurrently(scan_tasks, progress_callback, max_workers, multi_region)
+        else:
+            self._execute_tasks(scan_tasks, progress_callback, multi_region)
+
+        incremental_stats: Dict[str, int] = {}
+        if self._incremental is not None:
+            self._incremental.save(fingerprint_db)
+            incremental_stats = self._incremental.stats()
+            self._incremental = None
         
         if progress_callback:
             progress_callback(1.0, "Calculating scores...")
@@ -2972,36 +3230,135 @@ class AWSLandscapeScanner:
             scan_errors=self.scan_errors,
             scan_duration_seconds=(datetime.now() - start_time).total_seconds(),
             aiml_health_score=aiml_health,
-            aiml_findings=aiml_findings
+            aiml_findings=aiml_findings,
+            region_inventories=self.region_inventories,
+            skipped_regions=skipped_regions,
+            incremental_stats=incremental_stats
+        )
+
+    def _run_task(self, task: ScanTask, session=None) -> Tuple['AWSLandscapeScanner', Optional[str]]:
+        """Run one scan task into a forked scanner, returning it and any error"""
+        shard = self._fork(session)
+        try:
+            task.func.__func__(shard, *task.args)
+            return shard, None
+        except Exception as e:
+            return shard, str(e)
+
+    def _merge_task_result(self, task: ScanTask, shard: 'AWSLandscapeScanner',
+                           error: Optional[str], multi_region: bool):
+        """Fold a finished task into the scan, tagging findings with their region"""
+        region_key = task.region or GLOBAL_REGION_KEY
+        for finding in shard.findings:
+            if not finding.region:
+                finding.region = region_key
+            if finding.id in self._finding_ids:
+                finding.id = f"{finding.id}-{region_key}"
+            self._finding_ids.add(finding.id)
+
+        if multi_region and task.region:
+            shard.scan_errors = {f"{key} ({task.region})": value
+                                 for key, value in shard.scan_errors.items()}
+
+        self._merge_shard(shard)
+        merge_inventory(
+            self.region_inventories.setdefault(region_key, ResourceInventory()),
+            shard.inventory
         )
 
+        self.scan_status[task.label] = error is None
+        if error is not None:
+            self.scan_errors[task.label] = error
 
+    def _execute_tasks(self, scan_tasks: List[ScanTask],
+                       progress_callback: Callable = None,
+                       multi_region: bool = False):
+        """Run scan tasks one after another"""
+        total_tasks = len(scan_tasks)
+
+        for idx, task in enumerate(scan_tasks):
+            if progress_callback:
+                progress_callback(idx / total_tasks, f"Scanning {task.label}...")
+
+            shard, error = self._run_task(task)
+            self._merge_task_result(task, shard, error, multi_region)
+
+    def _execute_tasks_concurrently(self, scan_tasks: List[ScanTask],
+                                    progress_callback: Callable = None,
+                                    max_workers: Optional[int] = None,
+                                    multi_region: bool = False):
+        """
+        Run scan tasks on the async scan engine.
+
+        Each task scans into its own forked scanner so no two threads touch
+        the same findings list or inventory. Results are merged back in task
+        order once all tasks finish, which keeps the output identical to a
+        sequential scan. Concurrency limits apply per API family and region,
+        API calls are paced by the engine's per-endpoint token buckets, and
+        progress_callback is only invoked from the calling thread, so
+        Streamlit widgets can be updated safely.
+        """
+        engine = AsyncScanner(AsyncConfig.from_app_config(max_workers=max_workers))
+        shared_session = ThrottledSession(self.session, engine.throttler)
+        limits: Dict[Tuple[str, Optional[str]], threading.BoundedSemaphore] = {}
+        for task in scan_tasks:
+            family = SCAN_TASK_API_FAMILY.get(task.name, task.name)
+            if (family, task.region) not in limits:
+                limits[(family, task.region)] = threading.BoundedSemaphore(
+                    SERVICE_CONCURRENCY_LIMITS.get(family, DEFAULT_SERVICE_CONCURRENCY)
+                )
 
+        def run_limited(task: ScanTask):
+            family = SCAN_TASK_API_FAMILY.get(task.name, task.name)
+            with limits[(family, task.region)]:
+                return self._run_task(task, shared_session)
+
+        total_tasks = len(scan_tasks)
+        completed = 0
+
+        def on_complete(idx: int, result, error):
+            nonlocal completed
+            completed += 1
+            if progress_callback:
+                progress_callback(
+                    completed / total_tasks,
+                    f"Scanned {scan_tasks[idx].label} ({completed}/{total_tasks})..."
+                )
+
+        jobs = [
+            (idx, lambda task=task: run_limited(task))
+            for idx, task in enumerate(scan_tasks)
+        ]
+        try:
+            results = run_async(engine.run_jobs(jobs, on_complete))
+        finally:
+            engine.shutdown()
+
+        for idx, task in enumerate(scan_tasks):
+            shard, error = results[idx]
+            self._merge_task_result(task, shard, error, multi_region)
 
     def _calculate_pillar_scores(self) -> Dict[str, PillarScore]:
         """Calculate pillar scores"""
         pillar_scores = {}
         pillars = ['Security', 'Reliability', 'Performance Efficiency', 'Cost Optimization', 'Operational Excellence', 'Sustainability']
         
+        table = FindingsTable.from_findings(self.findings, service='source_service')
+        counts = table.severity_matrix(pillars)
+        totals = table.pillar_totals(pillars)
+        scores = table.pillar_scores({'CRITICAL': 20, 'HIGH': 10, 'MEDIUM': 5, 'LOW': 2, 'INFO': 2}, pillars)
+        
         for pillar in pillars:
-            pfindings = [f for f in self.findings if f.pillar == pillar]
-            critical = sum(1 for f in pfindings if f.severity == 'CRITICAL')
-            high = sum(1 for f in pfindings if f.severity == 'HIGH')
-            medium = sum(1 for f in pfindings if f.severity == 'MEDIUM')
-            low = sum(1 for f in pfindings if f.severity in ['LOW', 'INFO'])
-            
-            score = 100 - (critical * 20) - (high * 10) - (medium * 5) - (low * 2)
-            score = max(0, min(100, score))
-            
+            row = counts.loc[pillar]
             pillar_scores[pillar] = PillarScore(
                 name=pillar,
-                score=score,
-                findings_count=len(pfindings),
-                critical_count=critical,
-                high_count=high,
-                medium_count=medium,
-                low_count=low,
-                top_findings=pfindings[:5]
+                score=int(scores[pillar]),
+                findings_count=int(totals[pillar]),
+                critical_count=int(row['CRITICAL']),
+                high_count=int(row['HIGH']),
+                medium_count=int(row['MEDIUM']),
+                low_count=int(row['LOW'] + row['INFO']),
+                top_findings=[self.findings[i] for i in table.first_rows(pillar, 5)]
             )
         
         return pillar_scores
@@ -3081,15 +3438,35 @@ def render_landscape_scanner_tab():
             return
     
     # Options
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
     with col1:
         regions = st.multiselect(
             "Regions",
-            ["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-1"],
+            ["us-east-1", "us-east-2", "us-west-1", "us-west-2", "ca-central-1",
+             "eu-west-1", "eu-west-2", "eu-central-1", "eu-north-1",
+             "ap-southeast-1", "ap-southeast-2", "ap-northeast-1", "ap-south-1",
+             "sa-east-1"],
             default=["us-east-1", "us-west-2"]
         )
     with col2:
         generate_pdf = st.checkbox("📄 Generate PDF Report", value=True)
+    with col3:
+        parallel_scan = st.checkbox("⚡ Parallel Scan", value=True,
+                                    help="Scan services concurrently on a bounded worker pool")
+        skip_inactive = st.checkbox("⏭️ Skip Empty Regions", value=False,
+                                    help="Skip regions with no EC2, Lambda, RDS, ECS or custom VPCs "
+                                         "(results cached for 24 hours)")
+        incremental_scan = st.checkbox("♻️ Incremental Scan", value=False,
+                                       help="Reuse findings for security groups, EC2 instances, EBS volumes, "
+                                            "RDS instances and Lambda functions unchanged since the last "
+                                            "incremental scan, and for KMS keys and DynamoDB tables AWS Config "
+                                            "reports unchanged. S3 buckets and IAM users are always re-checked")
+    config_aggregator = st.text_input(
+        "AWS Config Aggregator (optional)", value="",
+        help="Inventory every account in the aggregator with AWS Config advanced queries "
+             "instead of per-service API calls. Uses the first selected region as the "
+             "aggregator's home region."
+    ).strip()
     
     # Run scan button
     btn_text = "🎭 Run Demo Assessment" if is_demo else "🚀 Run Live Assessment"
@@ -3123,8 +3500,24 @@ def render_landscape_scanner_tab():
             
             # Create scanner with validated session
             try:
-                scanner = AWSLandscapeScanner(session)
-                assessment = scanner.run_scan(regions, lambda p, m: (progress.progress(p), status.text(m)))
+                if config_aggregator:
+                    from config_inventory import ConfigInventoryScanner
+                    scanner = ConfigInventoryScanner(
+                        session, config_aggregator, region=regions[0] if regions else 'us-east-1'
+                    )
+                    assessment = scanner.run_scan(
+                        regions, lambda p, m: (progress.progress(p), status.text(m))
+                    )
+                else:
+                    scanner = AWSLandscapeScanner(session)
+                    assessment = scanner.run_scan(
+                        regions,
+                        lambda p, m: (progress.progress(p), status.text(m)),
+                        concurrent=parallel_scan,
+                        skip_inactive_regions=skip_inactive,
+                        incremental=incremental_scan,
+                        use_config_changes=incremental_scan
+                    )
             except Exception as e:
                 st.error(f"❌ Scan failed: {str(e)}")
                 st.info("💡 Try reconnecting in the AWS Connector tab or switch to Demo mode")
@@ -3213,6 +3606,31 @@ def render_assessment_summary(assessment: LandscapeAssessment):
             </p>
         </div>
         """, unsafe_allow_html=True)
+    
+    # Regional breakdown (multi-region scans)
+    region_inventories = getattr(assessment, 'region_inventories', {}) or {}
+    if len([r for r in region_inventories if r != GLOBAL_REGION_KEY]) > 1:
+        with st.expander("🌍 Regional Breakdown"):
+            rows = []
+            for region, inv in region_inventories.items():
+                rows.append({
+                    'Region': region,
+                    'Findings': sum(1 for f in assessment.findings if f.region == region),
+                    'EC2': inv.ec2_instances,
+                    'Lambda': inv.lambda_functions,
+                    'RDS': inv.rds_instances,
+                    'EBS Volumes': inv.ebs_volumes,
+                    'VPCs': inv.vpcs,
+                    'Load Balancers': inv.load_balancers,
+                })
+            st.dataframe(rows, use_container_width=True, hide_index=True)
+    skipped_regions = getattr(assessment, 'skipped_regions', []) or []
+    if skipped_regions:
+        st.caption(f"⏭️ Skipped empty regions: {', '.join(skipped_regions)}")
+    incremental_stats = getattr(assessment, 'incremental_stats', {}) or {}
+    if incremental_stats.get('carried_forward'):
+        st.caption(f"♻️ Incremental scan: {incremental_stats['checked']} resources checked, "
+                   f"{incremental_stats['carried_forward']} unchanged and reused")
 
 def render_pillar_scores(assessment: LandscapeAssessment):
     """Render pillar scores"""
@@ -0,0 +1,379 @@
+"""
+LLM Gateway Module
+==================
+Single entry point for Claude calls (Anthropic API and Bedrock) with a
+content-addressed, disk-backed response cache.
+
+Identical requests - same model, system prompt, normalized messages and
+generation parameters - are answered from a SQLite cache instead of
+being re-sent, so reruns and repeated analyses of the same findings cost
+neither latency nor tokens. The cache is shared by every process on the
+host, bounded by size (least recently used entries are evicted first)
+and entries expire after a TTL.
+
+Usage:
+    from llm_gateway import create_message
+
+    # Drop-in for client.messages.create(...)
+    response = create_message(client, model=..., max_tokens=..., messages=[...])
+    text = response.content[0].text
+"""
+
+import hashlib
+import io
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+from sqlite_pool import get_connection_pool
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+@dataclass
+class ResponseCacheConfig:
+    """Response cache location and limits"""
+    enabled: bool = True
+    path: str = "data/llm_cache.db"
+    max_size_mb: int = 256
+    ttl_seconds: int = 7 * 24 * 3600
+
+    @classmethod
+    def from_app_config(cls) -> 'ResponseCacheConfig':
+        """Build from production_config's AI settings"""
+        config = cls()
+        try:
+            from production_config import get_config
+            ai_config = get_config().ai
+            config.enabled = ai_config.response_cache_enabled
+            config.path = ai_config.response_cache_path
+            config.max_size_mb = ai_config.response_cache_max_mb
+            config.ttl_seconds = ai_config.response_cache_ttl_hours * 3600
+        except Exception as e:
+            logger.debug(f"Using default LLM cache settings: {e}")
+        return config
+
+
+# Parameters that only affect transport, not the generated text
+_UNCACHED_PARAMS = {'extra_headers', 'extra_query', 'extra_body', 'timeout', 'metadata'}
+
+
+def normalize_prompt(text: str) -> str:
+    """Normalize line endings and trailing whitespace so cosmetic differences hit the cache"""
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return re.sub(r'[ \t]+\n', '\n', text).strip()
+
+
+def _normalize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        return normalize_prompt(content)
+    if isinstance(content, list):
+        return [_normalize_content(item) for item in content]
+    if isinstance(content, dict):
+        return {k: (_normalize_content(v) if k in ('text', 'content') else v)
+                for k, v in content.items()}
+    return content
+
+
+def cache_key(model: str, system: Any, messages: List[Dict], params: Dict[str, Any]) -> str:
+    """Content address of a request: model, system prompt, normalized messages and parameters"""
+    payload = json.dumps({
+        'model': model,
+        'system': _normalize_content(system) if system else None,
+        'messages': _normalize_content(messages),
+        'params': {k: v for k, v in params.items() if k not in _UNCACHED_PARAMS},
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+class ResponseCache:
+    """SQLite key/value store with TTL and LRU eviction by total size"""
+
+    def __init__(self, config: ResponseCacheConfig = None):
+        self.config = config or ResponseCacheConfig.from_app_config()
+        self.pool = get_connection_pool(self.config.path)
+        self._write_lock = threading.Lock()
+        self._init_schema()
+
+    def _init_schema(self):
+        with self.pool.connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response_json TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access
+                    ON llm_responses (last_access);
+            """)
+
+    def get(self, key: str) -> Optional[Dict]:
+        now = time.time()
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT response_json, created_at FROM llm_responses WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row['created_at'] > self.config.ttl_seconds:
+                with conn:
+                    conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+                return None
+            with conn:
+                conn.execute("UPDATE llm_responses SET last_access = ? WHERE cache_key = ?", (now, key))
+            return json.loads(row['response_json'])
+
+    def put(self, key: str, model: str, response: Dict):
+        data = json.dumps(response, default=str)
+        now = time.time()
+        with self._write_lock, self.pool.connection() as conn:
+            with conn:
+                conn.execute("""
+                    INSERT INTO llm_responses (cache_key, model, response_json, size_bytes, created_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        response_json = excluded.response_json,
+                        size_bytes = excluded.size_bytes,
+                        created_at = excluded.created_at,
+                        last_access = excluded.last_access
+                """, (key, model, data, len(data), now, now))
+                self._evict(conn, now)
+
+    def _evict(self, conn, now: float):
+        conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.config.ttl_seconds,))
+
+        max_bytes = self.config.max_size_mb * 1024 * 1024
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM llm_responses").fetchone()[0]
+        if total <= max_bytes:
+            return
+        # Trim to 90% so eviction doesn't run on every write at the cap
+        excess = total - int(max_bytes * 0.9)
+        conn.execute("""
+            DELETE FROM llm_responses WHERE cache_key IN (
+                SELECT cache_key FROM (
+                    SELECT cache_key,
+                           SUM(size_bytes) OVER (ORDER BY last_access, cache_key
+                                                 ROWS UNBOUNDED PRECEDING) - size_bytes AS freed_before
+                    FROM llm_responses
+                ) WHERE freed_before < ?
+            )
+        """, (excess,))
+
+    def clear(self):
+        with self._write_lock, self.pool.connection() as conn:
+            with conn:
+                conn.execute("DELETE FROM llm_responses")
+
+    def stats(self) -> Dict[str, Any]:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_responses"
+            ).fetchone()
+        return {'entries': row[0], 'size_bytes': row[1]}
+
+
+# ============================================================================
+# CACHED RESPONSE OBJECTS
+# ============================================================================
+
+@dataclass
+class CachedTextBlock:
+    text: str
+    type: str = "text"
+
+
+@dataclass
+class CachedMessage:
+    """Stand-in for anthropic's Message when served from cache"""
+    model: str
+    content: List[CachedTextBlock] = field(default_factory=list)
+    stop_reason: Optional[str] = None
+    role: str = "assistant"
+    usage: Optional[Dict[str, int]] = None
+    cached: bool = True
+
+
+# ============================================================================
+# GATEWAY
+# ============================================================================
+
+class LLMGateway:
+    """Routes Claude calls through the shared response cache"""
+
+    def __init__(self, cache: Optional[ResponseCache] = None, enabled: bool = None):
+        config = cache.config if cache else ResponseCacheConfig.from_app_config()
+        self.enabled = config.enabled if enabled is None else enabled
+        self._cache = cache
+        self._config = config
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        if self._cache is None and self.enabled:
+            with self._lock:
+                if self._cache is None:
+                    try:
+                        self._cache = ResponseCache(self._config)
+                    except Exception as e:
+                        logger.warning(f"LLM response cache unavailable, calling the API directly: {e}")
+                        self.enabled = False
+        return self._cache
+
+    def _lookup(self, key: str) -> Optional[Dict]:
+        try:
+            cached = self.cache.get(key)
+        except Exception as e:
+            logger.debug(f"LLM cache read failed: {e}")
+            return None
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return cached
+
+    def _store(self, key: str, model: str, response: Dict):
+        try:
+            self.cache.put(key, model, response)
+        except Exception as e:
+            logger.debug(f"LLM cache write failed: {e}")
+
+    def create_message(self, client, before_call: Optional[Callable[[], Any]] = None,
+                       **kwargs) -> Any:
+        """
+        Cached equivalent of client.messages.create(**kwargs).
+
+        Returns the API response on a miss and a CachedMessage (same
+        .content[i].text / .stop_reason shape) on a hit. Streaming and
+        tool-use requests are passed straight through. before_call (e.g. a
+        rate limiter's acquire) runs only when the API is actually called.
+        """
+        if not self.enabled or kwargs.get('stream') or kwargs.get('tools') or self.cache is None:
+            if before_call:
+                before_call()
+            return client.messages.create(**kwargs)
+
+        params = {k: v for k, v in kwargs.items() if k not in ('model', 'system', 'messages')}
+        key = cache_key(kwargs.get('model'), kwargs.get('system'), kwargs.get('messages', []), params)
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return CachedMessage(
+                model=cached.get('model', kwargs.get('model')),
+                content=[CachedTextBlock(text) for text in cached.get('texts', [])],
+                stop_reason=cached.get('stop_reason'),
+            )
+
+        if before_call:
+            before_call()
+        response = client.messages.create(**kwargs)
+        texts = [block.text for block in getattr(response, 'content', []) if hasattr(block, 'text')]
+        if texts:
+            self._store(key, kwargs.get('model'), {
+                'model': getattr(response, 'model', kwargs.get('model')),
+                'texts': texts,
+                'stop_reason': getattr(response, 'stop_reason', None),
+            })
+        return response
+
+    def invoke_model(self, client, **kwargs) -> Dict[str, Any]:
+        """
+        Cached equivalent of bedrock_runtime.invoke_model(**kwargs).
+
+        The returned dict's 'body' supports .read() like botocore's
+        StreamingBody.
+        """
+        if not self.enabled or self.cache is None:
+            return client.invoke_model(**kwargs)
+
+        try:
+            body = json.loads(kwargs.get('body') or '{}')
+        except (TypeError, ValueError):
+            return client.invoke_model(**kwargs)
+        model = kwargs.get('modelId')
+        params = {k: v for k, v in body.items() if k not in ('system', 'messages')}
+        key = cache_key(model, body.get('system'), body.get('messages', []), params)
+
+        cached = self._lookup(key)
+        if cached is not None:
+            return {'body': io.BytesIO(cached['body'].encode('utf-8')),
+                    'contentType': cached.get('contentType', 'application/json')}
+
+        response = client.invoke_model(**kwargs)
+        raw = response['body'].read()
+        text = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+        self._store(key, model, {'body': text, 'contentType': response.get('contentType')})
+        return {**response, 'body': io.BytesIO(text.encode('utf-8'))}
+
+    def stats(self) -> Dict[str, Any]:
+        stats = {'enabled': self.enabled, 'hits': self.hits, 'misses': self.misses}
+        if self.enabled and self.cache is not None:
+            stats.update(self.cache.stats())
+        return stats
+
+
+# ============================================================================
+# SINGLETON INSTANCE
+# ============================================================================
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get or create the shared LLM gateway"""
+    global _gateway
+
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway()
+        return _gateway
+
+
+def create_message(client, before_call: Optional[Callable[[], Any]] = None, **kwargs) -> Any:
+    """client.messages.create(**kwargs) through the shared gateway"""
+    return get_llm_gateway().create_message(client, before_call, **kwargs)
+
+
+def invoke_model(client, **kwargs) -> Dict[str, Any]:
+    """bedrock_runtime.invoke_model(**kwargs) through the shared gateway"""
+    return get_llm_gateway().invoke_model(client, **kwargs)
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'ResponseCacheConfig',
+    'ResponseCache',
+    'LLMGateway',
+    'CachedMessage',
+    'cache_key',
+    'normalize_prompt',
+    'get_llm_gateway',
+    'create_message',
+    'invoke_model',
+]
@@ -0,0 +1,322 @@
+"""
+Metrics Engine Module
+=====================
+Batched CloudWatch metric retrieval built on GetMetricData.
+
+One GetMetricData request carries up to 500 metric queries, so a fleet's
+utilization is fetched in a handful of paged requests rather than one
+GetMetricStatistics call per resource and metric. Query windows are
+aligned to fixed time buckets and results are cached per
+(credentials, region, query, window), so dashboards that ask for the
+same data within a bucket never hit the API again. Series are returned
+as NumPy arrays ready for vectorised aggregation.
+
+Usage:
+    from metrics_engine import get_metrics_engine
+
+    engine = get_metrics_engine(session, 'us-east-1')
+    cpu = engine.resource_metric('AWS/EC2', 'CPUUtilization', 'InstanceId', instance_ids, days=14)
+    averages = {instance_id: series.mean() for instance_id, series in cpu.items()}
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+from credential_broker import credential_digest
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+MAX_QUERIES_PER_REQUEST = 500
+DEFAULT_BUCKET_SECONDS = 300
+DEFAULT_CACHE_TTL_SECONDS = 600
+MAX_CACHE_ENTRIES = 200_000
+MAX_PARALLEL_REQUESTS = 4
+MAX_ENGINES = 64
+
+
+def _session_identity(session) -> Tuple:
+    """Access key plus a keyed digest of the secret, so a known key ID alone matches nothing"""
+    credentials = session.get_credentials()
+    frozen = credentials.get_frozen_credentials() if credentials else None
+    if frozen is None:
+        return (id(session),)
+    return (frozen.access_key, credential_digest(frozen.secret_key, frozen.token))
+
+
+@dataclass(frozen=True)
+class MetricQuery:
+    """One metric series: namespace, name, dimensions, statistic and period"""
+    namespace: str
+    metric_name: str
+    dimensions: Tuple[Tuple[str, str], ...] = ()
+    stat: str = 'Average'
+    period: int = 3600
+
+    @classmethod
+    def for_resource(cls, namespace: str, metric_name: str, dimension_name: str,
+                     resource_id: str, stat: str = 'Average', period: int = 3600) -> 'MetricQuery':
+        return cls(namespace, metric_name, ((dimension_name, resource_id),), stat, period)
+
+    def to_api(self, query_id: str) -> Dict:
+        return {
+            'Id': query_id,
+            'MetricStat': {
+                'Metric': {
+                    'Namespace': self.namespace,
+                    'MetricName': self.metric_name,
+                    'Dimensions': [{'Name': name, 'Value': value} for name, value in self.dimensions],
+                },
+                'Period': self.period,
+                'Stat': self.stat,
+            },
+            'ReturnData': True,
+        }
+
+
+@dataclass
+class MetricSeries:
+    """Datapoints of one query, oldest first"""
+    timestamps: np.ndarray  # datetime64[s]
+    values: np.ndarray      # float64
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def mean(self, default: float = 0.0) -> float:
+        return float(self.values.mean()) if len(self.values) else default
+
+    def max(self, default: float = 0.0) -> float:
+        return float(self.values.max()) if len(self.values) else default
+
+    def percentile(self, q: float, default: float = 0.0) -> float:
+        return float(np.percentile(self.values, q)) if len(self.values) else default
+
+
+EMPTY_SERIES = MetricSeries(np.array([], dtype='datetime64[s]'), np.array([], dtype=np.float64))
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class MetricCache:
+    """In-process TTL cache of fetched series, shared by all engines"""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+                 max_entries: int = MAX_CACHE_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, Tuple[float, MetricSeries]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[MetricSeries]:
+        entry = self._entries.get(key)
+        if entry is None or time.time() - entry[0] > self.ttl_seconds:
+            return None
+        return entry[1]
+
+    def put_many(self, items: Dict[Tuple, MetricSeries]):
+        now = time.time()
+        with self._lock:
+            if len(self._entries) + len(items) > self.max_entries:
+                self._evict(now)
+            for key, series in items.items():
+                self._entries[key] = (now, series)
+
+    def _evict(self, now: float):
+        self._entries = {k: v for k, v in self._entries.items() if now - v[0] <= self.ttl_seconds}
+        # Still full: drop the oldest half
+        if len(self._entries) > self.max_entries // 2:
+            ordered = sorted(self._entries.items(), key=lambda item: item[1][0])
+            self._entries = dict(ordered[len(ordered) // 2:])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache = MetricCache()
+
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+class MetricsEngine:
+    """Fetches many metric series per GetMetricData request"""
+
+    def __init__(self, session, region: str, bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+                 cache: MetricCache = None):
+        self.region = region
+        self.bucket_seconds = bucket_seconds
+        self.cache = cache or _cache
+        self.client = session.client('cloudwatch', region_name=region)
+        self._identity = _session_identity(session)
+        self.api_calls = 0
+
+    def _window(self, start: datetime, end: datetime) -> Tuple[datetime, datetime]:
+        """Align a window to bucket boundaries so nearby calls share cache entries"""
+        bucket = self.bucket_seconds
+        end_ts = int(end.timestamp()) // bucket * bucket
+        start_ts = int(start.timestamp()) // bucket * bucket
+        return (datetime.fromtimestamp(start_ts, tz=timezone.utc),
+                datetime.fromtimestamp(end_ts, tz=timezone.utc))
+
+    def fetch(self, queries: Iterable[MetricQuery], start: datetime,
+              end: datetime = None) -> Dict[MetricQuery, MetricSeries]:
+        """
+        Fetch series for many queries.
+
+        Args:
+            queries: Metric queries (duplicates are fetched once)
+            start: Window start
+            end: Window end (default: now)
+
+        Returns:
+            Dict of query -> MetricSeries (empty series when no data)
+        """
+        end = end or datetime.now(timezone.utc)
+        start, end = self._window(start, end)
+        window = (self._identity, self.region, start, end)
+
+        results: Dict[MetricQuery, MetricSeries] = {}
+        missing: List[MetricQuery] = []
+        for query in dict.fromkeys(queries):
+            cached = self.cache.get((*window, query))
+            if cached is None:
+                missing.append(query)
+            else:
+                results[query] = cached
+
+        if missing:
+            chunks = [missing[i:i + MAX_QUERIES_PER_REQUEST]
+                      for i in range(0, len(missing), MAX_QUERIES_PER_REQUEST)]
+            fetched: Dict[MetricQuery, MetricSeries] = {}
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(chunks))) as executor:
+                futures = [executor.submit(self._fetch_chunk, chunk, start, end) for chunk in chunks]
+                for future in as_completed(futures):
+                    fetched.update(future.result())
+            self.cache.put_many({(*window, query): series for query, series in fetched.items()})
+            results.update(fetched)
+
+        return results
+
+    def _fetch_chunk(self, queries: List[MetricQuery], start: datetime,
+                     end: datetime) -> Dict[MetricQuery, MetricSeries]:
+        by_id = {f"q{i}": query for i, query in enumerate(queries)}
+        timestamps: Dict[str, List] = {query_id: [] for query_id in by_id}
+        values: Dict[str, List] = {query_id: [] for query_id in by_id}
+
+        paginator = self.client.get_paginator('get_metric_data')
+        for page in paginator.paginate(
+            MetricDataQueries=[query.to_api(query_id) for query_id, query in by_id.items()],
+            StartTime=start,
+            EndTime=end,
+            ScanBy='TimestampAscending'
+        ):
+            self.api_calls += 1
+            for result in page.get('MetricDataResults', []):
+                query_id = result['Id']
+                if query_id in timestamps:
+                    timestamps[query_id].extend(result.get('Timestamps', []))
+                    values[query_id].extend(result.get('Values', []))
+
+        series = {}
+        for query_id, query in by_id.items():
+            if not values[query_id]:
+                series[query] = EMPTY_SERIES
+                continue
+            stamps = np.array([int(ts.timestamp()) for ts in timestamps[query_id]], dtype='datetime64[s]')
+            data = np.asarray(values[query_id], dtype=np.float64)
+            order = np.argsort(stamps, kind='stable')
+            series[query] = MetricSeries(stamps[order], data[order])
+        return series
+
+    def resource_metric(self, namespace: str, metric_name: str, dimension_name: str,
+                        resource_ids: Iterable[str], days: int = 14, stat: str = 'Average',
+                        period: int = 3600) -> Dict[str, MetricSeries]:
+        """
+        One metric for many resources keyed by a single dimension.
+
+        Returns:
+            Dict of resource ID -> MetricSeries
+        """
+        queries = {resource_id: MetricQuery.for_resource(namespace, metric_name, dimension_name,
+                                                         resource_id, stat, period)
+                   for resource_id in resource_ids}
+        start = datetime.now(timezone.utc) - timedelta(days=days)
+        fetched = self.fetch(queries.values(), start)
+        return {resource_id: fetched.get(query, EMPTY_SERIES) for resource_id, query in queries.items()}
+
+    def mean_utilization(self, namespace: str, metric_name: str, dimension_name: str,
+                         resource_ids: List[str], days: int = 14,
+                         period: int = 3600) -> np.ndarray:
+        """
+        Mean of a metric per resource, aligned with resource_ids (NaN when no data).
+        """
+        series = self.resource_metric(namespace, metric_name, dimension_name, resource_ids,
+                                      days=days, period=period)
+        return np.array([series[r].mean(default=np.nan) for r in resource_ids], dtype=np.float64)
+
+
+# ============================================================================
+# SHARED ENGINES
+# ============================================================================
+
+_engines: 'OrderedDict[Tuple, MetricsEngine]' = OrderedDict()
+_engines_lock = threading.Lock()
+
+
+def get_metrics_engine(session, region: str) -> MetricsEngine:
+    """Get or create the engine for a session's credentials and region"""
+    key = (_session_identity(session), region)
+
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = MetricsEngine(session, region)
+            _engines[key] = engine
+            # Rotating STS credentials mint a new identity every hour
+            while len(_engines) > MAX_ENGINES:
+                _engines.popitem(last=False)
+        else:
+            _engines.move_to_end(key)
+        return engine
+
+
+def clear_metric_cache():
+    """Drop all cached series"""
+    _cache.clear()
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'MetricQuery',
+    'MetricSeries',
+    'MetricCache',
+    'MetricsEngine',
+    'get_metrics_engine',
+    'clear_metric_cache',
+    'MAX_QUERIES_PER_REQUEST',
+]
@@ -32,6 +32,7 @@ from enum import Enum
 from auth_azure_sso import require_permission
 import json
 import os
+from llm_gateway import create_message
 
 # ============================================================================
 # AI CLIENT INITIALIZATION
@@ -142,7 +143,7 @@ Respond with JSON:
 
 Respond ONLY with valid JSON."""
 
-        message = client.messages.create(
+        message = create_message(client,
             model="claude-sonnet-4-20250514",
             max_tokens=1000,
             messages=[{"role": "user", "content": prompt}]
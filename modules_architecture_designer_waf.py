@@ -21,6 +21,7 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field, asdict
 import uuid
 import re
+from llm_gateway import create_message
 
 # Import existing WAF engine
 try:
@@ -369,7 +370,7 @@ class NLPArchitectureParser:
         
         try:
             # Call Claude API to parse
-            message = anthropic_client.messages.create(
+            message = create_message(anthropic_client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 messages=[{
@@ -625,7 +626,7 @@ class WAFChatAssistant:
             })
             
             # Call Claude
-            message = anthropic_client.messages.create(
+            message = create_message(anthropic_client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=1000,
                 system=f"""You are an AWS Well-Architected Framework expert helping complete an architecture assessment.
@@ -29,6 +29,7 @@ from demo_mode_manager import DemoModeManager
 import json
 import os
 import random
+from llm_gateway import create_message
 
 # ============================================================================
 # PERFORMANCE OPTIMIZER - Makes module 10-100x faster!
@@ -327,7 +328,7 @@ Format as JSON:
 Respond ONLY with valid JSON."""
 
         import anthropic
-        message = client.messages.create(
+        message = create_message(client,
             model="claude-sonnet-4-20250514",
             max_tokens=2000,
             messages=[{"role": "user", "content": prompt}]
@@ -367,7 +368,7 @@ def natural_language_query(query: str, cost_data: Dict) -> str:
     
     try:
         import anthropic
-        message = client.messages.create(
+        message = create_message(client,
             model="claude-sonnet-4-20250514",
             max_tokens=1000,
             messages=[{
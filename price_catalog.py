@@ -0,0 +1,507 @@
+"""
+Price Catalog Module
+====================
+One local, indexed AWS price catalog shared by the cost estimators.
+
+Prices live in a SQLite table keyed by (service, region, item, os, term),
+where item is an instance type or a usage item such as a storage class.
+It is populated from AWS bulk Price List offer files (CSV or JSON),
+downloaded and ingested offline, never in the request path. It is
+seeded with the us-east-1 list prices the estimators used to hard-code,
+so it works before any ingest. Lookups read a per-(service, region)
+slice that is loaded into memory once, so pricing a large design costs
+dictionary lookups rather than API calls. Regions without ingested
+prices fall back to us-east-1; a warning is logged once per service and
+region, and callers can check has_prices() to flag such estimates.
+
+Usage:
+    from price_catalog import get_price_catalog
+
+    catalog = get_price_catalog()
+    monthly = catalog.monthly('AmazonEC2', 'm5.large', region='eu-west-1')
+
+    # Refresh offline (e.g. from cron):
+    #   python price_catalog.py refresh AmazonEC2,AmazonRDS us-east-1 eu-west-1
+    #   python price_catalog.py ingest ./AmazonEC2-us-east-1.csv
+"""
+
+import csv
+import io
+import json
+import os
+import threading
+import urllib.request
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+from sqlite_pool import get_connection_pool
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_CATALOG_PATH = os.environ.get('PRICE_CATALOG_PATH', 'data/price_catalog.db')
+DEFAULT_REGION = 'us-east-1'
+HOURS_PER_MONTH = 730
+
+OFFER_FILE_URL = 'https://pricing.us-east-1.amazonaws.com/offers/v1.0/aws/{service}/current/{region}/index.csv'
+
+ON_DEMAND = 'OnDemand'
+RESERVED_1YR = 'Reserved1yr'
+RESERVED_3YR = 'Reserved3yr'
+
+# Older offer files only carry the location name
+LOCATION_REGIONS = {
+    'US East (N. Virginia)': 'us-east-1',
+    'US East (Ohio)': 'us-east-2',
+    'US West (N. California)': 'us-west-1',
+    'US West (Oregon)': 'us-west-2',
+    'Canada (Central)': 'ca-central-1',
+    'EU (Ireland)': 'eu-west-1',
+    'EU (London)': 'eu-west-2',
+    'EU (Paris)': 'eu-west-3',
+    'EU (Frankfurt)': 'eu-central-1',
+    'EU (Stockholm)': 'eu-north-1',
+    'EU (Milan)': 'eu-south-1',
+    'Asia Pacific (Tokyo)': 'ap-northeast-1',
+    'Asia Pacific (Seoul)': 'ap-northeast-2',
+    'Asia Pacific (Osaka)': 'ap-northeast-3',
+    'Asia Pacific (Singapore)': 'ap-southeast-1',
+    'Asia Pacific (Sydney)': 'ap-southeast-2',
+    'Asia Pacific (Mumbai)': 'ap-south-1',
+    'Asia Pacific (Hong Kong)': 'ap-east-1',
+    'South America (Sao Paulo)': 'sa-east-1',
+    'Middle East (Bahrain)': 'me-south-1',
+    'Africa (Cape Town)': 'af-south-1',
+}
+
+# us-east-1 list prices: (service, item, os, unit, USD)
+SEED_PRICES: List[Tuple[str, str, str, str, float]] = [
+    # EC2 - Linux, shared tenancy, per hour
+    *[('AmazonEC2', item, 'Linux', 'Hrs', price) for item, price in {
+        't3.nano': 0.0052, 't3.micro': 0.0104, 't3.small': 0.0208, 't3.medium': 0.0416,
+        't3.large': 0.0832, 't3.xlarge': 0.1664, 't3.2xlarge': 0.3328,
+        'm5.large': 0.096, 'm5.xlarge': 0.192, 'm5.2xlarge': 0.384, 'm5.4xlarge': 0.768,
+        'm6i.large': 0.096, 'm6i.xlarge': 0.192, 'm6i.2xlarge': 0.384, 'm6i.4xlarge': 0.768,
+        'm6i.8xlarge': 1.536,
+        'm6a.large': 0.0864, 'm6a.xlarge': 0.1728, 'm6a.2xlarge': 0.3456,
+        'm6g.large': 0.077, 'm6g.xlarge': 0.154, 'm6g.2xlarge': 0.308,
+        'm7g.large': 0.0816, 'm7g.xlarge': 0.1632,
+        'c5.large': 0.085, 'c5.xlarge': 0.17, 'c5.2xlarge': 0.34,
+        'c6i.large': 0.085, 'c6i.xlarge': 0.17, 'c6i.2xlarge': 0.34, 'c6i.4xlarge': 0.68,
+        'c6g.large': 0.068, 'c6g.xlarge': 0.136,
+        'c7g.large': 0.0725, 'c7g.xlarge': 0.145,
+        'r5.large': 0.126, 'r5.xlarge': 0.252, 'r5.2xlarge': 0.504,
+        'r6i.large': 0.126, 'r6i.xlarge': 0.252, 'r6i.2xlarge': 0.504,
+        'r6g.large': 0.1008, 'r6g.xlarge': 0.2016,
+        'g5.xlarge': 1.006, 'g5.2xlarge': 1.212, 'g5.4xlarge': 1.624,
+        'g4dn.xlarge': 0.526, 'g4dn.2xlarge': 0.752,
+        'p4d.24xlarge': 32.77,
+        'inf2.xlarge': 0.758, 'inf2.8xlarge': 1.968,
+    }.items()],
+    # RDS - MySQL, Single-AZ, per hour
+    *[('AmazonRDS', item, 'MySQL', 'Hrs', price) for item, price in {
+        'db.t3.micro': 0.017, 'db.t3.small': 0.034, 'db.t3.medium': 0.068,
+        'db.t3.large': 0.136, 'db.t3.xlarge': 0.272,
+        'db.m5.large': 0.171, 'db.m5.xlarge': 0.342, 'db.m5.2xlarge': 0.684,
+        'db.r5.large': 0.24, 'db.r5.xlarge': 0.48,
+    }.items()],
+    # EBS - per GB-month (IOPS per IOPS-month)
+    ('AmazonEBS', 'gp3', '', 'GB-Mo', 0.08),
+    ('AmazonEBS', 'gp2', '', 'GB-Mo', 0.10),
+    ('AmazonEBS', 'io2', '', 'GB-Mo', 0.125),
+    ('AmazonEBS', 'st1', '', 'GB-Mo', 0.045),
+    ('AmazonEBS', 'sc1', '', 'GB-Mo', 0.015),
+    ('AmazonEBS', 'iops', '', 'IOPS-Mo', 0.005),
+    # S3 - per GB-month
+    ('AmazonS3', 'standard', '', 'GB-Mo', 0.023),
+    ('AmazonS3', 'intelligent_tiering', '', 'GB-Mo', 0.023),
+    ('AmazonS3', 'standard_ia', '', 'GB-Mo', 0.0125),
+    ('AmazonS3', 'one_zone_ia', '', 'GB-Mo', 0.01),
+    ('AmazonS3', 'glacier_instant', '', 'GB-Mo', 0.004),
+    ('AmazonS3', 'glacier_flexible', '', 'GB-Mo', 0.0036),
+    ('AmazonS3', 'glacier_deep', '', 'GB-Mo', 0.00099),
+    # Networking and platform
+    ('AmazonEKS', 'cluster', '', 'Hrs', 0.10),
+    ('AmazonVPC', 'nat_gateway', '', 'Hrs', 0.045),
+    ('AmazonVPC', 'nat_gateway_data', '', 'GB', 0.045),
+    ('AmazonVPC', 'vpc_endpoint', '', 'Hrs', 0.01),
+    ('AmazonVPC', 'inter_az_transfer', '', 'GB', 0.01),
+    ('ElasticLoadBalancing', 'alb', '', 'Hrs', 0.0225),
+    ('ElasticLoadBalancing', 'alb_lcu', '', 'LCU-Hrs', 0.008),
+    ('ElasticLoadBalancing', 'nlb', '', 'Hrs', 0.0225),
+    ('AmazonECR', 'storage', '', 'GB-Mo', 0.10),
+    ('AmazonCloudWatch', 'logs_ingestion', '', 'GB', 0.50),
+    ('AmazonCloudWatch', 'logs_storage', '', 'GB-Mo', 0.03),
+    ('AmazonCloudWatch', 'metric', '', 'Metric-Mo', 0.30),
+    ('AWSLambda', 'requests', '', '1M-Requests', 0.20),
+    ('AmazonDynamoDB', 'wcu', '', 'WCU-Mo', 0.47),
+    ('AmazonDynamoDB', 'rcu', '', 'RCU-Mo', 0.09),
+    ('AmazonCloudFront', 'data_transfer', '', 'GB', 0.085),
+    ('AmazonApiGateway', 'requests', '', '1M-Requests', 3.50),
+    ('AWSCloudTrail', 'trail', '', 'Trail-Mo', 2.00),
+    ('AmazonGuardDuty', 'events', '', '1M-Events', 4.80),
+    ('awswaf', 'web_acl', '', 'ACL-Mo', 5.00),
+]
+
+
+# ============================================================================
+# OFFER FILE PARSING
+# ============================================================================
+
+# JSON offer file attribute -> CSV column, so both formats share _classify
+_JSON_ATTRIBUTES = {
+    'instanceType': 'Instance Type',
+    'operatingSystem': 'Operating System',
+    'tenancy': 'Tenancy',
+    'preInstalledSw': 'Pre Installed S/W',
+    'capacitystatus': 'CapacityStatus',
+    'licenseModel': 'License Model',
+    'regionCode': 'Region Code',
+    'location': 'Location',
+    'databaseEngine': 'Database Engine',
+    'deploymentOption': 'Deployment Option',
+    'volumeApiName': 'Volume API Name',
+}
+
+
+def _region_of(row: Dict[str, str]) -> Optional[str]:
+    return row.get('Region Code') or LOCATION_REGIONS.get(row.get('Location', ''))
+
+
+def _term_of(row: Dict[str, str]) -> Optional[str]:
+    if row.get('TermType') == 'OnDemand':
+        return ON_DEMAND
+    if (row.get('TermType') == 'Reserved' and row.get('PurchaseOption') == 'No Upfront'
+            and row.get('OfferingClass', 'standard') == 'standard' and row.get('Unit') == 'Hrs'):
+        return {'1yr': RESERVED_1YR, '3yr': RESERVED_3YR}.get(row.get('LeaseContractLength'))
+    return None
+
+
+def _classify(product_family: str, row: Dict[str, str]) -> Optional[Tuple[str, str, str]]:
+    """(service, item, os) for the offer rows the catalog keeps, else None"""
+    if product_family == 'Compute Instance':
+        if (row.get('Tenancy') != 'Shared' or row.get('Pre Installed S/W', 'NA') != 'NA'
+                or row.get('CapacityStatus', 'Used') != 'Used'
+                or row.get('License Model', 'No License required') != 'No License required'):
+            return None
+        return 'AmazonEC2', row.get('Instance Type', ''), row.get('Operating System', '')
+    if product_family == 'Database Instance':
+        if row.get('Deployment Option') != 'Single-AZ' or row.get('License Model') == 'Bring your own license':
+            return None
+        return 'AmazonRDS', row.get('Instance Type', ''), row.get('Database Engine', '')
+    if product_family == 'Storage' and row.get('Volume API Name'):
+        return 'AmazonEBS', row['Volume API Name'], ''
+    return None
+
+
+def parse_offer_csv(lines: Iterable[str]) -> Iterator[Tuple]:
+    """
+    Stream catalog rows out of a bulk Price List CSV offer file.
+
+    Yields:
+        (service, region, item, os, term, unit, price) tuples
+    """
+    reader = csv.reader(lines)
+    header = None
+    for record in reader:
+        if header is None:
+            # Metadata lines (FormatVersion, Disclaimer, ...) precede the header
+            if record and record[0] == 'SKU':
+                header = record
+            continue
+        row = dict(zip(header, record))
+        term = _term_of(row)
+        if term is None:
+            continue
+        key = _classify(row.get('Product Family', ''), row)
+        region = _region_of(row)
+        if key is None or not key[1] or region is None:
+            continue
+        try:
+            price = float(row.get('PricePerUnit') or 0)
+        except ValueError:
+            continue
+        if price <= 0:
+            continue
+        yield (key[0], region, key[1], key[2], term, row.get('Unit', ''), price)
+
+
+def parse_offer_json(offer: Dict[str, Any]) -> Iterator[Tuple]:
+    """Catalog rows from a parsed JSON offer file (same tuples as parse_offer_csv)"""
+    products = {}
+    for sku, product in offer.get('products', {}).items():
+        attributes = product.get('attributes', {})
+        row = {column: attributes[name] for name, column in _JSON_ATTRIBUTES.items() if name in attributes}
+        key = _classify(product.get('productFamily', ''), row)
+        region = _region_of(row)
+        if key is not None and key[1] and region is not None:
+            products[sku] = (key, region)
+
+    for term_type, term_skus in offer.get('terms', {}).items():
+        for sku, offers in term_skus.items():
+            if sku not in products:
+                continue
+            (service, item, os_name), region = products[sku]
+            for term_offer in offers.values():
+                term_attributes = term_offer.get('termAttributes', {})
+                for dimension in term_offer.get('priceDimensions', {}).values():
+                    row = {
+                        'TermType': term_type,
+                        'Unit': dimension.get('unit', ''),
+                        'PurchaseOption': term_attributes.get('PurchaseOption'),
+                        'OfferingClass': term_attributes.get('OfferingClass', 'standard'),
+                        'LeaseContractLength': term_attributes.get('LeaseContractLength'),
+                    }
+                    term = _term_of(row)
+                    price = float(dimension.get('pricePerUnit', {}).get('USD') or 0)
+                    if term is not None and price > 0:
+                        yield (service, region, item, os_name, term, row['Unit'], price)
+
+
+# ============================================================================
+# CATALOG
+# ============================================================================
+
+class PriceCatalog:
+    """SQLite-backed price table with in-memory (service, region) slices"""
+
+    def __init__(self, db_path: str = DEFAULT_CATALOG_PATH):
+        self.db_path = db_path
+        self.pool = get_connection_pool(db_path)
+        self._slices: Dict[Tuple[str, str], Dict[Tuple[str, str, str], Tuple[float, str]]] = {}
+        self._fallback_warned = set()
+        self._lock = threading.Lock()
+        self._init_schema()
+
+    def _init_schema(self):
+        with self.pool.connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS prices (
+                    service TEXT NOT NULL,
+                    region TEXT NOT NULL,
+                    item TEXT NOT NULL,
+                    os TEXT NOT NULL DEFAULT '',
+                    term TEXT NOT NULL DEFAULT 'OnDemand',
+                    unit TEXT,
+                    price_usd REAL NOT NULL,
+                    source TEXT,
+                    PRIMARY KEY (service, region, item, os, term)
+                ) WITHOUT ROWID;
+
+                CREATE TABLE IF NOT EXISTS catalog_sources (
+                    source TEXT PRIMARY KEY,
+                    ingested_at TEXT,
+                    row_count INTEGER
+                );
+            """)
+            empty = conn.execute("SELECT 1 FROM prices LIMIT 1").fetchone() is None
+        if empty:
+            self._write(((service, DEFAULT_REGION, item, os_name, ON_DEMAND, unit, price)
+                         for service, item, os_name, unit, price in SEED_PRICES), 'seed')
+
+    def _write(self, rows: Iterable[Tuple], source: str, batch_size: int = 5000) -> int:
+        count = 0
+        batch: List[Tuple] = []
+        with self.pool.connection() as conn:
+            with conn:
+                for row in rows:
+                    batch.append((*row, source))
+                    if len(batch) >= batch_size:
+                        conn.executemany("INSERT OR REPLACE INTO prices VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                        count += len(batch)
+                        batch.clear()
+                if batch:
+                    conn.executemany("INSERT OR REPLACE INTO prices VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                    count += len(batch)
+                conn.execute("INSERT OR REPLACE INTO catalog_sources VALUES (?, ?, ?)",
+                             (source, datetime.now().isoformat(), count))
+        with self._lock:
+            self._slices.clear()
+        return count
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def ingest_file(self, path: str, regions: Optional[Iterable[str]] = None) -> int:
+        """
+        Ingest a bulk Price List offer file (.csv streamed, .json loaded).
+
+        Args:
+            path: Offer file path
+            regions: Only keep these regions (default: all in the file)
+
+        Returns:
+            Number of price rows written
+        """
+        if path.endswith('.json'):
+            with open(path, encoding='utf-8') as f:
+                rows = parse_offer_json(json.load(f))
+                return self._write(self._filter_regions(rows, regions), os.path.basename(path))
+        with open(path, newline='', encoding='utf-8') as f:
+            return self._write(self._filter_regions(parse_offer_csv(f), regions), os.path.basename(path))
+
+    def refresh_from_aws(self, services: Iterable[str] = ('AmazonEC2', 'AmazonRDS'),
+                         regions: Iterable[str] = (DEFAULT_REGION,)) -> Dict[str, int]:
+        """Download and stream-ingest the regional CSV offer files (run offline, e.g. from cron)"""
+        counts = {}
+        for service in services:
+            for region in regions:
+                url = OFFER_FILE_URL.format(service=service, region=region)
+                logger.info(f"Downloading price list {url}")
+                with urllib.request.urlopen(url, timeout=300) as response:
+                    lines = io.TextIOWrapper(response, encoding='utf-8', newline='')
+                    counts[f"{service}/{region}"] = self._write(parse_offer_csv(lines), f"{service}/{region}")
+        return counts
+
+    @staticmethod
+    def _filter_regions(rows: Iterable[Tuple], regions: Optional[Iterable[str]]) -> Iterator[Tuple]:
+        wanted = set(regions) if regions else None
+        return (row for row in rows if wanted is None or row[1] in wanted)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _slice(self, service: str, region: str) -> Dict[Tuple[str, str, str], Tuple[float, str]]:
+        key = (service, region)
+        prices = self._slices.get(key)
+        if prices is None:
+            with self.pool.connection() as conn:
+                rows = conn.execute(
+                    "SELECT item, os, term, price_usd, unit FROM prices WHERE service = ? AND region = ?",
+                    key
+                ).fetchall()
+            prices = {(r['item'], r['os'], r['term']): (r['price_usd'], r['unit']) for r in rows}
+            with self._lock:
+                self._slices[key] = prices
+        return prices
+
+    def has_prices(self, service: str, region: str) -> bool:
+        """True when the catalog holds prices for service in region itself"""
+        return bool(self._slice(service, region or DEFAULT_REGION))
+
+    def _check_region(self, service: str, region: str):
+        """Warn (once per service and region) when region has no prices of its own"""
+        region = region or DEFAULT_REGION
+        if region == DEFAULT_REGION or (service, region) in self._fallback_warned:
+            return
+        if not self.has_prices(service, region):
+            with self._lock:
+                self._fallback_warned.add((service, region))
+            logger.warning(f"No {service} prices ingested for {region}; estimates use {DEFAULT_REGION} "
+                           f"prices until a {region} offer file is ingested")
+
+    def lookup(self, service: str, item: str, region: str = DEFAULT_REGION,
+               os: str = '', term: str = ON_DEMAND) -> Optional[Tuple[float, str]]:
+        """(price, unit) for an exact key, falling back to us-east-1; None if unknown"""
+        if not os:
+            os = {'AmazonEC2': 'Linux', 'AmazonRDS': 'MySQL'}.get(service, '')
+        self._check_region(service, region)
+        for candidate in (region or DEFAULT_REGION, DEFAULT_REGION):
+            entry = self._slice(service, candidate).get((item, os, term))
+            if entry is not None:
+                return entry
+        return None
+
+    def price(self, service: str, item: str, region: str = DEFAULT_REGION,
+              os: str = '', term: str = ON_DEMAND, default: Optional[float] = None) -> Optional[float]:
+        """Unit price (per hour, per GB-month, ... as listed)"""
+        entry = self.lookup(service, item, region, os, term)
+        return entry[0] if entry else default
+
+    def hourly(self, service: str, item: str, region: str = DEFAULT_REGION,
+               os: str = '', term: str = ON_DEMAND, default: Optional[float] = None) -> Optional[float]:
+        """Hourly price of an hourly-billed item"""
+        return self.price(service, item, region, os, term, default)
+
+    def monthly(self, service: str, item: str, region: str = DEFAULT_REGION,
+                os: str = '', term: str = ON_DEMAND, default: Optional[float] = None) -> Optional[float]:
+        """Monthly price: hourly items x 730 hours, other units as listed"""
+        entry = self.lookup(service, item, region, os, term)
+        if entry is None:
+            return default
+        price, unit = entry
+        return price * HOURS_PER_MONTH if unit in ('Hrs', 'Hours') else price
+
+    def monthly_table(self, service: str, region: str = DEFAULT_REGION,
+                      os: str = '', term: str = ON_DEMAND) -> Dict[str, float]:
+        """item -> monthly price for every item of a service (region entries override us-east-1)"""
+        if not os:
+            os = {'AmazonEC2': 'Linux', 'AmazonRDS': 'MySQL'}.get(service, '')
+        self._check_region(service, region)
+        table = {}
+        for candidate in dict.fromkeys((DEFAULT_REGION, region or DEFAULT_REGION)):
+            for (item, item_os, item_term), (price, unit) in self._slice(service, candidate).items():
+                if item_os == os and item_term == term:
+                    table[item] = price * HOURS_PER_MONTH if unit in ('Hrs', 'Hours') else price
+        return table
+
+    def sources(self) -> List[Dict[str, Any]]:
+        """Ingested sources with timestamps and row counts"""
+        with self.pool.connection() as conn:
+            return [dict(r) for r in conn.execute(
+                "SELECT source, ingested_at, row_count FROM catalog_sources ORDER BY ingested_at DESC")]
+
+
+# ============================================================================
+# SINGLETON INSTANCE
+# ============================================================================
+
+_catalog: Optional[PriceCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_price_catalog() -> PriceCatalog:
+    """Get or create the shared price catalog"""
+    global _catalog
+
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = PriceCatalog()
+        return _catalog
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'PriceCatalog',
+    'get_price_catalog',
+    'parse_offer_csv',
+    'parse_offer_json',
+    'HOURS_PER_MONTH',
+    'ON_DEMAND',
+    'RESERVED_1YR',
+    'RESERVED_3YR',
+]
+
+
+if __name__ == "__main__":
+    import sys
+
+    usage = ("usage: python price_catalog.py ingest FILE [FILE ...]\n"
+             "       python price_catalog.py refresh SERVICE[,SERVICE] REGION [REGION ...]")
+    if len(sys.argv) < 3 or sys.argv[1] not in ('ingest', 'refresh'):
+        print(usage)
+        sys.exit(1)
+
+    catalog = get_price_catalog()
+    if sys.argv[1] == 'ingest':
+        for path in sys.argv[2:]:
+            print(f"{path}: {catalog.ingest_file(path)} prices")
+    else:
+        counts = catalog.refresh_from_aws(sys.argv[2].split(','), sys.argv[3:] or [DEFAULT_REGION])
+        for source, count in counts.items():
+            print(f"{source}: {count} prices")
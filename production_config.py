@@ -114,6 +114,11 @@ class AWSConfig:
     timeout_seconds: int = 30
     rate_limit_delay: float = 0.1
     
+    # Scan engine (async_operations)
+    scan_max_workers: int = 16
+    api_requests_per_second: float = 10.0
+    api_burst_size: int = 20
+    
     # AssumeRole
     default_role_name: str = "WAFScannerRole"
     session_duration: int = 3600
@@ -136,6 +141,12 @@ class AIConfig:
     auto_insights_enabled: bool = True
     architecture_analysis_enabled: bool = True
     remediation_suggestions_enabled: bool = True
+    
+    # Response cache (llm_gateway)
+    response_cache_enabled: bool = True
+    response_cache_path: str = "data/llm_cache.db"
+    response_cache_max_mb: int = 256
+    response_cache_ttl_hours: int = 168
 
 
 @dataclass
@@ -154,6 +165,11 @@ class DatabaseConfig:
     # Connection
     connection_timeout: int = 30
     max_connections: int = 10
+    
+    # SQLite pragmas (connections run in WAL mode)
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_cache_size_kb: int = 65536
+    sqlite_mmap_size_mb: int = 256
 
 
 @dataclass
@@ -233,10 +249,15 @@ class ProductionConfig:
         
         # AWS settings
         config.aws.default_region = os.environ.get('AWS_DEFAULT_REGION', 'us-east-1')
+        config.aws.scan_max_workers = int(os.environ.get('SCAN_MAX_WORKERS', config.aws.scan_max_workers))
         
         # AI settings
         config.ai.enabled = os.environ.get('AI_ENABLED', 'true').lower() == 'true'
         config.ai.model = os.environ.get('ANTHROPIC_MODEL', 'claude-3-sonnet-20240229')
+        config.ai.response_cache_enabled = os.environ.get('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+        config.ai.response_cache_path = os.environ.get('LLM_CACHE_PATH', config.ai.response_cache_path)
+        config.ai.response_cache_max_mb = int(os.environ.get('LLM_CACHE_MAX_MB', config.ai.response_cache_max_mb))
+        config.ai.response_cache_ttl_hours = int(os.environ.get('LLM_CACHE_TTL_HOURS', config.ai.response_cache_ttl_hours))
         
         # Database settings
         config.database.backend = os.environ.get('DB_BACKEND', 'sqlite')
@@ -1,19 +1,45 @@
 """
 Queue Service - Asynchronous Operations Management
 Handles background tasks and long-running operations
+
+Tasks are stored by a pluggable backend (SQLite by default) and claimed
+in priority order by worker pools, one pool per configured task type, so
+long scans and cost analyses don't queue behind each other. Pending and
+interrupted tasks are picked up again after a restart: functions
+registered with @task_handler, or any importable module-level function,
+called with JSON-serializable arguments are durable. Closures still run,
+but only for the life of the process that submitted them.
 """
 
 import streamlit as st
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Iterable
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+import importlib
+import inspect
 import json
+import os
+import socket
 import threading
 import time
-from queue import Queue, Empty
 import uuid
 
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+from sqlite_pool import get_connection_pool
+
+logger = get_logger(__name__)
+
+DEFAULT_QUEUE_PATH = os.environ.get('TASK_QUEUE_PATH', 'data/task_queue.db')
+
+
 class TaskStatus(Enum):
     """Task execution status"""
     PENDING = "pending"
@@ -29,13 +55,18 @@ class TaskPriority(Enum):
     HIGH = 3
     CRITICAL = 4
 
+FINISHED_STATUSES = (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+
+ORPHANED_TASK_ERROR = ("The submitting process stopped before the task finished "
+                       "(only registered handlers survive a restart)")
+
 @dataclass
 class Task:
     """Represents a queued task"""
     task_id: str
     task_type: str
     task_name: str
-    function: Callable
+    function: Optional[Callable]
     args: tuple = field(default_factory=tuple)
     kwargs: dict = field(default_factory=dict)
     priority: TaskPriority = TaskPriority.NORMAL
@@ -47,86 +78,745 @@ class Task:
     error: Optional[str] = None
     progress: int = 0
     metadata: Dict = field(default_factory=dict)
+    handler: Optional[str] = None          # Registered name; None if the task can't survive a restart
+    submitted_by: Optional[str] = None     # Owner of the submitting queue; only it can run non-durable tasks
+    attempts: int = 0
+    max_retries: int = 0
+    available_at: Optional[datetime] = None  # Not claimed before this (retry backoff)
+    checkpoint: Any = None                 # Last value saved through TaskContext.report_progress
     
     def __lt__(self, other):
         """For priority queue sorting"""
         return self.priority.value > other.priority.value
 
 
+class QueueFullError(Exception):
+    """Raised by submit_task when the queue already holds max_pending tasks"""
+
+
+@dataclass
+class WorkerPoolConfig:
+    """Workers dedicated to one task type"""
+    workers: int = 1
+    mode: str = 'thread'                # 'thread' or 'process' (process tasks can't report progress)
+    max_retries: int = 0
+    retry_backoff_seconds: float = 5.0
+    
+    def retry_delay(self, attempt: int) -> float:
+        """Exponential backoff before retry number `attempt`"""
+        return self.retry_backoff_seconds * (2 ** max(0, attempt - 1))
+
+
+# Task handler registry
+
+_TASK_HANDLERS: Dict[str, Callable] = {}
+
+
+def task_handler(name: str = None):
+    """
+    Register a function as a durable task handler.
+    
+    Queued calls to a registered function are stored by name and can be
+    resumed by any process that imports the module defining it.
+    
+    Usage:
+        @task_handler()
+        def run_scan(account_id, task_context=None):
+            ...
+    """
+    def decorator(func: Callable) -> Callable:
+        handler_name = name or f"{func.__module__}:{func.__qualname__}"
+        _TASK_HANDLERS[handler_name] = func
+        func._task_handler_name = handler_name
+        return func
+    return decorator
+
+
+def handler_name(func: Callable) -> Optional[str]:
+    """
+    Name a function can be re-imported by, or None for closures, lambdas,
+    methods and functions defined in __main__ (a Streamlit script can't be
+    imported by another process)
+    """
+    name = getattr(func, '_task_handler_name', None)
+    if name:
+        return None if name.startswith('__main__:') else name
+    if not inspect.isfunction(func) or '<' in func.__qualname__ or func.__module__ == '__main__':
+        return None
+    return f"{func.__module__}:{func.__qualname__}"
+
+
+def resolve_handler(name: str) -> Optional[Callable]:
+    """Look up a handler by name, importing its module if needed"""
+    if name in _TASK_HANDLERS:
+        return _TASK_HANDLERS[name]
+    module_name, _, qualname = name.partition(':')
+    try:
+        target = importlib.import_module(module_name)
+        for part in qualname.split('.'):
+            target = getattr(target, part)
+        return target if callable(target) else None
+    except Exception:
+        return _TASK_HANDLERS.get(name)
+
+
+def _accepts_context(func: Callable) -> bool:
+    try:
+        return 'task_context' in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def _dumps(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    try:
+        return json.dumps(value, default=str)
+    except (TypeError, ValueError):
+        return json.dumps(str(value))
+
+
+def _loads(text: Optional[str]) -> Any:
+    return json.loads(text) if text else None
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+class TaskContext:
+    """
+    Handed to task functions that accept a ``task_context`` argument.
+    
+    report_progress() publishes progress and optionally saves a checkpoint.
+    If the task is interrupted (restart, crash) or retried, the next run
+    sees the last saved checkpoint in ``checkpoint`` and can skip the work
+    already done.
+    """
+    
+    def __init__(self, backend: 'TaskBackend', task: Task):
+        self._backend = backend
+        self.task_id = task.task_id
+        self.attempt = task.attempts
+        self.checkpoint = task.checkpoint
+    
+    def report_progress(self, progress: int, checkpoint: Any = None):
+        """Record progress (0-100) and, if given, a JSON-serializable checkpoint"""
+        if checkpoint is not None:
+            self.checkpoint = checkpoint
+        self._backend.update_progress(self.task_id, max(0, min(100, int(progress))), checkpoint)
+
+
+class TaskBackend(ABC):
+    """
+    Storage for TaskQueue.
+    
+    claim() must be atomic: a pending task is handed to exactly one worker,
+    even across processes sharing the backend. Tasks without a handler are
+    only handed to the owner that submitted them. Claimed tasks hold a
+    lease that their owner renews; tasks whose lease runs out (the owner
+    died) go back to pending, or fail if they have no handler.
+    """
+    
+    @abstractmethod
+    def add(self, task: Task) -> None:
+        """Store a new pending task"""
+        pass
+    
+    @abstractmethod
+    def claim(self, owner: str, lease_seconds: float,
+              task_types: Optional[Iterable[str]] = None,
+              exclude_types: Iterable[str] = ()) -> Optional[Task]:
+        """Mark the highest-priority available task this owner can run RUNNING and return it"""
+        pass
+    
+    @abstractmethod
+    def complete(self, task_id: str, result: Any) -> None:
+        """Mark a running task COMPLETED"""
+        pass
+    
+    @abstractmethod
+    def fail(self, task_id: str, error: str, retry_at: Optional[datetime] = None) -> None:
+        """Mark a running task FAILED, or back to PENDING until retry_at"""
+        pass
+    
+    @abstractmethod
+    def update_progress(self, task_id: str, progress: int, checkpoint: Any = None) -> None:
+        """Record progress and optionally a checkpoint"""
+        pass
+    
+    @abstractmethod
+    def renew_leases(self, owner: str, lease_seconds: float) -> None:
+        """Extend the lease on every task the owner is running and mark the owner alive"""
+        pass
+    
+    @abstractmethod
+    def requeue_expired(self) -> int:
+        """
+        Return running tasks with expired leases to PENDING; returns the count.
+        
+        Tasks without a handler whose owner is gone are failed instead.
+        """
+        pass
+    
+    @abstractmethod
+    def cancel(self, task_id: str) -> bool:
+        """Cancel a pending task"""
+        pass
+    
+    @abstractmethod
+    def get(self, task_id: str) -> Optional[Task]:
+        """Get a task by ID"""
+        pass
+    
+    @abstractmethod
+    def list_tasks(self, status: Optional[TaskStatus] = None,
+                   task_type: Optional[str] = None) -> List[Task]:
+        """Tasks, newest first"""
+        pass
+    
+    @abstractmethod
+    def count_pending(self) -> int:
+        """Number of pending tasks"""
+        pass
+    
+    @abstractmethod
+    def delete_finished(self, cutoff: datetime) -> List[str]:
+        """Delete finished tasks completed before cutoff; returns their IDs"""
+        pass
+
+
+class MemoryTaskBackend(TaskBackend):
+    """In-process backend (nothing survives a restart); mainly for tests"""
+    
+    def __init__(self):
+        self._tasks: Dict[str, Task] = {}
+        self._leases: Dict[str, tuple] = {}  # task_id -> (owner, expires_at)
+        self._lock = threading.Lock()
+    
+    def add(self, task: Task) -> None:
+        with self._lock:
+            self._tasks[task.task_id] = task
+    
+    def claim(self, owner, lease_seconds, task_types=None, exclude_types=()):
+        now = datetime.now()
+        types = set(task_types) if task_types is not None else None
+        excluded = set(exclude_types)
+        with self._lock:
+            candidates = [
+                t for t in self._tasks.values()
+                if t.status == TaskStatus.PENDING
+                and (t.available_at is None or t.available_at <= now)
+                and (t.handler is not None or t.submitted_by == owner)
+                and (types is None or t.task_type in types)
+                and t.task_type not in excluded
+            ]
+            if not candidates:
+                return None
+            task = min(candidates, key=lambda t: (-t.priority.value, t.created_at))
+            task.status = TaskStatus.RUNNING
+            task.started_at = now
+            task.attempts += 1
+            self._leases[task.task_id] = (owner, now + timedelta(seconds=lease_seconds))
+            return task
+    
+    def complete(self, task_id, result):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task:
+                task.status = TaskStatus.COMPLETED
+                task.completed_at = datetime.now()
+                task.result = result
+                task.progress = 100
+                self._leases.pop(task_id, None)
+    
+    def fail(self, task_id, error, retry_at=None):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task:
+                task.error = error
+                if retry_at:
+                    task.status = TaskStatus.PENDING
+                    task.available_at = retry_at
+                else:
+                    task.status = TaskStatus.FAILED
+                    task.completed_at = datetime.now()
+                self._leases.pop(task_id, None)
+    
+    def update_progress(self, task_id, progress, checkpoint=None):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task:
+                task.progress = progress
+                if checkpoint is not None:
+                    task.checkpoint = checkpoint
+    
+    def renew_leases(self, owner, lease_seconds):
+        expires = datetime.now() + timedelta(seconds=lease_seconds)
+        with self._lock:
+            for task_id, (lease_owner, _) in list(self._leases.items()):
+                if lease_owner == owner:
+                    self._leases[task_id] = (owner, expires)
+    
+    def requeue_expired(self):
+        now = datetime.now()
+        with self._lock:
+            expired = [task_id for task_id, (_, expires) in self._leases.items() if expires < now]
+            requeued = 0
+            for task_id in expired:
+                del self._leases[task_id]
+                task = self._tasks[task_id]
+                if task.handler is None:
+                    task.status = TaskStatus.FAILED
+                    task.completed_at = now
+                    task.error = ORPHANED_TASK_ERROR
+                    continue
+                task.status = TaskStatus.PENDING
+                task.available_at = now
+                requeued += 1
+        return requeued
+    
+    def cancel(self, task_id):
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task and task.status == TaskStatus.PENDING:
+                task.status = TaskStatus.CANCELLED
+                task.completed_at = datetime.now()
+                return True
+        return False
+    
+    def get(self, task_id):
+        with self._lock:
+            return self._tasks.get(task_id)
+    
+    def list_tasks(self, status=None, task_type=None):
+        with self._lock:
+            tasks = list(self._tasks.values())
+        if status:
+            tasks = [t for t in tasks if t.status == status]
+        if task_type:
+            tasks = [t for t in tasks if t.task_type == task_type]
+        return sorted(tasks, key=lambda t: t.created_at, reverse=True)
+    
+    def count_pending(self):
+        with self._lock:
+            return sum(1 for t in self._tasks.values() if t.status == TaskStatus.PENDING)
+    
+    def delete_finished(self, cutoff):
+        with self._lock:
+            to_remove = [
+                task_id for task_id, task in self._tasks.items()
+                if task.status in FINISHED_STATUSES
+                and task.completed_at and task.completed_at < cutoff
+            ]
+            for task_id in to_remove:
+                del self._tasks[task_id]
+        return to_remove
+
+
+class SQLiteTaskBackend(TaskBackend):
+    """
+    Durable backend on a local SQLite database.
+    
+    Claims are a single UPDATE ... RETURNING, so several processes (e.g.
+    Streamlit server workers) can share one queue file.
+    """
+    
+    def __init__(self, db_path: str = DEFAULT_QUEUE_PATH):
+        self.db_path = db_path
+        self.pool = get_connection_pool(db_path)
+        self._init_schema()
+    
+    def _init_schema(self):
+        with self.pool.connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    task_id TEXT PRIMARY KEY,
+                    task_type TEXT NOT NULL,
+                    task_name TEXT,
+                    handler TEXT,
+                    submitted_by TEXT,
+                    args_json TEXT,
+                    kwargs_json TEXT,
+                    priority INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    available_at TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_retries INTEGER NOT NULL DEFAULT 0,
+                    owner TEXT,
+                    lease_expires_at TEXT,
+                    progress INTEGER NOT NULL DEFAULT 0,
+                    checkpoint_json TEXT,
+                    result_json TEXT,
+                    error TEXT,
+                    metadata_json TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_tasks_claim
+                    ON tasks (status, priority DESC, created_at);
+                CREATE INDEX IF NOT EXISTS idx_tasks_type_status
+                    ON tasks (task_type, status);
+                
+                CREATE TABLE IF NOT EXISTS queue_owners (
+                    owner TEXT PRIMARY KEY,
+                    expires_at TEXT NOT NULL
+                );
+            """)
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(tasks)")}
+            if 'submitted_by' not in columns:
+                with conn:
+                    conn.execute("ALTER TABLE tasks ADD COLUMN submitted_by TEXT")
+                    # Non-durable tasks queued before owners were recorded can't be run by anyone
+                    conn.execute("""
+                        UPDATE tasks SET status = 'failed', completed_at = ?, error = ?
+                        WHERE handler IS NULL AND status IN ('pending', 'running')
+                    """, (datetime.now().isoformat(), ORPHANED_TASK_ERROR))
+    
+    @staticmethod
+    def _row_to_task(row) -> Task:
+        return Task(
+            task_id=row['task_id'],
+            task_type=row['task_type'],
+            task_name=row['task_name'],
+            function=None,
+            args=tuple(_loads(row['args_json']) or ()),
+            kwargs=_loads(row['kwargs_json']) or {},
+            priority=TaskPriority(row['priority']),
+            status=TaskStatus(row['status']),
+            created_at=_parse_time(row['created_at']),
+            started_at=_parse_time(row['started_at']),
+            completed_at=_parse_time(row['completed_at']),
+            result=_loads(row['result_json']),
+            error=row['error'],
+            progress=row['progress'],
+            metadata=_loads(row['metadata_json']) or {},
+            handler=row['handler'],
+            submitted_by=row['submitted_by'],
+            attempts=row['attempts'],
+            max_retries=row['max_retries'],
+            available_at=_parse_time(row['available_at']),
+            checkpoint=_loads(row['checkpoint_json']),
+        )
+    
+    def add(self, task: Task) -> None:
+        # Arguments of non-durable tasks live only in the submitting process
+        durable = task.handler is not None
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute("""
+                    INSERT INTO tasks (
+                        task_id, task_type, task_name, handler, submitted_by, args_json, kwargs_json,
+                        priority, status, created_at, available_at, max_retries, metadata_json
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    task.task_id, task.task_type, task.task_name, task.handler, task.submitted_by,
+                    json.dumps(list(task.args)) if durable else None,
+                    json.dumps(task.kwargs) if durable else None,
+                    task.priority.value, task.status.value,
+                    task.created_at.isoformat(),
+                    (task.available_at or task.created_at).isoformat(),
+                    task.max_retries, _dumps(task.metadata),
+                ))
+    
+    def claim(self, owner, lease_seconds, task_types=None, exclude_types=()):
+        now = datetime.now()
+        clauses, params = [], []
+        if task_types is not None:
+            task_types = list(task_types)
+            if not task_types:
+                return None
+            clauses.append(f"AND task_type IN ({','.join('?' * len(task_types))})")
+            params.extend(task_types)
+        exclude_types = list(exclude_types)
+        if exclude_types:
+            clauses.append(f"AND task_type NOT IN ({','.join('?' * len(exclude_types))})")
+            params.extend(exclude_types)
+        
+        with self.pool.connection() as conn:
+            with conn:
+                row = conn.execute(f"""
+                    UPDATE tasks
+                    SET status = 'running', owner = ?, started_at = ?, lease_expires_at = ?,
+                        attempts = attempts + 1
+                    WHERE task_id = (
+                        SELECT task_id FROM tasks
+                        WHERE status = 'pending' AND available_at <= ?
+                            AND (handler IS NOT NULL OR submitted_by = ?) {' '.join(clauses)}
+                        ORDER BY priority DESC, created_at
+                        LIMIT 1
+                    )
+                    RETURNING *
+                """, (owner, now.isoformat(), (now + timedelta(seconds=lease_seconds)).isoformat(),
+                      now.isoformat(), owner, *params)).fetchone()
+        return self._row_to_task(row) if row else None
+    
+    def complete(self, task_id, result):
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute("""
+                    UPDATE tasks
+                    SET status = 'completed', completed_at = ?, result_json = ?, progress = 100,
+                        owner = NULL, lease_expires_at = NULL
+                    WHERE task_id = ?
+                """, (datetime.now().isoformat(), _dumps(result), task_id))
+    
+    def fail(self, task_id, error, retry_at=None):
+        with self.pool.connection() as conn:
+            with conn:
+                if retry_at:
+                    conn.execute("""
+                        UPDATE tasks
+                        SET status = 'pending', available_at = ?, error = ?,
+                            owner = NULL, lease_expires_at = NULL
+                        WHERE task_id = ?
+                    """, (retry_at.isoformat(), error, task_id))
+                else:
+                    conn.execute("""
+                        UPDATE tasks
+                        SET status = 'failed', completed_at = ?, error = ?,
+                            owner = NULL, lease_expires_at = NULL
+                        WHERE task_id = ?
+                    """, (datetime.now().isoformat(), error, task_id))
+    
+    def update_progress(self, task_id, progress, checkpoint=None):
+        with self.pool.connection() as conn:
+            with conn:
+                if checkpoint is None:
+                    conn.execute("UPDATE tasks SET progress = ? WHERE task_id = ?", (progress, task_id))
+                else:
+                    conn.execute("UPDATE tasks SET progress = ?, checkpoint_json = ? WHERE task_id = ?",
+                                 (progress, _dumps(checkpoint), task_id))
+    
+    def renew_leases(self, owner, lease_seconds):
+        expires = (datetime.now() + timedelta(seconds=lease_seconds)).isoformat()
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute("UPDATE tasks SET lease_expires_at = ? WHERE status = 'running' AND owner = ?",
+                             (expires, owner))
+                conn.execute("""
+                    INSERT INTO queue_owners (owner, expires_at) VALUES (?, ?)
+                    ON CONFLICT (owner) DO UPDATE SET expires_at = excluded.expires_at
+                """, (owner, expires))
+    
+    def requeue_expired(self):
+        now = datetime.now().isoformat()
+        with self.pool.connection() as conn:
+            with conn:
+                # Non-durable tasks die with their submitter: running ones whose
+                # lease ran out, and pending ones whose submitter stopped heartbeating
+                conn.execute("""
+                    UPDATE tasks
+                    SET status = 'failed', completed_at = ?, error = ?, owner = NULL, lease_expires_at = NULL
+                    WHERE handler IS NULL AND (
+                        (status = 'running' AND lease_expires_at < ?)
+                        OR (status = 'pending' AND submitted_by IN (
+                            SELECT owner FROM queue_owners WHERE expires_at < ?
+                        ))
+                    )
+                """, (now, ORPHANED_TASK_ERROR, now, now))
+                conn.execute("DELETE FROM queue_owners WHERE expires_at < ?", (now,))
+                cursor = conn.execute("""
+                    UPDATE tasks
+                    SET status = 'pending', available_at = ?, owner = NULL, lease_expires_at = NULL
+                    WHERE status = 'running' AND lease_expires_at < ?
+                """, (now, now))
+                return cursor.rowcount
+    
+    def cancel(self, task_id):
+        with self.pool.connection() as conn:
+            with conn:
+                cursor = conn.execute(
+                    "UPDATE tasks SET status = 'cancelled', completed_at = ? WHERE task_id = ? AND status = 'pending'",
+                    (datetime.now().isoformat(), task_id))
+                return cursor.rowcount > 0
+    
+    def get(self, task_id):
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return self._row_to_task(row) if row else None
+    
+    def list_tasks(self, status=None, task_type=None):
+        query, params = "SELECT * FROM tasks WHERE 1 = 1", []
+        if status:
+            query += " AND status = ?"
+            params.append(status.value)
+        if task_type:
+            query += " AND task_type = ?"
+            params.append(task_type)
+        with self.pool.connection() as conn:
+            rows = conn.execute(query + " ORDER BY created_at DESC", params).fetchall()
+        return [self._row_to_task(row) for row in rows]
+    
+    def count_pending(self):
+        with self.pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM tasks WHERE status = 'pending'").fetchone()[0]
+    
+    def delete_finished(self, cutoff):
+        with self.pool.connection() as conn:
+            with conn:
+                rows = conn.execute("""
+                    DELETE FROM tasks
+                    WHERE status IN ('completed', 'failed', 'cancelled') AND completed_at < ?
+                    RETURNING task_id
+                """, (cutoff.isoformat(),)).fetchall()
+        return [row['task_id'] for row in rows]
+
+
 class TaskQueue:
     """Queue for managing asynchronous tasks"""
     
-    def __init__(self, max_workers: int = 3):
+    DEFAULT_POOL = '__default__'
+    
+    def __init__(self, max_workers: int = 3,
+                 backend: Optional[TaskBackend] = None,
+                 pools: Optional[Dict[str, WorkerPoolConfig]] = None,
+                 max_pending: int = 1000,
+                 lease_seconds: float = 120.0,
+                 poll_interval: float = 1.0):
         """
         Initialize task queue
         
         Args:
-            max_workers: Maximum number of concurrent workers
+            max_workers: Workers for task types without their own pool
+            backend: Task storage (default: SQLiteTaskBackend at DEFAULT_QUEUE_PATH)
+            pools: Dedicated worker pool per task type
+            max_pending: submit_task raises QueueFullError beyond this many pending tasks
+            lease_seconds: How long a running task stays claimed without a
+                heartbeat before another worker may resume it
+            poll_interval: Idle workers re-check the backend this often
         """
-        self.queue = Queue()
-        self.tasks: Dict[str, Task] = {}
+        self.backend = backend or SQLiteTaskBackend()
         self.max_workers = max_workers
+        self.pools = dict(pools or {})
+        self.pools.setdefault(self.DEFAULT_POOL, WorkerPoolConfig(workers=max_workers))
+        self.max_pending = max_pending
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
         self.workers: List[threading.Thread] = []
         self.running = False
         self.lock = threading.Lock()
+        self._wakeup = threading.Condition()
+        self._executors: Dict[str, ProcessPoolExecutor] = {}
+        # Functions, arguments and results of tasks submitted/run by this process
+        self._local: Dict[str, tuple] = {}
+        self._results: Dict[str, Any] = {}
     
     def start(self):
         """Start queue workers"""
         if not self.running:
             self.running = True
-            for i in range(self.max_workers):
-                worker = threading.Thread(target=self._worker, args=(i,), daemon=True)
-                worker.start()
-                self.workers.append(worker)
+            self.backend.requeue_expired()
+            
+            dedicated = [name for name in self.pools if name != self.DEFAULT_POOL]
+            for pool_name, config in self.pools.items():
+                if pool_name == self.DEFAULT_POOL:
+                    task_types, exclude_types = None, dedicated
+                else:
+                    task_types, exclude_types = [pool_name], ()
+                executor = None
+                if config.mode == 'process':
+                    executor = ProcessPoolExecutor(max_workers=config.workers)
+                    self._executors[pool_name] = executor
+                for i in range(config.workers):
+                    worker = threading.Thread(
+                        target=self._worker,
+                        args=(f"{pool_name}-{i}", config, task_types, exclude_types, executor),
+                        daemon=True
+                    )
+                    worker.start()
+                    self.workers.append(worker)
+            
+            heartbeat = threading.Thread(target=self._heartbeat, daemon=True)
+            heartbeat.start()
+            self.workers.append(heartbeat)
     
     def stop(self):
         """Stop queue workers"""
         self.running = False
+        with self._wakeup:
+            self._wakeup.notify_all()
         for worker in self.workers:
             if worker.is_alive():
                 worker.join(timeout=5)
         self.workers.clear()
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        self._executors.clear()
     
-    def _worker(self, worker_id: int):
+    def _heartbeat(self):
+        """Keep leases on our running tasks alive and recover tasks from dead workers"""
+        interval = max(1.0, self.lease_seconds / 3)
+        while self.running:
+            try:
+                self.backend.renew_leases(self.owner, self.lease_seconds)
+                if self.backend.requeue_expired():
+                    with self._wakeup:
+                        self._wakeup.notify_all()
+            except Exception as e:
+                logger.warning(f"Task queue heartbeat failed: {e}")
+            with self._wakeup:
+                self._wakeup.wait(timeout=interval)
+    
+    def _worker(self, worker_id: str, config: WorkerPoolConfig,
+                task_types: Optional[List[str]], exclude_types: Iterable[str],
+                executor: Optional[ProcessPoolExecutor]):
         """Worker thread that processes tasks"""
         while self.running:
             try:
-                # Get task with timeout
-                task = self.queue.get(timeout=1)
+                task = self.backend.claim(self.owner, self.lease_seconds, task_types, exclude_types)
                 
                 if task is None:
+                    with self._wakeup:
+                        self._wakeup.wait(timeout=self.poll_interval)
                     continue
                 
-                # Update task status
-                with self.lock:
-                    task.status = TaskStatus.RUNNING
-                    task.started_at = datetime.now()
-                
-                try:
-                    # Execute task
-                    result = task.function(*task.args, **task.kwargs)
-                    
-                    # Update task with result
-                    with self.lock:
-                        task.status = TaskStatus.COMPLETED
-                        task.completed_at = datetime.now()
-                        task.result = result
-                        task.progress = 100
-                
-                except Exception as e:
-                    # Handle error
-                    with self.lock:
-                        task.status = TaskStatus.FAILED
-                        task.completed_at = datetime.now()
-                        task.error = str(e)
-                
-                finally:
-                    self.queue.task_done()
+                self._execute(task, config, executor)
             
-            except Empty:
-                continue
             except Exception as e:
-                st.error(f"Worker {worker_id} error: {e}")
+                logger.error(f"Worker {worker_id} error: {e}")
+                time.sleep(self.poll_interval)
+    
+    def _execute(self, task: Task, config: WorkerPoolConfig, executor: Optional[ProcessPoolExecutor]):
+        """Run a claimed task and record the outcome"""
+        local = self._local.get(task.task_id)
+        if local:
+            function, args, kwargs = local
+        else:
+            function = resolve_handler(task.handler) if task.handler else None
+            args, kwargs = task.args, task.kwargs
+        
+        if function is None:
+            # Claims only hand non-durable tasks to their submitter, so this is
+            # a submitter that restarted or a handler that no longer imports
+            self.backend.fail(task.task_id, "Task function is not available in this process "
+                                            "(only registered handlers survive a restart)")
+            return
+        
+        try:
+            if executor is not None:
+                result = executor.submit(function, *args, **kwargs).result()
+            else:
+                if _accepts_context(function):
+                    kwargs = {**kwargs, 'task_context': TaskContext(self.backend, task)}
+                result = function(*args, **kwargs)
+        
+        except Exception as e:
+            if task.attempts <= task.max_retries:
+                delay = config.retry_delay(task.attempts)
+                logger.warning(f"Task {task.task_name} failed (attempt {task.attempts}), retrying in {delay:.0f}s: {e}")
+                self.backend.fail(task.task_id, str(e), datetime.now() + timedelta(seconds=delay))
+            else:
+                logger.error(f"Task {task.task_name} failed: {e}")
+                self.backend.fail(task.task_id, str(e))
+                self._local.pop(task.task_id, None)
+            return
+        
+        self._results[task.task_id] = result
+        self.backend.complete(task.task_id, result)
+        self._local.pop(task.task_id, None)
     
     def submit_task(
         self,
@@ -136,7 +826,8 @@ class TaskQueue:
         args: tuple = (),
         kwargs: dict = None,
         priority: TaskPriority = TaskPriority.NORMAL,
-        metadata: Dict = None
+        metadata: Dict = None,
+        max_retries: Optional[int] = None
     ) -> str:
         """
         Submit a new task to the queue
@@ -149,11 +840,30 @@ class TaskQueue:
             kwargs: Keyword arguments for function
             priority: Task priority
             metadata: Additional task metadata
+            max_retries: Retries after a failure (default: the task type's pool setting)
         
         Returns:
             Task ID
+        
+        Raises:
+            QueueFullError: If max_pending tasks are already waiting
         """
+        if self.backend.count_pending() >= self.max_pending:
+            raise QueueFullError(f"Task queue is full ({self.max_pending} pending tasks)")
+        
         task_id = str(uuid.uuid4())
+        kwargs = kwargs or {}
+        
+        # Durable only if the function can be re-imported and the arguments stored
+        handler = handler_name(function)
+        if handler:
+            try:
+                json.dumps([list(args), kwargs])
+            except (TypeError, ValueError):
+                handler = None
+        
+        if max_retries is None:
+            max_retries = self.pools.get(task_type, self.pools[self.DEFAULT_POOL]).max_retries
         
         task = Task(
             task_id=task_id,
@@ -161,26 +871,40 @@ class TaskQueue:
             task_name=task_name,
             function=function,
             args=args,
-            kwargs=kwargs or {},
+            kwargs=kwargs,
             priority=priority,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            handler=handler,
+            submitted_by=self.owner,
+            max_retries=max_retries
         )
         
         with self.lock:
-            self.tasks[task_id] = task
+            self._local[task_id] = (function, args, kwargs)
+        
+        self.backend.add(task)
         
-        self.queue.put(task)
+        with self._wakeup:
+            self._wakeup.notify_all()
         
         return task_id
     
+    def _with_local_state(self, task: Optional[Task]) -> Optional[Task]:
+        if task is not None:
+            local = self._local.get(task.task_id)
+            if local:
+                task.function = local[0]
+            if task.task_id in self._results:
+                task.result = self._results[task.task_id]
+        return task
+    
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID"""
-        with self.lock:
-            return self.tasks.get(task_id)
+        return self._with_local_state(self.backend.get(task_id))
     
     def get_task_status(self, task_id: str) -> Optional[TaskStatus]:
         """Get task status"""
-        task = self.get_task(task_id)
+        task = self.backend.get(task_id)
         return task.status if task else None
     
     def get_task_result(self, task_id: str) -> Optional[Any]:
@@ -192,11 +916,9 @@ class TaskQueue:
     
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a pending task"""
-        with self.lock:
-            task = self.tasks.get(task_id)
-            if task and task.status == TaskStatus.PENDING:
-                task.status = TaskStatus.CANCELLED
-                return True
+        if self.backend.cancel(task_id):
+            self._local.pop(task_id, None)
+            return True
         return False
     
     def get_all_tasks(
@@ -205,36 +927,75 @@ class TaskQueue:
         task_type: Optional[str] = None
     ) -> List[Task]:
         """Get all tasks, optionally filtered"""
-        with self.lock:
-            tasks = list(self.tasks.values())
-        
-        if status:
-            tasks = [t for t in tasks if t.status == status]
-        
-        if task_type:
-            tasks = [t for t in tasks if t.task_type == task_type]
-        
-        return sorted(tasks, key=lambda t: t.created_at, reverse=True)
+        return [self._with_local_state(t) for t in self.backend.list_tasks(status, task_type)]
     
     def get_queue_size(self) -> int:
         """Get current queue size"""
-        return self.queue.qsize()
+        return self.backend.count_pending()
     
     def clear_completed_tasks(self, older_than_hours: int = 24):
         """Clear completed tasks older than specified hours"""
         cutoff = datetime.now() - timedelta(hours=older_than_hours)
         
+        removed = self.backend.delete_finished(cutoff)
+        
         with self.lock:
-            to_remove = [
-                task_id for task_id, task in self.tasks.items()
-                if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]
-                and task.completed_at and task.completed_at < cutoff
-            ]
-            
-            for task_id in to_remove:
-                del self.tasks[task_id]
+            for task_id in removed:
+                self._results.pop(task_id, None)
         
-        return len(to_remove)
+        return len(removed)
+
+
+# Background task handlers - module level so queued tasks survive a restart
+
+@task_handler('deployment.infrastructure')
+def deploy_infrastructure_task(blueprint_name: str, account_id: str, region: str, parameters: Dict):
+    """Actual deployment function"""
+    # This would integrate with CloudFormation/Terraform
+    time.sleep(5)  # Simulate deployment
+    return {
+        'status': 'success',
+        'stack_id': f'stack-{uuid.uuid4()}',
+        'outputs': {}
+    }
+
+@task_handler('security_scan.account')
+def security_scan_task(account_id: str, scan_type: str = 'full'):
+    """Actual scan function"""
+    time.sleep(10)  # Simulate scan
+    return {
+        'findings_count': 5,
+        'critical': 1,
+        'high': 2,
+        'medium': 2
+    }
+
+@task_handler('cost_analysis.account')
+def cost_analysis_task(account_id: str, start_date: str, end_date: str):
+    """Actual analysis function"""
+    time.sleep(8)  # Simulate analysis
+    return {
+        'total_cost': 12345.67,
+        'services': {
+            'EC2': 5000,
+            'RDS': 3000,
+            'S3': 500
+        },
+        'recommendations': [
+            'Right-size EC2 instances',
+            'Enable S3 Intelligent-Tiering'
+        ]
+    }
+
+@task_handler('backup.resources')
+def backup_resources_task(account_id: str, resource_types: List[str]):
+    """Actual backup function"""
+    time.sleep(15)  # Simulate backup
+    return {
+        'backed_up': 50,
+        'failed': 2,
+        'backup_ids': [f'backup-{i}' for i in range(5)]
+    }
 
 
 class BackgroundTaskManager:
@@ -253,20 +1014,11 @@ class BackgroundTaskManager:
     ) -> str:
         """Submit infrastructure deployment task"""
         
-        def deploy_fn():
-            """Actual deployment function"""
-            # This would integrate with CloudFormation/Terraform
-            time.sleep(5)  # Simulate deployment
-            return {
-                'status': 'success',
-                'stack_id': f'stack-{uuid.uuid4()}',
-                'outputs': {}
-            }
-        
         return self.queue.submit_task(
             task_type='deployment',
             task_name=f'Deploy {blueprint_name} to {account_id}',
-            function=deploy_fn,
+            function=deploy_infrastructure_task,
+            args=(blueprint_name, account_id, region, parameters),
             priority=TaskPriority.HIGH,
             metadata={
                 'blueprint': blueprint_name,
@@ -283,20 +1035,11 @@ class BackgroundTaskManager:
     ) -> str:
         """Submit security scan task"""
         
-        def scan_fn():
-            """Actual scan function"""
-            time.sleep(10)  # Simulate scan
-            return {
-                'findings_count': 5,
-                'critical': 1,
-                'high': 2,
-                'medium': 2
-            }
-        
         return self.queue.submit_task(
             task_type='security_scan',
             task_name=f'Security scan for {account_id}',
-            function=scan_fn,
+            function=security_scan_task,
+            args=(account_id, scan_type),
             priority=TaskPriority.NORMAL,
             metadata={
                 'account_id': account_id,
@@ -312,26 +1055,11 @@ class BackgroundTaskManager:
     ) -> str:
         """Submit cost analysis task"""
         
-        def analyze_fn():
-            """Actual analysis function"""
-            time.sleep(8)  # Simulate analysis
-            return {
-                'total_cost': 12345.67,
-                'services': {
-                    'EC2': 5000,
-                    'RDS': 3000,
-                    'S3': 500
-                },
-                'recommendations': [
-                    'Right-size EC2 instances',
-                    'Enable S3 Intelligent-Tiering'
-                ]
-            }
-        
         return self.queue.submit_task(
             task_type='cost_analysis',
             task_name=f'Cost analysis for {account_id}',
-            function=analyze_fn,
+            function=cost_analysis_task,
+            args=(account_id, start_date.isoformat(), end_date.isoformat()),
             priority=TaskPriority.LOW,
             metadata={
                 'account_id': account_id,
@@ -347,19 +1075,11 @@ class BackgroundTaskManager:
     ) -> str:
         """Submit backup task"""
         
-        def backup_fn():
-            """Actual backup function"""
-            time.sleep(15)  # Simulate backup
-            return {
-                'backed_up': 50,
-                'failed': 2,
-                'backup_ids': [f'backup-{i}' for i in range(5)]
-            }
-        
         return self.queue.submit_task(
             task_type='backup',
             task_name=f'Backup resources in {account_id}',
-            function=backup_fn,
+            function=backup_resources_task,
+            args=(account_id, resource_types),
             priority=TaskPriority.HIGH,
             metadata={
                 'account_id': account_id,
@@ -368,11 +1088,20 @@ class BackgroundTaskManager:
         )
 
 
+# Long-running task types get their own workers so they don't wait behind each other
+DEFAULT_WORKER_POOLS = {
+    'security_scan': WorkerPoolConfig(workers=2, max_retries=2, retry_backoff_seconds=30),
+    'cost_analysis': WorkerPoolConfig(workers=2, max_retries=2, retry_backoff_seconds=30),
+    'deployment': WorkerPoolConfig(workers=2),
+    'backup': WorkerPoolConfig(workers=1, max_retries=1, retry_backoff_seconds=60),
+}
+
 # Global instances
 @st.cache_resource
 def get_task_queue() -> TaskQueue:
     """Get cached task queue instance"""
-    queue = TaskQueue(max_workers=3)
+    queue = TaskQueue(max_workers=3, backend=SQLiteTaskBackend(DEFAULT_QUEUE_PATH),
+                      pools=DEFAULT_WORKER_POOLS)
     queue.start()
     return queue
 
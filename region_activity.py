@@ -0,0 +1,305 @@
+"""
+Region Activity Module
+======================
+Finds which regions of an account actually hold resources, and remembers
+the answer on disk so later scans can skip empty regions without probing
+them again. The index is a SQLite table shared safely by every worker
+process.
+
+Each region is checked with several cheap, single-page API calls (EC2
+instances, Lambda functions, RDS instances, ECS clusters and non-default
+VPCs). All region/signal probes run in parallel.
+
+Usage:
+    from region_activity import RegionActivityProber
+
+    prober = RegionActivityProber()
+    active = prober.discover_active_regions(session, account_id, regions)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Callable, Tuple
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+try:
+    from async_operations import AdaptiveThrottler, ThrottledSession
+except ImportError:
+    AdaptiveThrottler = ThrottledSession = None
+
+from sqlite_pool import get_connection_pool
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_INDEX_PATH = os.environ.get('REGION_INDEX_PATH', 'data/region_activity.db')
+DEFAULT_INDEX_TTL_SECONDS = 24 * 3600
+DEFAULT_PROBE_WORKERS = 16
+
+
+def _probe_ec2(session, region) -> bool:
+    response = session.client('ec2', region_name=region).describe_instances(MaxResults=5)
+    return any(r.get('Instances') for r in response.get('Reservations', []))
+
+
+def _probe_lambda(session, region) -> bool:
+    response = session.client('lambda', region_name=region).list_functions(MaxItems=1)
+    return bool(response.get('Functions'))
+
+
+def _probe_rds(session, region) -> bool:
+    response = session.client('rds', region_name=region).describe_db_instances(MaxRecords=20)
+    return bool(response.get('DBInstances'))
+
+
+def _probe_ecs(session, region) -> bool:
+    response = session.client('ecs', region_name=region).list_clusters(maxResults=1)
+    return bool(response.get('clusterArns'))
+
+
+def _probe_vpc(session, region) -> bool:
+    response = session.client('ec2', region_name=region).describe_vpcs(
+        Filters=[{'Name': 'is-default', 'Values': ['false']}],
+        MaxResults=5
+    )
+    return bool(response.get('Vpcs'))
+
+
+# Signal name -> probe(session, region) returning True when the region is in use
+REGION_SIGNALS: Dict[str, Callable] = {
+    'ec2': _probe_ec2,
+    'lambda': _probe_lambda,
+    'rds': _probe_rds,
+    'ecs': _probe_ecs,
+    'vpc': _probe_vpc,
+}
+
+
+# ============================================================================
+# DATA CLASSES
+# ============================================================================
+
+@dataclass
+class RegionActivity:
+    """Probe outcome for one account/region"""
+    account_id: str
+    region: str
+    active: bool
+    signals: Dict[str, bool] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    checked_at: float = field(default_factory=time.time)
+
+    @property
+    def conclusive(self) -> bool:
+        """True if the region is active or at least one probe answered"""
+        return self.active or bool(self.signals)
+
+
+# ============================================================================
+# ON-DISK INDEX
+# ============================================================================
+
+class RegionActivityIndex:
+    """
+    SQLite table of RegionActivity records keyed by (account_id, region).
+
+    Entries older than ttl_seconds are ignored. Each write upserts only
+    its own rows, so processes sharing the file never drop each other's
+    entries.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH,
+                 ttl_seconds: int = DEFAULT_INDEX_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.pool = get_connection_pool(path)
+        self._init_schema()
+
+    def _init_schema(self):
+        with self.pool.connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS region_activity (
+                    account_id TEXT NOT NULL,
+                    region TEXT NOT NULL,
+                    active INTEGER NOT NULL,
+                    signals_json TEXT NOT NULL,
+                    errors_json TEXT NOT NULL,
+                    checked_at REAL NOT NULL,
+                    PRIMARY KEY (account_id, region)
+                )
+            """)
+
+    def get(self, account_id: str, region: str) -> Optional[RegionActivity]:
+        """Return the cached record, or None when missing or expired"""
+        try:
+            with self.pool.connection() as conn:
+                row = conn.execute("""
+                    SELECT active, signals_json, errors_json, checked_at
+                    FROM region_activity WHERE account_id = ? AND region = ?
+                """, (account_id, region)).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not read region index {self.path}: {e}")
+            return None
+        if row is None or time.time() - row['checked_at'] > self.ttl_seconds:
+            return None
+        return RegionActivity(
+            account_id=account_id,
+            region=region,
+            active=bool(row['active']),
+            signals=json.loads(row['signals_json']),
+            errors=json.loads(row['errors_json']),
+            checked_at=row['checked_at'],
+        )
+
+    def put_many(self, records: List[RegionActivity]):
+        """Store records, replacing any earlier entries for their regions"""
+        try:
+            with self.pool.connection() as conn:
+                with conn:
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO region_activity (
+                            account_id, region, active, signals_json, errors_json, checked_at
+                        ) VALUES (?, ?, ?, ?, ?, ?)
+                    """, [
+                        (r.account_id, r.region, int(r.active), json.dumps(r.signals),
+                         json.dumps(r.errors), r.checked_at)
+                        for r in records
+                    ])
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not write region index {self.path}: {e}")
+
+    def invalidate(self, account_id: Optional[str] = None):
+        """Forget one account's regions, or everything"""
+        try:
+            with self.pool.connection() as conn:
+                with conn:
+                    if account_id is None:
+                        conn.execute("DELETE FROM region_activity")
+                    else:
+                        conn.execute("DELETE FROM region_activity WHERE account_id = ?", (account_id,))
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not write region index {self.path}: {e}")
+
+
+# ============================================================================
+# PROBER
+# ============================================================================
+
+class RegionActivityProber:
+    """
+    Parallel region prober backed by a RegionActivityIndex.
+    """
+
+    def __init__(self, index: RegionActivityIndex = None,
+                 max_workers: int = DEFAULT_PROBE_WORKERS,
+                 signals: Dict[str, Callable] = None):
+        self.index = index or get_region_index()
+        self.max_workers = max_workers
+        self.signals = signals or REGION_SIGNALS
+
+    def probe_regions(self, session, account_id: str, regions: List[str]) -> List[RegionActivity]:
+        """Probe every signal in every region concurrently"""
+        if ThrottledSession is not None and not isinstance(session, ThrottledSession):
+            session = ThrottledSession(session, AdaptiveThrottler())
+
+        signals: Dict[str, Dict[str, bool]] = {region: {} for region in regions}
+        errors: Dict[str, Dict[str, str]] = {region: {} for region in regions}
+        probes: List[Tuple[str, str]] = [(r, s) for r in regions for s in self.signals]
+
+        if probes:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(probes))) as executor:
+                future_to_probe = {
+                    executor.submit(self.signals[signal], session, region): (region, signal)
+                    for region, signal in probes
+                }
+                for future in as_completed(future_to_probe):
+                    region, signal = future_to_probe[future]
+                    try:
+                        signals[region][signal] = bool(future.result())
+                    except Exception as e:
+                        errors[region][signal] = str(e)[:200]
+
+        return [
+            RegionActivity(
+                account_id=account_id,
+                region=region,
+                active=any(signals[region].values()),
+                signals=signals[region],
+                errors=errors[region],
+            )
+            for region in regions
+        ]
+
+    def discover_active_regions(self, session, account_id: str, regions: List[str],
+                                force_refresh: bool = False) -> List[str]:
+        """
+        Return the subset of regions that hold resources, in input order.
+
+        Fresh index entries are reused; only unknown or expired regions are
+        probed. Regions whose probes all failed are kept (and not cached),
+        since an error does not prove the region is empty; a region where
+        some probes answered is judged on those answers.
+        """
+        known: Dict[str, RegionActivity] = {}
+        if not force_refresh:
+            for region in regions:
+                record = self.index.get(account_id, region)
+                if record is not None:
+                    known[region] = record
+
+        to_probe = [r for r in regions if r not in known]
+        if to_probe:
+            probed = self.probe_regions(session, account_id, to_probe)
+            self.index.put_many([r for r in probed if r.conclusive])
+            known.update({r.region: r for r in probed})
+            logger.info(
+                f"Probed {len(to_probe)} regions for {account_id}; "
+                f"{len(regions) - len(to_probe)} served from index"
+            )
+
+        return [r for r in regions if known[r].active or not known[r].conclusive]
+
+
+# ============================================================================
+# SINGLETON INSTANCE
+# ============================================================================
+
+_index: Optional[RegionActivityIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_region_index() -> RegionActivityIndex:
+    """Get or create the shared on-disk region index"""
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            _index = RegionActivityIndex()
+        return _index
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'REGION_SIGNALS',
+    'RegionActivity',
+    'RegionActivityIndex',
+    'RegionActivityProber',
+    'get_region_index',
+]
@@ -21,11 +21,17 @@ import boto3
 import json
 import time
 import hashlib
+import re
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
+from async_operations import TokenBucket
+from llm_gateway import create_message
 
 # ============================================================================
 # ENUMS & CONSTANTS
@@ -747,6 +753,15 @@ class RemediationBatch:
     deployed_count: int = 0
     failed_count: int = 0
     skipped_count: int = 0
+    in_progress_count: int = 0
+    completed_at: Optional[datetime] = None
+    
+    @property
+    def progress(self) -> float:
+        """Fraction of actions that have finished (deployed, failed or skipped)"""
+        if not self.total_count:
+            return 1.0
+        return (self.deployed_count + self.failed_count + self.skipped_count) / self.total_count
 
 @dataclass
 class DeploymentResult:
@@ -764,9 +779,30 @@ class DeploymentResult:
 class AIRemediationGenerator:
     """Generates remediation code using AI and templates"""
     
+    AI_MODEL = "claude-sonnet-4-20250514"
+    AI_MAX_WORKERS = 4
+    AI_MAX_RETRIES = 3
+    # Resources listed in a group prompt; the rest get the same template
+    GROUP_PROMPT_RESOURCES = 20
+    # Fields a group template must parameterise with {resource}
+    GROUP_CODE_FIELDS = ('cloudformation', 'terraform', 'aws_cli')
+    
     def __init__(self):
         self.ai_client = None
         self._initialize_client()
+        self._rate_limiter = TokenBucket(*self._ai_rate_limit())
+    
+    @staticmethod
+    def _ai_rate_limit() -> Tuple[float, int, float, float]:
+        """(rate, capacity, min_rate, max_rate) in requests/second for TokenBucket"""
+        requests_per_minute = 50
+        try:
+            from production_config import get_config
+            requests_per_minute = get_config().ai.requests_per_minute
+        except Exception:
+            pass
+        rate = requests_per_minute / 60.0
+        return rate, max(1, requests_per_minute // 10), rate / 8, rate
     
     def _initialize_client(self):
         """Initialize AI client"""
@@ -875,6 +911,199 @@ class AIRemediationGenerator:
             pre_scan_finding=finding
         )
     
+    def generate_remediations(self, findings: List[Dict],
+                              max_workers: int = None,
+                              progress_callback: Optional[Callable[[int, int], None]] = None
+                              ) -> List[Optional[RemediationAction]]:
+        """
+        Generate remediation actions for many findings at once.
+        
+        Template matches and manual placeholders are built inline. The
+        remaining findings are grouped by (service, check type); each
+        group costs one AI request whose parameterized remediation is
+        filled in per resource, and groups run concurrently under the
+        AI rate limit.
+        
+        Args:
+            findings: Finding dicts
+            max_workers: Concurrent AI requests (default AI_MAX_WORKERS)
+            progress_callback: Called with (groups_done, groups_total)
+            
+        Returns:
+            One entry per finding, in order (None where AI generation failed)
+        """
+        results: List[Optional[RemediationAction]] = [None] * len(findings)
+        groups: Dict[Tuple[str, str], List[int]] = {}
+        
+        for i, finding in enumerate(findings):
+            template = self._find_template(finding.get('service', ''), finding.get('title', '').lower())
+            if template:
+                results[i] = self._create_from_template(finding, template)
+            elif self.ai_client:
+                groups.setdefault(self._group_key(finding), []).append(i)
+            else:
+                results[i] = self._create_manual_remediation(finding)
+        
+        if not groups:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=max_workers or self.AI_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self._generate_group_with_ai, [findings[i] for i in indexes]): indexes
+                for indexes in groups.values()
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                indexes = futures[future]
+                try:
+                    actions = future.result()
+                except Exception:
+                    actions = [None] * len(indexes)
+                for i, action in zip(indexes, actions):
+                    results[i] = action
+                if progress_callback:
+                    progress_callback(done, len(futures))
+        
+        return results
+    
+    @staticmethod
+    def _group_key(finding: Dict) -> Tuple[str, str]:
+        """(service, check type) - the title with the resource and IDs taken out"""
+        check = finding.get('check_id') or finding.get('title', '')
+        resource = finding.get('resource', '')
+        if resource and not finding.get('check_id'):
+            check = check.replace(resource, '{resource}')
+        check = re.sub(r'arn:[^\s]+|\b[a-z]+-[0-9a-f]{8,17}\b|\b\d{6,}\b', '{id}', check.lower())
+        return finding.get('service', ''), ' '.join(check.split())
+    
+    def _call_ai(self, prompt: str) -> Optional[str]:
+        """
+        Rate-limited Claude call; backs off and retries on 429s.
+
+        Cached responses are served without taking a rate-limiter token.
+        """
+        for attempt in range(self.AI_MAX_RETRIES):
+            try:
+                response = create_message(self.ai_client, before_call=self._rate_limiter.acquire,
+                    model=self.AI_MODEL,
+                    max_tokens=2000,
+                    messages=[{"role": "user", "content": prompt}]
+                )
+                if not getattr(response, 'cached', False):
+                    self._rate_limiter.on_success(self._rate_limiter.min_rate)
+                return response.content[0].text
+            except Exception as e:
+                if getattr(e, 'status_code', None) != 429 or attempt == self.AI_MAX_RETRIES - 1:
+                    return None
+                self._rate_limiter.on_throttle(0.5)
+                time.sleep(2 ** attempt)
+        return None
+    
+    @staticmethod
+    def _parse_ai_json(text: Optional[str]) -> Optional[Dict]:
+        if not text:
+            return None
+        json_match = re.search(r'\{[\s\S]*\}', text)
+        if not json_match:
+            return None
+        try:
+            return json.loads(json_match.group())
+        except ValueError:
+            return None
+    
+    def _action_from_ai(self, finding: Dict, data: Dict) -> RemediationAction:
+        """Build a RemediationAction from parsed AI output"""
+        
+        risk_map = {
+            'low': RiskLevel.LOW,
+            'medium': RiskLevel.MEDIUM,
+            'high': RiskLevel.HIGH,
+            'critical': RiskLevel.CRITICAL
+        }
+        
+        return RemediationAction(
+            id=f"rem-ai-{uuid.uuid4().hex[:8]}",
+            finding_id=finding.get('id', ''),
+            finding_title=finding.get('title', ''),
+            service=finding.get('service', ''),
+            resource=finding.get('resource', ''),
+            account_id=finding.get('account_id', ''),
+            region=finding.get('region', 'us-east-1'),
+            remediation_type='ai_generated',
+            title=data.get('title', 'AI-Generated Remediation'),
+            description=data.get('description', ''),
+            risk_level=risk_map.get(data.get('risk_level', 'medium'), RiskLevel.MEDIUM),
+            auto_remediatable=data.get('auto_remediatable', False),
+            cloudformation=data.get('cloudformation', ''),
+            terraform=data.get('terraform', ''),
+            aws_cli=data.get('aws_cli', ''),
+            pre_scan_finding=finding
+        )
+    
+    def _generate_group_with_ai(self, group: List[Dict]) -> List[Optional[RemediationAction]]:
+        """One AI request for findings sharing a service and check type"""
+        
+        if len(group) == 1:
+            return [self._generate_with_ai(group[0])]
+        
+        sample = group[0]
+        resources = [f.get('resource', '') for f in group[:self.GROUP_PROMPT_RESOURCES]]
+        more = len(group) - len(resources)
+        
+        prompt = f"""Generate AWS remediation code for this security finding, which affects {len(group)} resources:
+
+Service: {sample.get('service', '')}
+Title: {sample.get('title', '')}
+Description: {sample.get('description', '')}
+Severity: {sample.get('severity', '')}
+Resources: {', '.join(resources)}{f' (and {more} more)' if more > 0 else ''}
+
+Write the code for a single resource, using the literal placeholder {{resource}}
+wherever the resource identifier goes; it will be filled in for each resource.
+
+Provide remediation in JSON format:
+{{
+    "title": "Remediation title",
+    "description": "What this fixes",
+    "risk_level": "low|medium|high|critical",
+    "auto_remediatable": true|false,
+    "cloudformation": "YAML template",
+    "terraform": "HCL code",
+    "aws_cli": "CLI commands"
+}}
+
+Focus on AWS best practices and security compliance."""
+
+        data = self._parse_ai_json(self._call_ai(prompt))
+        if not data:
+            return [None] * len(group)
+        
+        if not self._is_group_template(data, group):
+            # A template with a hard-coded resource would target the wrong
+            # resource for every other finding - generate them one by one
+            return [self._generate_with_ai(finding) for finding in group]
+        
+        actions = []
+        for finding in group:
+            resource = finding.get('resource', '')
+            filled = {
+                key: value.replace('{resource}', resource) if isinstance(value, str) else value
+                for key, value in data.items()
+            }
+            actions.append(self._action_from_ai(finding, filled))
+        return actions
+    
+    def _is_group_template(self, data: Dict, group: List[Dict]) -> bool:
+        """True when every code field uses {resource} and names no concrete resource"""
+        code = [data.get(key) for key in self.GROUP_CODE_FIELDS
+                if isinstance(data.get(key), str) and data.get(key).strip()]
+        if not code:
+            return False
+        resources = {f.get('resource', '') for f in group} - {''}
+        return all(
+            '{resource}' in value and not any(resource in value for resource in resources)
+            for value in code
+        )
+    
     def _generate_with_ai(self, finding: Dict) -> Optional[RemediationAction]:
         """Generate remediation using AI"""
         
@@ -899,48 +1128,9 @@ Provide remediation in JSON format:
 
 Focus on AWS best practices and security compliance."""
 
-        try:
-            response = self.ai_client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            text = response.content[0].text
-            
-            # Parse JSON from response
-            import re
-            json_match = re.search(r'\{[\s\S]*\}', text)
-            if json_match:
-                data = json.loads(json_match.group())
-                
-                risk_map = {
-                    'low': RiskLevel.LOW,
-                    'medium': RiskLevel.MEDIUM,
-                    'high': RiskLevel.HIGH,
-                    'critical': RiskLevel.CRITICAL
-                }
-                
-                return RemediationAction(
-                    id=f"rem-ai-{uuid.uuid4().hex[:8]}",
-                    finding_id=finding.get('id', ''),
-                    finding_title=finding.get('title', ''),
-                    service=finding.get('service', ''),
-                    resource=finding.get('resource', ''),
-                    account_id=finding.get('account_id', ''),
-                    region=finding.get('region', 'us-east-1'),
-                    remediation_type='ai_generated',
-                    title=data.get('title', 'AI-Generated Remediation'),
-                    description=data.get('description', ''),
-                    risk_level=risk_map.get(data.get('risk_level', 'medium'), RiskLevel.MEDIUM),
-                    auto_remediatable=data.get('auto_remediatable', False),
-                    cloudformation=data.get('cloudformation', ''),
-                    terraform=data.get('terraform', ''),
-                    aws_cli=data.get('aws_cli', ''),
-                    pre_scan_finding=finding
-                )
-        except Exception as e:
-            pass
+        data = self._parse_ai_json(self._call_ai(prompt))
+        if data:
+            return self._action_from_ai(finding, data)
         
         return None
     
@@ -974,8 +1164,15 @@ Focus on AWS best practices and security compliance."""
 class CloudFormationDeployer:
     """Deploys remediation via CloudFormation"""
     
+    STACK_SUCCESS_STATUSES = ('CREATE_COMPLETE', 'UPDATE_COMPLETE')
+    STACK_FAILED_STATUSES = ('CREATE_FAILED', 'ROLLBACK_COMPLETE', 'ROLLBACK_FAILED', 'DELETE_COMPLETE')
+    # Above this many stacks per region, one list_stacks sweep beats describe_stacks per stack
+    LIST_STACKS_THRESHOLD = 10
+    
     def __init__(self, session=None):
         self.session = session
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
         self._initialize_session()
     
     def _initialize_session(self):
@@ -986,6 +1183,13 @@ class CloudFormationDeployer:
             except Exception:
                 pass
     
+    def _client(self, region: str):
+        """Cached CloudFormation client (boto3 clients are thread-safe, sessions aren't)"""
+        with self._clients_lock:
+            if region not in self._clients:
+                self._clients[region] = self.session.client('cloudformation', region_name=region)
+            return self._clients[region]
+    
     def deploy(self, action: RemediationAction, parameters: Dict = None) -> DeploymentResult:
         """Deploy remediation via CloudFormation"""
         
@@ -1002,7 +1206,7 @@ class CloudFormationDeployer:
             )
         
         try:
-            cf_client = self.session.client('cloudformation', region_name=action.region)
+            cf_client = self._client(action.region)
             
             stack_name = f"waf-remediation-{action.id}"
             
@@ -1050,7 +1254,7 @@ class CloudFormationDeployer:
             return {"status": "UNKNOWN", "error": "No session"}
         
         try:
-            cf_client = self.session.client('cloudformation', region_name=region)
+            cf_client = self._client(region)
             
             response = cf_client.describe_stacks(StackName=stack_name)
             
@@ -1066,6 +1270,49 @@ class CloudFormationDeployer:
         
         return {"status": "NOT_FOUND"}
     
+    def get_stack_statuses(self, stack_names: List[str], region: str) -> Dict[str, Dict]:
+        """
+        Get the status of many stacks in one region.
+        
+        Small sets are described one by one; larger ones come from a
+        single paginated list_stacks sweep.
+        
+        Returns:
+            Dict of stack name -> status dict (as get_stack_status);
+            stacks not visible yet are omitted
+        """
+        if len(stack_names) <= self.LIST_STACKS_THRESHOLD:
+            statuses = {name: self.get_stack_status(name, region) for name in stack_names}
+            return {name: status for name, status in statuses.items()
+                    if status.get('status') != 'NOT_FOUND'}
+        
+        if not self.session:
+            return {name: {"status": "UNKNOWN", "error": "No session"} for name in stack_names}
+        
+        wanted = set(stack_names)
+        statuses = {}
+        try:
+            paginator = self._client(region).get_paginator('list_stacks')
+            pages = paginator.paginate(StackStatusFilter=[
+                'CREATE_IN_PROGRESS', 'ROLLBACK_IN_PROGRESS',
+                *self.STACK_SUCCESS_STATUSES, *self.STACK_FAILED_STATUSES
+            ])
+            for page in pages:
+                for summary in page.get('StackSummaries', []):
+                    name = summary.get('StackName')
+                    # Newest first, so the first entry per name is the current stack
+                    if name in wanted and name not in statuses:
+                        statuses[name] = {
+                            "status": summary.get('StackStatus'),
+                            "status_reason": summary.get('StackStatusReason', ''),
+                        }
+                if len(statuses) == len(wanted):
+                    break
+        except Exception as e:
+            return {name: {"status": "ERROR", "error": str(e)} for name in stack_names}
+        
+        return statuses
+    
     def rollback(self, stack_name: str, region: str) -> bool:
         """Delete/rollback a CloudFormation stack"""
         
@@ -1073,7 +1320,7 @@ class CloudFormationDeployer:
             return False
         
         try:
-            cf_client = self.session.client('cloudformation', region_name=region)
+            cf_client = self._client(region)
             cf_client.delete_stack(StackName=stack_name)
             return True
         except Exception:
@@ -1087,10 +1334,10 @@ class CloudFormationDeployer:
         while time.time() - start_time < timeout:
             status = self.get_stack_status(stack_name, region)
             
-            if status.get('status') in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
+            if status.get('status') in self.STACK_SUCCESS_STATUSES:
                 return {"success": True, "status": status.get('status')}
             
-            if status.get('status') in ['CREATE_FAILED', 'ROLLBACK_COMPLETE', 'ROLLBACK_FAILED', 'DELETE_COMPLETE']:
+            if status.get('status') in self.STACK_FAILED_STATUSES:
                 return {"success": False, "status": status.get('status'), "error": status.get('status_reason')}
             
             time.sleep(10)
@@ -1107,6 +1354,16 @@ class AWSCLIExecutor:
     
     def __init__(self, session=None):
         self.session = session or boto3.Session()
+        self._clients: Dict[Tuple[str, str], Any] = {}
+        self._clients_lock = threading.Lock()
+    
+    def _client(self, service: str, region: str):
+        """Cached boto3 client, safe to share between deployment threads"""
+        with self._clients_lock:
+            key = (service, region)
+            if key not in self._clients:
+                self._clients[key] = self.session.client(service, region_name=region)
+            return self._clients[key]
     
     def execute(self, action: RemediationAction) -> DeploymentResult:
         """Execute AWS CLI remediation"""
@@ -1143,7 +1400,7 @@ class AWSCLIExecutor:
         try:
             if service == 's3':
                 if rem_type == 'encryption':
-                    s3 = self.session.client('s3', region_name=region)
+                    s3 = self._client('s3', region)
                     s3.put_bucket_encryption(
                         Bucket=resource,
                         ServerSideEncryptionConfiguration={
@@ -1158,7 +1415,7 @@ class AWSCLIExecutor:
                     return DeploymentResult(success=True)
                 
                 elif rem_type == 'public_access':
-                    s3 = self.session.client('s3', region_name=region)
+                    s3 = self._client('s3', region)
                     s3.put_public_access_block(
                         Bucket=resource,
                         PublicAccessBlockConfiguration={
@@ -1171,7 +1428,7 @@ class AWSCLIExecutor:
                     return DeploymentResult(success=True)
                 
                 elif rem_type == 'versioning':
-                    s3 = self.session.client('s3', region_name=region)
+                    s3 = self._client('s3', region)
                     s3.put_bucket_versioning(
                         Bucket=resource,
                         VersioningConfiguration={'Status': 'Enabled'}
@@ -1180,7 +1437,7 @@ class AWSCLIExecutor:
             
             elif service == 'ec2':
                 if rem_type == 'imdsv2':
-                    ec2 = self.session.client('ec2', region_name=region)
+                    ec2 = self._client('ec2', region)
                     ec2.modify_instance_metadata_options(
                         InstanceId=resource,
                         HttpTokens='required',
@@ -1189,19 +1446,19 @@ class AWSCLIExecutor:
                     return DeploymentResult(success=True)
                 
                 elif rem_type == 'ebs_encryption':
-                    ec2 = self.session.client('ec2', region_name=region)
+                    ec2 = self._client('ec2', region)
                     ec2.enable_ebs_encryption_by_default()
                     return DeploymentResult(success=True)
             
             elif service == 'kms':
                 if rem_type == 'key_rotation':
-                    kms = self.session.client('kms', region_name=region)
+                    kms = self._client('kms', region)
                     kms.enable_key_rotation(KeyId=resource)
                     return DeploymentResult(success=True)
             
             elif service == 'guardduty':
                 if rem_type == 'enable':
-                    gd = self.session.client('guardduty', region_name=region)
+                    gd = self._client('guardduty', region)
                     response = gd.create_detector(
                         Enable=True,
                         FindingPublishingFrequency='FIFTEEN_MINUTES'
@@ -1210,7 +1467,7 @@ class AWSCLIExecutor:
             
             elif service == 'rds':
                 if rem_type == 'public_access':
-                    rds = self.session.client('rds', region_name=region)
+                    rds = self._client('rds', region)
                     rds.modify_db_instance(
                         DBInstanceIdentifier=resource,
                         PubliclyAccessible=False,
@@ -1224,6 +1481,168 @@ class AWSCLIExecutor:
         return DeploymentResult(success=False, error="Unsupported remediation type for CLI execution")
 
 
+# ============================================================================
+# BATCH DEPLOYMENT ORCHESTRATOR
+# ============================================================================
+
+class DeploymentOrchestrator:
+    """
+    Deploys a batch of remediations concurrently.
+    
+    Actions on the same resource form a chain that runs strictly in
+    order (the next one starts only after the previous one, including
+    its CloudFormation stack, has finished). Independent chains are
+    deployed in parallel, with a cap on in-flight API deployments per
+    account/region. Stacks are not waited on by worker threads: the
+    scheduler polls all outstanding stacks per region every
+    poll_interval seconds.
+    
+    Usage:
+        orchestrator = DeploymentOrchestrator(engine)
+        batch = orchestrator.run(batch, progress_callback=lambda b, a: ...)
+    """
+    
+    def __init__(self, engine: 'RemediationEngine',
+                 max_workers: int = 16,
+                 per_target_limit: int = 4,
+                 poll_interval: float = 10.0,
+                 stack_timeout: float = 300.0):
+        self.engine = engine
+        self.max_workers = max_workers
+        self.per_target_limit = per_target_limit
+        self.poll_interval = poll_interval
+        self.stack_timeout = stack_timeout
+    
+    @staticmethod
+    def _resource_key(action: RemediationAction) -> Tuple[str, ...]:
+        """Actions sharing this key must not run concurrently"""
+        if not action.resource:
+            return ('action', action.id)
+        return (action.account_id, action.region, action.service.lower(), action.resource)
+    
+    @staticmethod
+    def _target_key(action: RemediationAction) -> Tuple[str, str]:
+        return (action.account_id, action.region)
+    
+    def run(self, batch: RemediationBatch,
+            method: DeploymentMethod = DeploymentMethod.AUTO,
+            progress_callback: Optional[Callable[[RemediationBatch, RemediationAction], None]] = None
+            ) -> RemediationBatch:
+        """
+        Deploy every approved action in the batch.
+        
+        Args:
+            batch: Batch to deploy; its counters are updated as actions finish
+            method: Deployment method passed to deploy_remediation
+            progress_callback: Called with (batch, action) from the calling
+                thread each time an action finishes
+            
+        Returns:
+            The batch, with status and completed_at set
+        """
+        chains: Dict[Tuple[str, ...], deque] = {}
+        for action in batch.actions:
+            if action.status == RemediationStatus.APPROVED:
+                chains.setdefault(self._resource_key(action), deque()).append(action)
+            else:
+                batch.skipped_count += 1
+        
+        def finish(key, action):
+            batch.in_progress_count -= 1
+            if action.status == RemediationStatus.DEPLOYED:
+                batch.deployed_count += 1
+            elif action.status == RemediationStatus.FAILED:
+                batch.failed_count += 1
+            else:
+                batch.skipped_count += 1
+            if progress_callback:
+                progress_callback(batch, action)
+            chain = chains[key]
+            chain.popleft()
+            if chain:
+                ready.append(key)
+        
+        ready = deque(chains)
+        running: Dict[Any, Tuple[Tuple[str, ...], RemediationAction]] = {}
+        in_flight: Dict[Tuple[str, str], int] = {}
+        stacks: Dict[str, Tuple[Tuple[str, ...], RemediationAction, float]] = {}
+        next_poll = 0.0
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while ready or running or stacks:
+                # Start chain heads while their account/region has capacity
+                for _ in range(len(ready)):
+                    key = ready.popleft()
+                    action = chains[key][0]
+                    target = self._target_key(action)
+                    if len(running) >= self.max_workers or in_flight.get(target, 0) >= self.per_target_limit:
+                        ready.append(key)
+                        continue
+                    in_flight[target] = in_flight.get(target, 0) + 1
+                    batch.in_progress_count += 1
+                    future = executor.submit(self.engine.deploy_remediation, action, method)
+                    running[future] = (key, action)
+                
+                timeout = max(0.0, next_poll - time.monotonic()) if stacks else None
+                if running:
+                    done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                else:
+                    time.sleep(timeout or 0)
+                    done = set()
+                
+                for future in done:
+                    key, action = running.pop(future)
+                    in_flight[self._target_key(action)] -= 1
+                    try:
+                        future.result()
+                    except Exception as e:
+                        action.status = RemediationStatus.FAILED
+                        action.error_message = str(e)
+                    if action.status == RemediationStatus.DEPLOYING and action.stack_name:
+                        stacks[action.stack_name] = (key, action, time.monotonic())
+                        next_poll = min(next_poll or float('inf'), time.monotonic() + self.poll_interval)
+                    else:
+                        finish(key, action)
+                
+                if stacks and time.monotonic() >= next_poll:
+                    for key, action in self._poll_stacks(stacks):
+                        finish(key, action)
+                    next_poll = time.monotonic() + self.poll_interval
+        
+        batch.status = RemediationStatus.DEPLOYED if batch.failed_count == 0 else RemediationStatus.FAILED
+        batch.completed_at = datetime.now()
+        return batch
+    
+    def _poll_stacks(self, stacks: Dict[str, Tuple[Tuple[str, ...], RemediationAction, float]]
+                     ) -> List[Tuple[Tuple[str, ...], RemediationAction]]:
+        """Check all outstanding stacks, one status sweep per region; returns the finished ones"""
+        deployer = self.engine.cf_deployer
+        by_region: Dict[str, List[str]] = {}
+        for stack_name, (_, action, _) in stacks.items():
+            by_region.setdefault(action.region, []).append(stack_name)
+        
+        finished = []
+        now = time.monotonic()
+        for region, names in by_region.items():
+            statuses = deployer.get_stack_statuses(names, region)
+            for stack_name in names:
+                key, action, started = stacks[stack_name]
+                status = statuses.get(stack_name, {})
+                if status.get('status') in deployer.STACK_SUCCESS_STATUSES:
+                    action.status = RemediationStatus.DEPLOYED
+                elif status.get('status') in deployer.STACK_FAILED_STATUSES:
+                    action.status = RemediationStatus.FAILED
+                    action.error_message = status.get('status_reason') or status.get('status')
+                elif now - started >= self.stack_timeout:
+                    action.status = RemediationStatus.FAILED
+                    action.error_message = "Deployment timed out"
+                else:
+                    continue
+                del stacks[stack_name]
+                finished.append((key, action))
+        return finished
+
+
 # ============================================================================
 # REMEDIATION ENGINE
 # ============================================================================
@@ -1239,14 +1658,7 @@ class RemediationEngine:
     def generate_remediations(self, findings: List[Dict]) -> List[RemediationAction]:
         """Generate remediation actions for all findings"""
         
-        actions = []
-        
-        for finding in findings:
-            action = self.generator.generate_remediation(finding)
-            if action:
-                actions.append(action)
-        
-        return actions
+        return [action for action in self.generator.generate_remediations(findings) if action]
     
     def deploy_remediation(self, action: RemediationAction, 
                            method: DeploymentMethod = DeploymentMethod.AUTO,
@@ -1320,8 +1732,24 @@ class RemediationEngine:
         return action
     
     def batch_deploy(self, actions: List[RemediationAction],
-                     method: DeploymentMethod = DeploymentMethod.AUTO) -> RemediationBatch:
-        """Deploy multiple remediations as a batch"""
+                     method: DeploymentMethod = DeploymentMethod.AUTO,
+                     progress_callback: Optional[Callable[[RemediationBatch, RemediationAction], None]] = None,
+                     max_workers: int = 16,
+                     per_target_limit: int = 4) -> RemediationBatch:
+        """
+        Deploy multiple remediations as a batch.
+        
+        Independent actions deploy concurrently (see DeploymentOrchestrator);
+        CloudFormation stacks are followed to completion before the batch
+        returns.
+        
+        Args:
+            actions: Actions to deploy; only APPROVED ones are deployed
+            method: Deployment method
+            progress_callback: Called with (batch, action) as each action finishes
+            max_workers: Maximum concurrent deployments
+            per_target_limit: Maximum concurrent deployments per account/region
+        """
         
         batch = RemediationBatch(
             id=f"batch-{uuid.uuid4().hex[:8]}",
@@ -1331,20 +1759,9 @@ class RemediationEngine:
             total_count=len(actions)
         )
         
-        for action in actions:
-            if action.status == RemediationStatus.APPROVED:
-                self.deploy_remediation(action, method)
-                
-                if action.status == RemediationStatus.DEPLOYED:
-                    batch.deployed_count += 1
-                elif action.status == RemediationStatus.FAILED:
-                    batch.failed_count += 1
-            else:
-                batch.skipped_count += 1
-        
-        batch.status = RemediationStatus.DEPLOYED if batch.failed_count == 0 else RemediationStatus.FAILED
-        
-        return batch
+        orchestrator = DeploymentOrchestrator(self, max_workers=max_workers,
+                                              per_target_limit=per_target_limit)
+        return orchestrator.run(batch, method, progress_callback)
 
 
 # ============================================================================
@@ -1653,19 +2070,17 @@ class RemediationUI:
                 progress_bar = st.progress(0)
                 status_text = st.empty()
                 
-                for idx, action in enumerate(approved_actions):
-                    status_text.text(f"Deploying: {action.title}...")
-                    
-                    # Update progress
-                    progress_bar.progress((idx + 1) / len(approved_actions))
-                    
-                    # Deploy
-                    engine.deploy_remediation(action, deployment_method)
-                    
-                    # Brief pause for UI update
-                    time.sleep(0.5)
+                def on_progress(batch, action):
+                    progress_bar.progress(batch.progress)
+                    status_text.text(
+                        f"{action.title}: {action.status.value} "
+                        f"({batch.deployed_count} deployed, {batch.failed_count} failed, "
+                        f"{batch.in_progress_count} in progress)"
+                    )
+                
+                batch = engine.batch_deploy(approved_actions, deployment_method, on_progress)
                 
-                status_text.text("Deployment complete!")
+                status_text.text(f"Deployment complete! {batch.deployed_count} deployed, {batch.failed_count} failed")
                 st.rerun()
             
             if dry_run:
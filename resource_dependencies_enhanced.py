@@ -8,6 +8,31 @@ import pandas as pd
 import plotly.graph_objects as go
 from typing import Dict, List
 
+from resource_graph import DEFAULT_APPLICATION_TAG, get_resource_graph
+
+
+def get_application_dependencies(application_name: str, session, region: str,
+                                 tag_key: str = DEFAULT_APPLICATION_TAG,
+                                 refresh: bool = False) -> List[Dict]:
+    """
+    Dependency tree rows for every resource tagged tag_key=application_name.
+
+    Uses the cached account/region resource graph, so after the first
+    build this makes no AWS calls.
+
+    Args:
+        application_name: Value of the application tag
+        session: boto3 session
+        region: AWS region
+        tag_key: Tag identifying the application
+        refresh: Rebuild the resource graph first
+
+    Returns:
+        Rows with Resource, Type, Status, Depends On, Critical and Blast Radius
+    """
+    graph = get_resource_graph(session, region, refresh=refresh)
+    return graph.dependency_tree(graph.application(application_name, tag_key))
+
 def render_resource_dependencies_enhanced(account_mgr):
     """Enhanced resource dependencies with application selector - REAL MODE READY"""
     
@@ -475,27 +500,54 @@ def render_resource_dependencies_enhanced(account_mgr):
     else:  # Real Mode
         st.markdown("#### 🔄 Real Mode - Your AWS Resources")
         
-        # In real mode, you would fetch actual AWS resources
-        # Here's the framework for implementation:
+        try:
+            from aws_connector import get_aws_session
+            session = get_aws_session()
+        except Exception:
+            session = None
         
-        with col2:
-            # Get actual applications from AWS
-            # This would query your AWS environment for tagged resources
-            
-            # Example: Query resources with 'Application' tag
-            st.info("🔧 **Setup Required:** Tag your AWS resources with 'Application' tag to enable auto-discovery")
-            
-            # Placeholder for real implementation
-            real_applications = st.selectbox(
-                "Select Application",
-                options=["No applications found - Add 'Application' tags to your resources"],
-                key="real_app_selector",
-                disabled=True,
-                help="Tag your AWS resources with 'Application' to auto-discover them"
+        graph = None
+        if session is None:
+            st.warning("⚠️ Connect to AWS to view your resource dependencies")
+        else:
+            region = st.text_input(
+                "Region",
+                value=session.region_name or 'us-east-1',
+                key="dep_real_region"
             )
+            refresh = st.button("🔄 Refresh", key="dep_refresh_graph",
+                                help="Re-read resources from AWS (otherwise cached for 15 minutes)")
+            
+            try:
+                with st.spinner("Loading resource graph..."):
+                    graph = get_resource_graph(session, region, refresh=refresh)
+            except Exception as e:
+                st.error(f"Could not load resources: {e}")
+        
+        if graph is not None:
+            applications = graph.tag_values(DEFAULT_APPLICATION_TAG)
+        
+            with col2:
+                selected_app = st.selectbox(
+                    "Select Application",
+                    options=applications or ["No applications found - Add 'Application' tags to your resources"],
+                    key="real_app_selector",
+                    disabled=not applications,
+                    help="Tag your AWS resources with 'Application' to auto-discover them"
+                )
         
-        st.markdown("##### 📋 How to Enable Real Mode:")
-        st.code("""
+            with col3:
+                show_critical_only = st.checkbox(
+                    "Critical Only",
+                    value=False,
+                    key="real_show_critical_only",
+                    help="Show only critical dependencies"
+                )
+        
+            if not applications:
+                st.info("🔧 **Setup Required:** Tag your AWS resources with 'Application' tag to enable auto-discovery")
+                st.markdown("##### 📋 How to Enable Real Mode:")
+                st.code("""
 # Tag your AWS resources with 'Application' tag:
 # 
 # For EC2:
@@ -509,62 +561,60 @@ aws rds add-tags-to-resource --resource-name arn:aws:rds:... \\
 # For Load Balancers:
 aws elbv2 add-tags --resource-arns arn:aws:elasticloadbalancing:... \\
   --tags Key=Application,Value="Production Web Application"
-        """, language="bash")
+            """, language="bash")
+            else:
+                st.markdown(f"#### 🔍 {selected_app} - Dependency Tree")
         
-        # Implementation template
-        st.markdown("---")
-        st.markdown("##### 🔨 Real Mode Implementation (for developers):")
+                members = graph.application(selected_app)
+                dependencies = graph.dependency_tree(members)
         
-        with st.expander("View Real Mode Implementation Code"):
-            st.code('''
-def get_application_dependencies(application_name: str, session, region: str):
-    """
-    Query AWS to build dependency tree for an application
-    """
-    import boto3
-    
-    # Initialize AWS clients
-    ec2 = session.client('ec2', region_name=region)
-    elb = session.client('elbv2', region_name=region)
-    rds = session.client('rds', region_name=region)
-    lambda_client = session.client('lambda', region_name=region)
-    
-    dependencies = []
-    
-    # 1. Find all resources tagged with this application
-    ec2_resources = ec2.describe_instances(
-        Filters=[{'Name': 'tag:Application', 'Values': [application_name]}]
-    )
-    
-    # 2. For each resource, find its dependencies
-    for reservation in ec2_resources['Reservations']:
-        for instance in reservation['Instances']:
-            # Get VPC
-            vpc_id = instance.get('VpcId')
-            
-            # Get Security Groups
-            sg_ids = [sg['GroupId'] for sg in instance.get('SecurityGroups', [])]
-            
-            # Get EBS Volumes
-            volumes = [bdm['Ebs']['VolumeId'] for bdm in instance.get('BlockDeviceMappings', [])]
-            
-            # Get Elastic IPs
-            # ... and so on
-    
-    # 3. Find load balancers for this application
-    load_balancers = elb.describe_load_balancers()
-    for lb in load_balancers['LoadBalancers']:
-        tags = elb.describe_tags(ResourceArns=[lb['LoadBalancerArn']])
-        # Check if tagged with application
-        # Get target groups
-        # Get EC2 instances in target groups
-        # ... and so on
-    
-    # 4. Build dependency tree
-    # ... organize resources into parent-child relationships
-    
-    return dependencies
-            ''', language='python')
+                if show_critical_only:
+                    dependencies = [d for d in dependencies if d['Critical'] == 'Yes']
+        
+                st.dataframe(pd.DataFrame(dependencies), use_container_width=True, hide_index=True)
+        
+                st.markdown("---")
+                col1, col2, col3, col4 = st.columns(4)
+        
+                with col1:
+                    st.metric("Total Resources", len(members))
+        
+                with col2:
+                    critical_count = sum(1 for d in dependencies if d['Critical'] == 'Yes')
+                    st.metric("Critical Resources", critical_count)
+        
+                with col3:
+                    unique_types = len(set(graph.nodes[m].type for m in members))
+                    st.metric("Resource Types", unique_types)
+        
+                with col4:
+                    st.metric("Resources in Region", len(graph))
+        
+                # Blast radius of a single resource
+                st.markdown("#### 💥 Blast Radius")
+        
+                ordered = sorted(members, key=lambda m: (graph.nodes[m].label, graph.nodes[m].name or m))
+                target = st.selectbox(
+                    "What is affected if this resource changes or fails?",
+                    options=ordered,
+                    format_func=lambda m: f"{graph.nodes[m].label}: {graph.nodes[m].name or m}",
+                    key="dep_blast_radius_target"
+                )
+        
+                affected = graph.blast_radius(target)
+                if affected:
+                    st.dataframe(pd.DataFrame([
+                        {
+                            'Resource': graph.nodes[node_id].name or node_id,
+                            'Type': graph.nodes[node_id].label,
+                            'Status': graph.nodes[node_id].state or '-',
+                            'Hops': hops,
+                            'Application': graph.nodes[node_id].tags.get(DEFAULT_APPLICATION_TAG, '-'),
+                        }
+                        for node_id, hops in sorted(affected.items(), key=lambda item: item[1])
+                    ]), use_container_width=True, hide_index=True)
+                else:
+                    st.success("Nothing else depends on this resource")
     
     # ========================================================================
     # ADDITIONAL FEATURES
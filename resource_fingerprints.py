@@ -0,0 +1,360 @@
+"""
+Resource Fingerprints Module
+============================
+Incremental scanning support: remembers a content hash of each resource's
+configuration together with the findings its checks produced, so the next
+scan only re-runs checks for resources whose configuration changed and
+carries the previous findings forward for the rest.
+
+Resources whose listing payload holds everything their checks read
+(security groups, RDS instances, Lambda functions, EBS volumes, EC2
+instances) are carried forward whenever their fingerprint is unchanged.
+Some resources cannot be fingerprinted from their list/describe payload
+alone - an S3 bucket listing says nothing about its encryption or public
+access settings. Those "deep" resource types are carried forward only when
+an AWS Config change feed covering their region shows they did not change;
+without one they are always re-checked. Global resources (S3 buckets, IAM
+users) are recorded by Config in whichever region owns them, so a feed
+never vouches for them.
+
+Usage:
+    from resource_fingerprints import IncrementalScanState, run_incremental_check
+
+    state = IncrementalScanState.load(db, 'landscape', account_id)
+    run_incremental_check(state, findings, 'AWS::RDS::DBInstance', db_id,
+                          region, db, lambda sink: check_db(sink, db))
+    state.save(db)
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field, fields, is_dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set, Tuple, Callable, Any
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+try:
+    from aws_utils import iter_paginated
+except ImportError:
+    iter_paginated = None
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Resource types whose checks depend on settings that are not part of the
+# listing payload. These are re-checked unless a change feed covers them.
+DEEP_CONFIG_RESOURCE_TYPES = frozenset({
+    'AWS::S3::Bucket',
+    'AWS::IAM::User',
+    'AWS::KMS::Key',
+    'AWS::DynamoDB::Table',
+})
+
+# Payload keys that change without any configuration change
+VOLATILE_KEYS = frozenset({
+    'ResponseMetadata',
+    'LatestRestorableTime',
+    'PasswordLastUsed',
+})
+
+# Margin subtracted from the previous scan's start time before querying the
+# change feed, covering clock skew between this host and AWS Config
+CHANGE_FEED_SKEW = timedelta(minutes=5)
+
+ResourceKey = Tuple[str, str, str]  # (region, resource_type, resource_id)
+
+
+def _record_type(resource_type: str, check_name: str = '') -> str:
+    """Record type for a resource, qualified when several checks cover one resource"""
+    return f"{resource_type}#{check_name}" if check_name else resource_type
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_volatile(v) for k, v in value.items() if k not in VOLATILE_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(v) for v in value]
+    return value
+
+
+def fingerprint(config: Any) -> str:
+    """Stable SHA-256 of a resource's configuration payload"""
+    canonical = json.dumps(_strip_volatile(config), sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+# ============================================================================
+# DATA CLASSES
+# ============================================================================
+
+@dataclass
+class ResourceRecord:
+    """Fingerprint and check output for one resource"""
+    region: str
+    resource_type: str
+    resource_id: str
+    fingerprint: str
+    findings: List[Dict] = field(default_factory=list)
+    counters: Dict[str, float] = field(default_factory=dict)
+    updated_at: str = ""   # When the checks last actually ran (ISO 8601, UTC)
+    scanned_at: str = ""   # Start of the scan that last saved the record
+
+    @property
+    def key(self) -> ResourceKey:
+        return (self.region, self.resource_type, self.resource_id)
+
+
+# ============================================================================
+# SCAN STATE
+# ============================================================================
+
+class IncrementalScanState:
+    """
+    Previous fingerprints plus the records collected by the current scan.
+
+    Thread-safe: concurrent scan tasks record into the same state.
+    """
+
+    def __init__(self, scanner: str, account_id: str, previous: Dict[ResourceKey, ResourceRecord] = None,
+                 changed_resources: Optional[Set[Tuple[str, str]]] = None,
+                 change_feed_regions: Optional[Set[str]] = None):
+        """
+        Args:
+            scanner: Name of the scanner owning the records (scanners store
+                findings in different shapes, so they never share records)
+            account_id: Account being scanned
+            previous: Records from the last scan, keyed by (region, type, id)
+            changed_resources: (resource_type, id-or-name) pairs reported
+                changed by AWS Config, or None when no change feed is used
+            change_feed_regions: Regions the change feed was read from
+        """
+        self.scanner = scanner
+        self.account_id = account_id
+        self.previous = previous or {}
+        self.changed_resources = changed_resources
+        self.change_feed_regions = set(change_feed_regions or ())
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self.current: Dict[ResourceKey, ResourceRecord] = {}
+        self.checked = 0
+        self.carried_forward = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, db, scanner: str, account_id: str, **kwargs) -> 'IncrementalScanState':
+        """Build a state from the fingerprints stored by the last scan"""
+        previous = {}
+        for row in db.get_resource_fingerprints(scanner, account_id):
+            record = ResourceRecord(
+                region=row['region'],
+                resource_type=row['resource_type'],
+                resource_id=row['resource_id'],
+                fingerprint=row['fingerprint'],
+                findings=json.loads(row['findings_json'] or '[]'),
+                counters=json.loads(row['counters_json'] or '{}'),
+                updated_at=row['updated_at'],
+                scanned_at=row['scanned_at'] or '',
+            )
+            previous[record.key] = record
+        return cls(scanner, account_id, previous, **kwargs)
+
+    @property
+    def last_scan_time(self) -> Optional[str]:
+        """
+        Start of the previous scan, less CHANGE_FEED_SKEW (ISO 8601, UTC).
+
+        Scopes may have been saved by different scans, so the oldest
+        scan start among the stored records is used. Records saved before
+        scanned_at existed fall back to their check time.
+        """
+        times = [r.scanned_at or r.updated_at for r in self.previous.values()
+                 if r.scanned_at or r.updated_at]
+        if not times:
+            return None
+        return (datetime.fromisoformat(min(times)) - CHANGE_FEED_SKEW).isoformat()
+
+    def set_change_feed(self, changed_resources: Optional[Set[Tuple[str, str]]], regions: List[str]):
+        """Use an AWS Config change feed read from regions (None: feed unavailable)"""
+        self.changed_resources = changed_resources
+        self.change_feed_regions = set(regions) if changed_resources is not None else set()
+
+    def save(self, db):
+        """Persist this scan's records, replacing the scopes it covered"""
+        with self._lock:
+            records = list(self.current.values())
+        for record in records:
+            record.scanned_at = self.started_at
+        db.save_resource_fingerprints(self.scanner, self.account_id, records)
+
+    def should_check(self, region: str, resource_type: str, resource_id: str,
+                     config: Any, check_name: str = '') -> Tuple[bool, str]:
+        """Return (checks must run, new fingerprint) for a resource"""
+        fp = fingerprint(config)
+        previous = self.previous.get((region, _record_type(resource_type, check_name), resource_id))
+        if previous is None or previous.fingerprint != fp:
+            return True, fp
+        if self.changed_resources is not None and region in self.change_feed_regions:
+            return (resource_type, resource_id) in self.changed_resources, fp
+        # Only the listing payload is known, and for deep types it does not
+        # include the settings their checks evaluate
+        return resource_type in DEEP_CONFIG_RESOURCE_TYPES, fp
+
+    def record(self, record: ResourceRecord, carried: bool = False):
+        if not carried:
+            record.updated_at = self.started_at
+        with self._lock:
+            self.current[record.key] = record
+            if carried:
+                self.carried_forward += 1
+            else:
+                self.checked += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'checked': self.checked, 'carried_forward': self.carried_forward}
+
+
+def _numeric_snapshot(counters: Any) -> Dict[str, float]:
+    if counters is None:
+        return {}
+    if is_dataclass(counters):
+        items = ((f.name, getattr(counters, f.name)) for f in fields(counters))
+    else:
+        items = counters.items()
+    return {k: v for k, v in items if isinstance(v, (int, float)) and not isinstance(v, bool)}
+
+
+def _apply_counters(counters: Any, delta: Dict[str, float]):
+    for name, value in delta.items():
+        if is_dataclass(counters):
+            setattr(counters, name, getattr(counters, name) + value)
+        else:
+            counters[name] = counters.get(name, 0) + value
+
+
+def run_incremental_check(state: Optional[IncrementalScanState], findings: List,
+                          resource_type: str, resource_id: str, region: Optional[str],
+                          config: Any, check: Callable[[List], None],
+                          counters: Any = None,
+                          to_dict: Callable[[Any], Dict] = dict,
+                          from_dict: Callable[[Dict], Any] = dict,
+                          check_name: str = ''):
+    """
+    Run check(sink) for one resource, or replay its previous output.
+
+    check appends the resource's findings to sink; they are then added to
+    findings. When the resource is unchanged, its stored findings (and any
+    numeric counters the check incremented) are replayed instead.
+
+    Args:
+        state: Incremental state, or None for a normal full check
+        findings: List receiving the resource's findings
+        resource_type: AWS Config style type, e.g. 'AWS::RDS::DBInstance'
+        resource_id: Resource identifier (or name) within its type
+        region: Region the resource lives in ('global' for global services)
+        config: Listing/describe payload to fingerprint
+        check: Callable running the checks into a sink list
+        counters: Optional dataclass or dict of numeric counters the check
+            increments (e.g. a ResourceInventory)
+        to_dict / from_dict: Convert findings to and from JSON-safe dicts
+        check_name: Distinguishes the records of different checks that
+            cover the same resource (e.g. two scans of one security group)
+    """
+    if state is None:
+        sink: List = []
+        check(sink)
+        findings.extend(sink)
+        return
+
+    region = region or 'global'
+    run, fp = state.should_check(region, resource_type, resource_id, config, check_name)
+    record_type = _record_type(resource_type, check_name)
+
+    if not run:
+        previous = state.previous[(region, record_type, resource_id)]
+        findings.extend(from_dict(dict(f)) for f in previous.findings)
+        if counters is not None:
+            _apply_counters(counters, previous.counters)
+        state.record(ResourceRecord(region, record_type, resource_id, fp,
+                                    previous.findings, previous.counters,
+                                    previous.updated_at), carried=True)
+        return
+
+    before = _numeric_snapshot(counters)
+    sink = []
+    check(sink)
+    after = _numeric_snapshot(counters)
+    delta = {k: after[k] - before.get(k, 0) for k in after if after[k] != before.get(k, 0)}
+
+    findings.extend(sink)
+    state.record(ResourceRecord(region, record_type, resource_id, fp,
+                                [to_dict(f) for f in sink], delta))
+
+
+def finding_to_dict(finding: Any) -> Dict:
+    """to_dict for dataclass findings"""
+    return asdict(finding) if is_dataclass(finding) else dict(finding)
+
+
+# ============================================================================
+# AWS CONFIG CHANGE FEED
+# ============================================================================
+
+def config_changed_resources(session, regions: List[str], since: str
+                             ) -> Optional[Set[Tuple[str, str]]]:
+    """
+    Resources AWS Config recorded a configuration change for since a time.
+
+    Returns (resource_type, identifier) pairs, with both resourceId and
+    resourceName included as identifiers. Returns None when any region
+    cannot be queried, so callers fall back to fingerprints alone.
+    """
+    if iter_paginated is None:
+        return None
+
+    expression = (
+        "SELECT resourceId, resourceName, resourceType "
+        f"WHERE configurationItemCaptureTime >= '{since}'"
+    )
+    changed: Set[Tuple[str, str]] = set()
+    for region in regions:
+        try:
+            config = session.client('config', region_name=region)
+            for item in iter_paginated(config, 'select_resource_config', 'Results[]',
+                                       Expression=expression):
+                data = json.loads(item)
+                resource_type = data.get('resourceType')
+                for identifier in (data.get('resourceId'), data.get('resourceName')):
+                    if identifier:
+                        changed.add((resource_type, identifier))
+        except Exception as e:
+            logger.info(f"AWS Config change feed unavailable in {region}: {e}")
+            return None
+
+    logger.info(f"AWS Config reported {len(changed)} changed resource identifiers since {since}")
+    return changed
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'DEEP_CONFIG_RESOURCE_TYPES',
+    'CHANGE_FEED_SKEW',
+    'fingerprint',
+    'ResourceRecord',
+    'IncrementalScanState',
+    'run_incremental_check',
+    'finding_to_dict',
+    'config_changed_resources',
+]
@@ -0,0 +1,563 @@
+"""
+Resource Graph Module
+=====================
+Indexed dependency graph of an account/region's network-attached resources:
+VPCs, subnets, security groups, ENIs, EC2 instances, load balancers,
+target groups, RDS instances and Lambda functions.
+
+The graph is built from a fixed set of paginated bulk describe calls,
+run concurrently, plus one Resource Groups Tagging API sweep for the
+tags that describe calls don't return. The number of API calls does not
+depend on the number of resources, except that target health has no bulk
+API (one call per target group). Graphs are cached per account, region
+and calling principal, and the queries are in-memory set traversals:
+
+- dependencies(x): everything x needs (instance -> ENI -> subnet -> VPC)
+- blast_radius(x): everything that transitively depends on x
+- tagged(key, value): resources carrying a tag, via an inverted index
+
+Usage:
+    from resource_graph import get_resource_graph
+
+    graph = get_resource_graph(session, 'us-east-1')
+    affected = graph.blast_radius('sg-0123456789abcdef0')
+    app = graph.tagged('Application', 'checkout')
+"""
+
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_GRAPH_TTL_SECONDS = 900
+DEFAULT_APPLICATION_TAG = 'Application'
+
+# Describe calls per graph build run on this many threads
+BUILD_WORKERS = 8
+
+# Tags the EC2/RDS describe calls don't return come from the Tagging API
+TAGGING_RESOURCE_TYPES = [
+    'elasticloadbalancing:loadbalancer',
+    'elasticloadbalancing:targetgroup',
+    'lambda:function',
+]
+
+RESOURCE_TYPE_LABELS = {
+    'vpc': 'VPC',
+    'subnet': 'Subnet',
+    'security_group': 'Security Group',
+    'eni': 'Network Interface',
+    'instance': 'EC2 Instance',
+    'load_balancer': 'Load Balancer',
+    'target_group': 'Target Group',
+    'rds': 'RDS Instance',
+    'lambda': 'Lambda Function',
+}
+
+
+# ============================================================================
+# GRAPH
+# ============================================================================
+
+@dataclass
+class ResourceNode:
+    """A resource in the graph; id is the EC2 ID or, for other services, the ARN"""
+    id: str
+    type: str
+    name: str = ''
+    arn: str = ''
+    state: str = ''
+    tags: Dict[str, str] = field(default_factory=dict)
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def label(self) -> str:
+        return RESOURCE_TYPE_LABELS.get(self.type, self.type)
+
+
+class ResourceGraph:
+    """
+    Directed dependency graph with forward and reverse adjacency sets.
+
+    An edge a -> b means "a depends on b" (an instance depends on its
+    subnet). dependencies() walks edges forward, blast_radius() walks
+    them in reverse.
+    """
+
+    def __init__(self, account_id: str = '', region: str = ''):
+        self.account_id = account_id
+        self.region = region
+        self.built_at = time.time()
+        self.nodes: Dict[str, ResourceNode] = {}
+        self._depends_on: Dict[str, Set[str]] = {}
+        self._dependents: Dict[str, Set[str]] = {}
+        self._relations: Dict[Tuple[str, str], str] = {}
+        self._by_arn: Dict[str, str] = {}
+        self._by_tag: Dict[Tuple[str, str], Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, resource: str) -> bool:
+        return self.resolve(resource) is not None
+
+    def add_node(self, node: ResourceNode) -> ResourceNode:
+        existing = self.nodes.get(node.id)
+        if existing:
+            # A later, richer describe wins for attributes; tags are merged
+            existing.name = node.name or existing.name
+            existing.arn = node.arn or existing.arn
+            existing.state = node.state or existing.state
+            existing.attributes.update(node.attributes)
+            self.set_tags(node.id, node.tags)
+            node = existing
+        else:
+            self.nodes[node.id] = node
+            self._depends_on.setdefault(node.id, set())
+            self._dependents.setdefault(node.id, set())
+            tags, node.tags = node.tags, {}
+            self.set_tags(node.id, tags)
+        if node.arn:
+            self._by_arn[node.arn] = node.id
+        return node
+
+    def add_edge(self, source: str, target: str, relation: str = 'uses'):
+        """Record that source depends on target; unknown endpoints are ignored"""
+        if not source or not target or source == target:
+            return
+        if source not in self.nodes or target not in self.nodes:
+            return
+        self._depends_on[source].add(target)
+        self._dependents[target].add(source)
+        self._relations.setdefault((source, target), relation)
+
+    def set_tags(self, resource: str, tags: Dict[str, str]):
+        node_id = self.resolve(resource)
+        if node_id is None:
+            return
+        node = self.nodes[node_id]
+        for key, value in tags.items():
+            old = node.tags.get(key)
+            if old is not None:
+                self._by_tag.get((key, old), set()).discard(node_id)
+            node.tags[key] = value
+            self._by_tag.setdefault((key, value), set()).add(node_id)
+
+    def resolve(self, resource: str) -> Optional[str]:
+        """Node ID for an ID or ARN"""
+        if resource in self.nodes:
+            return resource
+        return self._by_arn.get(resource)
+
+    def relation(self, source: str, target: str) -> Optional[str]:
+        return self._relations.get((source, target))
+
+    def _walk(self, start: Iterable[str], adjacency: Dict[str, Set[str]],
+              max_depth: Optional[int]) -> Dict[str, int]:
+        depths: Dict[str, int] = {}
+        queue = deque()
+        for resource in start:
+            node_id = self.resolve(resource)
+            if node_id is not None and node_id not in depths:
+                depths[node_id] = 0
+                queue.append(node_id)
+        while queue:
+            node_id = queue.popleft()
+            depth = depths[node_id]
+            if max_depth is not None and depth >= max_depth:
+                continue
+            for neighbour in adjacency[node_id]:
+                if neighbour not in depths:
+                    depths[neighbour] = depth + 1
+                    queue.append(neighbour)
+        return depths
+
+    def dependencies(self, resource: str, max_depth: Optional[int] = None) -> Dict[str, int]:
+        """Everything the resource needs, transitively; node ID -> hop distance"""
+        depths = self._walk([resource], self._depends_on, max_depth)
+        depths.pop(self.resolve(resource), None)
+        return depths
+
+    def blast_radius(self, resource: str, max_depth: Optional[int] = None) -> Dict[str, int]:
+        """Everything that transitively depends on the resource; node ID -> hop distance"""
+        depths = self._walk([resource], self._dependents, max_depth)
+        depths.pop(self.resolve(resource), None)
+        return depths
+
+    def direct_dependencies(self, resource: str) -> Set[str]:
+        node_id = self.resolve(resource)
+        return set(self._depends_on[node_id]) if node_id else set()
+
+    def direct_dependents(self, resource: str) -> Set[str]:
+        node_id = self.resolve(resource)
+        return set(self._dependents[node_id]) if node_id else set()
+
+    def tagged(self, key: str, value: Optional[str] = None) -> Set[str]:
+        """Resources tagged key=value (any value when value is None)"""
+        if value is not None:
+            return set(self._by_tag.get((key, value), ()))
+        return set().union(*(ids for (k, _), ids in self._by_tag.items() if k == key))
+
+    def tag_values(self, key: str) -> List[str]:
+        """Distinct values of a tag key, sorted"""
+        return sorted(v for (k, v), ids in self._by_tag.items() if k == key and ids)
+
+    def application(self, value: str, tag_key: str = DEFAULT_APPLICATION_TAG) -> Set[str]:
+        """Resources tagged with the application plus everything they depend on"""
+        return set(self._walk(self.tagged(tag_key, value), self._depends_on, None))
+
+    def dependency_tree(self, resources: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Rows of a depth-first dependency tree over the given resources.
+
+        Roots are the resources nothing else in the set depends on; each
+        resource is expanded once, and later references are listed
+        without children.
+
+        Returns:
+            Row dicts with 'Resource' (tree-indented), 'Type', 'Status',
+            'Depends On', 'Critical' (Yes when the resource is a root or
+            shared by several resources in the set) and 'Blast Radius'
+        """
+        members = {self.resolve(r) for r in resources} - {None}
+        roots = sorted(
+            (n for n in members if not (self._dependents[n] & members)),
+            key=lambda n: (self.nodes[n].type, self.nodes[n].name or n)
+        )
+        rows: List[Dict[str, Any]] = []
+        expanded: Set[str] = set()
+        radius: Dict[str, int] = {}
+
+        def visit(node_id: str, parent: Optional[str], prefix: str, last: bool):
+            node = self.nodes[node_id]
+            branch = '' if parent is None else ('└─ ' if last else '├─ ')
+            shared = len(self._dependents[node_id] & members) > 1
+            if node_id not in radius:
+                radius[node_id] = len(self.blast_radius(node_id))
+            rows.append({
+                'Resource': f"{prefix}{branch}{node.label}: {node.name or node.id}",
+                'Type': node.label,
+                'Status': node.state or '-',
+                'Depends On': self.nodes[parent].label if parent else '-',
+                'Critical': 'Yes' if parent is None or shared else 'No',
+                'Blast Radius': radius[node_id],
+            })
+            if node_id in expanded:
+                return
+            expanded.add(node_id)
+            children = sorted(self._depends_on[node_id] & members,
+                              key=lambda n: (self.nodes[n].type, self.nodes[n].name or n))
+            child_prefix = prefix if parent is None else prefix + ('   ' if last else '│  ')
+            for i, child in enumerate(children):
+                visit(child, node_id, child_prefix, i == len(children) - 1)
+
+        for root in roots:
+            visit(root, None, '', True)
+        return rows
+
+
+# ============================================================================
+# GRAPH BUILDER
+# ============================================================================
+
+def _tag_dict(tags: Optional[List[Dict]]) -> Dict[str, str]:
+    return {t['Key']: t.get('Value', '') for t in tags or [] if 'Key' in t}
+
+
+def _paginate(client, operation: str, result_key: str, **kwargs) -> List[Dict]:
+    items: List[Dict] = []
+    for page in client.get_paginator(operation).paginate(**kwargs):
+        items.extend(page.get(result_key, []))
+    return items
+
+
+class ResourceGraphBuilder:
+    """Builds a ResourceGraph for one account/region from bulk API calls"""
+
+    def __init__(self, session, region: str, account_id: str = '', max_workers: int = BUILD_WORKERS):
+        self.session = session
+        self.region = region
+        self.account_id = account_id
+        self.max_workers = max_workers
+        # Clients are created up front: boto3 sessions aren't thread-safe, clients are
+        self._clients = {
+            name: session.client(name, region_name=region)
+            for name in ('ec2', 'elbv2', 'rds', 'lambda', 'resourcegroupstaggingapi')
+        }
+
+    def _ec2_arn(self, kind: str, resource_id: str, owner: str = '') -> str:
+        return f"arn:aws:ec2:{self.region}:{owner or self.account_id}:{kind}/{resource_id}"
+
+    def _fetch_all(self) -> Dict[str, List[Dict]]:
+        ec2, elbv2 = self._clients['ec2'], self._clients['elbv2']
+        calls: Dict[str, Callable[[], List[Dict]]] = {
+            'vpcs': lambda: _paginate(ec2, 'describe_vpcs', 'Vpcs'),
+            'subnets': lambda: _paginate(ec2, 'describe_subnets', 'Subnets'),
+            'security_groups': lambda: _paginate(ec2, 'describe_security_groups', 'SecurityGroups'),
+            'enis': lambda: _paginate(ec2, 'describe_network_interfaces', 'NetworkInterfaces'),
+            'reservations': lambda: _paginate(ec2, 'describe_instances', 'Reservations'),
+            'load_balancers': lambda: _paginate(elbv2, 'describe_load_balancers', 'LoadBalancers'),
+            'target_groups': lambda: _paginate(elbv2, 'describe_target_groups', 'TargetGroups'),
+            'db_instances': lambda: _paginate(self._clients['rds'], 'describe_db_instances', 'DBInstances'),
+            'functions': lambda: _paginate(self._clients['lambda'], 'list_functions', 'Functions'),
+            'tagged': lambda: _paginate(self._clients['resourcegroupstaggingapi'], 'get_resources',
+                                        'ResourceTagMappingList',
+                                        ResourceTypeFilters=TAGGING_RESOURCE_TYPES),
+        }
+        results: Dict[str, List[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(call): name for name, call in calls.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                except Exception as e:
+                    # Missing permissions for one service shouldn't lose the rest of the graph
+                    logger.warning(f"Resource graph: {name} unavailable in {self.region}: {e}")
+                    results[name] = []
+        return results
+
+    def _fetch_targets(self, target_groups: List[Dict]) -> Dict[str, List[Dict]]:
+        """Registered targets per target group (no bulk API; one call per group, concurrently)"""
+        elbv2 = self._clients['elbv2']
+
+        def targets(arn: str) -> List[Dict]:
+            return elbv2.describe_target_health(TargetGroupArn=arn).get('TargetHealthDescriptions', [])
+
+        results: Dict[str, List[Dict]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(targets, tg['TargetGroupArn']): tg['TargetGroupArn']
+                       for tg in target_groups}
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    logger.debug(f"Resource graph: target health for {futures[future]} failed: {e}")
+        return results
+
+    def build(self) -> ResourceGraph:
+        """Fetch everything and assemble the graph"""
+        data = self._fetch_all()
+        targets = self._fetch_targets(data['target_groups'])
+
+        graph = ResourceGraph(self.account_id, self.region)
+
+        for vpc in data['vpcs']:
+            tags = _tag_dict(vpc.get('Tags'))
+            graph.add_node(ResourceNode(
+                id=vpc['VpcId'], type='vpc', name=tags.get('Name', ''),
+                arn=self._ec2_arn('vpc', vpc['VpcId'], vpc.get('OwnerId')),
+                state=vpc.get('State', ''), tags=tags,
+                attributes={'cidr': vpc.get('CidrBlock')}
+            ))
+
+        for subnet in data['subnets']:
+            tags = _tag_dict(subnet.get('Tags'))
+            graph.add_node(ResourceNode(
+                id=subnet['SubnetId'], type='subnet', name=tags.get('Name', ''),
+                arn=subnet.get('SubnetArn', ''), state=subnet.get('State', ''), tags=tags,
+                attributes={'cidr': subnet.get('CidrBlock'), 'az': subnet.get('AvailabilityZone')}
+            ))
+            graph.add_edge(subnet['SubnetId'], subnet.get('VpcId'), 'in_vpc')
+
+        for sg in data['security_groups']:
+            graph.add_node(ResourceNode(
+                id=sg['GroupId'], type='security_group', name=sg.get('GroupName', ''),
+                arn=self._ec2_arn('security-group', sg['GroupId'], sg.get('OwnerId')),
+                state='Active', tags=_tag_dict(sg.get('Tags'))
+            ))
+        for sg in data['security_groups']:
+            graph.add_edge(sg['GroupId'], sg.get('VpcId'), 'in_vpc')
+            # A rule allowing traffic from another group breaks if that group changes
+            for permission in sg.get('IpPermissions', []):
+                for pair in permission.get('UserIdGroupPairs', []):
+                    graph.add_edge(sg['GroupId'], pair.get('GroupId'), 'references')
+
+        for reservation in data['reservations']:
+            for instance in reservation.get('Instances', []):
+                tags = _tag_dict(instance.get('Tags'))
+                instance_id = instance['InstanceId']
+                graph.add_node(ResourceNode(
+                    id=instance_id, type='instance', name=tags.get('Name', ''),
+                    arn=self._ec2_arn('instance', instance_id, reservation.get('OwnerId')),
+                    state=instance.get('State', {}).get('Name', ''), tags=tags,
+                    attributes={'instance_type': instance.get('InstanceType'),
+                                'private_ip': instance.get('PrivateIpAddress')}
+                ))
+                graph.add_edge(instance_id, instance.get('SubnetId'), 'in_subnet')
+                for sg in instance.get('SecurityGroups', []):
+                    graph.add_edge(instance_id, sg['GroupId'], 'security_group')
+
+        for eni in data['enis']:
+            eni_id = eni['NetworkInterfaceId']
+            graph.add_node(ResourceNode(
+                id=eni_id, type='eni', name=eni.get('Description', ''),
+                arn=self._ec2_arn('network-interface', eni_id, eni.get('OwnerId')),
+                state=eni.get('Status', ''), tags=_tag_dict(eni.get('TagSet')),
+                attributes={'interface_type': eni.get('InterfaceType'),
+                            'private_ip': eni.get('PrivateIpAddress')}
+            ))
+            graph.add_edge(eni_id, eni.get('SubnetId'), 'in_subnet')
+            for group in eni.get('Groups', []):
+                graph.add_edge(eni_id, group['GroupId'], 'security_group')
+            graph.add_edge(eni.get('Attachment', {}).get('InstanceId'), eni_id, 'network_interface')
+
+        for lb in data['load_balancers']:
+            arn = lb['LoadBalancerArn']
+            graph.add_node(ResourceNode(
+                id=arn, type='load_balancer', name=lb.get('LoadBalancerName', ''), arn=arn,
+                state=lb.get('State', {}).get('Code', ''),
+                attributes={'type': lb.get('Type'), 'scheme': lb.get('Scheme'),
+                            'dns_name': lb.get('DNSName')}
+            ))
+            for az in lb.get('AvailabilityZones', []):
+                graph.add_edge(arn, az.get('SubnetId'), 'in_subnet')
+            for sg_id in lb.get('SecurityGroups', []):
+                graph.add_edge(arn, sg_id, 'security_group')
+
+        for db in data['db_instances']:
+            arn = db['DBInstanceArn']
+            graph.add_node(ResourceNode(
+                id=arn, type='rds', name=db.get('DBInstanceIdentifier', ''), arn=arn,
+                state=db.get('DBInstanceStatus', ''), tags=_tag_dict(db.get('TagList')),
+                attributes={'engine': db.get('Engine'), 'instance_class': db.get('DBInstanceClass')}
+            ))
+            for sg in db.get('VpcSecurityGroups', []):
+                graph.add_edge(arn, sg.get('VpcSecurityGroupId'), 'security_group')
+            for subnet in db.get('DBSubnetGroup', {}).get('Subnets', []):
+                graph.add_edge(arn, subnet.get('SubnetIdentifier'), 'in_subnet')
+
+        for function in data['functions']:
+            arn = function['FunctionArn']
+            graph.add_node(ResourceNode(
+                id=arn, type='lambda', name=function.get('FunctionName', ''), arn=arn,
+                state=function.get('State', 'Active'),
+                attributes={'runtime': function.get('Runtime')}
+            ))
+            vpc_config = function.get('VpcConfig') or {}
+            for subnet_id in vpc_config.get('SubnetIds', []):
+                graph.add_edge(arn, subnet_id, 'in_subnet')
+            for sg_id in vpc_config.get('SecurityGroupIds', []):
+                graph.add_edge(arn, sg_id, 'security_group')
+
+        # Targets are instance IDs or Lambda ARNs, so target groups go after both
+        for tg in data['target_groups']:
+            arn = tg['TargetGroupArn']
+            graph.add_node(ResourceNode(
+                id=arn, type='target_group', name=tg.get('TargetGroupName', ''), arn=arn,
+                state='Active',
+                attributes={'target_type': tg.get('TargetType'), 'port': tg.get('Port')}
+            ))
+            for lb_arn in tg.get('LoadBalancerArns', []):
+                graph.add_edge(lb_arn, arn, 'target_group')
+            healthy = 0
+            for target in targets.get(arn, []):
+                target_id = target.get('Target', {}).get('Id')
+                graph.add_edge(arn, target_id, 'target')
+                healthy += target.get('TargetHealth', {}).get('State') == 'healthy'
+            if arn in targets:
+                graph.nodes[arn].state = 'Healthy' if healthy == len(targets[arn]) else \
+                    f"{healthy}/{len(targets[arn])} healthy"
+
+        for mapping in data['tagged']:
+            graph.set_tags(mapping['ResourceARN'], _tag_dict(mapping.get('Tags')))
+
+        logger.info(f"Resource graph for {self.account_id or 'account'}/{self.region}: "
+                    f"{len(graph)} resources")
+        return graph
+
+
+# ============================================================================
+# SINGLETON CACHE
+# ============================================================================
+
+# Keyed by (account_id, region, principal ARN): what a graph contains
+# depends on the permissions of the role or user that built it
+_graphs: Dict[Tuple[str, str, str], ResourceGraph] = {}
+_graphs_lock = threading.Lock()
+_build_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+_session_identities: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _caller_identity(session) -> Tuple[str, str]:
+    """(account ID, principal ARN) of a session, looked up with STS once per session"""
+    try:
+        return _session_identities[session]
+    except (KeyError, TypeError):
+        pass
+    identity = session.client('sts').get_caller_identity()
+    identity = (identity['Account'], identity['Arn'])
+    try:
+        _session_identities[session] = identity
+    except TypeError:
+        pass
+    return identity
+
+
+def get_resource_graph(session, region: str, account_id: str = None,
+                       max_age: float = DEFAULT_GRAPH_TTL_SECONDS,
+                       refresh: bool = False) -> ResourceGraph:
+    """
+    Get the cached graph for an account/region, building it if missing or stale.
+
+    Graphs are cached per calling principal, so a role never sees a graph
+    built with another role's permissions. Concurrent callers for the same
+    account/region/principal share one build.
+
+    Args:
+        session: boto3 session
+        region: AWS region
+        account_id: Account ID (defaults to the session's account)
+        max_age: Rebuild graphs older than this many seconds
+        refresh: Rebuild regardless of age
+    """
+    session_account_id, principal = _caller_identity(session)
+    account_id = account_id or session_account_id
+    key = (account_id, region, principal)
+
+    with _graphs_lock:
+        build_lock = _build_locks.setdefault(key, threading.Lock())
+
+    with build_lock:
+        graph = _graphs.get(key)
+        if graph is None or refresh or time.time() - graph.built_at > max_age:
+            graph = ResourceGraphBuilder(session, region, account_id).build()
+            with _graphs_lock:
+                _graphs[key] = graph
+        return graph
+
+
+def clear_resource_graphs():
+    """Drop all cached graphs"""
+    with _graphs_lock:
+        _graphs.clear()
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'ResourceNode',
+    'ResourceGraph',
+    'ResourceGraphBuilder',
+    'get_resource_graph',
+    'clear_resource_graphs',
+    'DEFAULT_APPLICATION_TAG',
+]
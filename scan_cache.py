@@ -0,0 +1,265 @@
+"""
+Scan Cache Module
+=================
+Disk-backed scan result cache shared by every user and worker process.
+
+Results are keyed explicitly by (account, region, service, check
+version, scanning principal) rather than by hashing call arguments, stored as
+zlib-compressed JSON in SQLite, expire after a TTL and are evicted
+least-recently-used first once the cache exceeds its size limit.
+
+Concurrent misses for the same key are collapsed: the first caller takes
+a short lease and scans, the others wait for its result instead of
+scanning the same account again.
+
+Usage:
+    from scan_cache import get_scan_cache, scan_cache_key
+
+    key = scan_cache_key(account_id, region, 'RDS', version=1, principal=caller_arn)
+    result = get_scan_cache().get_or_compute(key, lambda: scan(...), ttl_seconds=300)
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+import zlib
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+from sqlite_pool import get_connection_pool
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_SCAN_CACHE_PATH = os.environ.get('SCAN_CACHE_PATH', 'data/scan_cache.db')
+DEFAULT_SCAN_CACHE_MAX_MB = 256
+DEFAULT_SCAN_TTL_SECONDS = 300
+LEASE_SECONDS = 120
+LEASE_POLL_SECONDS = 0.5
+
+
+def scan_cache_key(account_id: str, region: Optional[str], service: str,
+                   version: Union[int, str] = 1, principal: Optional[str] = None) -> str:
+    """
+    Cache key for one service scan of one account/region at a check version.
+
+    Include the scanning principal (role or user ARN) whenever what a scan
+    can see depends on the caller's permissions.
+    """
+    return f"{account_id}|{region or 'global'}|{service}|v{version}|{principal or '*'}"
+
+
+# ============================================================================
+# SCAN CACHE
+# ============================================================================
+
+class ScanCache:
+    """SQLite store of compressed scan results with TTL, LRU eviction and leases"""
+
+    def __init__(self, path: str = DEFAULT_SCAN_CACHE_PATH,
+                 max_size_mb: int = DEFAULT_SCAN_CACHE_MAX_MB):
+        self.path = path
+        self.max_size_mb = max_size_mb
+        self.pool = get_connection_pool(path)
+        self._write_lock = threading.Lock()
+        self._owner = uuid.uuid4().hex
+        self._init_schema()
+
+    def _init_schema(self):
+        with self.pool.connection() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS scan_results (
+                    cache_key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_scan_results_last_access
+                    ON scan_results (last_access);
+
+                CREATE TABLE IF NOT EXISTS scan_leases (
+                    cache_key TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                );
+            """)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value, or None when missing or expired"""
+        now = time.time()
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT payload, expires_at FROM scan_results WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row['expires_at'] < now:
+                with conn:
+                    conn.execute("DELETE FROM scan_results WHERE cache_key = ?", (key,))
+                return None
+            with conn:
+                conn.execute("UPDATE scan_results SET last_access = ? WHERE cache_key = ?", (now, key))
+        return json.loads(zlib.decompress(row['payload']))
+
+    def put(self, key: str, value: Any, ttl_seconds: int = DEFAULT_SCAN_TTL_SECONDS):
+        payload = zlib.compress(json.dumps(value, default=str).encode('utf-8'))
+        now = time.time()
+        with self._write_lock, self.pool.connection() as conn:
+            with conn:
+                conn.execute("""
+                    INSERT INTO scan_results (cache_key, payload, size_bytes, created_at, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        payload = excluded.payload,
+                        size_bytes = excluded.size_bytes,
+                        created_at = excluded.created_at,
+                        expires_at = excluded.expires_at,
+                        last_access = excluded.last_access
+                """, (key, payload, len(payload), now, now + ttl_seconds, now))
+                self._evict(conn, now)
+
+    def _evict(self, conn, now: float):
+        conn.execute("DELETE FROM scan_results WHERE expires_at < ?", (now,))
+
+        max_bytes = self.max_size_mb * 1024 * 1024
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM scan_results").fetchone()[0]
+        if total <= max_bytes:
+            return
+        # Trim to 90% so eviction doesn't run on every write at the cap
+        excess = total - int(max_bytes * 0.9)
+        conn.execute("""
+            DELETE FROM scan_results WHERE cache_key IN (
+                SELECT cache_key FROM (
+                    SELECT cache_key,
+                           SUM(size_bytes) OVER (ORDER BY last_access, cache_key
+                                                 ROWS UNBOUNDED PRECEDING) - size_bytes AS freed_before
+                    FROM scan_results
+                ) WHERE freed_before < ?
+            )
+        """, (excess,))
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+
+    def _acquire_lease(self, key: str) -> bool:
+        now = time.time()
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute("DELETE FROM scan_leases WHERE cache_key = ? AND expires_at < ?", (key, now))
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO scan_leases (cache_key, owner, expires_at) VALUES (?, ?, ?)",
+                    (key, self._owner, now + LEASE_SECONDS)
+                )
+                return cursor.rowcount == 1
+
+    def _release_lease(self, key: str):
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute("DELETE FROM scan_leases WHERE cache_key = ? AND owner = ?", (key, self._owner))
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any],
+                       ttl_seconds: int = DEFAULT_SCAN_TTL_SECONDS,
+                       cacheable: Callable[[Any], bool] = None,
+                       wait_timeout: float = LEASE_SECONDS) -> Any:
+        """
+        Cached value for key, computing and storing it on a miss.
+
+        When another thread or process is already computing the same key,
+        waits up to wait_timeout for its result before computing anyway.
+
+        Args:
+            key: Cache key (see scan_cache_key)
+            compute: Produces the value on a miss
+            ttl_seconds: Lifetime of a stored value
+            cacheable: Optional predicate; values it rejects are not stored
+            wait_timeout: How long to wait on another caller's lease
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        leased = self._acquire_lease(key)
+        if not leased:
+            deadline = time.time() + wait_timeout
+            while time.time() < deadline:
+                time.sleep(LEASE_POLL_SECONDS)
+                cached = self.get(key)
+                if cached is not None:
+                    return cached
+                if self._acquire_lease(key):
+                    leased = True
+                    break
+
+        try:
+            if leased:
+                # The previous holder may have stored the value just before releasing
+                cached = self.get(key)
+                if cached is not None:
+                    return cached
+            value = compute()
+            if cacheable is None or cacheable(value):
+                self.put(key, value, ttl_seconds)
+            return value
+        finally:
+            if leased:
+                self._release_lease(key)
+
+    def invalidate(self, account_id: str = None):
+        """Drop one account's results, or everything"""
+        with self._write_lock, self.pool.connection() as conn:
+            with conn:
+                if account_id:
+                    conn.execute("DELETE FROM scan_results WHERE cache_key LIKE ?", (f"{account_id}|%",))
+                else:
+                    conn.execute("DELETE FROM scan_results")
+
+    def stats(self) -> Dict[str, Any]:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM scan_results"
+            ).fetchone()
+        return {'entries': row[0], 'size_bytes': row[1]}
+
+
+# ============================================================================
+# SINGLETON INSTANCE
+# ============================================================================
+
+_scan_cache: Optional[ScanCache] = None
+_scan_cache_lock = threading.Lock()
+
+
+def get_scan_cache() -> ScanCache:
+    """Get or create the shared scan cache"""
+    global _scan_cache
+
+    with _scan_cache_lock:
+        if _scan_cache is None:
+            _scan_cache = ScanCache()
+        return _scan_cache
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'ScanCache',
+    'scan_cache_key',
+    'get_scan_cache',
+    'DEFAULT_SCAN_TTL_SECONDS',
+]
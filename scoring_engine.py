@@ -0,0 +1,237 @@
+"""
+Scoring Engine Module
+=====================
+Columnar pillar / severity / account aggregation for findings.
+
+Findings are pulled out of their dicts or dataclasses once into a pandas
+table with categorical pillar, severity, service and account columns.
+Every pillar / severity count the scorers need comes from a single
+group-by over that table, and pillar scores are a matrix product of the pillar x severity
+counts with a severity deduction vector, instead of one Python pass per
+pillar and severity.
+
+Usage:
+    from scoring_engine import FindingsTable
+
+    table = FindingsTable.from_findings(findings)
+    scores = table.pillar_scores({'CRITICAL': 20, 'HIGH': 10}, pillars=PILLARS)
+"""
+
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+SEVERITY_LEVELS = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO', 'INFORMATIONAL')
+
+# Group-by key for findings that have no pillar
+UNMAPPED_PILLAR = '__unmapped__'
+
+# A field name, a callable(finding) -> value, or precomputed values (one per finding)
+FieldSpec = Union[str, Callable[[Any], Any], Sequence[Any]]
+
+
+def get_field(finding: Any, name: str, default: Any = '') -> Any:
+    """Read a field from a finding dict or object"""
+    if isinstance(finding, dict):
+        return finding.get(name, default)
+    return getattr(finding, name, default)
+
+
+def _column(findings: Sequence[Any], spec: FieldSpec, default: Any) -> List[Any]:
+    if not isinstance(spec, str) and not callable(spec):
+        return list(spec)
+    if callable(spec):
+        return list(map(spec, findings))
+    # Fast path when every finding has the field; fall back to per-finding defaults
+    try:
+        if findings and isinstance(findings[0], dict):
+            return list(map(itemgetter(spec), findings))
+        return list(map(attrgetter(spec), findings))
+    except (KeyError, AttributeError, TypeError):
+        return [get_field(f, spec, default) for f in findings]
+
+
+def _categorical(values: Sequence[Any]) -> pd.Categorical:
+    # factorize + from_codes skips the category sort and string-dtype
+    # inference pd.Categorical(values) does; categories keep first-seen order
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    codes, uniques = pd.factorize(array)
+    return pd.Categorical.from_codes(codes, pd.Index(uniques, dtype=object))
+
+
+def map_categories(column: pd.Categorical, func: Callable[[Any], Any]) -> pd.Categorical:
+    """Apply func once per distinct value of a column (None for missing values)"""
+    values = np.array([func(v) for v in column.categories] + [func(None)], dtype=object)
+    return _categorical(values[column.codes])
+
+
+def map_category_pairs(first: pd.Categorical, second: pd.Categorical,
+                       func: Callable[[Any, Any], Any]) -> pd.Categorical:
+    """Apply func once per distinct (first, second) value pair of two columns"""
+    width = len(second.categories) + 1
+    keys = (first.codes.astype(np.int64) + 1) * width + (second.codes.astype(np.int64) + 1)
+    unique, inverse = np.unique(keys, return_inverse=True)
+    first_values = [None, *first.categories]
+    second_values = [None, *second.categories]
+    values = np.array([func(first_values[k // width], second_values[k % width]) for k in unique],
+                      dtype=object)
+    return _categorical(values[inverse.reshape(-1)])
+
+
+# ============================================================================
+# FINDINGS TABLE
+# ============================================================================
+
+class FindingsTable:
+    """
+    Findings as a columnar table.
+
+    Row i of the table is findings[i] of the sequence it was built from,
+    so callers can map aggregate results (e.g. top findings per pillar)
+    back to the original objects.
+    """
+
+    def __init__(self, frame: pd.DataFrame, findings: Sequence[Any] = (),
+                 fields: Optional[Dict[str, FieldSpec]] = None):
+        self.frame = frame
+        self._findings = findings
+        self._fields = fields or {}
+        self._counts: Optional[pd.Series] = None
+
+    @classmethod
+    def from_findings(cls,
+                      findings: Sequence[Any],
+                      pillar: FieldSpec = 'pillar',
+                      severity: FieldSpec = 'severity',
+                      service: FieldSpec = 'service',
+                      account: FieldSpec = 'account_id',
+                      default_pillar: Any = '',
+                      default_severity: str = '',
+                      pillar_resolver: Optional[Callable[[Any, Any], Any]] = None) -> 'FindingsTable':
+        """
+        Build a table from finding dicts or objects.
+
+        Pillar and severity are extracted up front; service and account
+        are only read from the findings the first time they are needed.
+
+        Args:
+            findings: Finding dicts or dataclasses
+            pillar, severity, service, account: Field name to read, a
+                callable(finding) returning the value, or a precomputed
+                list of values
+            default_pillar: Pillar used when the field is missing
+            default_severity: Severity used when the field is missing
+            pillar_resolver: Optional callable(pillar, service) -> pillar,
+                called once per distinct pair rather than per finding
+
+        Returns:
+            FindingsTable. Empty pillars are grouped under UNMAPPED_PILLAR.
+        """
+        if not isinstance(findings, (list, tuple)):
+            findings = list(findings)
+
+        table = cls(pd.DataFrame({
+            'pillar': _categorical(_column(findings, pillar, default_pillar)),
+            'severity': _categorical(_column(findings, severity, default_severity)),
+        }), findings, {'service': service, 'account': account})
+
+        pillars = table.frame['pillar'].array
+        if pillar_resolver is not None:
+            pillars = map_category_pairs(pillars, table.column('service').array, pillar_resolver)
+        table.frame['pillar'] = map_categories(pillars, lambda p: p or UNMAPPED_PILLAR)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def column(self, name: str) -> pd.Series:
+        """A categorical column, extracted from the findings on first use"""
+        if name not in self.frame:
+            self.frame[name] = _categorical(_column(self._findings, self._fields[name], ''))
+        return self.frame[name]
+
+    def counts(self) -> pd.Series:
+        """Finding counts per (pillar, severity), computed once"""
+        if self._counts is None:
+            self._counts = self.frame.groupby(['pillar', 'severity'], observed=True, dropna=False).size()
+        return self._counts
+
+    def _matrix(self, counts: pd.Series, rows: Optional[Iterable],
+                severities: Iterable[str]) -> pd.DataFrame:
+        matrix = counts.unstack(fill_value=0) if not counts.empty else pd.DataFrame(dtype='int64')
+        index = list(rows) if rows is not None else list(matrix.index)
+        return matrix.reindex(index=index, columns=list(severities), fill_value=0).astype('int64')
+
+    def severity_matrix(self, pillars: Optional[Iterable] = None,
+                        severities: Iterable[str] = SEVERITY_LEVELS) -> pd.DataFrame:
+        """Pillar x severity count matrix (missing combinations are 0)"""
+        return self._matrix(self.counts(), pillars, severities)
+
+    def account_matrix(self, accounts: Optional[Iterable] = None,
+                       severities: Iterable[str] = SEVERITY_LEVELS) -> pd.DataFrame:
+        """Account x severity count matrix"""
+        counts = pd.DataFrame({'account': self.column('account'), 'severity': self.frame['severity']}) \
+            .groupby(['account', 'severity'], observed=True, dropna=False).size()
+        return self._matrix(counts, accounts, severities)
+
+    def pillar_totals(self, pillars: Optional[Iterable] = None) -> pd.Series:
+        """Total findings per pillar, across all severities"""
+        counts = self.counts()
+        totals = counts.groupby(level='pillar', observed=True, dropna=False).sum() if not counts.empty \
+            else pd.Series(dtype='int64')
+        index = list(pillars) if pillars is not None else list(totals.index)
+        return totals.reindex(index, fill_value=0).astype('int64')
+
+    def pillar_scores(self, deductions: Dict[str, float], pillars: Iterable,
+                      base: float = 100.0) -> pd.Series:
+        """
+        Score each pillar as base minus its severity deductions, clipped to [0, base].
+
+        Args:
+            deductions: Points deducted per finding of each severity;
+                severities not listed deduct nothing
+            pillars: Pillars to score (pillars without findings score base)
+            base: Starting score
+
+        Returns:
+            Series of scores indexed by pillar
+        """
+        pillars = list(pillars)
+        matrix = self.severity_matrix(pillars, deductions.keys())
+        penalty = matrix.to_numpy(dtype=float) @ np.fromiter(deductions.values(), dtype=float)
+        return pd.Series(np.clip(base - penalty, 0, base), index=pillars)
+
+    def first_rows(self, pillar: Any, n: int) -> List[int]:
+        """Positions of the first n findings of a pillar, in input order"""
+        mask = (self.frame['pillar'] == pillar).to_numpy()
+        return np.flatnonzero(mask)[:n].tolist()
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'SEVERITY_LEVELS',
+    'UNMAPPED_PILLAR',
+    'FindingsTable',
+    'get_field',
+    'map_categories',
+    'map_category_pairs',
+]
@@ -22,8 +22,20 @@ from enum import Enum
 import logging
 import json
 import time
+import queue
+import itertools
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from security_hub_sync import SecurityHubSync
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -49,6 +61,140 @@ class SecurityHubConfig:
     enable_cross_region: bool = True
     parallel_workers: int = 5
     finding_age_days: int = 90
+    export_workers: int = 8  # Concurrent GetFindings partitions for exports
+    export_batch_size: int = 10000  # Findings per Parquet row group
+    create_summary_insights: bool = False  # Create missing summary insights (needs CreateInsight)
+
+SEVERITY_LABELS = ["CRITICAL", "HIGH", "MEDIUM", "LOW", "INFORMATIONAL"]
+ACCOUNT_PARTITION_SIZE = 20  # GetFindings accepts at most 20 values per filter field
+
+# Parquet export columns (the fields of a parsed finding); types is stored as JSON text
+FINDING_EXPORT_COLUMNS = [
+    "id", "arn", "account_id", "region", "title", "description", "severity",
+    "severity_normalized", "product_name", "company_name", "resource_type",
+    "resource_id", "resource_region", "compliance_status", "workflow_status",
+    "record_state", "generator_id", "created_at", "updated_at",
+    "first_observed_at", "last_observed_at", "remediation", "remediation_url",
+    "types", "source_url",
+]
+
+# ============================================================================
+# INSIGHT-BASED SUMMARY ENGINE
+# ============================================================================
+
+ACTIVE_FINDINGS_FILTER = {'RecordState': [{'Value': 'ACTIVE', 'Comparison': 'EQUALS'}]}
+
+# Summary dimension -> (GroupByAttribute, extra filters)
+SUMMARY_DIMENSIONS = {
+    "by_severity": ("SeverityLabel", {}),
+    "by_status": ("WorkflowStatus", {}),
+    "by_compliance": ("ComplianceStatus", {}),
+    "by_account": ("AwsAccountId", {}),
+    "by_account_critical": ("AwsAccountId", {'SeverityLabel': [{'Value': 'CRITICAL', 'Comparison': 'EQUALS'}]}),
+    "by_account_high": ("AwsAccountId", {'SeverityLabel': [{'Value': 'HIGH', 'Comparison': 'EQUALS'}]}),
+    "by_product": ("ProductName", {}),
+    "by_resource_type": ("ResourceType", {}),
+}
+
+INSIGHT_NAME_PREFIX = "waf-scanner-summary"
+
+
+class InsightsUnavailable(Exception):
+    """A summary insight does not exist and creating it was not enabled"""
+
+
+class InsightSummaryEngine:
+    """
+    Grouped finding counts computed by Security Hub itself.
+
+    One custom insight per summary dimension is adopted if it already
+    exists (or created, when create_missing is set) and then queried with
+    GetInsightResults, so a summary costs a handful of API calls however
+    many findings the aggregator holds. Security Hub returns at most the
+    top 100 groups per insight, which bounds the per-account and
+    per-resource-type breakdowns for very large organizations.
+    """
+
+    def __init__(self, client, parallel_workers: int = 5, create_missing: bool = False):
+        self.client = client
+        self.parallel_workers = parallel_workers
+        self.create_missing = create_missing
+        self._insight_arns: Dict[str, str] = {}
+
+    @staticmethod
+    def _insight_name(dimension: str) -> str:
+        return f"{INSIGHT_NAME_PREFIX}-{dimension.replace('_', '-')}"
+
+    def _ensure_insights(self, dimensions: List[str]):
+        """
+        Adopt (or, with create_missing, create) the insights backing dimensions.
+
+        Raises:
+            InsightsUnavailable: If an insight is missing and create_missing is off
+            ClientError: If insights cannot be listed, updated or created
+        """
+        missing = [d for d in dimensions if d not in self._insight_arns]
+        if not missing:
+            return
+
+        existing = {}
+        for page in self.client.get_paginator('get_insights').paginate():
+            for insight in page.get('Insights', []):
+                if insight.get('Name', '').startswith(INSIGHT_NAME_PREFIX):
+                    existing[insight['Name']] = insight
+
+        absent = [d for d in missing if self._insight_name(d) not in existing]
+        if absent and not self.create_missing:
+            raise InsightsUnavailable(
+                f"Summary insights not found for {', '.join(absent)} "
+                f"(set create_summary_insights to create them)"
+            )
+
+        for dimension in missing:
+            group_by, extra_filters = SUMMARY_DIMENSIONS[dimension]
+            name = self._insight_name(dimension)
+            filters = {**ACTIVE_FINDINGS_FILTER, **extra_filters}
+
+            insight = existing.get(name)
+            if insight is None:
+                response = self.client.create_insight(Name=name, Filters=filters,
+                                                      GroupByAttribute=group_by)
+                self._insight_arns[dimension] = response['InsightArn']
+                continue
+
+            if insight.get('Filters') != filters or insight.get('GroupByAttribute') != group_by:
+                # Restore the definition after an edit in the console
+                self.client.update_insight(InsightArn=insight['InsightArn'], Filters=filters,
+                                           GroupByAttribute=group_by)
+            self._insight_arns[dimension] = insight['InsightArn']
+
+    def _insight_counts(self, dimension: str) -> Dict[str, int]:
+        response = self.client.get_insight_results(InsightArn=self._insight_arns[dimension])
+        return {
+            result['GroupByAttributeValue']: result['Count']
+            for result in response.get('InsightResults', {}).get('ResultValues', [])
+        }
+
+    def grouped_counts(self, dimensions: List[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Return {dimension: {group value: finding count}} for active findings.
+
+        Raises:
+            InsightsUnavailable: If an insight is missing and create_missing is off
+            ClientError: If insights cannot be created or queried
+        """
+        self._ensure_insights(dimensions)
+
+        counts = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.parallel_workers, len(dimensions)))) as executor:
+            future_to_dimension = {
+                executor.submit(self._insight_counts, dimension): dimension
+                for dimension in dimensions
+            }
+            for future in as_completed(future_to_dimension):
+                counts[future_to_dimension[future]] = future.result()
+
+        return counts
 
 # ============================================================================
 # ENTERPRISE SECURITY HUB MANAGER
@@ -73,6 +219,8 @@ class EnterpriseSecurityHubManager:
         self._cache_timestamps = {}
         self._securityhub_client = None
         self._organizations_client = None
+        self._insight_engine = None
+        self._finding_sync = None
     
     # ============================================================================
     # CONNECTION MANAGEMENT
@@ -133,6 +281,8 @@ class EnterpriseSecurityHubManager:
             
             # Initialize clients
             self._securityhub_client = self.session.client('securityhub', region_name=region)
+            self._insight_engine = None
+            self._finding_sync = None
             
             # Validate connection
             hub_info = self._securityhub_client.describe_hub()
@@ -305,7 +455,8 @@ class EnterpriseSecurityHubManager:
                                 compliance_status: str = None,
                                 max_results: int = None,
                                 sort_by: str = "SeverityLabel",
-                                sort_order: str = "desc") -> Generator[Dict, None, None]:
+                                sort_order: str = "desc",
+                                incremental: bool = False) -> Generator[Dict, None, None]:
         """
         Get aggregated findings from ALL member accounts.
         
@@ -322,6 +473,9 @@ class EnterpriseSecurityHubManager:
             max_results: Limit total results (None = all)
             sort_by: Field to sort by
             sort_order: "asc" or "desc"
+            incremental: Sync changes since the last call into the local
+                finding store and read from it, instead of paging the full
+                finding set from Security Hub
             
         Yields:
             Finding dictionaries
@@ -330,33 +484,22 @@ class EnterpriseSecurityHubManager:
             logger.error("Not connected to Security Hub")
             return
         
-        # Build filters
-        filters = {
-            'RecordState': [{'Value': 'ACTIVE', 'Comparison': 'EQUALS'}]
-        }
-        
-        if severity_filter:
-            filters['SeverityLabel'] = [
-                {'Value': sev, 'Comparison': 'EQUALS'} 
-                for sev in severity_filter
-            ]
-        
-        if account_ids:
-            filters['AwsAccountId'] = [
-                {'Value': acc, 'Comparison': 'EQUALS'} 
-                for acc in account_ids
-            ]
+        if incremental:
+            self.sync_findings()
+            for finding in self._finding_sync.iter_findings(
+                severity_filter=severity_filter,
+                account_ids=account_ids,
+                product_names=product_names,
+                compliance_status=compliance_status,
+                max_results=max_results,
+                sort_by=sort_by,
+                sort_order=sort_order
+            ):
+                yield self._parse_finding(finding)
+            return
         
-        if product_names:
-            filters['ProductName'] = [
-                {'Value': prod, 'Comparison': 'EQUALS'} 
-                for prod in product_names
-            ]
-        
-        if compliance_status:
-            filters['ComplianceStatus'] = [
-                {'Value': compliance_status, 'Comparison': 'EQUALS'}
-            ]
+        filters = self._build_findings_filters(severity_filter, account_ids,
+                                               product_names, compliance_status)
         
         # Sort criteria
         sort_criteria = [
@@ -388,6 +531,55 @@ class EnterpriseSecurityHubManager:
             logger.error(f"Failed to get findings: {e}")
             raise
     
+    def sync_findings(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Bring the local finding store up to date with the aggregator.
+        
+        Only findings updated since the previous sync are downloaded
+        (everything active on the first sync, or when full=True).
+        """
+        if self._finding_sync is None:
+            hub_account_id = self.session.client('sts').get_caller_identity()['Account']
+            self._finding_sync = SecurityHubSync(self._securityhub_client,
+                                                 page_size=self.config.max_findings_per_request,
+                                                 account_id=hub_account_id)
+        return self._finding_sync.sync(full=full)
+    
+    @staticmethod
+    def _build_findings_filters(severity_filter: List[str] = None,
+                                account_ids: List[str] = None,
+                                product_names: List[str] = None,
+                                compliance_status: str = None) -> Dict[str, List[Dict]]:
+        """Build GetFindings filters for active findings"""
+        filters = {
+            'RecordState': [{'Value': 'ACTIVE', 'Comparison': 'EQUALS'}]
+        }
+        
+        if severity_filter:
+            filters['SeverityLabel'] = [
+                {'Value': sev, 'Comparison': 'EQUALS'} 
+                for sev in severity_filter
+            ]
+        
+        if account_ids:
+            filters['AwsAccountId'] = [
+                {'Value': acc, 'Comparison': 'EQUALS'} 
+                for acc in account_ids
+            ]
+        
+        if product_names:
+            filters['ProductName'] = [
+                {'Value': prod, 'Comparison': 'EQUALS'} 
+                for prod in product_names
+            ]
+        
+        if compliance_status:
+            filters['ComplianceStatus'] = [
+                {'Value': compliance_status, 'Comparison': 'EQUALS'}
+            ]
+        
+        return filters
+    
     def _parse_finding(self, finding: Dict) -> Dict:
         """Parse raw finding into clean structure"""
         resources = finding.get('Resources', [{}])
@@ -428,15 +620,50 @@ class EnterpriseSecurityHubManager:
         """
         Get aggregated findings summary across all 500+ accounts.
         
-        This is optimized to minimize API calls while providing
-        comprehensive summary data.
+        Counts are computed server-side by Security Hub custom insights;
+        findings are only downloaded for the critical and recent sample
+        lists. Missing insights are created only when
+        config.create_summary_insights is set. If insights are unavailable
+        (not created, or securityhub:CreateInsight denied), every active
+        finding is paged in severity partitions and counted instead.
         """
         cache_key = f"findings_summary_{group_by}"
         
         if self._is_cache_valid(cache_key):
             return self._cache[cache_key]
         
-        summary = {
+        summary = self._empty_findings_summary()
+        
+        try:
+            self._summarize_with_insights(summary, include_by_account, include_by_product)
+        except (ClientError, InsightsUnavailable) as e:
+            logger.warning(f"Insight summary unavailable, counting findings instead: {e}")
+            summary = self._empty_findings_summary()
+            self._summarize_by_scan(summary, include_by_account, include_by_product)
+        
+        # Calculate derived metrics
+        total = summary["total_findings"]
+        if total > 0:
+            summary["critical_percentage"] = round(summary["by_severity"]["CRITICAL"] / total * 100, 2)
+            summary["high_percentage"] = round(summary["by_severity"]["HIGH"] / total * 100, 2)
+            summary["compliance_rate"] = round(
+                summary["by_compliance"]["PASSED"] / 
+                (summary["by_compliance"]["PASSED"] + summary["by_compliance"]["FAILED"]) * 100, 2
+            ) if (summary["by_compliance"]["PASSED"] + summary["by_compliance"]["FAILED"]) > 0 else 0
+        
+        # Top 10 accounts by findings
+        summary["top_accounts_by_findings"] = sorted(
+            summary["by_account"].items(),
+            key=lambda x: x[1]["total"],
+            reverse=True
+        )[:10]
+        
+        self._set_cache(cache_key, summary)
+        return summary
+    
+    @staticmethod
+    def _empty_findings_summary() -> Dict[str, Any]:
+        return {
             "total_findings": 0,
             "by_severity": {
                 "CRITICAL": 0,
@@ -463,72 +690,284 @@ class EnterpriseSecurityHubManager:
             "critical_findings": [],  # Store first 50 critical
             "recent_findings": []     # Store 20 most recent
         }
+    
+    def _summarize_with_insights(self, summary: Dict[str, Any],
+                                 include_by_account: bool, include_by_product: bool):
+        """Fill summary from custom insight counts plus two small finding samples"""
+        if not self._securityhub_client:
+            logger.error("Not connected to Security Hub")
+            return
+        
+        if self._insight_engine is None:
+            self._insight_engine = InsightSummaryEngine(self._securityhub_client,
+                                                        self.config.parallel_workers,
+                                                        self.config.create_summary_insights)
+        
+        dimensions = ["by_severity", "by_status", "by_compliance", "by_resource_type"]
+        if include_by_account:
+            dimensions += ["by_account", "by_account_critical", "by_account_high"]
+        if include_by_product:
+            dimensions.append("by_product")
+        
+        counts = self._insight_engine.grouped_counts(dimensions)
+        
+        for dimension in ("by_severity", "by_status", "by_compliance", "by_product", "by_resource_type"):
+            summary[dimension].update(counts.get(dimension, {}))
+        summary["total_findings"] = sum(counts["by_severity"].values())
         
-        critical_limit = 50
-        recent_limit = 20
+        if include_by_account:
+            critical = counts["by_account_critical"]
+            high = counts["by_account_high"]
+            summary["by_account"] = {
+                account_id: {"total": total, "critical": critical.get(account_id, 0),
+                             "high": high.get(account_id, 0)}
+                for account_id, total in counts["by_account"].items()
+            }
+        
+        summary["critical_findings"] = list(self.get_aggregated_findings(
+            severity_filter=["CRITICAL"], max_results=50
+        ))
+        summary["recent_findings"] = list(self.get_aggregated_findings(
+            max_results=20, sort_by="UpdatedAt"
+        ))
+    
+    def _summarize_by_scan(self, summary: Dict[str, Any],
+                           include_by_account: bool, include_by_product: bool):
+        """Fill summary by paging every active finding in severity partitions"""
+        for page in self.iter_findings_partitioned(partition_by="severity"):
+            for finding in page:
+                summary["total_findings"] += 1
+                
+                # By severity
+                severity = finding.get("severity", "INFORMATIONAL")
+                summary["by_severity"][severity] = summary["by_severity"].get(severity, 0) + 1
+                
+                # By workflow status
+                status = finding.get("workflow_status", "NEW")
+                summary["by_status"][status] = summary["by_status"].get(status, 0) + 1
+                
+                # By compliance
+                compliance = finding.get("compliance_status", "NOT_AVAILABLE")
+                summary["by_compliance"][compliance] = summary["by_compliance"].get(compliance, 0) + 1
+                
+                # By account
+                if include_by_account:
+                    account_id = finding.get("account_id", "Unknown")
+                    if account_id not in summary["by_account"]:
+                        summary["by_account"][account_id] = {"total": 0, "critical": 0, "high": 0}
+                    summary["by_account"][account_id]["total"] += 1
+                    if severity == "CRITICAL":
+                        summary["by_account"][account_id]["critical"] += 1
+                    elif severity == "HIGH":
+                        summary["by_account"][account_id]["high"] += 1
+                
+                # By product
+                if include_by_product:
+                    product = finding.get("product_name", "Unknown")
+                    summary["by_product"][product] = summary["by_product"].get(product, 0) + 1
+                
+                # By resource type
+                resource_type = finding.get("resource_type", "Unknown")
+                summary["by_resource_type"][resource_type] = summary["by_resource_type"].get(resource_type, 0) + 1
+        
+        # Partitions arrive unordered, so the samples are queried separately
+        summary["critical_findings"] = list(self.get_aggregated_findings(
+            severity_filter=["CRITICAL"], max_results=50
+        ))
+        summary["recent_findings"] = list(self.get_aggregated_findings(
+            max_results=20, sort_by="UpdatedAt"
+        ))
+    
+    # ============================================================================
+    # PARTITIONED EXPORT
+    # ============================================================================
+    
+    def _export_partitions(self, partition_by: List[str], severity_filter: List[str] = None,
+                           account_ids: List[str] = None,
+                           regions: List[str] = None) -> List[Dict[str, List[Dict]]]:
+        """
+        Split the finding space into disjoint filter sets.
+        
+        Each dimension contributes one filter field; several dimensions are
+        combined as a cross product (e.g. region x severity).
+        """
+        dimensions = []
+        for dimension in partition_by:
+            if dimension == "severity":
+                dimensions.append([
+                    {'SeverityLabel': [{'Value': sev, 'Comparison': 'EQUALS'}]}
+                    for sev in (severity_filter or SEVERITY_LABELS)
+                ])
+            elif dimension == "region":
+                regions = regions or self.session.get_available_regions('securityhub')
+                dimensions.append([
+                    {'Region': [{'Value': region, 'Comparison': 'EQUALS'}]}
+                    for region in regions
+                ])
+            elif dimension == "account":
+                if not account_ids:
+                    account_ids = [m["account_id"] for m in self.get_all_member_accounts()]
+                    account_ids.append(self.session.client('sts').get_caller_identity()['Account'])
+                dimensions.append([
+                    {'AwsAccountId': [
+                        {'Value': acc, 'Comparison': 'EQUALS'}
+                        for acc in account_ids[i:i + ACCOUNT_PARTITION_SIZE]
+                    ]}
+                    for i in range(0, len(account_ids), ACCOUNT_PARTITION_SIZE)
+                ])
+            else:
+                raise ValueError(f"Unknown partition dimension: {dimension}")
         
-        for finding in self.get_aggregated_findings():
-            summary["total_findings"] += 1
+        partitions = []
+        for combination in itertools.product(*dimensions):
+            partition = {}
+            for part in combination:
+                partition.update(part)
+            partitions.append(partition)
+        return partitions
+    
+    def iter_findings_partitioned(self,
+                                  partition_by=("severity",),
+                                  severity_filter: List[str] = None,
+                                  account_ids: List[str] = None,
+                                  product_names: List[str] = None,
+                                  compliance_status: str = None,
+                                  regions: List[str] = None,
+                                  max_workers: int = None) -> Generator[List[Dict], None, None]:
+        """
+        Page disjoint partitions of the findings concurrently.
+        
+        Yields lists of parsed findings (one GetFindings page each) in
+        arrival order, so there is no global sort. Memory stays bounded: at
+        most a few pages per worker are buffered ahead of the consumer.
+        
+        Args:
+            partition_by: "severity", "region" and/or "account" (a string
+                or a sequence, combined as a cross product)
+            severity_filter / account_ids / product_names / compliance_status:
+                Same filters as get_aggregated_findings
+            regions: Regions for region partitions (default: every region
+                Security Hub is available in)
+            max_workers: Concurrent partitions (default config.export_workers)
+        """
+        if not self._securityhub_client:
+            logger.error("Not connected to Security Hub")
+            return
+        
+        if isinstance(partition_by, str):
+            partition_by = [partition_by]
+        base_filters = self._build_findings_filters(
+            None if "severity" in partition_by else severity_filter,
+            None if "account" in partition_by else account_ids,
+            product_names, compliance_status
+        )
+        partitions = [
+            {**base_filters, **partition}
+            for partition in self._export_partitions(partition_by, severity_filter, account_ids, regions)
+        ]
+        if not partitions:
+            return
+        
+        max_workers = max(1, min(max_workers or self.config.export_workers, len(partitions)))
+        pages: "queue.Queue" = queue.Queue(maxsize=max_workers * 4)
+        stop = threading.Event()
+        done = object()
+        
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def page_partition(filters):
+            try:
+                paginator = self._securityhub_client.get_paginator('get_findings')
+                for page in paginator.paginate(
+                    Filters=filters,
+                    PaginationConfig={'PageSize': self.config.max_findings_per_request}
+                ):
+                    findings = [self._parse_finding(f) for f in page.get('Findings', [])]
+                    if findings and not put(findings):
+                        return
+                put(done)
+            except Exception as e:
+                put(e)
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for filters in partitions:
+                executor.submit(page_partition, filters)
+            
+            remaining = len(partitions)
+            while remaining:
+                item = pages.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
             
-            # By severity
-            severity = finding.get("severity", "INFORMATIONAL")
-            summary["by_severity"][severity] = summary["by_severity"].get(severity, 0) + 1
+            logger.info(f"Exported {len(partitions)} finding partitions")
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def export_findings(self, output_path: str, **partition_kwargs) -> Dict[str, Any]:
+        """
+        Export active findings to a Parquet file using partitioned paging.
+        
+        Findings are written in row groups of config.export_batch_size as
+        they arrive, so the export never holds the full result in memory.
+        Every file has the same schema (FINDING_EXPORT_COLUMNS as strings,
+        severity_normalized as int64), whatever the batches contain; list
+        fields (types) are stored as JSON strings.
+        
+        Args:
+            output_path: Destination .parquet file
+            **partition_kwargs: Passed to iter_findings_partitioned
             
-            # By workflow status
-            status = finding.get("workflow_status", "NEW")
-            summary["by_status"][status] = summary["by_status"].get(status, 0) + 1
+        Returns:
+            Dict with path, findings count and elapsed seconds
             
-            # By compliance
-            compliance = finding.get("compliance_status", "NOT_AVAILABLE")
-            summary["by_compliance"][compliance] = summary["by_compliance"].get(compliance, 0) + 1
-            
-            # By account
-            if include_by_account:
-                account_id = finding.get("account_id", "Unknown")
-                if account_id not in summary["by_account"]:
-                    summary["by_account"][account_id] = {"total": 0, "critical": 0, "high": 0}
-                summary["by_account"][account_id]["total"] += 1
-                if severity == "CRITICAL":
-                    summary["by_account"][account_id]["critical"] += 1
-                elif severity == "HIGH":
-                    summary["by_account"][account_id]["high"] += 1
-            
-            # By product
-            if include_by_product:
-                product = finding.get("product_name", "Unknown")
-                summary["by_product"][product] = summary["by_product"].get(product, 0) + 1
-            
-            # By resource type
-            resource_type = finding.get("resource_type", "Unknown")
-            summary["by_resource_type"][resource_type] = summary["by_resource_type"].get(resource_type, 0) + 1
-            
-            # Store critical findings
-            if severity == "CRITICAL" and len(summary["critical_findings"]) < critical_limit:
-                summary["critical_findings"].append(finding)
-            
-            # Store recent (first N are most recent due to default sort)
-            if len(summary["recent_findings"]) < recent_limit:
-                summary["recent_findings"].append(finding)
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
         
-        # Calculate derived metrics
-        total = summary["total_findings"]
-        if total > 0:
-            summary["critical_percentage"] = round(summary["by_severity"]["CRITICAL"] / total * 100, 2)
-            summary["high_percentage"] = round(summary["by_severity"]["HIGH"] / total * 100, 2)
-            summary["compliance_rate"] = round(
-                summary["by_compliance"]["PASSED"] / 
-                (summary["by_compliance"]["PASSED"] + summary["by_compliance"]["FAILED"]) * 100, 2
-            ) if (summary["by_compliance"]["PASSED"] + summary["by_compliance"]["FAILED"]) > 0 else 0
+        start = time.time()
+        schema = pa.schema([
+            (column, pa.int64() if column == "severity_normalized" else pa.string())
+            for column in FINDING_EXPORT_COLUMNS
+        ])
+        batch: List[Dict] = []
+        total = 0
         
-        # Top 10 accounts by findings
-        summary["top_accounts_by_findings"] = sorted(
-            summary["by_account"].items(),
-            key=lambda x: x[1]["total"],
-            reverse=True
-        )[:10]
+        def flush():
+            for row in batch:
+                row["types"] = json.dumps(row.get("types", []))
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            batch.clear()
         
-        self._set_cache(cache_key, summary)
-        return summary
+        writer = pq.ParquetWriter(output_path, schema, compression='zstd')
+        try:
+            for page in self.iter_findings_partitioned(**partition_kwargs):
+                batch.extend(page)
+                total += len(page)
+                if len(batch) >= self.config.export_batch_size:
+                    flush()
+            if batch:
+                flush()
+        finally:
+            writer.close()
+        
+        elapsed = round(time.time() - start, 2)
+        logger.info(f"Exported {total} findings to {output_path} in {elapsed}s")
+        return {"path": output_path, "findings": total, "seconds": elapsed}
     
     # ============================================================================
     # COMPLIANCE STANDARDS
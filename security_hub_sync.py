@@ -0,0 +1,345 @@
+"""
+Security Hub Sync Module
+========================
+Keeps a local SQLite copy of Security Hub findings up to date by fetching
+only findings whose UpdatedAt is newer than the last sync watermark.
+
+The first sync downloads the active findings; every later sync costs
+about as much as the changes since the previous one. Updates are applied
+as upserts, and findings that were archived upstream are kept with their
+new RecordState so readers can filter them out.
+
+Watermarks and stored findings are scoped to the hub they came from
+(administrator account and region), so several tenants can share one
+store without resuming from, or reading, each other's findings.
+
+Usage:
+    from security_hub_sync import SecurityHubSync, get_finding_store
+
+    sync = SecurityHubSync(session.client('securityhub'), get_finding_store(), account_id=account_id)
+    sync.sync()
+    for finding in sync.iter_findings(severity_filter=['CRITICAL']):
+        ...
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Generator, Any
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+from sqlite_pool import get_connection_pool
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_STORE_PATH = os.environ.get('SECURITY_HUB_STORE_PATH', 'data/security_hub_findings.db')
+
+# Re-read this much history before the watermark on every sync. Findings
+# can reach the aggregator after their UpdatedAt time; upserts make the
+# overlap harmless.
+DEFAULT_WATERMARK_OVERLAP = timedelta(hours=1)
+
+SEVERITY_ORDER = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3, "INFORMATIONAL": 4}
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _format_timestamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+# ============================================================================
+# FINDING STORE
+# ============================================================================
+
+class SecurityHubFindingStore:
+    """SQLite table of raw Security Hub findings plus per-scope sync watermarks"""
+
+    def __init__(self, db_path: str = DEFAULT_STORE_PATH):
+        self.db_path = db_path
+        self.pool = get_connection_pool(db_path)
+        self._init_schema()
+
+    def _init_schema(self):
+        with self.pool.connection() as conn:
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(securityhub_findings)")}
+            if columns and 'hub_account_id' not in columns:
+                # Unscoped store from before hub scoping - rebuild it with a full sync
+                logger.info("Rebuilding Security Hub finding store with per-hub scoping")
+                conn.executescript("""
+                    DROP TABLE securityhub_findings;
+                    DROP TABLE IF EXISTS securityhub_sync_state;
+                """)
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS securityhub_findings (
+                    hub_account_id TEXT NOT NULL,
+                    hub_region TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    account_id TEXT,
+                    region TEXT,
+                    severity TEXT,
+                    workflow_status TEXT,
+                    record_state TEXT,
+                    compliance_status TEXT,
+                    product_name TEXT,
+                    resource_type TEXT,
+                    updated_at TEXT,
+                    finding_json TEXT NOT NULL,
+                    PRIMARY KEY (hub_account_id, hub_region, id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_securityhub_findings_account
+                    ON securityhub_findings (account_id);
+                CREATE INDEX IF NOT EXISTS idx_securityhub_findings_hub_state_severity
+                    ON securityhub_findings (hub_account_id, hub_region, record_state, severity);
+                CREATE INDEX IF NOT EXISTS idx_securityhub_findings_updated
+                    ON securityhub_findings (updated_at);
+
+                CREATE TABLE IF NOT EXISTS securityhub_sync_state (
+                    scope TEXT PRIMARY KEY,
+                    watermark TEXT,
+                    last_sync TEXT,
+                    last_sync_count INTEGER DEFAULT 0
+                );
+            """)
+
+    def get_watermark(self, scope: str) -> Optional[str]:
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT watermark FROM securityhub_sync_state WHERE scope = ?", (scope,)
+            ).fetchone()
+            return row['watermark'] if row else None
+
+    def upsert_findings(self, findings: List[Dict], hub_account_id: str, hub_region: str) -> int:
+        """Insert or replace one hub's findings, keeping whichever copy is newer"""
+        rows = []
+        for finding in findings:
+            resources = finding.get('Resources') or [{}]
+            rows.append((
+                hub_account_id,
+                hub_region,
+                finding['Id'],
+                finding.get('AwsAccountId'),
+                finding.get('Region'),
+                finding.get('Severity', {}).get('Label', 'INFORMATIONAL'),
+                finding.get('Workflow', {}).get('Status', 'NEW'),
+                finding.get('RecordState', 'ACTIVE'),
+                finding.get('Compliance', {}).get('Status', 'NOT_AVAILABLE'),
+                finding.get('ProductName'),
+                resources[0].get('Type', 'Unknown'),
+                finding.get('UpdatedAt'),
+                json.dumps(finding, default=str),
+            ))
+
+        with self.pool.connection() as conn:
+            with conn:
+                conn.executemany("""
+                    INSERT INTO securityhub_findings (
+                        hub_account_id, hub_region, id, account_id, region, severity,
+                        workflow_status, record_state, compliance_status, product_name,
+                        resource_type, updated_at, finding_json
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (hub_account_id, hub_region, id) DO UPDATE SET
+                        account_id = excluded.account_id,
+                        region = excluded.region,
+                        severity = excluded.severity,
+                        workflow_status = excluded.workflow_status,
+                        record_state = excluded.record_state,
+                        compliance_status = excluded.compliance_status,
+                        product_name = excluded.product_name,
+                        resource_type = excluded.resource_type,
+                        updated_at = excluded.updated_at,
+                        finding_json = excluded.finding_json
+                    WHERE excluded.updated_at >= securityhub_findings.updated_at
+                """, rows)
+        return len(rows)
+
+    def set_watermark(self, scope: str, watermark: str, count: int):
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute("""
+                    INSERT INTO securityhub_sync_state (scope, watermark, last_sync, last_sync_count)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (scope) DO UPDATE SET
+                        watermark = excluded.watermark,
+                        last_sync = excluded.last_sync,
+                        last_sync_count = excluded.last_sync_count
+                """, (scope, watermark, _format_timestamp(datetime.now(timezone.utc)), count))
+
+    def reset(self, scope: str):
+        """Forget a scope's watermark so the next sync is a full one"""
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute("DELETE FROM securityhub_sync_state WHERE scope = ?", (scope,))
+
+    def iter_findings(self,
+                      hub_account_id: str,
+                      hub_region: str,
+                      severity_filter: List[str] = None,
+                      account_ids: List[str] = None,
+                      product_names: List[str] = None,
+                      compliance_status: str = None,
+                      workflow_statuses: List[str] = None,
+                      max_results: int = None,
+                      sort_by: str = "SeverityLabel",
+                      sort_order: str = "desc") -> Generator[Dict, None, None]:
+        """
+        Yield one hub's stored ACTIVE findings (raw Security Hub format).
+
+        Accepts the same filters as EnterpriseSecurityHubManager.
+        get_aggregated_findings; sort_by supports SeverityLabel and
+        UpdatedAt. "desc" severity order means most severe first.
+        """
+        clauses = ["hub_account_id = ?", "hub_region = ?", "record_state = 'ACTIVE'"]
+        params: List[Any] = [hub_account_id, hub_region]
+        for column, values in (("severity", severity_filter), ("account_id", account_ids),
+                               ("product_name", product_names),
+                               ("workflow_status", workflow_statuses)):
+            if values:
+                clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+                params.extend(values)
+        if compliance_status:
+            clauses.append("compliance_status = ?")
+            params.append(compliance_status)
+
+        descending = sort_order.lower() == "desc"
+        if sort_by == "UpdatedAt":
+            order = f"updated_at {'DESC' if descending else 'ASC'}"
+        else:
+            severity_rank = "CASE severity " + " ".join(
+                f"WHEN '{label}' THEN {rank}" for label, rank in SEVERITY_ORDER.items()
+            ) + " ELSE 5 END"
+            order = f"{severity_rank} {'ASC' if descending else 'DESC'}, updated_at DESC"
+
+        query = f"SELECT finding_json FROM securityhub_findings WHERE {' AND '.join(clauses)} ORDER BY {order}"
+        if max_results:
+            query += " LIMIT ?"
+            params.append(max_results)
+
+        with self.pool.connection() as conn:
+            for row in conn.execute(query, params):
+                yield json.loads(row['finding_json'])
+
+
+# ============================================================================
+# SYNC
+# ============================================================================
+
+class SecurityHubSync:
+    """
+    Incremental GetFindings sync into a SecurityHubFindingStore.
+
+    The watermark is the newest UpdatedAt seen; each sync asks only for
+    findings updated after (watermark - overlap), in every record state,
+    so archived findings are picked up too.
+    """
+
+    def __init__(self, client, store: SecurityHubFindingStore = None, scope: str = None,
+                 overlap: timedelta = DEFAULT_WATERMARK_OVERLAP, page_size: int = 100,
+                 account_id: str = None):
+        """
+        Args:
+            client: Security Hub client for the aggregator/administrator account
+            store: Local finding store (default shared store)
+            scope: Watermark key (default: securityhub:<account>:<region>)
+            overlap: History re-read before the watermark on every sync
+            page_size: GetFindings page size
+            account_id: Hub account ID from STS (default: read from the hub ARN)
+        """
+        self.client = client
+        self.store = store or get_finding_store()
+        self.region = client.meta.region_name
+        self.account_id = account_id or client.describe_hub()['HubArn'].split(':')[4]
+        self.scope = scope or f"securityhub:{self.account_id}:{self.region}"
+        self.overlap = overlap
+        self.page_size = page_size
+        self._lock = threading.Lock()
+
+    def sync(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Fetch findings changed since the last sync and upsert them.
+
+        Args:
+            full: Ignore the watermark and re-download all active findings
+
+        Returns:
+            Dict with mode ('full' or 'incremental'), findings fetched and
+            the new watermark
+        """
+        with self._lock:
+            watermark = None if full else self.store.get_watermark(self.scope)
+
+            if watermark:
+                start = _parse_timestamp(watermark) - self.overlap
+                filters = {'UpdatedAt': [{
+                    'Start': _format_timestamp(start),
+                    'End': _format_timestamp(datetime.now(timezone.utc) + timedelta(minutes=5)),
+                }]}
+            else:
+                filters = {'RecordState': [{'Value': 'ACTIVE', 'Comparison': 'EQUALS'}]}
+
+            fetched = 0
+            newest = watermark
+            paginator = self.client.get_paginator('get_findings')
+            for page in paginator.paginate(Filters=filters,
+                                           PaginationConfig={'PageSize': self.page_size}):
+                findings = page.get('Findings', [])
+                if not findings:
+                    continue
+                self.store.upsert_findings(findings, self.account_id, self.region)
+                fetched += len(findings)
+                page_newest = max(f.get('UpdatedAt', '') for f in findings)
+                if not newest or _parse_timestamp(page_newest) > _parse_timestamp(newest):
+                    newest = page_newest
+
+            if newest:
+                self.store.set_watermark(self.scope, newest, fetched)
+
+            mode = 'incremental' if watermark else 'full'
+            logger.info(f"Security Hub {mode} sync for {self.scope}: {fetched} findings")
+            return {'mode': mode, 'fetched': fetched, 'watermark': newest}
+
+    def iter_findings(self, **filters) -> Generator[Dict, None, None]:
+        """Stored findings of this sync's hub (see SecurityHubFindingStore.iter_findings)"""
+        return self.store.iter_findings(self.account_id, self.region, **filters)
+
+
+# ============================================================================
+# SINGLETON INSTANCE
+# ============================================================================
+
+_store: Optional[SecurityHubFindingStore] = None
+_store_lock = threading.Lock()
+
+
+def get_finding_store() -> SecurityHubFindingStore:
+    """Get or create the shared local finding store"""
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = SecurityHubFindingStore()
+        return _store
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'SecurityHubFindingStore',
+    'SecurityHubSync',
+    'get_finding_store',
+]
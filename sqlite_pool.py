@@ -0,0 +1,204 @@
+"""
+SQLite Connection Pool Module
+=============================
+Thread-safe pool of SQLite connections opened in WAL mode.
+
+With the default rollback journal a writer locks out every reader for
+the length of its transaction; in WAL mode readers keep reading the last
+committed snapshot while a scan is being stored. Connections are reused
+across calls instead of being opened (and re-running their pragmas) for
+every query.
+
+Usage:
+    from sqlite_pool import get_connection_pool
+
+    pool = get_connection_pool('data/waf_scanner.db')
+    with pool.connection() as conn:
+        rows = conn.execute("SELECT ...").fetchall()
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+logger = get_logger(__name__)
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+@dataclass
+class PoolConfig:
+    """Pool size and per-connection pragmas"""
+    max_connections: int = 10
+    timeout_seconds: float = 30.0      # Wait for a free connection / a lock
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"        # Durable across app crashes in WAL mode
+    cache_size_kb: int = 64 * 1024
+    mmap_size_mb: int = 256
+
+    @classmethod
+    def from_app_config(cls, **overrides) -> 'PoolConfig':
+        """Build from production_config's database settings"""
+        config = cls()
+        try:
+            from production_config import get_config
+            db_config = get_config().database
+            config.max_connections = db_config.max_connections
+            config.timeout_seconds = float(db_config.connection_timeout)
+            config.synchronous = db_config.sqlite_synchronous
+            config.cache_size_kb = db_config.sqlite_cache_size_kb
+            config.mmap_size_mb = db_config.sqlite_mmap_size_mb
+        except Exception as e:
+            logger.debug(f"Using default SQLite pool settings: {e}")
+        for name, value in overrides.items():
+            setattr(config, name, value)
+        return config
+
+
+# ============================================================================
+# CONNECTION POOL
+# ============================================================================
+
+class SQLiteConnectionPool:
+    """
+    Bounded pool of reusable sqlite3 connections.
+
+    Connections are created lazily up to max_connections; callers beyond
+    that wait for one to be returned. A connection is only ever used by
+    one thread at a time, and any transaction left open by the caller is
+    rolled back before it goes back into the pool.
+    """
+
+    def __init__(self, db_path: str, config: PoolConfig = None):
+        self.db_path = db_path
+        self.config = config or PoolConfig.from_app_config()
+        if db_path == ':memory:':
+            # Every in-memory connection is a separate database
+            self.config.max_connections = 1
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.db_path)
+        if directory and self.db_path != ':memory:':
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path, timeout=self.config.timeout_seconds,
+                               check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA journal_mode = {self.config.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.config.synchronous}")
+        conn.execute(f"PRAGMA cache_size = -{int(self.config.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.config.mmap_size_mb) * 1024 * 1024}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute(f"PRAGMA busy_timeout = {int(self.config.timeout_seconds * 1000)}")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        if self._closed:
+            raise RuntimeError(f"Connection pool for {self.db_path} is closed")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.config.max_connections
+            if can_create:
+                self._created += 1
+        if can_create:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.config.timeout_seconds)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No SQLite connection available for {self.db_path} "
+                f"within {self.config.timeout_seconds}s"
+            )
+
+    def _release(self, conn: sqlite3.Connection):
+        if self._closed:
+            conn.close()
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            # Broken connection - drop it and let the pool open a new one
+            conn.close()
+            with self._lock:
+                self._created -= 1
+            return
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of the with block"""
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def close_all(self):
+        """Close idle connections; busy ones are closed when returned"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def stats(self) -> Dict[str, int]:
+        return {'created': self._created, 'idle': self._idle.qsize()}
+
+
+# ============================================================================
+# SHARED POOLS
+# ============================================================================
+
+_pools: Dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_path: str, config: Optional[PoolConfig] = None) -> SQLiteConnectionPool:
+    """Get or create the process-wide pool for a database file"""
+    key = db_path if db_path == ':memory:' else os.path.abspath(db_path)
+
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = SQLiteConnectionPool(db_path, config)
+            _pools[key] = pool
+        return pool
+
+
+# ============================================================================
+# EXPORTS
+# ============================================================================
+
+__all__ = [
+    'PoolConfig',
+    'SQLiteConnectionPool',
+    'get_connection_pool',
+]
@@ -2415,6 +2415,24 @@ def run_single_account_waf_scan(session, region, depth, pillars, account_id):
         with st.expander("Error Details"):
             st.code(traceback.format_exc())
 
+def get_security_hub_session(region, use_hub_creds=True):
+    """Create a session for the Security Hub hub account, or None without credentials"""
+    import boto3
+    
+    if use_hub_creds and 'multi_hub_access_key' in st.session_state:
+        return boto3.Session(
+            aws_access_key_id=st.session_state.multi_hub_access_key,
+            aws_secret_access_key=st.session_state.multi_hub_secret_key,
+            region_name=region
+        )
+    elif 'org_credentials' in st.session_state:
+        return boto3.Session(
+            aws_access_key_id=st.session_state.org_credentials['access_key'],
+            aws_secret_access_key=st.session_state.org_credentials['secret_key'],
+            region_name=region
+        )
+    return None
+
 def fetch_from_security_hub(region, use_hub_creds=True):
     """
     Fetch security findings from AWS Security Hub for all accounts.
@@ -2422,25 +2440,13 @@ def fetch_from_security_hub(region, use_hub_creds=True):
     
     Returns findings for ALL accounts in the organization in one API call.
     """
-    import boto3
     from botocore.exceptions import ClientError, NoCredentialsError
     from collections import defaultdict
     
     try:
         # Create Security Hub client
-        if use_hub_creds and 'multi_hub_access_key' in st.session_state:
-            session = boto3.Session(
-                aws_access_key_id=st.session_state.multi_hub_access_key,
-                aws_secret_access_key=st.session_state.multi_hub_secret_key,
-                region_name=region
-            )
-        elif 'org_credentials' in st.session_state:
-            session = boto3.Session(
-                aws_access_key_id=st.session_state.org_credentials['access_key'],
-                aws_secret_access_key=st.session_state.org_credentials['secret_key'],
-                region_name=region
-            )
-        else:
+        session = get_security_hub_session(region, use_hub_creds)
+        if session is None:
             st.error("No credentials configured. Please set up hub account credentials.")
             return None
         
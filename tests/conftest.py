@@ -0,0 +1,10 @@
+"""Shared pytest setup: make the flat top-level modules importable from tests/"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# logging_config reads LOG_DIR at import; keep test-run logs out of the working tree
+os.environ.setdefault('LOG_DIR', tempfile.mkdtemp(prefix='waf-test-logs-'))
@@ -0,0 +1,112 @@
+"""Adaptive throttling: token bucket AIMD and per-endpoint client instrumentation"""
+
+import boto3
+import pytest
+from botocore.awsrequest import AWSResponse
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from async_operations import AdaptiveThrottler, AsyncConfig, ThrottledSession, TokenBucket
+
+pytestmark = pytest.mark.unit
+
+
+THROTTLED_BODY = (b'<Response><Errors><Error><Code>RequestLimitExceeded</Code>'
+                  b'<Message>Rate exceeded</Message></Error></Errors></Response>')
+
+
+class RawBody:
+    def stream(self, **kwargs):
+        yield THROTTLED_BODY
+
+
+NO_RETRIES = Config(retries={'total_max_attempts': 1})
+
+
+def throttling_session():
+    """Session whose every request gets a throttling response"""
+    session = boto3.Session(aws_access_key_id='AKIATEST', aws_secret_access_key='secret')
+    session.events.register(
+        'before-send', lambda request, **kwargs: AWSResponse(request.url, 503, {}, RawBody()))
+    return session
+
+
+def ec2_client(region='us-east-1'):
+    return throttling_session().client('ec2', region_name=region, config=NO_RETRIES)
+
+
+def throttled(client):
+    with pytest.raises(ClientError):
+        client.describe_instances()
+
+
+def test_bucket_backs_off_multiplicatively_and_recovers_additively():
+    bucket = TokenBucket(rate=8.0, capacity=5, min_rate=1.0, max_rate=10.0)
+
+    bucket.on_throttle(0.5)
+    bucket.on_throttle(0.5)
+    assert (bucket.rate, bucket.throttle_count) == (2.0, 2)
+    bucket.on_throttle(0.1)
+    assert bucket.rate == 1.0
+
+    for _ in range(20):
+        bucket.on_success(1.0)
+    assert bucket.rate == 10.0
+
+
+def test_empty_bucket_blocks_until_refilled():
+    bucket = TokenBucket(rate=50.0, capacity=1, min_rate=1.0, max_rate=50.0)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() > 0.0
+
+
+def test_throttle_drains_the_burst():
+    bucket = TokenBucket(rate=50.0, capacity=10, min_rate=1.0, max_rate=50.0)
+
+    bucket.on_throttle(0.5)
+
+    assert bucket.acquire() > 0.0
+
+
+def test_endpoints_are_throttled_independently():
+    throttler = AdaptiveThrottler(AsyncConfig(requests_per_second=10.0, endpoint_rates={'iam': 2.0}))
+    east, west = ec2_client('us-east-1'), ec2_client('us-west-2')
+    throttler.instrument(east)
+    throttler.instrument(west)
+
+    throttled(east)
+
+    assert throttler.bucket('ec2', 'us-east-1').rate == 5.0
+    assert throttler.bucket('ec2', 'us-west-2').rate == 10.0
+    assert throttler.bucket('iam', None).rate == 2.0
+
+
+def test_released_clients_no_longer_feed_the_throttler():
+    throttler = AdaptiveThrottler()
+    client = throttler.instrument(ec2_client())
+    throttler.release()
+
+    throttled(client)
+
+    assert throttler.bucket('ec2', 'us-east-1').throttle_count == 0
+
+
+def test_call_records_throttling_errors():
+    throttler = AdaptiveThrottler()
+
+    def describe():
+        raise ClientError({'Error': {'Code': 'RequestLimitExceeded'}}, 'DescribeInstances')
+
+    with pytest.raises(ClientError):
+        throttler.call('ec2', 'us-east-1', describe)
+    assert throttler.stats()['ec2/us-east-1']['throttles'] == 1
+
+
+def test_throttled_session_instruments_every_client():
+    throttler = AdaptiveThrottler()
+    session = ThrottledSession(throttling_session(), throttler)
+
+    throttled(session.client('ec2', region_name='eu-west-1', config=NO_RETRIES))
+
+    assert throttler.bucket('ec2', 'eu-west-1').throttle_count == 1
@@ -0,0 +1,57 @@
+"""iter_paginated streaming across paginated and single-call operations"""
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from aws_utils import iter_paginated
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def ec2():
+    client = boto3.client('ec2', region_name='us-east-1', aws_access_key_id='AKIATEST',
+                          aws_secret_access_key='secret')
+    with Stubber(client) as stubber:
+        yield client, stubber
+
+
+def test_items_are_flattened_across_pages(ec2):
+    client, stubber = ec2
+    stubber.add_response('describe_instances', {
+        'Reservations': [{'Instances': [{'InstanceId': 'i-1'}, {'InstanceId': 'i-2'}]}],
+        'NextToken': 'page-2',
+    })
+    stubber.add_response('describe_instances', {
+        'Reservations': [{'Instances': [{'InstanceId': 'i-3'}]}, {'Instances': []}],
+    }, {'NextToken': 'page-2', 'MaxResults': 50})
+
+    instances = iter_paginated(client, 'describe_instances', 'Reservations[].Instances[]',
+                               MaxResults=50)
+
+    assert [i['InstanceId'] for i in instances] == ['i-1', 'i-2', 'i-3']
+    stubber.assert_no_pending_responses()
+
+
+def test_pages_are_fetched_only_as_items_are_consumed(ec2):
+    client, stubber = ec2
+    stubber.add_response('describe_instances', {
+        'Reservations': [{'Instances': [{'InstanceId': 'i-1'}]}], 'NextToken': 'page-2',
+    })
+
+    instances = iter_paginated(client, 'describe_instances', 'Reservations[].Instances[]')
+
+    assert next(instances)['InstanceId'] == 'i-1'
+    stubber.assert_no_pending_responses()
+
+
+def test_operation_without_paginator_is_called_once(ec2):
+    client, stubber = ec2
+    stubber.add_response('describe_account_attributes', {
+        'AccountAttributes': [{'AttributeName': 'supported-platforms'}],
+    })
+
+    attributes = list(iter_paginated(client, 'describe_account_attributes', 'AccountAttributes'))
+
+    assert attributes == [{'AttributeName': 'supported-platforms'}]
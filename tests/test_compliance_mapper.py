@@ -0,0 +1,57 @@
+"""ComplianceMapper: title normalization, control IDs and framework coverage"""
+
+import pytest
+
+from compliance_mapper import ComplianceMapper, finding_control_id, match_title
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize('title, key', [
+    ('S3 bucket allows public access', 's3_public_access'),
+    ('S3 Block Public Access disabled', 's3_public_access'),
+    ('S3 default encryption not enabled', 's3_no_encryption'),
+    ('S3 encryption enabled with SSE-KMS', 'unknown'),
+    ('S3 bucket versioning disabled', 's3_no_versioning'),
+    ('S3 server access logging disabled', 's3_no_logging'),
+    ('CloudTrail is DISABLED in region', 'cloudtrail_not_enabled'),
+    ('Root account has no MFA', 'iam_root_no_mfa'),
+    ('IAM user without MFA', 'iam_user_no_mfa'),
+    ('IAM access key unused for 90 days', 'iam_inactive_credentials'),
+    ('Security group allows 0.0.0.0/0 on port 22', 'security_group_unrestricted_ingress'),
+    ('RDS instance storage not encrypted', 'rds_no_encryption'),
+    ('RDS instance is publicly accessible', 'rds_public_access'),
+    ('RDS automated backup disabled', 'rds_no_backup'),
+    ('EBS volume unencrypted', 'ebs_unencrypted'),
+    ('KMS key rotation disabled', 'kms_key_rotation_disabled'),
+    ('VPC flow logs disabled', 'vpc_flow_logs_disabled'),
+    ('AWS Config not enabled', 'config_not_enabled'),
+    ('Lambda function uses deprecated runtime', 'unknown'),
+])
+def test_titles_map_to_keys(title, key):
+    assert match_title(title) == key
+
+
+def test_control_id_comes_from_the_finding_or_its_generator():
+    assert finding_control_id({'control_id': 's3.8'}) == 'S3.8'
+    assert finding_control_id({'generator_id': 'security-control/IAM.6'}) == 'IAM.6'
+    assert finding_control_id({'generator_id': 'aws-foundational-security-best-practices'}) is None
+
+
+def test_control_id_takes_precedence_over_the_title():
+    mapper = ComplianceMapper()
+    finding = {'title': 'Bucket settings need review', 'control_id': 'S3.8'}
+
+    assert mapper.get_finding_mappings(finding) == mapper.get_compliance_mappings('S3 public bucket')
+    assert mapper.get_finding_mappings({'title': 'Bucket settings need review'}) == []
+
+
+def test_framework_coverage_counts_each_mapped_finding():
+    coverage = ComplianceMapper().get_framework_coverage([
+        {'title': 'S3 bucket allows public access'},
+        {'title': 'Root account has no MFA'},
+        {'title': 'Unmapped finding'},
+    ])
+
+    assert coverage['CIS_AWS_FOUNDATIONS'] == 2
+    assert set(coverage) == {'CIS_AWS_FOUNDATIONS', 'PCI_DSS', 'HIPAA', 'SOC2', 'NIST_CSF'}
@@ -0,0 +1,116 @@
+"""Config aggregator inventory: query fan-out and row handling"""
+
+import json
+
+import pytest
+
+from config_inventory import ConfigInventoryScanner
+from landscape_scanner import GLOBAL_REGION_KEY
+
+pytestmark = pytest.mark.unit
+
+ACCOUNT = '111122223333'
+
+
+class FakeConfig:
+    """select_aggregate_resource_config answering from rows keyed by resource type"""
+
+    def __init__(self, rows, fail=()):
+        self.rows = rows
+        self.fail = set(fail)
+        self.expressions = []
+
+    def client(self, service, **kwargs):
+        return self
+
+    def can_paginate(self, operation):
+        return False
+
+    def select_aggregate_resource_config(self, Expression, ConfigurationAggregatorName, Limit):
+        self.expressions.append(Expression)
+        resource_type = Expression.split("resourceType = '")[1].split("'")[0]
+        if resource_type in self.fail:
+            raise RuntimeError('AccessDenied')
+        return {'Results': [json.dumps(row) for row in self.rows.get(resource_type, [])]}
+
+
+def scan(rows, **kwargs):
+    session = FakeConfig(rows, fail=kwargs.pop('fail', ()))
+    assessment = ConfigInventoryScanner(session, 'org-aggregator').run_scan(**kwargs)
+    return session, assessment
+
+
+def test_counts_are_summed_per_region_and_across_accounts():
+    session, assessment = scan({
+        'AWS::Lambda::Function': [
+            {'accountId': ACCOUNT, 'awsRegion': 'us-east-1', 'COUNT(*)': 4},
+            {'accountId': '444455556666', 'awsRegion': 'us-east-1', 'COUNT(*)': 2},
+            {'accountId': ACCOUNT, 'awsRegion': 'eu-west-1', 'COUNT(*)': 1},
+        ],
+        'AWS::IAM::Role': [{'accountId': ACCOUNT, 'awsRegion': 'us-east-1', 'COUNT(*)': 7}],
+        'AWS::EC2::Instance': [
+            {'accountId': ACCOUNT, 'awsRegion': 'us-east-1', 'configuration': {'state': {'name': 'running'}},
+             'COUNT(*)': 3},
+            {'accountId': ACCOUNT, 'awsRegion': 'us-east-1', 'configuration': {'state': {'name': 'stopped'}},
+             'COUNT(*)': 1},
+        ],
+    })
+
+    regions = assessment.region_inventories
+    assert regions['us-east-1'].lambda_functions == 6
+    assert regions['eu-west-1'].lambda_functions == 1
+    assert regions[GLOBAL_REGION_KEY].iam_roles == 7
+    assert (regions['us-east-1'].ec2_running, regions['us-east-1'].ec2_stopped) == (3, 1)
+    assert assessment.inventory.lambda_functions == 7
+    assert assessment.accounts_scanned == [ACCOUNT, '444455556666']
+    assert assessment.regions_scanned == ['eu-west-1', 'us-east-1']
+    assert all('COUNT(*)' not in e or 'GROUP BY accountId, awsRegion' in e for e in session.expressions)
+
+
+def test_checked_types_produce_findings_tagged_with_account_and_region():
+    _, assessment = scan({
+        'AWS::EC2::Volume': [{
+            'accountId': ACCOUNT, 'awsRegion': 'us-east-1', 'resourceId': 'vol-0123456789',
+            'configuration': {'state': {'value': 'available'}, 'encrypted': True,
+                              'volumeType': 'gp3', 'size': 100},
+        }],
+        'AWS::RDS::DBInstance': [{
+            'accountId': ACCOUNT, 'awsRegion': 'eu-west-1', 'resourceName': 'orders',
+            'configuration': {'multiAZ': True, 'storageEncrypted': 'false',
+                              'backupRetentionPeriod': 7, 'publiclyAccessible': False},
+        }],
+        'AWS::S3::Bucket': [{
+            'accountId': ACCOUNT, 'awsRegion': 'us-east-1', 'resourceName': 'logs',
+            'supplementaryConfiguration': {
+                'PublicAccessBlockConfiguration': json.dumps({
+                    'blockPublicAcls': True, 'blockPublicPolicy': True,
+                    'ignorePublicAcls': True, 'restrictPublicBuckets': True}),
+                'ServerSideEncryptionConfiguration': {'rules': []},
+                'BucketVersioningConfiguration': json.dumps({'status': 'Enabled'}),
+            },
+        }],
+    })
+
+    findings = {f.id: (f.account_id, f.region) for f in assessment.findings}
+    assert findings == {
+        'ebs-unattached-vol-01234567': (ACCOUNT, 'us-east-1'),
+        'rds-noenc-orders': (ACCOUNT, 'eu-west-1'),
+    }
+    assert assessment.region_inventories[GLOBAL_REGION_KEY].s3_versioning_enabled == 1
+    assert assessment.region_inventories['us-east-1'].ebs_unattached == 1
+
+
+def test_region_filter_keeps_global_types_and_failed_queries_are_reported():
+    _, assessment = scan({
+        'AWS::SQS::Queue': [
+            {'accountId': ACCOUNT, 'awsRegion': 'us-east-1', 'COUNT(*)': 2},
+            {'accountId': ACCOUNT, 'awsRegion': 'eu-west-1', 'COUNT(*)': 5},
+        ],
+        'AWS::IAM::User': [{'accountId': ACCOUNT, 'awsRegion': 'global', 'COUNT(*)': 3}],
+    }, regions=['us-east-1'], fail={'AWS::KMS::Key'})
+
+    assert assessment.inventory.sqs_queues == 2
+    assert assessment.inventory.iam_users == 3
+    assert assessment.services_scanned['AWS::KMS::Key'] is False
+    assert assessment.scan_errors['AWS::KMS::Key'] == 'AccessDenied'
+    assert assessment.services_scanned['AWS::SQS::Queue'] is True
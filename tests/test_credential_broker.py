@@ -0,0 +1,219 @@
+"""CredentialBroker session caching and cache keying"""
+
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+import credential_broker
+from credential_broker import BrokeredSession, CredentialBroker, credential_digest
+
+pytestmark = pytest.mark.unit
+
+VALID_SECRET = 'valid-secret'
+
+
+class FakeSts:
+    def __init__(self, session=None):
+        self.session = session
+        self.identity_calls = 0
+        self.assume_role_calls = []
+
+    def get_caller_identity(self):
+        self.identity_calls += 1
+        if self.session.get_credentials().get_frozen_credentials().secret_key != VALID_SECRET:
+            raise ClientError({'Error': {'Code': 'SignatureDoesNotMatch', 'Message': 'bad secret'}},
+                              'GetCallerIdentity')
+        return {'Arn': 'arn:aws:iam::111122223333:user/scanner'}
+
+    def assume_role(self, **params):
+        self.assume_role_calls.append(params)
+        return {'Credentials': {
+            'AccessKeyId': f"ASIA{len(self.assume_role_calls)}",
+            'SecretAccessKey': 'assumed-secret',
+            'SessionToken': 'token',
+            'Expiration': datetime.now(timezone.utc) + timedelta(hours=1),
+        }}
+
+
+@pytest.fixture
+def sts_calls(monkeypatch):
+    """Route every BrokeredSession STS client to a FakeSts bound to that session"""
+    clients = []
+
+    def client(self, service_name, region_name=None, *args, **kwargs):
+        assert service_name == 'sts'
+        fake = FakeSts(self)
+        clients.append(fake)
+        return fake
+
+    monkeypatch.setattr(BrokeredSession, 'client', client)
+    return clients
+
+
+def base_session(secret='base-secret'):
+    return boto3.Session(aws_access_key_id='AKIABASE', aws_secret_access_key=secret,
+                         region_name='us-east-1')
+
+
+def test_digest_hides_secret_and_tracks_token():
+    digest = credential_digest('secret')
+
+    assert 'secret' not in digest
+    assert digest == credential_digest('secret')
+    assert digest != credential_digest('other')
+    assert digest != credential_digest('secret', 'token')
+    assert credential_digest(None) is None
+
+
+def test_static_session_validated_once_and_reused(sts_calls):
+    broker = CredentialBroker()
+
+    first = broker.get_static_session('AKIA1', VALID_SECRET, 'us-east-1')
+    again = broker.get_static_session('AKIA1', VALID_SECRET, 'us-east-1')
+    other_region = broker.get_static_session('AKIA1', VALID_SECRET, 'eu-west-1')
+
+    assert first is again
+    assert other_region is not first
+    assert sum(fake.identity_calls for fake in sts_calls) == 1
+
+
+def test_rejected_secret_is_not_cached(sts_calls):
+    broker = CredentialBroker()
+
+    with pytest.raises(ClientError):
+        broker.get_static_session('AKIA1', 'wrong-secret', 'us-east-1')
+    assert broker.stats()['sessions'] == 0
+
+    with pytest.raises(ClientError):
+        broker.get_static_session('AKIA1', 'wrong-secret', 'us-east-1')
+
+
+def test_same_key_id_with_other_secret_gets_own_session(sts_calls):
+    broker = CredentialBroker()
+    good = broker.get_static_session('AKIA1', VALID_SECRET, 'us-east-1')
+
+    with pytest.raises(ClientError):
+        broker.get_static_session('AKIA1', 'wrong-secret', 'us-east-1')
+
+    assert broker.get_static_session('AKIA1', VALID_SECRET, 'us-east-1') is good
+
+
+def test_base_identity_distinguishes_secrets():
+    first = CredentialBroker._base_identity(base_session('one'))
+    second = CredentialBroker._base_identity(base_session('two'))
+
+    assert first[0] == second[0] == 'AKIABASE'
+    assert first != second
+    assert 'one' not in first and 'two' not in second
+
+
+class FakeBaseSession:
+    """Stands in for the caller's base session in AssumeRole tests"""
+
+    def __init__(self, secret='base-secret'):
+        self._session = base_session(secret)
+        self.region_name = 'us-east-1'
+        self.sts = FakeSts()
+
+    def get_credentials(self):
+        return self._session.get_credentials()
+
+    def client(self, service_name):
+        assert service_name == 'sts'
+        return self.sts
+
+
+def test_role_assumed_once_across_regions():
+    broker = CredentialBroker()
+    base = FakeBaseSession()
+    role = 'arn:aws:iam::111122223333:role/Audit'
+
+    east = broker.get_session(role, region_name='us-east-1', base_session=base)
+    west = broker.get_session(role, region_name='us-west-2', base_session=base)
+
+    assert east is broker.get_session(role, region_name='us-east-1', base_session=base)
+    assert west is not east
+    assert len(base.sts.assume_role_calls) == 1
+    assert broker.stats()['assume_role_calls'] == 1
+
+
+def test_role_sessions_keyed_on_base_secret_and_external_id():
+    broker = CredentialBroker()
+    role = 'arn:aws:iam::111122223333:role/Audit'
+    first_base, second_base = FakeBaseSession('one'), FakeBaseSession('two')
+
+    first = broker.get_session(role, base_session=first_base)
+    second = broker.get_session(role, base_session=second_base)
+    with_external_id = broker.get_session(role, external_id='ext', base_session=first_base)
+
+    assert len({id(first), id(second), id(with_external_id)}) == 3
+    assert first_base.sts.assume_role_calls[-1]['ExternalId'] == 'ext'
+
+
+def test_invalidate_role_drops_only_that_role():
+    broker = CredentialBroker()
+    base = FakeBaseSession()
+    audit = 'arn:aws:iam::111122223333:role/Audit'
+    other = 'arn:aws:iam::111122223333:role/Other'
+    audit_session = broker.get_session(audit, base_session=base)
+    other_session = broker.get_session(other, base_session=base)
+
+    broker.invalidate(audit)
+
+    assert broker.get_session(audit, base_session=base) is not audit_session
+    assert broker.get_session(other, base_session=base) is other_session
+    assert len(base.sts.assume_role_calls) == 3
+
+
+def test_rotated_base_credentials_evict_least_recently_used(monkeypatch):
+    monkeypatch.setattr(credential_broker, 'MAX_CACHED_SESSIONS', 2)
+    broker = CredentialBroker()
+    role = 'arn:aws:iam::111122223333:role/Audit'
+    bases = [FakeBaseSession(f'rotated-{i}') for i in range(3)]
+
+    first = broker.get_session(role, base_session=bases[0])
+    broker.get_session(role, base_session=bases[1])
+    assert broker.get_session(role, base_session=bases[0]) is first
+    broker.get_session(role, base_session=bases[2])
+
+    assert broker.stats()['sessions'] == 2
+    assert max(len(cache) for cache in (broker._credentials, broker._sts_clients,
+                                        broker._key_locks)) <= 2
+    assert broker.get_session(role, base_session=bases[0]) is first
+    assert len(bases[1].sts.assume_role_calls) == 1
+
+
+def test_force_refresh_assumes_role_and_replaces_cached_sessions():
+    broker = CredentialBroker()
+    base = FakeBaseSession()
+    role = 'arn:aws:iam::111122223333:role/Audit'
+    east = broker.get_session(role, region_name='us-east-1', base_session=base)
+    west = broker.get_session(role, region_name='us-west-2', base_session=base)
+
+    refreshed = broker.get_session(role, region_name='us-east-1', base_session=base, force_refresh=True)
+
+    assert len(base.sts.assume_role_calls) == 2
+    assert refreshed is not east
+    assert broker.get_session(role, region_name='us-east-1', base_session=base) is refreshed
+    assert broker.get_session(role, region_name='us-west-2', base_session=base) is not west
+    assert len(base.sts.assume_role_calls) == 2
+
+
+def test_failed_force_refresh_drops_cached_credentials():
+    broker = CredentialBroker()
+    base = FakeBaseSession()
+    role = 'arn:aws:iam::111122223333:role/Audit'
+    broker.get_session(role, base_session=base)
+
+    def revoked(**params):
+        raise ClientError({'Error': {'Code': 'AccessDenied', 'Message': 'trust revoked'}}, 'AssumeRole')
+
+    base.sts.assume_role = revoked
+    with pytest.raises(ClientError):
+        broker.get_session(role, base_session=base, force_refresh=True)
+
+    assert broker.stats()['sessions'] == 0
+    with pytest.raises(ClientError):
+        broker.get_session(role, base_session=base)
@@ -0,0 +1,129 @@
+"""Landscape scanner: findings, concurrent task execution and multi-region fan-out"""
+
+import threading
+import time
+
+import pytest
+
+from landscape_scanner import (
+    SCOPE_GLOBAL, SCOPE_HOME, SCOPE_REGIONAL, AWSLandscapeScanner, Finding, Pillar, Severity,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class NoCredentials:
+    def client(self, service, **kwargs):
+        raise RuntimeError('no credentials')
+
+
+def finding(finding_id, service):
+    return Finding(finding_id, f'{service} finding', '', 'HIGH', 'Security', service)
+
+
+def test_finding_coerces_severity_and_pillar():
+    known = finding('f1', 'EC2')
+    custom = Finding('f2', 't', '', 'URGENT', 'Governance', 'EC2')
+
+    assert (known.severity, known.pillar) == (Severity.HIGH, Pillar.SECURITY)
+    assert known.severity == 'HIGH'
+    assert (custom.severity, custom.pillar) == ('URGENT', 'Governance')
+    assert not hasattr(known, '__dict__')
+
+
+def test_finding_round_trips_through_plain_dicts():
+    original = Finding('f1', 't', 'd', 'LOW', 'Cost Optimization', 'EBS',
+                       affected_resources=['vol-1'], remediation_steps=['Snapshot', 'Delete'],
+                       compliance_frameworks=['CIS'])
+
+    data = original.to_dict()
+
+    assert (data['severity'], data['pillar']) == ('LOW', 'Cost Optimization')
+    assert type(data['severity']) is str
+    assert data['remediation_steps'] == ['Snapshot', 'Delete']
+    assert Finding.from_dict(data) == original
+
+
+def test_repeated_text_is_shared_between_findings():
+    steps = ['Enable MFA', 'Rotate keys']
+    first = Finding('a', 't', '', 'HIGH', 'Security', 'IAM', recommendation=' '.join(['Enable', 'MFA']),
+                    remediation_steps=list(steps))
+    second = Finding('b', 't', '', 'HIGH', 'Security', 'IAM', recommendation='Enable MFA',
+                     remediation_steps=list(steps))
+
+    assert first.recommendation is second.recommendation
+    assert first.remediation_steps is second.remediation_steps
+
+
+class FakeScanner(AWSLandscapeScanner):
+    """Scanner whose catalog is a few API-free scans"""
+
+    def _scan_catalog(self):
+        return [
+            ("IAM", self._scan_users, SCOPE_GLOBAL),
+            ("EC2", self._scan_instances, SCOPE_REGIONAL),
+            ("CloudTrail", self._scan_trail, SCOPE_HOME),
+            ("Lambda", self._scan_broken, SCOPE_REGIONAL),
+        ]
+
+    def _scan_users(self):
+        time.sleep(0.02)  # finish last so completion order differs from task order
+        self.inventory.iam_users += 2
+        self.findings.append(finding('iam-mfa', 'IAM'))
+
+    def _scan_instances(self, region):
+        self.inventory.ec2_instances += 3
+        self.findings.append(finding('ec2-public-ip', 'EC2'))
+
+    def _scan_trail(self, region):
+        self.findings.append(finding('cloudtrail-off', 'CloudTrail'))
+
+    def _scan_broken(self, region):
+        raise RuntimeError('AccessDenied')
+
+
+def summary(assessment):
+    return ([(f.id, f.region) for f in assessment.findings], assessment.inventory,
+            assessment.services_scanned, assessment.scan_errors)
+
+
+def test_concurrent_scan_matches_sequential_scan():
+    sequential = FakeScanner(NoCredentials()).run_scan(['us-east-1'])
+    concurrent = FakeScanner(NoCredentials()).run_scan(['us-east-1'], concurrent=True, max_workers=4)
+
+    assert summary(concurrent) == summary(sequential)
+    assert [f.id for f in concurrent.findings] == ['iam-mfa', 'ec2-public-ip', 'cloudtrail-off']
+    assert concurrent.services_scanned == {'IAM': True, 'EC2': True, 'CloudTrail': True, 'Lambda': False}
+    assert concurrent.scan_errors == {'Lambda': 'AccessDenied'}
+
+
+def test_progress_is_reported_from_the_calling_thread():
+    threads, progress = set(), []
+
+    def on_progress(fraction, message):
+        threads.add(threading.get_ident())
+        progress.append(fraction)
+
+    FakeScanner(NoCredentials()).run_scan(['us-east-1'], on_progress, concurrent=True, max_workers=4)
+
+    assert threads == {threading.get_ident()}
+    assert progress[-1] == 1.0
+
+
+def test_regional_services_fan_out_and_global_services_run_once():
+    assessment = FakeScanner(NoCredentials()).run_scan(['us-east-1', 'eu-west-1'], concurrent=True)
+
+    assert [(f.id, f.region) for f in assessment.findings] == [
+        ('iam-mfa', 'global'),
+        ('ec2-public-ip', 'us-east-1'),
+        ('ec2-public-ip-eu-west-1', 'eu-west-1'),
+        ('cloudtrail-off', 'us-east-1'),
+    ]
+    assert assessment.inventory.ec2_instances == 6
+    assert {region: inventory.ec2_instances
+            for region, inventory in assessment.region_inventories.items()} == {
+        'global': 0, 'us-east-1': 3, 'eu-west-1': 3,
+    }
+    assert assessment.regions_scanned == ['us-east-1', 'eu-west-1']
+    assert assessment.scan_errors == {'Lambda (us-east-1)': 'AccessDenied',
+                                      'Lambda (eu-west-1)': 'AccessDenied'}
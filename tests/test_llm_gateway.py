@@ -0,0 +1,135 @@
+"""LLMGateway response caching for Anthropic and Bedrock calls"""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from llm_gateway import CachedMessage, LLMGateway, ResponseCache, ResponseCacheConfig, cache_key
+
+pytestmark = pytest.mark.unit
+
+
+class FakeAnthropic:
+    def __init__(self):
+        self.calls = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(model=kwargs['model'], stop_reason='end_turn',
+                               content=[SimpleNamespace(type='text', text=f"answer {len(self.calls)}")])
+
+
+class FakeBedrock:
+    def __init__(self):
+        self.calls = []
+
+    def invoke_model(self, **kwargs):
+        self.calls.append(kwargs)
+        body = json.dumps({'content': [{'type': 'text', 'text': f"answer {len(self.calls)}"}]})
+        return {'body': io.BytesIO(body.encode('utf-8')), 'contentType': 'application/json'}
+
+
+@pytest.fixture
+def gateway(tmp_path):
+    return LLMGateway(ResponseCache(ResponseCacheConfig(path=str(tmp_path / 'llm_cache.db'))))
+
+
+def ask(gateway, client, prompt='Review this architecture', **kwargs):
+    return gateway.create_message(client, model='claude-test', max_tokens=100,
+                                  messages=[{'role': 'user', 'content': prompt}], **kwargs)
+
+
+def test_key_ignores_cosmetic_whitespace_and_transport_params():
+    messages = [{'role': 'user', 'content': 'line one\nline two'}]
+    crlf = [{'role': 'user', 'content': 'line one  \r\nline two\n'}]
+
+    assert cache_key('m', None, messages, {'max_tokens': 10}) == \
+        cache_key('m', None, crlf, {'max_tokens': 10, 'timeout': 30})
+    assert cache_key('m', None, messages, {'max_tokens': 10}) != \
+        cache_key('m', None, messages, {'max_tokens': 20})
+    assert cache_key('m', None, messages, {}) != cache_key('other', None, messages, {})
+    assert cache_key('m', 'system a', messages, {}) != cache_key('m', 'system b', messages, {})
+
+
+def test_repeat_message_served_from_cache(gateway):
+    client = FakeAnthropic()
+
+    first = ask(gateway, client)
+    second = ask(gateway, client, prompt='Review this architecture  \n')
+
+    assert len(client.calls) == 1
+    assert isinstance(second, CachedMessage)
+    assert second.content[0].text == first.content[0].text == 'answer 1'
+    assert second.stop_reason == 'end_turn'
+    assert gateway.stats()['hits'] == 1
+
+
+def test_streaming_and_tool_requests_bypass_cache(gateway):
+    client = FakeAnthropic()
+
+    ask(gateway, client, tools=[{'name': 't'}])
+    ask(gateway, client, tools=[{'name': 't'}])
+    ask(gateway, client, stream=True)
+
+    assert len(client.calls) == 3
+    assert gateway.stats()['entries'] == 0
+
+
+def test_disabled_gateway_always_calls_api(tmp_path):
+    gateway = LLMGateway(ResponseCache(ResponseCacheConfig(path=str(tmp_path / 'c.db'))), enabled=False)
+    client = FakeAnthropic()
+
+    ask(gateway, client)
+    ask(gateway, client)
+
+    assert len(client.calls) == 2
+
+
+def test_bedrock_body_cached_and_readable(gateway):
+    client = FakeBedrock()
+    body = json.dumps({'anthropic_version': 'bedrock-2023-05-31', 'max_tokens': 100,
+                       'messages': [{'role': 'user', 'content': 'hi'}]})
+
+    first = gateway.invoke_model(client, modelId='anthropic.claude-test', body=body)
+    second = gateway.invoke_model(client, modelId='anthropic.claude-test', body=body)
+
+    assert len(client.calls) == 1
+    assert json.loads(first['body'].read()) == json.loads(second['body'].read())
+    assert second['contentType'] == 'application/json'
+
+
+def test_expired_response_is_refetched(tmp_path):
+    gateway = LLMGateway(ResponseCache(ResponseCacheConfig(path=str(tmp_path / 'c.db'), ttl_seconds=-1)))
+    client = FakeAnthropic()
+
+    ask(gateway, client)
+    assert ask(gateway, client).content[0].text == 'answer 2'
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    # Room for three ~920 byte responses
+    cache = ResponseCache(ResponseCacheConfig(path=str(tmp_path / 'c.db'), max_size_mb=3000 / (1024 * 1024)))
+    text = 'x' * 900
+
+    cache.put('a', 'm', {'texts': [text]})
+    cache.put('b', 'm', {'texts': [text]})
+    cache.put('c', 'm', {'texts': [text]})
+    cache.get('a')
+    cache.put('d', 'm', {'texts': [text]})
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('d') is not None
+
+
+def test_before_call_runs_only_for_real_api_calls(gateway):
+    client, calls = FakeAnthropic(), []
+
+    ask(gateway, client, before_call=lambda: calls.append('token'))
+    ask(gateway, client, before_call=lambda: calls.append('token'))
+
+    assert calls == ['token']
+    assert len(client.calls) == 1
@@ -0,0 +1,146 @@
+"""MetricsEngine batching, caching and engine keying"""
+
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import numpy as np
+import pytest
+
+import metrics_engine
+from metrics_engine import MetricCache, MetricQuery, MetricsEngine, get_metrics_engine
+
+pytestmark = pytest.mark.unit
+
+NOW = datetime(2026, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeCloudWatch:
+    """GetMetricData paginator answering every query with its index as the value"""
+
+    def __init__(self):
+        self.requests = []
+
+    def get_paginator(self, operation):
+        assert operation == 'get_metric_data'
+        return self
+
+    def paginate(self, MetricDataQueries, StartTime, EndTime, ScanBy):
+        self.requests.append(MetricDataQueries)
+        yield {'MetricDataResults': [
+            {'Id': query['Id'],
+             'Timestamps': [NOW, NOW - timedelta(hours=1)],
+             'Values': [float(i) + 1, float(i)]}
+            for i, query in enumerate(MetricDataQueries)
+            if query['MetricStat']['Metric']['Dimensions'][0]['Value'] != 'idle'
+        ]}
+
+
+class FakeSession:
+    def __init__(self, access_key='AKIA1', secret='secret'):
+        self._session = boto3.Session(aws_access_key_id=access_key, aws_secret_access_key=secret)
+        self.cloudwatch = FakeCloudWatch()
+
+    def get_credentials(self):
+        return self._session.get_credentials()
+
+    def client(self, service_name, region_name=None):
+        assert service_name == 'cloudwatch'
+        return self.cloudwatch
+
+
+@pytest.fixture(autouse=True)
+def clean_engines():
+    metrics_engine._engines.clear()
+    yield
+    metrics_engine._engines.clear()
+
+
+def queries(*resource_ids):
+    return [MetricQuery.for_resource('AWS/EC2', 'CPUUtilization', 'InstanceId', r) for r in resource_ids]
+
+
+def test_series_sorted_oldest_first_and_empty_when_no_data():
+    session = FakeSession()
+    engine = MetricsEngine(session, 'us-east-1', cache=MetricCache())
+    busy, idle = queries('i-1', 'idle')
+
+    results = engine.fetch([busy, idle, busy], NOW - timedelta(days=1), NOW)
+
+    assert list(results[busy].values) == [0.0, 1.0]
+    assert results[busy].timestamps[0] < results[busy].timestamps[1]
+    assert len(results[idle]) == 0
+    assert results[idle].mean(default=-1) == -1
+    assert len(session.cloudwatch.requests[0]) == 2
+
+
+def test_queries_split_into_request_sized_chunks(monkeypatch):
+    monkeypatch.setattr(metrics_engine, 'MAX_QUERIES_PER_REQUEST', 2)
+    session = FakeSession()
+    engine = MetricsEngine(session, 'us-east-1', cache=MetricCache())
+
+    results = engine.fetch(queries('a', 'b', 'c', 'd', 'e'), NOW - timedelta(days=1), NOW)
+
+    assert sorted(len(request) for request in session.cloudwatch.requests) == [1, 2, 2]
+    assert len(results) == 5
+    assert engine.api_calls == 3
+
+
+def test_repeat_fetch_in_same_bucket_is_cached():
+    session = FakeSession()
+    engine = MetricsEngine(session, 'us-east-1', cache=MetricCache())
+    start = NOW - timedelta(days=1)
+
+    engine.fetch(queries('i-1'), start, NOW)
+    engine.fetch(queries('i-1', 'i-2'), start + timedelta(seconds=30), NOW + timedelta(seconds=30))
+
+    assert [len(request) for request in session.cloudwatch.requests] == [1, 1]
+
+
+def test_cache_not_shared_across_credentials():
+    cache = MetricCache()
+    first, second = FakeSession(secret='one'), FakeSession(secret='two')
+
+    MetricsEngine(first, 'us-east-1', cache=cache).fetch(queries('i-1'), NOW - timedelta(days=1), NOW)
+    MetricsEngine(second, 'us-east-1', cache=cache).fetch(queries('i-1'), NOW - timedelta(days=1), NOW)
+
+    assert len(second.cloudwatch.requests) == 1
+
+
+def test_cache_expires_entries():
+    cache = MetricCache(ttl_seconds=-1)
+    cache.put_many({('k',): metrics_engine.EMPTY_SERIES})
+
+    assert cache.get(('k',)) is None
+
+
+def test_mean_utilization_aligned_with_ids():
+    engine = MetricsEngine(FakeSession(), 'us-east-1', cache=MetricCache())
+
+    means = engine.mean_utilization('AWS/EC2', 'CPUUtilization', 'InstanceId', ['i-1', 'idle'])
+
+    assert means[0] == pytest.approx(0.5)
+    assert np.isnan(means[1])
+
+
+def test_engines_keyed_on_secret_and_region():
+    session = FakeSession()
+
+    engine = get_metrics_engine(session, 'us-east-1')
+
+    assert get_metrics_engine(FakeSession(), 'us-east-1') is engine
+    assert get_metrics_engine(FakeSession(secret='other'), 'us-east-1') is not engine
+    assert get_metrics_engine(session, 'eu-west-1') is not engine
+
+
+def test_engine_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(metrics_engine, 'MAX_ENGINES', 2)
+    sessions = [FakeSession(access_key=f"AKIA{i}") for i in range(3)]
+
+    first = get_metrics_engine(sessions[0], 'us-east-1')
+    second = get_metrics_engine(sessions[1], 'us-east-1')
+    get_metrics_engine(sessions[0], 'us-east-1')
+    get_metrics_engine(sessions[2], 'us-east-1')
+
+    assert len(metrics_engine._engines) == 2
+    assert get_metrics_engine(sessions[0], 'us-east-1') is first
+    assert get_metrics_engine(sessions[1], 'us-east-1') is not second
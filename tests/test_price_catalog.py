@@ -0,0 +1,142 @@
+"""PriceCatalog offer-file parsing and lookups"""
+
+import csv
+import io
+import json
+
+import pytest
+
+from price_catalog import (
+    HOURS_PER_MONTH, ON_DEMAND, RESERVED_1YR, PriceCatalog, parse_offer_csv, parse_offer_json,
+)
+
+pytestmark = pytest.mark.unit
+
+CSV_COLUMNS = ['SKU', 'TermType', 'PricePerUnit', 'Unit', 'LeaseContractLength', 'PurchaseOption',
+               'OfferingClass', 'Product Family', 'Location', 'Region Code', 'Instance Type',
+               'Operating System', 'Tenancy', 'Pre Installed S/W', 'CapacityStatus', 'License Model']
+
+
+def offer_csv(*rows):
+    out = io.StringIO()
+    out.write('"FormatVersion","v1.0"\n"Disclaimer","..."\n')
+    writer = csv.writer(out)
+    writer.writerow(CSV_COLUMNS)
+    for row in rows:
+        base = {'TermType': 'OnDemand', 'Unit': 'Hrs', 'Product Family': 'Compute Instance',
+                'Region Code': 'eu-west-1', 'Instance Type': 'm5.large', 'Operating System': 'Linux',
+                'Tenancy': 'Shared', 'Pre Installed S/W': 'NA', 'CapacityStatus': 'Used',
+                'License Model': 'No License required', 'PricePerUnit': '0.107'}
+        base.update(row)
+        writer.writerow([base.get(column, '') for column in CSV_COLUMNS])
+    return out.getvalue().splitlines(keepends=True)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return PriceCatalog(str(tmp_path / 'prices.db'))
+
+
+def test_csv_keeps_on_demand_and_no_upfront_reserved_rows():
+    rows = list(parse_offer_csv(offer_csv(
+        {},
+        {'TermType': 'Reserved', 'LeaseContractLength': '1yr', 'PurchaseOption': 'No Upfront',
+         'OfferingClass': 'standard', 'PricePerUnit': '0.067'},
+        {'TermType': 'Reserved', 'LeaseContractLength': '1yr', 'PurchaseOption': 'All Upfront',
+         'Unit': 'Quantity', 'PricePerUnit': '587'},
+        {'Tenancy': 'Dedicated'},
+        {'Pre Installed S/W': 'SQL Std'},
+        {'PricePerUnit': '0'},
+        {'Region Code': '', 'Location': 'EU (Ireland)', 'Instance Type': 'm5.xlarge'},
+    )))
+
+    assert rows == [
+        ('AmazonEC2', 'eu-west-1', 'm5.large', 'Linux', ON_DEMAND, 'Hrs', 0.107),
+        ('AmazonEC2', 'eu-west-1', 'm5.large', 'Linux', RESERVED_1YR, 'Hrs', 0.067),
+        ('AmazonEC2', 'eu-west-1', 'm5.xlarge', 'Linux', ON_DEMAND, 'Hrs', 0.107),
+    ]
+
+
+def test_json_offer_matches_csv_rows():
+    offer = {
+        'products': {
+            'SKU1': {'productFamily': 'Compute Instance', 'attributes': {
+                'instanceType': 'm5.large', 'operatingSystem': 'Linux', 'tenancy': 'Shared',
+                'preInstalledSw': 'NA', 'capacitystatus': 'Used', 'licenseModel': 'No License required',
+                'regionCode': 'eu-west-1'}},
+            'SKU2': {'productFamily': 'Storage', 'attributes': {
+                'volumeApiName': 'gp3', 'location': 'EU (Ireland)'}},
+        },
+        'terms': {'OnDemand': {
+            'SKU1': {'SKU1.T': {'priceDimensions': {
+                'd': {'unit': 'Hrs', 'pricePerUnit': {'USD': '0.107'}}}}},
+            'SKU2': {'SKU2.T': {'priceDimensions': {
+                'd': {'unit': 'GB-Mo', 'pricePerUnit': {'USD': '0.088'}}}}},
+        }},
+    }
+
+    assert sorted(parse_offer_json(offer)) == [
+        ('AmazonEBS', 'eu-west-1', 'gp3', '', ON_DEMAND, 'GB-Mo', 0.088),
+        ('AmazonEC2', 'eu-west-1', 'm5.large', 'Linux', ON_DEMAND, 'Hrs', 0.107),
+    ]
+
+
+def test_seed_prices_cover_default_region(catalog):
+    assert catalog.hourly('AmazonEC2', 'm5.large') == 0.096
+    assert catalog.monthly('AmazonEC2', 'm5.large') == pytest.approx(0.096 * HOURS_PER_MONTH)
+    assert catalog.monthly('AmazonS3', 'standard') == 0.023
+    assert catalog.price('AmazonEC2', 'no-such-type', default=-1) == -1
+
+
+def test_regional_price_overrides_fallback(catalog, tmp_path):
+    path = tmp_path / 'ec2.csv'
+    path.write_text(''.join(offer_csv({}, {'Region Code': 'ap-south-1'})), encoding='utf-8')
+
+    assert catalog.hourly('AmazonEC2', 'm5.large', region='eu-west-1') == 0.096
+    assert catalog.ingest_file(str(path), regions=['eu-west-1']) == 1
+
+    assert catalog.hourly('AmazonEC2', 'm5.large', region='eu-west-1') == 0.107
+    assert catalog.hourly('AmazonEC2', 'm5.large', region='ap-south-1') == 0.096
+    table = catalog.monthly_table('AmazonEC2', 'eu-west-1')
+    assert table['m5.large'] == pytest.approx(0.107 * HOURS_PER_MONTH)
+    assert table['m5.xlarge'] == pytest.approx(0.192 * HOURS_PER_MONTH)
+    assert [s['source'] for s in catalog.sources()][0] == 'ec2.csv'
+
+
+def test_json_file_ingest(catalog, tmp_path):
+    path = tmp_path / 'ebs.json'
+    path.write_text(json.dumps({
+        'products': {'S': {'productFamily': 'Storage', 'attributes': {
+            'volumeApiName': 'gp3', 'regionCode': 'eu-west-1'}}},
+        'terms': {'OnDemand': {'S': {'S.T': {'priceDimensions': {
+            'd': {'unit': 'GB-Mo', 'pricePerUnit': {'USD': '0.088'}}}}}}},
+    }), encoding='utf-8')
+
+    catalog.ingest_file(str(path))
+
+    assert catalog.monthly('AmazonEBS', 'gp3', region='eu-west-1') == 0.088
+
+
+def test_region_without_prices_warns_once(catalog, tmp_path, caplog):
+    assert catalog.has_prices('AmazonEC2', 'us-east-1')
+    assert not catalog.has_prices('AmazonEC2', 'eu-west-1')
+
+    with caplog.at_level('WARNING', logger='price_catalog'):
+        catalog.hourly('AmazonEC2', 'm5.large', region='eu-west-1')
+        catalog.monthly_table('AmazonEC2', 'eu-west-1')
+    assert sum('No AmazonEC2 prices ingested for eu-west-1' in r.message for r in caplog.records) == 1
+
+    path = tmp_path / 'ec2.csv'
+    path.write_text(''.join(offer_csv({})), encoding='utf-8')
+    catalog.ingest_file(str(path))
+    assert catalog.has_prices('AmazonEC2', 'eu-west-1')
+
+
+def test_cost_calculator_flags_fallback_pricing(catalog, monkeypatch):
+    import cost_calculator
+    monkeypatch.setattr(cost_calculator, 'get_price_catalog', lambda: catalog)
+
+    assert cost_calculator.CostImpactCalculator('us-east-1').pricing_fallback is False
+    calculator = cost_calculator.CostImpactCalculator('eu-west-1')
+    assert calculator.pricing_fallback is True
+    assert calculator.calculate_finding_impact({'service': 'EC2', 'title': 'idle'})['pricing_fallback'] is True
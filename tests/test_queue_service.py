@@ -0,0 +1,181 @@
+"""TaskQueue backends: priority order, retries, leases and owner scoping"""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip('streamlit')  # queue_service caches its singletons with st.cache_resource
+
+import queue_service as qs
+from queue_service import (
+    MemoryTaskBackend, SQLiteTaskBackend, Task, TaskPriority, TaskQueue, TaskStatus,
+    WorkerPoolConfig, task_handler,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@task_handler('tests.add')
+def add_task(a, b):
+    return a + b
+
+
+_flaky_calls = []
+
+
+@task_handler('tests.flaky')
+def flaky_task():
+    _flaky_calls.append(1)
+    if len(_flaky_calls) < 2:
+        raise RuntimeError('transient')
+    return 'ok'
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def backend(request, tmp_path):
+    if request.param == 'memory':
+        return MemoryTaskBackend()
+    return SQLiteTaskBackend(str(tmp_path / 'queue.db'))
+
+
+def make_task(name, priority=TaskPriority.NORMAL, handler='tests.add', submitted_by='owner-a',
+              created_offset=0.0, **kwargs):
+    return Task(task_id=name, task_type='t', task_name=name, function=None,
+                args=(1, 2), priority=priority, handler=handler, submitted_by=submitted_by,
+                created_at=datetime.now() + timedelta(seconds=created_offset), **kwargs)
+
+
+def test_claims_highest_priority_then_oldest(backend):
+    backend.add(make_task('low', TaskPriority.LOW, created_offset=-3))
+    backend.add(make_task('normal-old', TaskPriority.NORMAL, created_offset=-2))
+    backend.add(make_task('normal-new', TaskPriority.NORMAL, created_offset=-1))
+    backend.add(make_task('critical', TaskPriority.CRITICAL, created_offset=0))
+
+    order = [backend.claim('owner-a', 60).task_id for _ in range(4)]
+
+    assert order == ['critical', 'normal-old', 'normal-new', 'low']
+    assert backend.claim('owner-a', 60) is None
+
+
+def test_claim_respects_task_type_filters(backend):
+    backend.add(make_task('scan'))
+    assert backend.claim('owner-a', 60, task_types=['other']) is None
+    assert backend.claim('owner-a', 60, exclude_types=['t']) is None
+    assert backend.claim('owner-a', 60, task_types=['t']).task_id == 'scan'
+
+
+def test_retry_waits_for_backoff(backend):
+    backend.add(make_task('retry', max_retries=1))
+    task = backend.claim('owner-a', 60)
+    backend.fail(task.task_id, 'boom', retry_at=datetime.now() + timedelta(seconds=60))
+
+    assert backend.get('retry').status == TaskStatus.PENDING
+    assert backend.claim('owner-a', 60) is None
+
+    backend.fail(task.task_id, 'boom', retry_at=datetime.now() - timedelta(seconds=1))
+    again = backend.claim('owner-a', 60)
+    assert again.task_id == 'retry'
+    assert again.attempts == 2
+
+
+def test_expired_lease_is_requeued(backend):
+    backend.add(make_task('durable'))
+    backend.claim('owner-a', 0.01)
+    time.sleep(0.05)
+
+    assert backend.requeue_expired() == 1
+    assert backend.claim('owner-b', 60).task_id == 'durable'
+
+
+def test_renewed_lease_is_not_requeued(backend):
+    backend.add(make_task('durable'))
+    backend.claim('owner-a', 0.05)
+    backend.renew_leases('owner-a', 60)
+    time.sleep(0.1)
+
+    assert backend.requeue_expired() == 0
+    assert backend.get('durable').status == TaskStatus.RUNNING
+
+
+def test_non_durable_task_only_claimed_by_submitter(backend):
+    backend.add(make_task('closure', handler=None, submitted_by='owner-a'))
+
+    assert backend.claim('owner-b', 60) is None
+    assert backend.claim('owner-a', 60).task_id == 'closure'
+
+
+def test_non_durable_task_fails_when_its_lease_expires(backend):
+    backend.add(make_task('closure', handler=None, submitted_by='owner-a'))
+    backend.claim('owner-a', 0.01)
+    time.sleep(0.05)
+
+    assert backend.requeue_expired() == 0
+    assert backend.get('closure').status == TaskStatus.FAILED
+
+
+def test_pending_non_durable_task_fails_when_submitter_stops(tmp_path):
+    backend = SQLiteTaskBackend(str(tmp_path / 'queue.db'))
+    backend.add(make_task('closure', handler=None, submitted_by='owner-a'))
+    backend.renew_leases('owner-a', 0.01)
+    time.sleep(0.05)
+
+    backend.requeue_expired()
+
+    assert backend.get('closure').status == TaskStatus.FAILED
+
+
+def test_handler_name_rejects_closures_and_main():
+    def local():
+        pass
+
+    def script_function():
+        pass
+    script_function.__module__ = '__main__'
+    script_function.__qualname__ = 'script_function'
+
+    assert qs.handler_name(add_task) == 'tests.add'
+    assert qs.handler_name(local) is None
+    assert qs.handler_name(lambda: None) is None
+    assert qs.handler_name(script_function) is None
+
+
+def wait_for(queue, task_id, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = queue.get_task_status(task_id)
+        if status in qs.FINISHED_STATUSES:
+            return status
+        time.sleep(0.02)
+    raise AssertionError(f"task {task_id} did not finish")
+
+
+def test_queue_runs_durable_and_closure_tasks(tmp_path):
+    queue = TaskQueue(max_workers=1, backend=SQLiteTaskBackend(str(tmp_path / 'queue.db')),
+                      poll_interval=0.02)
+    queue.start()
+    try:
+        durable = queue.submit_task('t', 'add', add_task, args=(2, 3))
+        offset = 10
+        closure = queue.submit_task('t', 'closure', lambda: offset * 2)
+
+        assert wait_for(queue, durable) == TaskStatus.COMPLETED
+        assert wait_for(queue, closure) == TaskStatus.COMPLETED
+        assert queue.get_task_result(durable) == 5
+        assert queue.get_task_result(closure) == 20
+    finally:
+        queue.stop()
+
+
+def test_queue_retries_failed_task(tmp_path):
+    _flaky_calls.clear()
+    queue = TaskQueue(backend=SQLiteTaskBackend(str(tmp_path / 'queue.db')), poll_interval=0.02,
+                      pools={'flaky': WorkerPoolConfig(workers=1, max_retries=2, retry_backoff_seconds=0.01)})
+    queue.start()
+    try:
+        task_id = queue.submit_task('flaky', 'flaky', flaky_task)
+
+        assert wait_for(queue, task_id) == TaskStatus.COMPLETED
+        assert queue.get_task(task_id).attempts == 2
+    finally:
+        queue.stop()
@@ -0,0 +1,76 @@
+"""RegionActivityIndex persistence across index instances"""
+
+import time
+
+import pytest
+
+from region_activity import RegionActivity, RegionActivityIndex, RegionActivityProber
+
+pytestmark = pytest.mark.unit
+
+
+def activity(account_id, region, active=True):
+    return RegionActivity(account_id, region, active, signals={'ec2': active})
+
+
+def test_round_trip_and_expiry(tmp_path):
+    index = RegionActivityIndex(str(tmp_path / 'regions.db'), ttl_seconds=60)
+    index.put_many([activity('111', 'us-east-1')])
+
+    record = index.get('111', 'us-east-1')
+    assert (record.active, record.signals) == (True, {'ec2': True})
+    assert index.get('111', 'eu-west-1') is None
+
+    stale = activity('111', 'eu-west-1')
+    stale.checked_at = time.time() - 120
+    index.put_many([stale])
+    assert index.get('111', 'eu-west-1') is None
+
+
+def test_writers_sharing_a_file_keep_each_others_entries(tmp_path):
+    path = str(tmp_path / 'regions.db')
+    first, second = RegionActivityIndex(path), RegionActivityIndex(path)
+
+    first.put_many([activity('111', 'us-east-1')])
+    second.put_many([activity('222', 'eu-west-1', active=False)])
+
+    for index in (first, second):
+        assert index.get('111', 'us-east-1').active is True
+        assert index.get('222', 'eu-west-1').active is False
+
+
+def test_invalidate_one_account(tmp_path):
+    index = RegionActivityIndex(str(tmp_path / 'regions.db'))
+    index.put_many([activity('111', 'us-east-1'), activity('222', 'us-east-1')])
+
+    index.invalidate('111')
+
+    assert index.get('111', 'us-east-1') is None
+    assert index.get('222', 'us-east-1') is not None
+
+
+def denied(session, region):
+    raise Exception('AccessDenied')
+
+
+def empty(session, region):
+    return False
+
+
+def test_partial_access_denied_is_still_cached(tmp_path):
+    index = RegionActivityIndex(str(tmp_path / 'regions.db'))
+    prober = RegionActivityProber(index, signals={'ec2': denied, 'lambda': empty})
+
+    assert prober.discover_active_regions(object(), '111', ['us-east-1']) == []
+
+    record = index.get('111', 'us-east-1')
+    assert (record.active, record.signals) == (False, {'lambda': False})
+    assert 'ec2' in record.errors
+
+
+def test_region_is_kept_uncached_when_every_probe_fails(tmp_path):
+    index = RegionActivityIndex(str(tmp_path / 'regions.db'))
+    prober = RegionActivityProber(index, signals={'ec2': denied, 'lambda': denied})
+
+    assert prober.discover_active_regions(object(), '111', ['us-east-1']) == ['us-east-1']
+    assert index.get('111', 'us-east-1') is None
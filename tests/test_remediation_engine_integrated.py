@@ -0,0 +1,203 @@
+"""Remediation engine: grouped AI generation, rate limiting and batch deployment"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import llm_gateway
+from llm_gateway import LLMGateway, ResponseCache, ResponseCacheConfig
+from remediation_engine_integrated import (
+    AIRemediationGenerator, CloudFormationDeployer, DeploymentOrchestrator, RemediationAction,
+    RemediationBatch, RemediationStatus, RiskLevel,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeAnthropic:
+    def __init__(self, reply=None):
+        self.calls = []
+        self.messages = self
+        self.reply = reply or {'title': 'Fix'}
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(model=kwargs['model'], stop_reason='end_turn',
+                               content=[SimpleNamespace(type='text', text=json.dumps(self.reply))])
+
+
+class CountingBucket:
+    min_rate = 0.1
+
+    def __init__(self):
+        self.acquired = 0
+        self.successes = 0
+
+    def acquire(self):
+        self.acquired += 1
+
+    def on_success(self, increase):
+        self.successes += 1
+
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    cache = ResponseCache(ResponseCacheConfig(path=str(tmp_path / 'llm_cache.db')))
+    monkeypatch.setattr(llm_gateway, '_gateway', LLMGateway(cache))
+    generator = AIRemediationGenerator()
+    generator.ai_client = FakeAnthropic()
+    generator._rate_limiter = CountingBucket()
+    return generator
+
+
+def test_cached_responses_do_not_take_rate_limit_tokens(generator):
+    assert json.loads(generator._call_ai('Fix bucket')) == {'title': 'Fix'}
+    assert json.loads(generator._call_ai('Fix bucket')) == {'title': 'Fix'}
+
+    assert len(generator.ai_client.calls) == 1
+    assert (generator._rate_limiter.acquired, generator._rate_limiter.successes) == (1, 1)
+
+
+def runtime_finding(function_name):
+    return {'service': 'Lambda', 'resource': function_name,
+            'title': f'Function {function_name} uses deprecated runtime python3.7'}
+
+
+def test_findings_of_one_check_share_a_single_request(generator):
+    generator.ai_client.reply = {'title': 'Upgrade runtime',
+                                 'aws_cli': 'aws lambda update-function-configuration '
+                                            '--function-name {resource} --runtime python3.12'}
+    findings = [runtime_finding('orders'), {'service': 'S3', 'resource': 'logs',
+                                            'title': 'Bucket versioning disabled'},
+                runtime_finding('billing')]
+
+    actions = generator.generate_remediations(findings)
+
+    assert len(generator.ai_client.calls) == 1
+    assert actions[1].remediation_type == 'versioning'
+    assert [a.resource for a in actions] == ['orders', 'logs', 'billing']
+    assert '--function-name billing ' in actions[2].aws_cli
+
+
+def test_group_reply_naming_one_resource_falls_back_to_per_finding_requests(generator):
+    generator.ai_client.reply = {'title': 'Upgrade runtime',
+                                 'aws_cli': 'aws lambda update-function-configuration '
+                                            '--function-name orders --runtime python3.12'}
+
+    actions = generator.generate_remediations([runtime_finding('orders'), runtime_finding('billing')])
+
+    assert len(generator.ai_client.calls) == 3
+    assert all(a is not None for a in actions)
+
+
+def test_group_key_ignores_resource_names_and_ids():
+    key = AIRemediationGenerator._group_key
+
+    assert key(runtime_finding('orders')) == key(runtime_finding('billing'))
+    assert key({'service': 'EC2', 'title': 'Instance i-0123456789abcdef0 has IMDSv1'}) == \
+        key({'service': 'EC2', 'title': 'Instance i-0fedcba9876543210 has IMDSv1'})
+    assert key({'service': 'EC2', 'check_id': 'EC2.8'}) != key({'service': 'EC2', 'check_id': 'EC2.9'})
+
+
+def action(action_id, resource, region='us-east-1', stack=False, status=RemediationStatus.APPROVED):
+    return RemediationAction(
+        id=action_id, finding_id=action_id, finding_title='', service='S3', resource=resource,
+        account_id='111122223333', region=region, remediation_type='encryption', title='',
+        description='', risk_level=RiskLevel.LOW, auto_remediatable=True,
+        cloudformation='Resources: {}' if stack else '', terraform='', aws_cli='', status=status,
+    )
+
+
+class FakeStacks:
+    STACK_SUCCESS_STATUSES = CloudFormationDeployer.STACK_SUCCESS_STATUSES
+    STACK_FAILED_STATUSES = CloudFormationDeployer.STACK_FAILED_STATUSES
+
+    def __init__(self):
+        self.sweeps = []
+
+    def get_stack_statuses(self, names, region):
+        self.sweeps.append((region, sorted(names)))
+        return {name: {'status': 'CREATE_COMPLETE'} for name in names}
+
+
+class FakeEngine:
+    """deploy_remediation stand-in recording overlap per resource and target"""
+
+    def __init__(self, fail=()):
+        self.cf_deployer = FakeStacks()
+        self.fail = set(fail)
+        self.events = []
+        self.active = {}
+        self.peak = {}
+        self.lock = threading.Lock()
+
+    def deploy_remediation(self, action, method):
+        target = (action.account_id, action.region)
+        with self.lock:
+            self.events.append(('start', action.id))
+            self.active[target] = self.active.get(target, 0) + 1
+            self.peak[target] = max(self.peak.get(target, 0), self.active[target])
+        time.sleep(0.02)
+        with self.lock:
+            self.active[target] -= 1
+            self.events.append(('end', action.id))
+        if action.id in self.fail:
+            raise RuntimeError('AccessDenied')
+        if action.cloudformation:
+            action.stack_name = f'remediation-{action.id}'
+            action.status = RemediationStatus.DEPLOYING
+        else:
+            action.status = RemediationStatus.DEPLOYED
+        return action
+
+
+def deploy(engine, actions, **kwargs):
+    batch = RemediationBatch('b1', 'batch', datetime.now(), actions, total_count=len(actions))
+    return DeploymentOrchestrator(engine, poll_interval=0.01, **kwargs).run(batch)
+
+
+def test_actions_on_one_resource_run_in_order_and_others_in_parallel():
+    engine = FakeEngine()
+
+    batch = deploy(engine, [action('a1', 'bucket-a'), action('b1', 'bucket-b'),
+                            action('a2', 'bucket-a'), action('c1', 'bucket-c')])
+
+    events = engine.events
+    assert events.index(('end', 'a1')) < events.index(('start', 'a2'))
+    assert engine.peak[('111122223333', 'us-east-1')] == 3
+    assert (batch.deployed_count, batch.status) == (4, RemediationStatus.DEPLOYED)
+
+
+def test_per_target_limit_caps_concurrent_deployments():
+    engine = FakeEngine()
+
+    deploy(engine, [action(f'a{i}', f'bucket-{i}') for i in range(6)]
+           + [action('w1', 'bucket-w', region='us-west-2')], per_target_limit=2)
+
+    assert engine.peak == {('111122223333', 'us-east-1'): 2, ('111122223333', 'us-west-2'): 1}
+
+
+def test_stacks_are_polled_per_region_before_the_next_action_starts():
+    engine = FakeEngine()
+
+    batch = deploy(engine, [action('a1', 'bucket-a', stack=True), action('a2', 'bucket-a'),
+                            action('b1', 'bucket-b', stack=True)])
+
+    assert engine.cf_deployer.sweeps[0] == ('us-east-1', ['remediation-a1', 'remediation-b1'])
+    assert engine.events.index(('start', 'a2')) == 4
+    assert batch.deployed_count == 3
+
+
+def test_unapproved_actions_are_skipped_and_failures_counted():
+    engine = FakeEngine(fail={'b1'})
+
+    batch = deploy(engine, [action('a1', 'bucket-a'), action('b1', 'bucket-b'),
+                            action('p1', 'bucket-p', status=RemediationStatus.PENDING)])
+
+    assert (batch.deployed_count, batch.failed_count, batch.skipped_count) == (1, 1, 1)
+    assert batch.actions[1].error_message == 'AccessDenied'
+    assert batch.status == RemediationStatus.FAILED
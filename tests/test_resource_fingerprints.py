@@ -0,0 +1,221 @@
+"""Incremental scanning: fingerprint skip, deep-config refresh and replay"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+from resource_fingerprints import (
+    CHANGE_FEED_SKEW, IncrementalScanState, ResourceRecord, config_changed_resources,
+    fingerprint, run_incremental_check,
+)
+from waf_database import WAFDatabase
+
+pytestmark = pytest.mark.unit
+
+RDS = 'AWS::RDS::DBInstance'
+S3 = 'AWS::S3::Bucket'
+SG = 'AWS::EC2::SecurityGroup'
+
+
+@dataclass
+class Inventory:
+    instances: int = 0
+    public: int = 0
+    label: str = ''
+
+
+def previous_state(*records, **kwargs):
+    return IncrementalScanState('test', '111122223333', {r.key: r for r in records}, **kwargs)
+
+
+def record(resource_type, resource_id, config, region='us-east-1', findings=None, counters=None):
+    return ResourceRecord(region, resource_type, resource_id, fingerprint(config),
+                          findings or [], counters or {}, '2026-01-01T00:00:00+00:00')
+
+
+def test_fingerprint_ignores_key_order_and_volatile_fields():
+    base = {'Name': 'db', 'Tags': [{'Key': 'a', 'Value': '1'}]}
+    reordered = {'Tags': [{'Value': '1', 'Key': 'a'}], 'Name': 'db',
+                 'ResponseMetadata': {'RequestId': 'x'}}
+
+    assert fingerprint(base) == fingerprint(reordered)
+    assert fingerprint(base) != fingerprint({**base, 'Name': 'other'})
+
+
+def test_unchanged_shallow_resource_is_skipped():
+    config = {'DBInstanceIdentifier': 'db1', 'PubliclyAccessible': False}
+    state = previous_state(record(RDS, 'db1', config))
+
+    assert state.should_check('us-east-1', RDS, 'db1', config)[0] is False
+    assert state.should_check('us-east-1', RDS, 'db1', {**config, 'PubliclyAccessible': True})[0] is True
+    assert state.should_check('us-east-1', RDS, 'db2', config)[0] is True
+    assert state.should_check('eu-west-1', RDS, 'db1', config)[0] is True
+
+
+def test_deep_resource_rechecked_without_change_feed():
+    config = {'Name': 'bucket'}
+    state = previous_state(record(S3, 'bucket', config, region='global'))
+
+    assert state.should_check('global', S3, 'bucket', config)[0] is True
+
+
+def test_change_feed_decides_for_covered_regions():
+    config = {'Name': 'bucket'}
+    state = previous_state(record(S3, 'bucket', config), record(S3, 'other', {'Name': 'other'}),
+                           record(RDS, 'db1', {'Id': 'db1'}))
+    state.set_change_feed({(S3, 'bucket'), (RDS, 'db1')}, ['us-east-1'])
+
+    assert state.should_check('us-east-1', S3, 'bucket', config)[0] is True
+    assert state.should_check('us-east-1', S3, 'other', {'Name': 'other'})[0] is False
+    assert state.should_check('us-east-1', RDS, 'db1', {'Id': 'db1'})[0] is True
+
+
+def test_change_feed_ignored_outside_its_regions():
+    state = previous_state(record(S3, 'bucket', {'Name': 'bucket'}, region='global'),
+                           record(RDS, 'db1', {'Id': 'db1'}, region='eu-west-1'))
+    state.set_change_feed(set(), ['us-east-1'])
+
+    assert state.should_check('global', S3, 'bucket', {'Name': 'bucket'})[0] is True
+    assert state.should_check('eu-west-1', RDS, 'db1', {'Id': 'db1'})[0] is False
+
+
+def test_unavailable_change_feed_falls_back_to_fingerprints():
+    state = previous_state(record(S3, 'bucket', {'Name': 'bucket'}))
+    state.set_change_feed(None, ['us-east-1'])
+
+    assert state.change_feed_regions == set()
+    assert state.should_check('us-east-1', S3, 'bucket', {'Name': 'bucket'})[0] is True
+
+
+def test_unchanged_resource_replays_findings_and_counters():
+    config = {'Id': 'db1'}
+    state = previous_state(record(RDS, 'db1', config, findings=[{'title': 'public'}],
+                                  counters={'instances': 1, 'public': 1}))
+    findings, inventory = [], Inventory(instances=5)
+
+    def check(sink):
+        raise AssertionError('check should not run for an unchanged resource')
+
+    run_incremental_check(state, findings, RDS, 'db1', 'us-east-1', config, check, counters=inventory)
+
+    assert findings == [{'title': 'public'}]
+    assert (inventory.instances, inventory.public) == (6, 1)
+    assert state.stats() == {'checked': 0, 'carried_forward': 1}
+    carried = state.current[('us-east-1', RDS, 'db1')]
+    assert carried.updated_at == '2026-01-01T00:00:00+00:00'
+
+
+def test_changed_resource_runs_check_and_records_delta():
+    state = previous_state(record(RDS, 'db1', {'Id': 'db1', 'v': 1}))
+    findings, inventory = [], Inventory(instances=2, label='x')
+
+    def check(sink):
+        inventory.instances += 1
+        inventory.label = 'changed'
+        sink.append({'title': 'unencrypted'})
+
+    run_incremental_check(state, findings, RDS, 'db1', 'us-east-1', {'Id': 'db1', 'v': 2}, check,
+                          counters=inventory)
+
+    assert findings == [{'title': 'unencrypted'}]
+    current = state.current[('us-east-1', RDS, 'db1')]
+    assert current.counters == {'instances': 1}
+    assert current.findings == [{'title': 'unencrypted'}]
+    assert current.updated_at == state.started_at
+    assert state.stats() == {'checked': 1, 'carried_forward': 0}
+
+
+def test_checks_of_one_resource_keep_separate_records():
+    sg = {'GroupId': 'sg-1', 'IpPermissions': []}
+    state = previous_state(ResourceRecord('us-east-1', f'{SG}#ec2', 'sg-1', fingerprint(sg),
+                                          [{'title': 'ec2'}], {}, '2026-01-01T00:00:00+00:00'))
+    findings = []
+
+    run_incremental_check(state, findings, SG, 'sg-1', 'us-east-1', sg,
+                          lambda sink: sink.append({'title': 'fresh ec2'}), check_name='ec2')
+    run_incremental_check(state, findings, SG, 'sg-1', 'us-east-1', sg,
+                          lambda sink: sink.append({'title': 'vpc'}), check_name='vpc')
+
+    assert findings == [{'title': 'ec2'}, {'title': 'vpc'}]
+    assert set(state.current) == {('us-east-1', f'{SG}#ec2', 'sg-1'), ('us-east-1', f'{SG}#vpc', 'sg-1')}
+    assert state.stats() == {'checked': 1, 'carried_forward': 1}
+
+
+def test_no_state_always_runs_check():
+    findings = []
+
+    run_incremental_check(None, findings, RDS, 'db1', None, {}, lambda sink: sink.append('f'))
+
+    assert findings == ['f']
+
+
+def test_last_scan_time_is_oldest_scan_start_less_skew():
+    older = record(RDS, 'a', {})
+    newer = record(RDS, 'b', {})
+    older.scanned_at = '2026-03-01T00:10:00+00:00'
+    newer.scanned_at = '2026-03-02T00:00:00+00:00'
+
+    assert previous_state(older, newer).last_scan_time == '2026-03-01T00:05:00+00:00'
+    assert previous_state().last_scan_time is None
+
+
+def test_last_scan_time_advances_for_carried_records(tmp_path):
+    db = WAFDatabase(str(tmp_path / 'waf.db'))
+    first = previous_state(record(RDS, 'db1', {'a': 1}))
+    run_incremental_check(first, [], RDS, 'db1', 'us-east-1', {'a': 1}, lambda sink: None)
+    first.save(db)
+
+    second = IncrementalScanState.load(db, 'test', '111122223333')
+    run_incremental_check(second, [], RDS, 'db1', 'us-east-1', {'a': 1}, lambda sink: None)
+    second.save(db)
+    third = IncrementalScanState.load(db, 'test', '111122223333')
+
+    carried = third.previous[('us-east-1', RDS, 'db1')]
+    assert carried.updated_at == '2026-01-01T00:00:00+00:00'
+    assert third.last_scan_time == (
+        datetime.fromisoformat(second.started_at) - CHANGE_FEED_SKEW).isoformat()
+
+
+def config_client(region, results=None, error_code=None):
+    client = boto3.client('config', region_name=region, aws_access_key_id='AKIATEST',
+                          aws_secret_access_key='secret')
+    stubber = Stubber(client)
+    if error_code:
+        stubber.add_client_error('select_resource_config', error_code)
+    else:
+        stubber.add_response('select_resource_config', {'Results': results or []})
+    stubber.activate()
+    return client
+
+
+class FakeSession:
+    def __init__(self, clients):
+        self.clients = clients
+
+    def client(self, service_name, region_name=None):
+        assert service_name == 'config'
+        return self.clients[region_name]
+
+
+def test_change_feed_collects_ids_and_names():
+    client = config_client('us-east-1', [
+        '{"resourceId": "i-1", "resourceType": "AWS::EC2::Instance"}',
+        '{"resourceId": "vol-1", "resourceName": "data", "resourceType": "AWS::EC2::Volume"}',
+    ])
+
+    changed = config_changed_resources(FakeSession({'us-east-1': client}), ['us-east-1'],
+                                       '2026-01-01T00:00:00+00:00')
+
+    assert changed == {('AWS::EC2::Instance', 'i-1'), ('AWS::EC2::Volume', 'vol-1'),
+                       ('AWS::EC2::Volume', 'data')}
+
+
+def test_change_feed_unavailable_in_any_region_returns_none():
+    session = FakeSession({'us-east-1': config_client('us-east-1'),
+                           'eu-west-1': config_client('eu-west-1',
+                                                      error_code='NoSuchConfigurationRecorderException')})
+
+    assert config_changed_resources(session, ['us-east-1', 'eu-west-1'], '2026-01-01') is None
@@ -0,0 +1,104 @@
+"""Resource graph queries and per-principal caching"""
+
+import pytest
+
+import resource_graph
+from resource_graph import ResourceGraph, ResourceNode, clear_resource_graphs, get_resource_graph
+
+pytestmark = pytest.mark.unit
+
+
+def network_graph():
+    graph = ResourceGraph('111122223333', 'us-east-1')
+    for node_id, kind in [('vpc-1', 'vpc'), ('subnet-1', 'subnet'), ('sg-1', 'security_group'),
+                          ('eni-1', 'eni'), ('i-1', 'instance'), ('i-2', 'instance')]:
+        graph.add_node(ResourceNode(node_id, kind))
+    graph.add_node(ResourceNode('db', 'rds', arn='arn:aws:rds:us-east-1:111122223333:db:db',
+                                tags={'Application': 'checkout'}))
+    graph.add_edge('subnet-1', 'vpc-1')
+    graph.add_edge('eni-1', 'subnet-1')
+    graph.add_edge('eni-1', 'sg-1')
+    graph.add_edge('i-1', 'eni-1', 'attached')
+    graph.add_edge('i-2', 'subnet-1')
+    graph.add_edge('db', 'sg-1')
+    graph.set_tags('i-1', {'Application': 'checkout'})
+    graph.set_tags('i-2', {'Application': 'search'})
+    return graph
+
+
+def test_dependencies_and_blast_radius_walk_edges_with_hop_counts():
+    graph = network_graph()
+
+    assert graph.dependencies('i-1') == {'eni-1': 1, 'subnet-1': 2, 'sg-1': 2, 'vpc-1': 3}
+    assert graph.blast_radius('vpc-1', max_depth=2) == {'subnet-1': 1, 'eni-1': 2, 'i-2': 2}
+    assert graph.blast_radius('sg-1') == {'eni-1': 1, 'db': 1, 'i-1': 2}
+    assert graph.relation('i-1', 'eni-1') == 'attached'
+
+
+def test_edges_to_unknown_resources_are_ignored():
+    graph = network_graph()
+
+    graph.add_edge('i-1', 'vol-unknown')
+
+    assert graph.direct_dependencies('i-1') == {'eni-1'}
+
+
+def test_tag_index_and_arn_lookup():
+    graph = network_graph()
+
+    assert 'arn:aws:rds:us-east-1:111122223333:db:db' in graph
+    assert graph.tagged('Application', 'checkout') == {'i-1', 'db'}
+    assert graph.tagged('Application') == {'i-1', 'i-2', 'db'}
+    assert graph.application('search') == {'i-2', 'subnet-1', 'vpc-1'}
+
+    graph.set_tags('i-2', {'Application': 'checkout'})
+
+    assert graph.tag_values('Application') == ['checkout']
+
+
+class FakeSession:
+    def __init__(self, arn, account_id='111122223333'):
+        self.identity = {'Account': account_id, 'Arn': arn}
+
+    def client(self, service, **kwargs):
+        return self
+
+    def get_caller_identity(self):
+        return self.identity
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    built = []
+
+    def build(builder):
+        built.append((builder.account_id, builder.region))
+        return ResourceGraph(builder.account_id, builder.region)
+
+    monkeypatch.setattr(resource_graph.ResourceGraphBuilder, 'build', build)
+    clear_resource_graphs()
+    yield built
+    clear_resource_graphs()
+
+
+def test_graphs_are_cached_per_principal(builds):
+    admin = FakeSession('arn:aws:sts::111122223333:assumed-role/Admin/scan')
+    readonly = FakeSession('arn:aws:sts::111122223333:assumed-role/ReadOnly/scan')
+
+    first = get_resource_graph(admin, 'us-east-1')
+    assert get_resource_graph(admin, 'us-east-1') is first
+    assert get_resource_graph(readonly, 'us-east-1') is not first
+
+    assert builds == [('111122223333', 'us-east-1')] * 2
+
+
+def test_stale_graphs_are_rebuilt(builds):
+    session = FakeSession('arn:aws:sts::111122223333:assumed-role/Admin/scan')
+
+    first = get_resource_graph(session, 'us-east-1')
+    first.built_at -= 60
+
+    assert get_resource_graph(session, 'us-east-1', max_age=120) is first
+    assert get_resource_graph(session, 'us-east-1', max_age=30) is not first
+    assert get_resource_graph(session, 'us-east-1', refresh=True) is not first
+    assert len(builds) == 3
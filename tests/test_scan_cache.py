@@ -0,0 +1,163 @@
+"""ScanCache TTL, leases, eviction and key scoping"""
+
+import os
+import threading
+import time
+
+import pytest
+
+import scan_cache
+from scan_cache import ScanCache, scan_cache_key
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(scan_cache, 'LEASE_POLL_SECONDS', 0.01)
+    return ScanCache(str(tmp_path / 'scan_cache.db'))
+
+
+def test_key_scopes_principal_and_version():
+    key = scan_cache_key('111', None, 'iam', version='3.abc', principal='arn:aws:iam::111:role/Audit')
+
+    assert key == '111|global|iam|v3.abc|arn:aws:iam::111:role/Audit'
+    assert scan_cache_key('111', 'us-east-1', 'ec2') == '111|us-east-1|ec2|v1|*'
+    assert key != scan_cache_key('111', None, 'iam', version='3.abc', principal='arn:aws:iam::111:role/Other')
+    assert key != scan_cache_key('111', None, 'iam', version='3.def', principal='arn:aws:iam::111:role/Audit')
+
+
+def test_put_and_get_round_trip(cache):
+    cache.put('k', {'findings': [{'id': 1}], 'score': 90})
+
+    assert cache.get('k') == {'findings': [{'id': 1}], 'score': 90}
+    assert cache.get('missing') is None
+
+
+def test_expired_entry_is_dropped(cache):
+    cache.put('k', {'v': 1}, ttl_seconds=0.05)
+    assert cache.get('k') == {'v': 1}
+
+    time.sleep(0.1)
+
+    assert cache.get('k') is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_hit_skips_compute(cache):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'v': len(calls)}
+
+    assert cache.get_or_compute('k', compute) == {'v': 1}
+    assert cache.get_or_compute('k', compute) == {'v': 1}
+    assert len(calls) == 1
+
+
+def test_rejected_value_is_not_stored(cache):
+    result = cache.get_or_compute('k', lambda: {'error': 'AccessDenied'},
+                                  cacheable=lambda value: 'error' not in value)
+
+    assert result == {'error': 'AccessDenied'}
+    assert cache.get('k') is None
+
+
+def test_concurrent_misses_compute_once(cache):
+    calls = []
+    results = []
+    started = threading.Event()
+
+    def compute():
+        calls.append(1)
+        started.set()
+        time.sleep(0.2)
+        return {'v': 'scanned'}
+
+    def worker():
+        results.append(cache.get_or_compute('k', compute))
+
+    first = threading.Thread(target=worker)
+    first.start()
+    started.wait(1)
+    others = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in others:
+        thread.start()
+    for thread in [first] + others:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{'v': 'scanned'}] * 4
+
+
+def test_value_stored_before_lease_is_taken_is_reused(cache, monkeypatch):
+    # Another caller stored the value and released its lease between our miss and our lease
+    cache.put('k', {'v': 'scanned'})
+    real_get = cache.get
+    misses = iter([None])
+    monkeypatch.setattr(cache, 'get', lambda key: next(misses, None) or real_get(key))
+
+    def compute():
+        raise AssertionError('value was already cached')
+
+    assert cache.get_or_compute('k', compute) == {'v': 'scanned'}
+    assert cache._acquire_lease('k')
+
+
+def test_waiter_computes_after_lease_holder_fails(cache):
+    started = threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError('scan failed')
+
+    def worker():
+        try:
+            cache.get_or_compute('k', failing)
+        except RuntimeError as e:
+            errors.append(e)
+
+    holder = threading.Thread(target=worker)
+    holder.start()
+    started.wait(1)
+
+    assert cache.get_or_compute('k', lambda: {'v': 'retry'}) == {'v': 'retry'}
+    holder.join()
+    assert len(errors) == 1
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    blobs = {name: os.urandom(500).hex() for name in 'abcd'}
+    probe = ScanCache(str(tmp_path / 'probe.db'))
+    probe.put('a', blobs['a'])
+    entry_bytes = probe.stats()['size_bytes']
+    # Room for three entries, so the fourth put forces an eviction
+    max_bytes = int(entry_bytes * 3.5)
+    cache = ScanCache(str(tmp_path / 'scan_cache.db'), max_size_mb=max_bytes / (1024 * 1024))
+
+    cache.put('a', blobs['a'])
+    cache.put('b', blobs['b'])
+    cache.put('c', blobs['c'])
+    cache.get('a')
+    cache.put('d', blobs['d'])
+
+    assert cache.stats()['size_bytes'] <= max_bytes
+    assert cache.get('b') is None
+    assert cache.get('a') == blobs['a']
+    assert cache.get('d') == blobs['d']
+
+
+def test_invalidate_by_account(cache):
+    cache.put(scan_cache_key('111', 'us-east-1', 'ec2'), {'v': 1})
+    cache.put(scan_cache_key('222', 'us-east-1', 'ec2'), {'v': 2})
+
+    cache.invalidate('111')
+
+    assert cache.get(scan_cache_key('111', 'us-east-1', 'ec2')) is None
+    assert cache.get(scan_cache_key('222', 'us-east-1', 'ec2')) == {'v': 2}
+
+    cache.invalidate()
+    assert cache.stats()['entries'] == 0
@@ -0,0 +1,101 @@
+"""FindingsTable must score exactly like the per-finding loops it replaced"""
+
+import random
+from dataclasses import dataclass
+
+import pytest
+
+from scoring_engine import UNMAPPED_PILLAR, FindingsTable
+
+pytestmark = pytest.mark.unit
+
+PILLARS = ['Security', 'Reliability', 'Performance Efficiency', 'Cost Optimization',
+           'Operational Excellence', 'Sustainability']
+SEVERITIES = ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO']
+
+
+@dataclass
+class Finding:
+    pillar: str
+    severity: str
+    source_service: str = 'EC2'
+
+
+def legacy_pillar_scores(findings):
+    """The per-pillar loop AWSLandscapeScanner._calculate_pillar_scores used before FindingsTable"""
+    scores = {}
+    for pillar in PILLARS:
+        pfindings = [f for f in findings if f.pillar == pillar]
+        critical = sum(1 for f in pfindings if f.severity == 'CRITICAL')
+        high = sum(1 for f in pfindings if f.severity == 'HIGH')
+        medium = sum(1 for f in pfindings if f.severity == 'MEDIUM')
+        low = sum(1 for f in pfindings if f.severity in ['LOW', 'INFO'])
+        score = 100 - (critical * 20) - (high * 10) - (medium * 5) - (low * 2)
+        scores[pillar] = {
+            'score': max(0, min(100, score)),
+            'count': len(pfindings),
+            'critical': critical,
+            'high': high,
+            'medium': medium,
+            'low': low,
+            'top': pfindings[:5],
+        }
+    return scores
+
+
+def random_findings(rng, n):
+    return [Finding(rng.choice(PILLARS + ['']), rng.choice(SEVERITIES)) for _ in range(n)]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_pillar_scores_match_legacy_loop(seed):
+    rng = random.Random(seed)
+    findings = random_findings(rng, rng.randint(0, 40))
+    expected = legacy_pillar_scores(findings)
+
+    table = FindingsTable.from_findings(findings, service='source_service')
+    counts = table.severity_matrix(PILLARS)
+    totals = table.pillar_totals(PILLARS)
+    scores = table.pillar_scores({'CRITICAL': 20, 'HIGH': 10, 'MEDIUM': 5, 'LOW': 2, 'INFO': 2}, PILLARS)
+
+    for pillar in PILLARS:
+        row = counts.loc[pillar]
+        assert int(scores[pillar]) == expected[pillar]['score']
+        assert int(totals[pillar]) == expected[pillar]['count']
+        assert int(row['CRITICAL']) == expected[pillar]['critical']
+        assert int(row['HIGH']) == expected[pillar]['high']
+        assert int(row['MEDIUM']) == expected[pillar]['medium']
+        assert int(row['LOW'] + row['INFO']) == expected[pillar]['low']
+        assert [findings[i] for i in table.first_rows(pillar, 5)] == expected[pillar]['top']
+
+
+def test_scores_are_clipped_at_zero():
+    findings = [Finding('Security', 'CRITICAL')] * 10
+    scores = FindingsTable.from_findings(findings).pillar_scores({'CRITICAL': 20}, PILLARS)
+    assert scores['Security'] == 0
+    assert scores['Reliability'] == 100
+
+
+def test_dict_findings_with_missing_fields():
+    findings = [{'pillar': 'Security', 'severity': 'HIGH'}, {'severity': 'LOW'}]
+    table = FindingsTable.from_findings(findings)
+    assert table.pillar_totals(['Security', UNMAPPED_PILLAR]).tolist() == [1, 1]
+
+
+def test_empty_findings_score_base():
+    scores = FindingsTable.from_findings([]).pillar_scores({'HIGH': 10}, PILLARS)
+    assert scores.tolist() == [100.0] * len(PILLARS)
+
+
+def test_pillar_resolver_runs_once_per_distinct_pair():
+    calls = []
+
+    def resolve(pillar, service):
+        calls.append((pillar, service))
+        return pillar or {'S3': 'Security'}.get(service, 'Reliability')
+
+    findings = [{'pillar': '', 'severity': 'HIGH', 'service': 'S3'}] * 50 \
+        + [{'pillar': '', 'severity': 'LOW', 'service': 'EC2'}] * 50
+    table = FindingsTable.from_findings(findings, pillar_resolver=resolve)
+    assert table.pillar_totals(['Security', 'Reliability']).tolist() == [50, 50]
+    assert len(calls) == 2
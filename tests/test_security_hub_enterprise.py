@@ -0,0 +1,177 @@
+"""Security Hub summaries: insight adoption and the partitioned GetFindings fallback"""
+
+import pyarrow.parquet as pq
+import pytest
+from botocore.exceptions import ClientError
+
+from security_hub_enterprise import (
+    ACTIVE_FINDINGS_FILTER, FINDING_EXPORT_COLUMNS, SUMMARY_DIMENSIONS, EnterpriseSecurityHubManager,
+    InsightSummaryEngine, InsightsUnavailable, SEVERITY_LABELS, SecurityHubConfig,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def finding(finding_id, severity, account='111122223333'):
+    return {'Id': finding_id, 'AwsAccountId': account, 'Severity': {'Label': severity},
+            'ProductName': 'GuardDuty', 'Resources': [{'Type': 'AwsS3Bucket'}]}
+
+
+class FakeSecurityHub:
+    """Insight and GetFindings client recording the calls it receives"""
+
+    def __init__(self, insights=(), findings=(), deny_create=False):
+        self.insights = list(insights)
+        self.findings = list(findings)
+        self.deny_create = deny_create
+        self.calls = []
+
+    def get_paginator(self, operation):
+        self.operation = operation
+        return self
+
+    def paginate(self, Filters=None, **kwargs):
+        if self.operation == 'get_insights':
+            return [{'Insights': self.insights}]
+        severities = {f['Value'] for f in Filters.get('SeverityLabel', [])}
+        if 'SortCriteria' not in kwargs:
+            self.calls.append(('partition', min(severities)))
+        return [{'Findings': [f for f in self.findings
+                              if not severities or f['Severity']['Label'] in severities]}]
+
+    def update_insight(self, **kwargs):
+        self.calls.append(('update_insight', kwargs['InsightArn']))
+
+    def create_insight(self, Name, **kwargs):
+        if self.deny_create:
+            raise ClientError({'Error': {'Code': 'AccessDeniedException'}}, 'CreateInsight')
+        self.calls.append(('create_insight', Name))
+        return {'InsightArn': f'arn:insight/{Name}'}
+
+    def get_insight_results(self, InsightArn):
+        return {'InsightResults': {'ResultValues': [{'GroupByAttributeValue': 'HIGH', 'Count': 3}]}}
+
+
+def insight(dimension, filters=None):
+    group_by, extra_filters = SUMMARY_DIMENSIONS[dimension]
+    name = InsightSummaryEngine._insight_name(dimension)
+    return {'Name': name, 'InsightArn': f'arn:insight/{name}', 'GroupByAttribute': group_by,
+            'Filters': filters if filters is not None else {**ACTIVE_FINDINGS_FILTER, **extra_filters}}
+
+
+def test_matching_insight_is_adopted_without_update():
+    client = FakeSecurityHub(insights=[insight('by_severity')])
+
+    counts = InsightSummaryEngine(client).grouped_counts(['by_severity'])
+
+    assert counts == {'by_severity': {'HIGH': 3}}
+    assert client.calls == []
+
+
+def test_edited_insight_is_restored():
+    client = FakeSecurityHub(insights=[insight('by_severity', filters={})])
+
+    InsightSummaryEngine(client).grouped_counts(['by_severity'])
+
+    assert client.calls == [('update_insight', 'arn:insight/waf-scanner-summary-by-severity')]
+
+
+def test_missing_insight_is_created_only_when_enabled():
+    client = FakeSecurityHub()
+
+    with pytest.raises(InsightsUnavailable):
+        InsightSummaryEngine(client).grouped_counts(['by_status'])
+    assert client.calls == []
+
+    InsightSummaryEngine(client, create_missing=True).grouped_counts(['by_status'])
+    assert client.calls == [('create_insight', 'waf-scanner-summary-by-status')]
+
+
+@pytest.mark.parametrize('config', [
+    SecurityHubConfig(),
+    SecurityHubConfig(create_summary_insights=True),
+])
+def test_summary_counts_severity_partitions_without_insights(config):
+    client = FakeSecurityHub(
+        findings=[finding('a', 'CRITICAL'), finding('b', 'HIGH'), finding('c', 'HIGH', account='222')],
+        deny_create=True,
+    )
+    manager = EnterpriseSecurityHubManager(config=config)
+    manager._securityhub_client = client
+
+    summary = manager.get_findings_summary()
+
+    assert summary['total_findings'] == 3
+    assert summary['by_severity']['HIGH'] == 2
+    assert summary['by_account']['111122223333'] == {'total': 2, 'critical': 1, 'high': 1}
+    assert [f['id'] for f in summary['critical_findings']] == ['a']
+    assert sorted(c[1] for c in client.calls if c[0] == 'partition') == sorted(SEVERITY_LABELS)
+
+
+def test_export_keeps_one_schema_across_batches(tmp_path):
+    sparse = {**finding('a', 'LOW'), 'Title': None, 'Resources': []}
+    full = {**finding('b', 'HIGH'), 'Title': 'Open bucket', 'Types': ['Effects/Data Exposure'],
+            'Severity': {'Label': 'HIGH', 'Normalized': 70}}
+    manager = EnterpriseSecurityHubManager(config=SecurityHubConfig(export_batch_size=1))
+    manager._securityhub_client = FakeSecurityHub(findings=[sparse, full])
+    path = str(tmp_path / 'findings.parquet')
+
+    result = manager.export_findings(path, partition_by='severity', severity_filter=['LOW', 'HIGH'],
+                                     max_workers=1)
+
+    parquet = pq.ParquetFile(path)
+    assert result['findings'] == 2
+    assert parquet.metadata.num_row_groups == 2
+    assert parquet.schema_arrow.names == FINDING_EXPORT_COLUMNS
+    assert str(parquet.schema_arrow.field('severity_normalized').type) == 'int64'
+    rows = {r['id']: r for r in parquet.read().to_pylist()}
+    assert rows['a']['title'] is None
+    assert (rows['b']['title'], rows['b']['types']) == ('Open bucket', '["Effects/Data Exposure"]')
+
+
+def test_empty_export_still_has_the_schema(tmp_path):
+    manager = EnterpriseSecurityHubManager()
+    manager._securityhub_client = FakeSecurityHub()
+    path = str(tmp_path / 'findings.parquet')
+
+    assert manager.export_findings(path)['findings'] == 0
+    assert pq.read_table(path).schema.names == FINDING_EXPORT_COLUMNS
+
+
+def test_partitions_cross_severity_with_region():
+    manager = EnterpriseSecurityHubManager()
+
+    partitions = manager._export_partitions(['region', 'severity'],
+                                            severity_filter=['CRITICAL', 'HIGH'],
+                                            regions=['us-east-1', 'eu-west-1'])
+
+    assert [(p['Region'][0]['Value'], p['SeverityLabel'][0]['Value']) for p in partitions] == [
+        ('us-east-1', 'CRITICAL'), ('us-east-1', 'HIGH'),
+        ('eu-west-1', 'CRITICAL'), ('eu-west-1', 'HIGH'),
+    ]
+
+
+def test_account_partitions_respect_the_filter_value_limit():
+    accounts = [f'{i:012d}' for i in range(45)]
+
+    partitions = EnterpriseSecurityHubManager()._export_partitions(['account'], account_ids=accounts)
+
+    assert [len(p['AwsAccountId']) for p in partitions] == [20, 20, 5]
+    assert [a['Value'] for p in partitions for a in p['AwsAccountId']] == accounts
+
+
+def test_unknown_partition_dimension_is_rejected():
+    with pytest.raises(ValueError):
+        EnterpriseSecurityHubManager()._export_partitions(['product'])
+
+
+def test_partitioned_paging_yields_every_finding_once():
+    client = FakeSecurityHub(findings=[finding(str(i), severity)
+                                       for i, severity in enumerate(SEVERITY_LABELS * 3)])
+    manager = EnterpriseSecurityHubManager()
+    manager._securityhub_client = client
+
+    pages = list(manager.iter_findings_partitioned(partition_by='severity', max_workers=3))
+
+    assert sorted(int(f['id']) for page in pages for f in page) == list(range(15))
+    assert len(pages) == len(SEVERITY_LABELS)
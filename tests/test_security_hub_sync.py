@@ -0,0 +1,131 @@
+"""Security Hub incremental sync: watermarks and per-hub scoping"""
+
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from security_hub_sync import SecurityHubFindingStore, SecurityHubSync
+
+pytestmark = pytest.mark.unit
+
+
+def finding(finding_id, updated_at, severity='HIGH', record_state='ACTIVE', account='111122223333'):
+    return {
+        'Id': finding_id,
+        'AwsAccountId': account,
+        'Region': 'us-east-1',
+        'UpdatedAt': updated_at,
+        'RecordState': record_state,
+        'Severity': {'Label': severity},
+        'Resources': [{'Type': 'AwsS3Bucket'}],
+    }
+
+
+class FakeSecurityHub:
+    """GetFindings client returning queued page lists and recording filters"""
+
+    def __init__(self, region='us-east-1', hub_account='999988887777'):
+        self.meta = SimpleNamespace(region_name=region)
+        self.hub_arn = f"arn:aws:securityhub:{region}:{hub_account}:hub/default"
+        self.responses = []
+        self.filters = []
+
+    def describe_hub(self):
+        return {'HubArn': self.hub_arn}
+
+    def get_paginator(self, operation):
+        assert operation == 'get_findings'
+        return self
+
+    def paginate(self, Filters, PaginationConfig):
+        self.filters.append(Filters)
+        return [{'Findings': page} for page in self.responses.pop(0)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SecurityHubFindingStore(str(tmp_path / 'findings.db'))
+
+
+def test_first_sync_is_full_then_incremental(store):
+    client = FakeSecurityHub()
+    client.responses = [
+        [[finding('a', '2026-01-01T00:00:00.000Z')], [finding('b', '2026-01-02T00:00:00.000Z')]],
+        [[finding('a', '2026-01-03T00:00:00.000Z', record_state='ARCHIVED')]],
+    ]
+    sync = SecurityHubSync(client, store)
+
+    first = sync.sync()
+    second = sync.sync()
+
+    assert first == {'mode': 'full', 'fetched': 2, 'watermark': '2026-01-02T00:00:00.000Z'}
+    assert client.filters[0] == {'RecordState': [{'Value': 'ACTIVE', 'Comparison': 'EQUALS'}]}
+    assert second['mode'] == 'incremental'
+    assert client.filters[1]['UpdatedAt'][0]['Start'] == '2026-01-01T23:00:00.000000Z'
+    assert [f['Id'] for f in sync.iter_findings()] == ['b']
+
+
+def test_older_copy_does_not_overwrite_newer(store):
+    store.upsert_findings([finding('a', '2026-01-02T00:00:00.000Z', severity='LOW')], '1', 'us-east-1')
+    store.upsert_findings([finding('a', '2026-01-01T00:00:00.000Z', severity='CRITICAL')], '1', 'us-east-1')
+
+    assert [f['Severity']['Label'] for f in store.iter_findings('1', 'us-east-1')] == ['LOW']
+
+
+def test_hub_account_read_from_hub_arn(store):
+    sync = SecurityHubSync(FakeSecurityHub(hub_account='999988887777'), store)
+
+    assert sync.account_id == '999988887777'
+    assert sync.scope == 'securityhub:999988887777:us-east-1'
+    assert SecurityHubSync(FakeSecurityHub(), store, account_id='123').scope == 'securityhub:123:us-east-1'
+
+
+def test_hubs_in_other_accounts_keep_separate_findings_and_watermarks(store):
+    first_client = FakeSecurityHub(hub_account='111111111111')
+    second_client = FakeSecurityHub(hub_account='222222222222')
+    first_client.responses = [[[finding('shared-id', '2026-01-05T00:00:00.000Z', severity='CRITICAL')]]]
+    second_client.responses = [[[finding('shared-id', '2026-01-01T00:00:00.000Z', severity='LOW')]]]
+    first = SecurityHubSync(first_client, store)
+    second = SecurityHubSync(second_client, store)
+
+    first.sync()
+    result = second.sync()
+
+    assert result['mode'] == 'full'
+    assert [f['Severity']['Label'] for f in first.iter_findings()] == ['CRITICAL']
+    assert [f['Severity']['Label'] for f in second.iter_findings()] == ['LOW']
+
+
+def test_store_filters_and_orders_by_severity(store):
+    store.upsert_findings([
+        finding('low', '2026-01-01T00:00:00.000Z', severity='LOW'),
+        finding('critical', '2026-01-01T00:00:00.000Z', severity='CRITICAL'),
+        finding('medium', '2026-01-01T00:00:00.000Z', severity='MEDIUM', account='444455556666'),
+    ], '1', 'us-east-1')
+
+    def ids(**filters):
+        return [f['Id'] for f in store.iter_findings('1', 'us-east-1', **filters)]
+
+    assert ids() == ['critical', 'medium', 'low']
+    assert ids(sort_order='asc') == ['low', 'medium', 'critical']
+    assert ids(severity_filter=['LOW', 'MEDIUM']) == ['medium', 'low']
+    assert ids(account_ids=['444455556666']) == ['medium']
+    assert ids(max_results=1) == ['critical']
+
+
+def test_unscoped_store_is_rebuilt(tmp_path):
+    path = str(tmp_path / 'findings.db')
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE securityhub_findings (id TEXT PRIMARY KEY, finding_json TEXT NOT NULL);
+        CREATE TABLE securityhub_sync_state (scope TEXT PRIMARY KEY, watermark TEXT);
+        INSERT INTO securityhub_sync_state VALUES ('securityhub:us-east-1', '2026-01-01T00:00:00Z');
+    """)
+    conn.close()
+
+    store = SecurityHubFindingStore(path)
+
+    assert store.get_watermark('securityhub:us-east-1') is None
+    store.upsert_findings([finding('a', '2026-01-01T00:00:00.000Z')], '1', 'us-east-1')
+    assert [f['Id'] for f in store.iter_findings('1', 'us-east-1')] == ['a']
@@ -0,0 +1,69 @@
+"""SQLiteConnectionPool reuse, bounds, transaction cleanup and WAL reads"""
+
+import threading
+
+import pytest
+
+from sqlite_pool import PoolConfig, SQLiteConnectionPool, get_connection_pool
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = SQLiteConnectionPool(str(tmp_path / 'pool.db'), PoolConfig(max_connections=2,
+                                                                      timeout_seconds=0.2))
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE items (name TEXT)")
+    yield pool
+    pool.close_all()
+
+
+def count(pool):
+    with pool.connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+def test_connections_are_reused_in_wal_mode(pool):
+    with pool.connection() as first:
+        assert first.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    with pool.connection() as second:
+        assert second is first
+    assert pool.stats() == {'created': 1, 'idle': 1}
+
+
+def test_pool_is_bounded(pool):
+    with pool.connection(), pool.connection():
+        with pytest.raises(TimeoutError):
+            with pool.connection():
+                pass
+
+
+def test_uncommitted_transaction_is_rolled_back_on_return(pool):
+    with pool.connection() as conn:
+        conn.execute("INSERT INTO items VALUES ('draft')")
+
+    assert count(pool) == 0
+
+
+def test_readers_are_not_blocked_by_an_open_write(pool):
+    with pool.connection() as writer:
+        writer.execute("INSERT INTO items VALUES ('pending')")
+        counts = []
+        reader = threading.Thread(target=lambda: counts.append(count(pool)))
+        reader.start()
+        reader.join(1)
+        writer.commit()
+
+    assert counts == [0]
+    assert count(pool) == 1
+
+
+def test_one_shared_pool_per_database_file(tmp_path):
+    path = str(tmp_path / 'shared.db')
+
+    pool = get_connection_pool(path)
+    assert get_connection_pool(str(tmp_path / '.' / 'shared.db')) is pool
+
+    pool.close_all()
+    assert get_connection_pool(path) is not pool
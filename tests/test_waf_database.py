@@ -0,0 +1,82 @@
+"""WAFDatabase finding-history storage and schema migration"""
+
+import pytest
+
+from waf_database import WAFDatabase
+
+pytestmark = pytest.mark.unit
+
+
+def scan(scan_id, *findings, account_id='111'):
+    return {'scan_id': scan_id, 'account_id': account_id, 'findings': list(findings)}
+
+
+def history(db):
+    with db.get_connection() as conn:
+        return [dict(r) for r in conn.execute("""
+            SELECT finding_id, account_id, scan_id, severity, status, first_seen, last_seen
+            FROM finding_history ORDER BY finding_id, account_id
+        """)]
+
+
+def test_repeat_scans_keep_one_row_per_finding_and_account(tmp_path):
+    db = WAFDatabase(str(tmp_path / 'waf.db'))
+    db.store_scan(scan('s1', {'id': 'f1', 'severity': 'HIGH'}, {'id': 'f2', 'severity': 'LOW'}))
+    db.store_scan(scan('s2', {'id': 'f1', 'severity': 'CRITICAL'}))
+    db.store_scan(scan('s3', {'id': 'f1', 'severity': 'HIGH'}, account_id='222'))
+
+    rows = history(db)
+
+    assert [(r['finding_id'], r['account_id'], r['scan_id'], r['severity']) for r in rows] == [
+        ('f1', '111', 's2', 'CRITICAL'),
+        ('f1', '222', 's3', 'HIGH'),
+        ('f2', '111', 's1', 'LOW'),
+    ]
+    assert rows[0]['first_seen'] < rows[0]['last_seen']
+
+
+def test_resolved_finding_seen_again_is_reopened(tmp_path):
+    db = WAFDatabase(str(tmp_path / 'waf.db'))
+    db.store_scan(scan('s1', {'id': 'f1'}))
+    db.update_finding_status('f1', 'resolved', 'ops@example.com')
+
+    db.store_scan(scan('s2', {'id': 'f1'}))
+
+    assert [r['status'] for r in history(db)] == ['reopened']
+
+
+def legacy_rows(path, rows):
+    """Recreate a pre-upsert database holding one finding_history row per scan"""
+    db = WAFDatabase(path)
+    with db.get_connection() as conn:
+        conn.execute("DROP INDEX idx_finding_history_finding_account")
+        conn.executemany("""
+            INSERT INTO finding_history (
+                finding_id, scan_id, account_id, status, first_seen, last_seen, false_positive
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+
+def test_migration_merges_and_archives_duplicate_history(tmp_path):
+    path = str(tmp_path / 'waf.db')
+    legacy_rows(path, [
+        ('f1', 's1', '111', 'open', '2026-01-01', '2026-01-01', 1),
+        ('f1', 's2', '111', 'open', '2026-01-02', '2026-01-02', 0),
+        ('f1', 's3', '111', 'resolved', '2026-01-03', '2026-01-03', 0),
+        ('f1', 's3', '222', 'open', '2026-01-03', '2026-01-03', 0),
+    ])
+
+    db = WAFDatabase(path)
+
+    with db.get_connection() as conn:
+        rows = conn.execute("""
+            SELECT account_id, scan_id, status, first_seen, last_seen, false_positive
+            FROM finding_history ORDER BY account_id
+        """).fetchall()
+        archived = conn.execute(
+            "SELECT scan_id FROM finding_history_archive ORDER BY scan_id").fetchall()
+    assert [tuple(r) for r in rows] == [
+        ('111', 's3', 'resolved', '2026-01-01', '2026-01-03', 1),
+        ('222', 's3', 'open', '2026-01-03', '2026-01-03', 0),
+    ]
+    assert [r['scan_id'] for r in archived] == ['s1', 's2']
@@ -0,0 +1,75 @@
+"""Multi-account scan scheduler: bounded parallelism, ordering and timeouts"""
+
+import threading
+import time
+
+import pytest
+import streamlit as st
+
+import waf_scanner_integrated as scanner
+
+pytestmark = pytest.mark.unit
+
+ACCOUNTS = [{'account_name': f'acct-{i}', 'account_id': f'11112222333{i}'} for i in range(4)]
+
+
+@pytest.fixture
+def shown(monkeypatch):
+    """Results passed to the results view"""
+    displayed = []
+    monkeypatch.setattr(scanner, 'display_multi_account_results', displayed.append)
+    monkeypatch.setattr(scanner, '_SCHEDULER_POLL_SECONDS', 0.01)
+    st.session_state.connected_accounts = ACCOUNTS
+    yield displayed
+    del st.session_state['connected_accounts']
+
+
+def run(accounts, parallel_scans, **kwargs):
+    selected = [f"{a['account_name']} ({a['account_id']})" for a in accounts]
+    scanner.run_enhanced_multi_account_scan(
+        selected, 'Standard', [], 'Demo', 'us-east-1', parallel_scans,
+        enable_ai=False, enable_waf_mapping=False, generate_consolidated_pdf=False,
+        cross_account_analysis=False, **kwargs
+    )
+
+
+def test_accounts_run_on_a_bounded_pool_and_keep_selection_order(shown, monkeypatch):
+    lock, active, peak = threading.Lock(), [0], [0]
+
+    def job(account, session, scan_mode, scan_depth, waf_pillars, scan_region, enable_ai,
+            enable_waf_mapping, status_buffer, started, incremental, cancelled):
+        started.set()
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05 if account is ACCOUNTS[0] else 0.01)  # first account finishes last
+        with lock:
+            active[0] -= 1
+        return {'account_id': account['account_id'], 'findings': [{'title': 'x'}]}
+
+    monkeypatch.setattr(scanner, '_scan_account_job', job)
+
+    run(ACCOUNTS, parallel_scans=2)
+
+    assert peak[0] == 2
+    assert list(shown[0]) == [a['account_id'] for a in ACCOUNTS]
+
+
+def test_slow_account_times_out_and_is_told_to_stop(shown, monkeypatch):
+    stopped = threading.Event()
+
+    def job(account, session, scan_mode, scan_depth, waf_pillars, scan_region, enable_ai,
+            enable_waf_mapping, status_buffer, started, incremental, cancelled):
+        started.set()
+        if account is ACCOUNTS[0] and cancelled.wait(5):
+            stopped.set()
+        return {'account_id': account['account_id'], 'findings': []}
+
+    monkeypatch.setattr(scanner, '_scan_account_job', job)
+
+    run(ACCOUNTS[:2], parallel_scans=2, account_timeout=0.1)
+
+    results = shown[0]
+    assert results[ACCOUNTS[0]['account_id']]['status'] == 'Timed Out'
+    assert 'status' not in results[ACCOUNTS[1]['account_id']]
+    assert stopped.wait(1)
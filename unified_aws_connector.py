@@ -26,6 +26,8 @@ import logging
 import json
 import time
 
+from scoring_engine import FindingsTable
+
 logger = logging.getLogger(__name__)
 
 # ============================================================================
@@ -1090,44 +1092,29 @@ class UnifiedAWSConnector:
         if findings is None:
             findings = list(self.get_findings(max_results=1000))
         
-        # Initialize pillar data
+        pillars = [pillar.value for pillar in WAFPillar]
+        table = FindingsTable.from_findings(
+            findings,
+            pillar='waf_pillar',
+            default_pillar=WAFPillar.SECURITY.value,
+            default_severity='LOW',
+        )
+        counts = table.severity_matrix(pillars)
+        totals = table.pillar_totals(pillars)
+        scores = table.pillar_scores({'CRITICAL': 10, 'HIGH': 5, 'MEDIUM': 2, 'LOW': 0.5}, pillars)
+        
         pillar_data = {
-            pillar.value: {
-                'findings_count': 0,
-                'critical_count': 0,
-                'high_count': 0,
-                'medium_count': 0,
-                'low_count': 0,
-                'score': 100  # Start at 100, deduct for issues
+            pillar: {
+                'findings_count': int(totals[pillar]),
+                'critical_count': int(counts.at[pillar, 'CRITICAL']),
+                'high_count': int(counts.at[pillar, 'HIGH']),
+                'medium_count': int(counts.at[pillar, 'MEDIUM']),
+                'low_count': int(counts.at[pillar, 'LOW']),
+                'score': float(scores[pillar])
             }
-            for pillar in WAFPillar
+            for pillar in pillars
         }
         
-        # Count findings per pillar
-        for finding in findings:
-            pillar = finding.get('waf_pillar', WAFPillar.SECURITY.value)
-            severity = finding.get('severity', 'LOW')
-            
-            if pillar in pillar_data:
-                pillar_data[pillar]['findings_count'] += 1
-                
-                if severity == 'CRITICAL':
-                    pillar_data[pillar]['critical_count'] += 1
-                    pillar_data[pillar]['score'] -= 10
-                elif severity == 'HIGH':
-                    pillar_data[pillar]['high_count'] += 1
-                    pillar_data[pillar]['score'] -= 5
-                elif severity == 'MEDIUM':
-                    pillar_data[pillar]['medium_count'] += 1
-                    pillar_data[pillar]['score'] -= 2
-                elif severity == 'LOW':
-                    pillar_data[pillar]['low_count'] += 1
-                    pillar_data[pillar]['score'] -= 0.5
-        
-        # Normalize scores (min 0, max 100)
-        for pillar in pillar_data:
-            pillar_data[pillar]['score'] = max(0, min(100, pillar_data[pillar]['score']))
-        
         # Calculate overall score
         weights = self._pillar_mapper.get_pillar_weights()
         overall_score = sum(
@@ -25,6 +25,8 @@ from enum import Enum
 import hashlib
 import io
 
+from scoring_engine import FindingsTable, UNMAPPED_PILLAR
+
 # ============================================================================
 # ENUMS & CONSTANTS
 # ============================================================================
@@ -211,73 +213,62 @@ class DashboardDataAggregator:
             return finding.get('pillar', '')
         return getattr(finding, 'pillar', '')
     
+    # Service to pillar mapping for findings without explicit pillar
+    SERVICE_PILLAR_MAP = {
+        'IAM': WAFPillar.SECURITY,
+        'S3': WAFPillar.SECURITY,
+        'EC2': WAFPillar.RELIABILITY,
+        'RDS': WAFPillar.RELIABILITY,
+        'VPC': WAFPillar.SECURITY,
+        'Lambda': WAFPillar.OPERATIONAL_EXCELLENCE,
+        'CloudWatch': WAFPillar.OPERATIONAL_EXCELLENCE,
+        'CloudTrail': WAFPillar.SECURITY,
+        'KMS': WAFPillar.SECURITY,
+        'ELB': WAFPillar.RELIABILITY,
+        'AutoScaling': WAFPillar.RELIABILITY,
+        'DynamoDB': WAFPillar.RELIABILITY,
+        'EKS': WAFPillar.OPERATIONAL_EXCELLENCE,
+        'ECS': WAFPillar.OPERATIONAL_EXCELLENCE,
+        'SNS': WAFPillar.OPERATIONAL_EXCELLENCE,
+        'SQS': WAFPillar.OPERATIONAL_EXCELLENCE,
+        'Secrets Manager': WAFPillar.SECURITY,
+        'Config': WAFPillar.OPERATIONAL_EXCELLENCE,
+        'GuardDuty': WAFPillar.SECURITY,
+        'Security Hub': WAFPillar.SECURITY,
+        'Cost': WAFPillar.COST_OPTIMIZATION,
+        'Budget': WAFPillar.COST_OPTIMIZATION,
+        'Backup': WAFPillar.RELIABILITY,
+    }
+    
+    def _resolve_pillar(self, pillar_key, service) -> str:
+        """Pillar name for a finding's pillar field, inferred from its service if not set ('' if unknown)"""
+        pillar = self._normalize_pillar_key(pillar_key)
+        if not pillar and service:
+            pillar = self.SERVICE_PILLAR_MAP.get(service)
+        return pillar.value if pillar else ''
+    
     def _calculate_scores_from_findings(self, findings) -> Dict[WAFPillar, int]:
         """Calculate WAF pillar scores based on findings severity - FIXED to handle missing pillar"""
-        pillar_scores = {p: 100 for p in WAFPillar}  # Start at 100
-        
-        # Service to pillar mapping for findings without explicit pillar
-        service_pillar_map = {
-            'IAM': WAFPillar.SECURITY,
-            'S3': WAFPillar.SECURITY,
-            'EC2': WAFPillar.RELIABILITY,
-            'RDS': WAFPillar.RELIABILITY,
-            'VPC': WAFPillar.SECURITY,
-            'Lambda': WAFPillar.OPERATIONAL_EXCELLENCE,
-            'CloudWatch': WAFPillar.OPERATIONAL_EXCELLENCE,
-            'CloudTrail': WAFPillar.SECURITY,
-            'KMS': WAFPillar.SECURITY,
-            'ELB': WAFPillar.RELIABILITY,
-            'AutoScaling': WAFPillar.RELIABILITY,
-            'DynamoDB': WAFPillar.RELIABILITY,
-            'EKS': WAFPillar.OPERATIONAL_EXCELLENCE,
-            'ECS': WAFPillar.OPERATIONAL_EXCELLENCE,
-            'SNS': WAFPillar.OPERATIONAL_EXCELLENCE,
-            'SQS': WAFPillar.OPERATIONAL_EXCELLENCE,
-            'Secrets Manager': WAFPillar.SECURITY,
-            'Config': WAFPillar.OPERATIONAL_EXCELLENCE,
-            'GuardDuty': WAFPillar.SECURITY,
-            'Security Hub': WAFPillar.SECURITY,
-            'Cost': WAFPillar.COST_OPTIMIZATION,
-            'Budget': WAFPillar.COST_OPTIMIZATION,
-            'Backup': WAFPillar.RELIABILITY,
-        }
+        pillars = [p.value for p in WAFPillar]
+        table = FindingsTable.from_findings(findings, pillar_resolver=self._resolve_pillar)
         
-        for finding in findings:
-            severity = self._get_severity(finding)
-            pillar_str = self._get_pillar(finding)
-            pillar = self._normalize_pillar_key(pillar_str)
-            
-            # If no pillar, try to infer from service
-            if not pillar:
-                service = finding.get('service', '') if isinstance(finding, dict) else getattr(finding, 'service', '')
-                if service:
-                    pillar = service_pillar_map.get(service)
-            
-            # If still no pillar, distribute penalty across Security and Operational Excellence
-            if not pillar:
-                # Calculate penalty
-                if severity == 'CRITICAL':
-                    penalty = 8  # Split across 2 pillars
-                elif severity == 'HIGH':
-                    penalty = 5
-                elif severity == 'MEDIUM':
-                    penalty = 3
-                else:
-                    penalty = 1
-                
-                # Apply to Security and Operational Excellence (most common)
-                pillar_scores[WAFPillar.SECURITY] = max(0, pillar_scores[WAFPillar.SECURITY] - penalty)
-                pillar_scores[WAFPillar.OPERATIONAL_EXCELLENCE] = max(0, pillar_scores[WAFPillar.OPERATIONAL_EXCELLENCE] - penalty)
-            else:
-                # Deduct points based on severity for specific pillar
-                if severity == 'CRITICAL':
-                    pillar_scores[pillar] = max(0, pillar_scores[pillar] - 15)
-                elif severity == 'HIGH':
-                    pillar_scores[pillar] = max(0, pillar_scores[pillar] - 10)
-                elif severity == 'MEDIUM':
-                    pillar_scores[pillar] = max(0, pillar_scores[pillar] - 5)
-                elif severity == 'LOW':
-                    pillar_scores[pillar] = max(0, pillar_scores[pillar] - 2)
+        # Deduct points based on severity for specific pillar
+        scores = table.pillar_scores({'CRITICAL': 15, 'HIGH': 10, 'MEDIUM': 5, 'LOW': 2}, pillars)
+        
+        # Findings with no pillar are penalized on both Security and
+        # Operational Excellence (most common); any other severity costs 1
+        unmapped = table.severity_matrix([UNMAPPED_PILLAR]).loc[UNMAPPED_PILLAR]
+        unmapped_total = int(table.pillar_totals([UNMAPPED_PILLAR])[UNMAPPED_PILLAR])
+        unmapped_other = unmapped_total - int(unmapped['CRITICAL'] + unmapped['HIGH'] + unmapped['MEDIUM'])
+        unmapped_penalty = (8 * unmapped['CRITICAL'] + 5 * unmapped['HIGH'] +
+                            3 * unmapped['MEDIUM'] + unmapped_other)
+        
+        pillar_scores = {}
+        for pillar in WAFPillar:
+            score = scores[pillar.value]
+            if pillar in (WAFPillar.SECURITY, WAFPillar.OPERATIONAL_EXCELLENCE):
+                score -= unmapped_penalty
+            pillar_scores[pillar] = int(max(0, score))
         
         return pillar_scores
     
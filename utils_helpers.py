@@ -5,6 +5,7 @@ Helper Utilities
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 import streamlit as st
+from llm_gateway import create_message
 
 class Helpers:
     """General helper functions"""
@@ -215,7 +216,7 @@ class AnthropicHelper:
                 full_prompt = prompt
             
             # Call Claude API
-            message = self.client.messages.create(
+            message = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 messages=[
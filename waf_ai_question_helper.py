@@ -12,6 +12,7 @@ import json
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
+from llm_gateway import create_message
 
 # ============================================================================
 # CONFIGURATION
@@ -490,7 +491,7 @@ Be specific to AWS services and provide actionable guidance."""
 
         try:
             if self.provider == AIProvider.ANTHROPIC:
-                response = self.client.messages.create(
+                response = create_message(self.client,
                     model="claude-sonnet-4-20250514",
                     max_tokens=2000,
                     messages=[{"role": "user", "content": prompt}]
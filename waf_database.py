@@ -10,6 +10,16 @@ from typing import List, Dict, Optional, Tuple
 import pandas as pd
 from contextlib import contextmanager
 
+from sqlite_pool import get_connection_pool
+
+try:
+    from logging_config import get_logger
+except ImportError:
+    import logging
+    def get_logger(name): return logging.getLogger(name)
+
+logger = get_logger(__name__)
+
 
 class WAFDatabase:
     """Comprehensive database for WAF scanner with historical tracking"""
@@ -18,19 +28,21 @@ class WAFDatabase:
         self.db_path = db_path
         self.init_database()
     
+    @property
+    def pool(self):
+        """Shared connection pool for this database file"""
+        return get_connection_pool(self.db_path)
+    
     @contextmanager
     def get_connection(self):
-        """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+        """Context manager for pooled database connections (one transaction per block)"""
+        with self.pool.connection() as conn:
+            try:
+                yield conn
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                raise e
     
     def init_database(self):
         """Initialize all database tables"""
@@ -55,9 +67,7 @@ class WAFDatabase:
                     resources_scanned INTEGER,
                     scan_type TEXT,
                     user_email TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_account_date (account_id, scan_date),
-                    INDEX idx_scan_date (scan_date)
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
             
@@ -86,10 +96,7 @@ class WAFDatabase:
                     remediation_effort TEXT,
                     compliance_frameworks TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (scan_id) REFERENCES scan_history(scan_id),
-                    INDEX idx_finding_id (finding_id),
-                    INDEX idx_status (status),
-                    INDEX idx_severity (severity)
+                    FOREIGN KEY (scan_id) REFERENCES scan_history(scan_id)
                 )
             """)
             
@@ -106,8 +113,7 @@ class WAFDatabase:
                     medium_count INTEGER DEFAULT 0,
                     low_count INTEGER DEFAULT 0,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (scan_id) REFERENCES scan_history(scan_id),
-                    INDEX idx_pillar (pillar)
+                    FOREIGN KEY (scan_id) REFERENCES scan_history(scan_id)
                 )
             """)
             
@@ -122,9 +128,7 @@ class WAFDatabase:
                     due_date TIMESTAMP,
                     priority TEXT DEFAULT 'normal',
                     status TEXT DEFAULT 'assigned',
-                    notes TEXT,
-                    INDEX idx_assigned_to (assigned_to),
-                    INDEX idx_finding_id (finding_id)
+                    notes TEXT
                 )
             """)
             
@@ -137,8 +141,7 @@ class WAFDatabase:
                     comment_text TEXT NOT NULL,
                     timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     edited BOOLEAN DEFAULT 0,
-                    edited_timestamp TIMESTAMP,
-                    INDEX idx_finding_id (finding_id)
+                    edited_timestamp TIMESTAMP
                 )
             """)
             
@@ -151,8 +154,7 @@ class WAFDatabase:
                     new_status TEXT NOT NULL,
                     updated_by TEXT NOT NULL,
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    notes TEXT,
-                    INDEX idx_finding_id (finding_id)
+                    notes TEXT
                 )
             """)
             
@@ -170,9 +172,7 @@ class WAFDatabase:
                     backup_id TEXT,
                     terraform_plan TEXT,
                     verification_status TEXT,
-                    error_message TEXT,
-                    INDEX idx_finding_id (finding_id),
-                    INDEX idx_status (action_status)
+                    error_message TEXT
                 )
             """)
             
@@ -185,9 +185,7 @@ class WAFDatabase:
                     requirement_id TEXT NOT NULL,
                     requirement_description TEXT,
                     severity_impact TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_finding_type (finding_type),
-                    INDEX idx_framework (framework)
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
             
@@ -202,8 +200,7 @@ class WAFDatabase:
                     risk_cost REAL DEFAULT 0,
                     total_impact REAL DEFAULT 0,
                     calculation_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (scan_id) REFERENCES scan_history(scan_id),
-                    INDEX idx_scan_id (scan_id)
+                    FOREIGN KEY (scan_id) REFERENCES scan_history(scan_id)
                 )
             """)
             
@@ -219,9 +216,7 @@ class WAFDatabase:
                     target_resource_type TEXT,
                     target_service TEXT,
                     dependency_type TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    INDEX idx_source (source_resource_id),
-                    INDEX idx_target (target_resource_id)
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
             
@@ -236,9 +231,7 @@ class WAFDatabase:
                     sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                     delivery_status TEXT DEFAULT 'pending',
                     channel TEXT,
-                    metadata TEXT,
-                    INDEX idx_recipient (recipient),
-                    INDEX idx_type (notification_type)
+                    metadata TEXT
                 )
             """)
             
@@ -258,6 +251,62 @@ class WAFDatabase:
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            
+            # Resource fingerprints for incremental scans
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS resource_fingerprints (
+                    scanner TEXT NOT NULL,
+                    account_id TEXT NOT NULL,
+                    region TEXT NOT NULL,
+                    resource_type TEXT NOT NULL,
+                    resource_id TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    findings_json TEXT,
+                    counters_json TEXT,
+                    updated_at TIMESTAMP,
+                    scanned_at TIMESTAMP,
+                    PRIMARY KEY (scanner, account_id, region, resource_type, resource_id)
+                )
+            """)
+            cursor.execute("PRAGMA table_info(resource_fingerprints)")
+            if 'scanned_at' not in {row[1] for row in cursor.fetchall()}:
+                cursor.execute("ALTER TABLE resource_fingerprints ADD COLUMN scanned_at TIMESTAMP")
+            
+            # One lifecycle row per finding and account (upsert target)
+            cursor.execute("""
+                SELECT 1 FROM sqlite_master
+                WHERE type = 'index' AND name = 'idx_finding_history_finding_account'
+            """)
+            if cursor.fetchone() is None:
+                self._merge_duplicate_findings(cursor)
+                cursor.execute("""
+                    CREATE UNIQUE INDEX idx_finding_history_finding_account
+                    ON finding_history (finding_id, account_id)
+                """)
+            
+            # Indexes (SQLite has no inline INDEX clause; names are database-wide)
+            for index in (
+                "idx_scan_history_account_date ON scan_history (account_id, scan_date)",
+                "idx_scan_history_scan_date ON scan_history (scan_date)",
+                "idx_finding_history_finding_id ON finding_history (finding_id)",
+                "idx_finding_history_status ON finding_history (status)",
+                "idx_finding_history_severity ON finding_history (severity)",
+                "idx_pillar_scores_history_pillar ON pillar_scores_history (pillar)",
+                "idx_assignments_assigned_to ON assignments (assigned_to)",
+                "idx_assignments_finding_id ON assignments (finding_id)",
+                "idx_comments_finding_id ON comments (finding_id)",
+                "idx_status_updates_finding_id ON status_updates (finding_id)",
+                "idx_remediation_actions_finding_id ON remediation_actions (finding_id)",
+                "idx_remediation_actions_status ON remediation_actions (action_status)",
+                "idx_compliance_mappings_finding_type ON compliance_mappings (finding_type)",
+                "idx_compliance_mappings_framework ON compliance_mappings (framework)",
+                "idx_cost_impact_history_scan_id ON cost_impact_history (scan_id)",
+                "idx_resource_dependencies_source ON resource_dependencies (source_resource_id)",
+                "idx_resource_dependencies_target ON resource_dependencies (target_resource_id)",
+                "idx_notifications_recipient ON notifications (recipient)",
+                "idx_notifications_type ON notifications (notification_type)",
+            ):
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {index}")
     
     # ==================== SCAN HISTORY METHODS ====================
     
@@ -295,13 +344,13 @@ class WAFDatabase:
             ))
             
             # Store pillar scores
-            for pillar, data in scan_result.get('pillar_distribution', {}).items():
-                cursor.execute("""
-                    INSERT INTO pillar_scores_history (
-                        scan_id, pillar, score, findings_count,
-                        critical_count, high_count, medium_count, low_count
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            cursor.executemany("""
+                INSERT INTO pillar_scores_history (
+                    scan_id, pillar, score, findings_count,
+                    critical_count, high_count, medium_count, low_count
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     scan_id,
                     pillar,
                     data.get('score', 0),
@@ -310,58 +359,115 @@ class WAFDatabase:
                     data.get('high', 0),
                     data.get('medium', 0),
                     data.get('low', 0)
-                ))
+                )
+                for pillar, data in scan_result.get('pillar_distribution', {}).items()
+            ])
             
             # Store findings
-            for finding in scan_result.get('findings', []):
-                self._store_finding(cursor, scan_id, scan_result['account_id'], finding)
+            self._upsert_findings(cursor, scan_id, scan_result['account_id'],
+                                  scan_result.get('findings', []))
             
             return scan_id
     
-    def _store_finding(self, cursor, scan_id: str, account_id: str, finding: Dict):
-        """Store individual finding with lifecycle tracking"""
-        finding_id = finding.get('id', finding.get('finding_id'))
-        
-        # Check if finding exists
+    def _merge_duplicate_findings(self, cursor):
+        """
+        Collapse finding_history to one row per (finding_id, account_id).
+
+        Databases written before findings were upserted hold one row per
+        scan. The latest row of each finding survives, taking the earliest
+        first_seen and any false-positive/ignored flag of its duplicates;
+        the other rows are copied to finding_history_archive, then removed.
+        Runs in its own savepoint so a failure leaves the table untouched.
+        """
         cursor.execute("""
-            SELECT id, first_seen FROM finding_history 
-            WHERE finding_id = ? AND account_id = ?
-        """, (finding_id, account_id))
-        
-        existing = cursor.fetchone()
-        
-        compliance_frameworks = json.dumps(finding.get('compliance_frameworks', []))
-        
-        if existing:
-            # Update existing finding
+            SELECT COUNT(*) - COUNT(DISTINCT finding_id || '|' || account_id)
+            FROM finding_history WHERE finding_id IS NOT NULL
+        """)
+        duplicates = cursor.fetchone()[0]
+        if not duplicates:
+            return
+
+        cursor.execute("SAVEPOINT merge_finding_history")
+        try:
             cursor.execute("""
-                UPDATE finding_history 
-                SET last_seen = ?, scan_id = ?, severity = ?, 
-                    status = CASE WHEN status = 'resolved' THEN 'reopened' ELSE status END,
-                    estimated_savings = ?, risk_cost = ?,
-                    compliance_frameworks = ?
-                WHERE finding_id = ? AND account_id = ?
-            """, (
-                datetime.now(),
-                scan_id,
-                finding.get('severity'),
-                finding.get('estimated_savings', 0),
-                finding.get('risk_cost', 0),
-                compliance_frameworks,
-                finding_id,
-                account_id
-            ))
-        else:
-            # Insert new finding
+                CREATE TEMP TABLE finding_history_survivors AS
+                SELECT MAX(id) AS id, finding_id, account_id,
+                       MIN(first_seen) AS first_seen,
+                       MAX(false_positive) AS false_positive,
+                       MAX(ignored) AS ignored
+                FROM finding_history
+                WHERE finding_id IS NOT NULL
+                GROUP BY finding_id, account_id
+                HAVING COUNT(*) > 1
+            """)
             cursor.execute("""
-                INSERT INTO finding_history (
-                    finding_id, scan_id, account_id, service, resource,
-                    severity, title, description, pillar, status,
-                    first_seen, last_seen, estimated_savings, risk_cost,
-                    remediation_effort, compliance_frameworks
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                finding_id,
+                UPDATE finding_history SET
+                    first_seen = (SELECT s.first_seen FROM finding_history_survivors s
+                                  WHERE s.id = finding_history.id),
+                    false_positive = (SELECT s.false_positive FROM finding_history_survivors s
+                                      WHERE s.id = finding_history.id),
+                    ignored = (SELECT s.ignored FROM finding_history_survivors s
+                               WHERE s.id = finding_history.id)
+                WHERE id IN (SELECT id FROM finding_history_survivors)
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS finding_history_archive AS
+                SELECT * FROM finding_history WHERE 0
+            """)
+            duplicate_rows = """
+                SELECT fh.id FROM finding_history fh
+                JOIN finding_history_survivors s
+                  ON s.finding_id = fh.finding_id AND s.account_id = fh.account_id
+                WHERE fh.id <> s.id
+            """
+            cursor.execute(f"""
+                INSERT INTO finding_history_archive
+                SELECT * FROM finding_history WHERE id IN ({duplicate_rows})
+            """)
+            cursor.execute(f"DELETE FROM finding_history WHERE id IN ({duplicate_rows})")
+            merged = cursor.rowcount
+            cursor.execute("SELECT COUNT(*) FROM finding_history_survivors")
+            findings = cursor.fetchone()[0]
+            cursor.execute("DROP TABLE finding_history_survivors")
+            cursor.execute("RELEASE merge_finding_history")
+        except sqlite3.Error:
+            cursor.execute("ROLLBACK TO merge_finding_history")
+            cursor.execute("RELEASE merge_finding_history")
+            raise
+
+        logger.warning(
+            f"Merged {merged} duplicate finding_history rows into {findings} findings; "
+            f"the merged rows were archived to finding_history_archive"
+        )
+
+    def _upsert_findings(self, cursor, scan_id: str, account_id: str, findings: List[Dict]):
+        """
+        Store findings with lifecycle tracking in one batched upsert.
+        
+        New findings are inserted as open; findings already known for the
+        account get last_seen/scan/severity/cost refreshed, and resolved
+        ones are reopened.
+        """
+        now = datetime.now()
+        cursor.executemany("""
+            INSERT INTO finding_history (
+                finding_id, scan_id, account_id, service, resource,
+                severity, title, description, pillar, status,
+                first_seen, last_seen, estimated_savings, risk_cost,
+                remediation_effort, compliance_frameworks
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 'open', ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (finding_id, account_id) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                scan_id = excluded.scan_id,
+                severity = excluded.severity,
+                status = CASE WHEN finding_history.status = 'resolved'
+                              THEN 'reopened' ELSE finding_history.status END,
+                estimated_savings = excluded.estimated_savings,
+                risk_cost = excluded.risk_cost,
+                compliance_frameworks = excluded.compliance_frameworks
+        """, [
+            (
+                finding.get('id', finding.get('finding_id')),
                 scan_id,
                 account_id,
                 finding.get('service'),
@@ -370,14 +476,15 @@ class WAFDatabase:
                 finding.get('title'),
                 finding.get('description'),
                 finding.get('pillar'),
-                'open',
-                datetime.now(),
-                datetime.now(),
+                now,
+                now,
                 finding.get('estimated_savings', 0),
                 finding.get('risk_cost', 0),
                 finding.get('remediation_effort'),
-                compliance_frameworks
-            ))
+                json.dumps(finding.get('compliance_frameworks', []))
+            )
+            for finding in findings
+        ])
     
     def get_trend_data(self, account_id: str, days: int = 30) -> pd.DataFrame:
         """Get trend data for specified period"""
@@ -614,10 +721,53 @@ class WAFDatabase:
             """, params)
             
             return dict(cursor.fetchone())
-    
+
+    # ==================== INCREMENTAL SCAN METHODS ====================
+
+    def get_resource_fingerprints(self, scanner: str, account_id: str) -> List[Dict]:
+        """Get resource fingerprints a scanner stored for an account"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT region, resource_type, resource_id, fingerprint,
+                       findings_json, counters_json, updated_at, scanned_at
+                FROM resource_fingerprints
+                WHERE scanner = ? AND account_id = ?
+            """, (scanner, account_id))
+
+            return [dict(row) for row in cursor.fetchall()]
+
+    def save_resource_fingerprints(self, scanner: str, account_id: str, records: List) -> int:
+        """
+        Replace fingerprints for the (region, resource_type) scopes covered
+        by records, so resources deleted since the last scan are dropped.
+        """
+        scopes = {(r.region, r.resource_type) for r in records}
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                DELETE FROM resource_fingerprints
+                WHERE scanner = ? AND account_id = ? AND region = ? AND resource_type = ?
+            """, [(scanner, account_id, region, resource_type) for region, resource_type in scopes])
+            cursor.executemany("""
+                INSERT OR REPLACE INTO resource_fingerprints (
+                    scanner, account_id, region, resource_type, resource_id, fingerprint,
+                    findings_json, counters_json, updated_at, scanned_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
+                    scanner, account_id, r.region, r.resource_type, r.resource_id, r.fingerprint,
+                    json.dumps(r.findings, default=str), json.dumps(r.counters), r.updated_at,
+                    r.scanned_at
+                )
+                for r in records
+            ])
+
+            return len(records)
+
     def close(self):
-        """Close database connection"""
-        pass  # Using context managers, no persistent connection
+        """Close the pooled connections for this database file"""
+        self.pool.close_all()
 
 
 # Example usage
@@ -31,6 +31,7 @@ from enum import Enum
 import json
 import uuid
 import hashlib
+from llm_gateway import create_message
 
 # Import existing modules for integration
 try:
@@ -2525,7 +2526,7 @@ Provide a JSON response with these exact keys:
 
 Be conversational, practical, and avoid jargon. Focus on actionable advice."""
 
-        response = client.messages.create(
+        response = create_message(client,
             model="claude-sonnet-4-20250514",
             max_tokens=2000,
             temperature=0.7,
@@ -26,6 +26,12 @@ import json
 import uuid
 from io import BytesIO
 
+import numpy as np
+import pandas as pd
+
+from scoring_engine import FindingsTable, get_field, map_categories
+from llm_gateway import create_message
+
 # Try to import required modules
 try:
     from aws_connector import get_aws_session, test_aws_connection
@@ -229,7 +235,7 @@ Format as JSON:
 }}"""
         
         try:
-            message = self.client.messages.create(
+            message = create_message(self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=1000,
                 messages=[{"role": "user", "content": prompt}]
@@ -466,39 +472,58 @@ class WAFFrameworkMapper:
         )
     
     @classmethod
-    def calculate_pillar_scores(cls, findings) -> Dict[str, float]:
-        """Calculate WAF pillar scores based on findings
+    def map_findings_to_pillars(cls, findings) -> List[str]:
+        """Map many findings to WAF pillars at once
+        
+        Same result as map_finding_to_pillar(f).pillar for each finding,
+        with the keyword matching done column-wise.
         
         Args:
             findings: List of Finding objects or dicts
         """
+        findings = list(findings)
+        if not findings:
+            return []
         
-        # Initialize scores at 100
-        scores = {pillar: 100.0 for pillar in cls.PILLARS.keys()}
-        
-        # Deduct points based on findings
-        for finding in findings:
-            mapping = cls.map_finding_to_pillar(finding)
-            pillar = mapping.pillar
-            
-            # Get severity from dict or object
-            if isinstance(finding, dict):
-                severity = finding.get('severity', 'MEDIUM')
-            else:
-                severity = getattr(finding, 'severity', 'MEDIUM')
-            
-            # Deduct points based on severity
-            deduction = {
-                'CRITICAL': 15,
-                'HIGH': 10,
-                'MEDIUM': 5,
-                'LOW': 2,
-                'INFO': 0
-            }.get(severity, 0)
-            
-            scores[pillar] = max(0, scores[pillar] - deduction)
+        explicit = map_categories(
+            pd.Categorical([get_field(f, 'pillar', None) for f in findings]),
+            lambda value: str(value).lower().replace(' ', '_') if value else ''
+        )
+        text = pd.Categorical([
+            f"{get_field(f, 'title', '')} {get_field(f, 'description', '')}".lower() for f in findings
+        ])
+        
+        # Keyword matching runs once per distinct text
+        unique_text = pd.Series(text.categories, dtype=object)
+        hits = pd.DataFrame({
+            pillar: sum(unique_text.str.contains(keyword, regex=False).astype(int) for keyword in data['keywords'])
+            for pillar, data in cls.PILLARS.items()
+        })
+        # idxmax keeps the first pillar on ties, like max() over PILLARS
+        matched = hits.idxmax(axis=1).where(hits.max(axis=1) > 0, 'security').to_numpy(dtype=object)
+        
+        explicit_values = np.asarray(explicit, dtype=object)
+        return np.where(pd.Series(explicit_values).isin(list(cls.PILLARS)).to_numpy(),
+                        explicit_values, matched[text.codes]).tolist()
+    
+    @classmethod
+    def calculate_pillar_scores(cls, findings) -> Dict[str, float]:
+        """Calculate WAF pillar scores based on findings
         
-        return scores
+        Args:
+            findings: List of Finding objects or dicts
+        """
+        findings = list(findings)
+        table = FindingsTable.from_findings(
+            findings,
+            pillar=cls.map_findings_to_pillars(findings),
+            default_severity='MEDIUM',
+        )
+        scores = table.pillar_scores(
+            {'CRITICAL': 15, 'HIGH': 10, 'MEDIUM': 5, 'LOW': 2, 'INFO': 0},
+            pillars=cls.PILLARS.keys(),
+        )
+        return {pillar: float(score) for pillar, score in scores.items()}
 
 # ============================================================================
 # PDF REPORT GENERATOR
@@ -1008,10 +1033,9 @@ class EnhancedWAFScanner:
         
         # Step 2: Map findings to WAF pillars
         pillar_distribution = {}
-        for finding in landscape.findings:
-            mapping = self.mapper.map_finding_to_pillar(finding)
-            finding.pillar = mapping.pillar  # Update finding pillar
-            pillar_distribution[mapping.pillar] = pillar_distribution.get(mapping.pillar, 0) + 1
+        for finding, pillar in zip(landscape.findings, self.mapper.map_findings_to_pillars(landscape.findings)):
+            finding.pillar = pillar  # Update finding pillar
+            pillar_distribution[pillar] = pillar_distribution.get(pillar, 0) + 1
         
         if progress_callback:
             progress_callback("Calculating WAF scores...", 60)
@@ -12,9 +12,22 @@ This module KEEPS all existing functionality and ADDS AI features:
 + PDF report generation
 """
 
+import hashlib
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import wraps
+from itertools import islice
+
 # Module-level imports for caching decorators
 import streamlit as st
 
+from aws_utils import iter_paginated
+from async_operations import AsyncConfig, AsyncScanner, ThrottledSession, run_async
+from resource_fingerprints import IncrementalScanState, config_changed_resources, run_incremental_check
+from scan_cache import get_scan_cache, scan_cache_key
+
 def render_integrated_waf_scanner():
     """
     Enhanced WAF Scanner with AI integration
@@ -549,9 +562,26 @@ def render_direct_multi_account_scanner():
             "Parallel Scans",
             min_value=1,
             max_value=10,
-            value=3,
+            value=DEFAULT_PARALLEL_ACCOUNT_SCANS,
             help="Number of accounts to scan in parallel"
         )
+        
+        account_timeout_minutes = st.number_input(
+            "Per-Account Timeout (min)",
+            min_value=1,
+            max_value=120,
+            value=ACCOUNT_SCAN_TIMEOUT_SECONDS // 60,
+            help="Accounts still running after this long are marked as timed out"
+        )
+        
+        incremental_scan = st.checkbox(
+            "♻️ Incremental Scan",
+            value=False,
+            help="Reuse findings for security groups, EC2 instances, EBS volumes, RDS instances "
+                 "and Lambda functions unchanged since the last incremental scan, and for KMS keys "
+                 "and DynamoDB tables AWS Config reports unchanged. S3 buckets and IAM users are "
+                 "always re-checked"
+        )
     
     # ========================================================================
     # AI ENHANCEMENT OPTIONS
@@ -613,7 +643,9 @@ def render_direct_multi_account_scanner():
                 enable_ai=enable_ai_analysis,
                 enable_waf_mapping=enable_waf_mapping,
                 generate_consolidated_pdf=generate_consolidated_pdf,
-                cross_account_analysis=cross_account_analysis
+                cross_account_analysis=cross_account_analysis,
+                account_timeout=account_timeout_minutes * 60,
+                incremental=incremental_scan
             )
     
     with col2:
@@ -758,21 +790,43 @@ def run_enhanced_single_account_scan(session, account_id, region, scan_mode, waf
 @st.cache_data(ttl=300, show_spinner="Fetching Security Hub findings...")  # 5 min cache
 def fetch_and_analyze_security_hub(hub_region, use_hub_creds, severity_filter, max_findings,
                                    enable_ai, enable_waf_mapping, generate_consolidated_pdf, generate_account_pdfs):
-    """Fetch Security Hub findings and apply AI analysis"""
+    """
+    Fetch Security Hub findings and apply AI analysis.
+    
+    Findings come from the local Security Hub finding store, which is
+    synced incrementally: only findings updated since the previous fetch
+    are downloaded from the hub.
+    """
     import streamlit as st
+    from collections import defaultdict
     
     progress_bar = st.progress(0)
     status_text = st.empty()
     
     try:
-        # Step 1: Fetch from Security Hub
-        status_text.text("🔍 Querying AWS Security Hub...")
+        # Step 1: Sync changes from Security Hub into the local store
+        status_text.text("🔍 Syncing AWS Security Hub findings...")
         progress_bar.progress(20)
         
-        # Import Security Hub fetcher
-        from streamlit_app import fetch_from_security_hub
+        from streamlit_app import get_security_hub_session
+        from security_hub_sync import SecurityHubSync
+        
+        session = get_security_hub_session(hub_region, use_hub_creds)
+        if session is None:
+            st.error("No credentials configured. Please set up hub account credentials.")
+            return
+        
+        hub_account_id = session.client('sts').get_caller_identity()['Account']
+        sync = SecurityHubSync(session.client('securityhub', region_name=hub_region),
+                               account_id=hub_account_id)
+        sync_stats = sync.sync()
+        status_text.text(f"🔍 Security Hub {sync_stats['mode']} sync: {sync_stats['fetched']} findings fetched")
         
-        results = fetch_from_security_hub(hub_region, use_hub_creds)
+        results = defaultdict(list)
+        # Same workflow scope as a live fetch: suppressed and resolved findings stay out
+        for finding in sync.iter_findings(severity_filter=severity_filter,
+                                          workflow_statuses=['NEW', 'NOTIFIED']):
+            results[finding.get('AwsAccountId', 'Unknown')].append(finding)
         
         if not results:
             st.error("No findings retrieved from Security Hub")
@@ -866,13 +920,167 @@ def fetch_and_analyze_security_hub(hub_region, use_hub_creds, severity_filter, m
         progress_bar.empty()
 
 
+# ============================================================================
+# MULTI-ACCOUNT SCAN SCHEDULER
+# ============================================================================
+
+DEFAULT_PARALLEL_ACCOUNT_SCANS = 3
+SERVICE_SCAN_WORKERS = 8  # Per-account cap on the configured scan pool size
+ACCOUNT_SCAN_TIMEOUT_SECONDS = 900
+_SCHEDULER_POLL_SECONDS = 0.5
+
+
+class _AccountStatusBuffer:
+    """
+    Thread-safe stand-in for a Streamlit placeholder.
+
+    Worker threads have no Streamlit script context, so the per-service
+    scanners write their progress lines here and the scheduler renders
+    the latest line per account from the main thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._text = ""
+
+    def markdown(self, text, *args, **kwargs):
+        with self._lock:
+            self._text = text
+
+    def empty(self):
+        self.markdown("")
+
+    @property
+    def text(self):
+        with self._lock:
+            return self._text
+
+
+def _account_identity(account):
+    """Return (account_name, account_id) using the connector's key variants"""
+    account_name = account.get('account_name', account.get('name', 'Unknown'))
+    account_id = account.get('account_id', account.get('id', account.get('Id', 'N/A')))
+    return account_name, account_id
+
+
+def _build_demo_account_results(account_name, account_id):
+    """Generate sample findings for Demo Mode"""
+    import random
+    from datetime import datetime
+    
+    findings = []
+    for i in range(random.randint(20, 60)):
+        findings.append({
+            'title': f'Sample Finding {i+1}',
+            'severity': random.choice(['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']),
+            'service': random.choice(['EC2', 'S3', 'RDS', 'VPC', 'IAM', 'Lambda']),
+            'resource': f'resource-{i+1}',
+            'description': f'Sample finding description for {account_name}'
+        })
+    
+    return {
+        'account_name': account_name,
+        'account_id': account_id,
+        'findings': findings,
+        'resources': {'ec2': 10, 's3': 5, 'rds': 3},
+        'scan_time': datetime.now().isoformat(),
+        'mode': 'Demo'
+    }
+
+
+def _scan_account_job(account, session, scan_mode, scan_depth, waf_pillars, scan_region,
+                      enable_ai, enable_waf_mapping, status_buffer, started, incremental=False,
+                      cancelled=None):
+    """
+    Scan and enrich a single account. Runs on a scheduler worker thread.
+    
+    Args:
+        account: Connected account dict
+        session: Pre-built boto3 session shared by every service scan of this account
+        status_buffer: _AccountStatusBuffer receiving progress lines
+        started: threading.Event set once the job actually starts running,
+            so the per-account timeout does not count time spent queued
+        incremental: Reuse findings for resources unchanged since the last scan
+        cancelled: threading.Event set by the scheduler when the account times
+            out; remaining services and enrichment are skipped so the worker
+            slot is released
+    """
+    started.set()
+    account_name, account_id = _account_identity(account)
+    
+    if scan_mode == "Real Scan":
+        scan_results = scan_real_aws_account_enhanced(
+            account,
+            scan_depth,
+            waf_pillars,
+            scan_region,
+            status_buffer,
+            session=session,
+            incremental=incremental,
+            cancelled=cancelled
+        )
+        
+        # Convert to findings format
+        findings = []
+        for service, data in scan_results.get('resources', {}).items():
+            if isinstance(data, dict) and 'issues' in data:
+                for issue in data['issues']:
+                    findings.append({
+                        'title': issue.get('title', 'Issue'),
+                        'severity': issue.get('severity', 'MEDIUM'),
+                        'service': service,
+                        'resource': issue.get('resource', 'N/A'),
+                        'description': issue.get('description', 'N/A')
+                    })
+        
+        scan_results['findings'] = findings
+    else:
+        scan_results = _build_demo_account_results(account_name, account_id)
+    
+    if cancelled is not None and cancelled.is_set():
+        return scan_results
+    
+    # WAF Pillar Mapping
+    if enable_waf_mapping:
+        status_buffer.markdown(f"🔍 **{account_name}** - Mapping to WAF pillars...")
+        scan_results = apply_waf_mapping(scan_results)
+    
+    # AI Analysis
+    if enable_ai:
+        status_buffer.markdown(f"🔍 **{account_name}** - Running AI analysis...")
+        scan_results = apply_ai_analysis(scan_results)
+    
+    return scan_results
+
+
+def _failed_account_result(account_name, account_id, error, status='Failed'):
+    return {
+        'account_name': account_name,
+        'account_id': account_id,
+        'error': error,
+        'status': status,
+        'findings': []
+    }
+
+
 def run_enhanced_multi_account_scan(selected_accounts, scan_depth, waf_pillars, scan_mode,
                                     scan_region, parallel_scans, enable_ai, enable_waf_mapping,
-                                    generate_consolidated_pdf, cross_account_analysis):
-    """Execute enhanced multi-account scan with progress tracking"""
+                                    generate_consolidated_pdf, cross_account_analysis,
+                                    account_timeout=ACCOUNT_SCAN_TIMEOUT_SECONDS,
+                                    incremental=False):
+    """
+    Execute enhanced multi-account scan with progress tracking.
+    
+    Accounts are scheduled on a bounded worker pool (``parallel_scans``
+    accounts in flight). Each account gets one session, created up front
+    on the calling thread and reused by all of its service scans. Results
+    are streamed into ``st.session_state.multi_scan_results`` as each
+    account finishes, and an account that runs longer than
+    ``account_timeout`` seconds is recorded as timed out and told to stop
+    at its next service boundary, releasing its worker slot. With ``incremental`` set, resources
+    whose fingerprint is unchanged since the last scan are not re-checked.
+    """
     import streamlit as st
-    import boto3
-    from datetime import datetime
     
     # Parse account selections back to account objects
     accounts = []
@@ -891,110 +1099,115 @@ def run_enhanced_multi_account_scan(selected_accounts, scan_depth, waf_pillars,
         st.error("❌ No valid accounts found")
         return
     
+    max_workers = max(1, min(int(parallel_scans or DEFAULT_PARALLEL_ACCOUNT_SCANS), len(accounts)))
+    
     # Initialize progress tracking
-    st.info(f"🚀 Starting {'REAL' if scan_mode == 'Real Scan' else 'DEMO'} scan of {len(accounts)} accounts...")
+    st.info(f"🚀 Starting {'REAL' if scan_mode == 'Real Scan' else 'DEMO'} scan of {len(accounts)} accounts "
+            f"({max_workers} in parallel)...")
     
     progress_bar = st.progress(0)
     status_text = st.empty()
     
     results = {}
     total_accounts = len(accounts)
+    st.session_state.multi_scan_results = results
+    
+    # Resolve credentials once per account on the calling thread - session
+    # creation reads st.session_state, which worker threads cannot access
+    sessions = {}
+    jobs = []
+    for account in accounts:
+        account_name, account_id = _account_identity(account)
+        session = None
+        if scan_mode == "Real Scan":
+            if account_id not in sessions:
+                status_text.markdown(f"🔐 **{account_name}** - Creating AWS session...")
+                sessions[account_id] = create_session_for_account(account)
+            session = sessions[account_id]
+            if not session:
+                results[account_id] = _failed_account_result(
+                    account_name, account_id, "Could not create AWS session - check credentials"
+                )
+                st.error(f"❌ Failed to scan {account_name}: could not create AWS session")
+                continue
+        jobs.append((account, session))
     
-    # Scan each account
-    for idx, account in enumerate(accounts):
-        account_name = account.get('account_name', account.get('name', 'Unknown'))
-        account_id = account.get('account_id', account.get('id', account.get('Id', 'N/A')))
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="waf-account-scan")
+    running = {}
+    try:
+        for account, session in jobs:
+            status_buffer = _AccountStatusBuffer()
+            started = threading.Event()
+            cancelled = threading.Event()
+            future = executor.submit(
+                _scan_account_job, account, session, scan_mode, scan_depth, waf_pillars,
+                scan_region, enable_ai, enable_waf_mapping, status_buffer, started, incremental,
+                cancelled
+            )
+            running[future] = {
+                'account': account,
+                'status': status_buffer,
+                'started': started,
+                'cancelled': cancelled,
+                'deadline': None,
+            }
         
-        try:
-            # Update progress
-            progress = int((idx / total_accounts) * 100)
-            progress_bar.progress(progress)
-            status_text.markdown(f"🔍 **Scanning {account_name}** ({idx + 1}/{total_accounts})")
+        while running:
+            done, _ = wait(list(running), timeout=_SCHEDULER_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
             
-            if scan_mode == "Real Scan":
-                # REAL AWS SCANNING - Use the original scan logic
-                scan_results = scan_real_aws_account_enhanced(
-                    account, 
-                    scan_depth, 
-                    waf_pillars, 
-                    scan_region,
-                    status_text
-                )
-                
-                # Convert to findings format
-                findings = []
-                for service, data in scan_results.get('resources', {}).items():
-                    if isinstance(data, dict) and 'issues' in data:
-                        for issue in data['issues']:
-                            findings.append({
-                                'title': issue.get('title', 'Issue'),
-                                'severity': issue.get('severity', 'MEDIUM'),
-                                'service': service,
-                                'resource': issue.get('resource', 'N/A'),
-                                'description': issue.get('description', 'N/A')
-                            })
-                
-                scan_results['findings'] = findings
-                
-                # WAF Pillar Mapping
-                if enable_waf_mapping:
-                    status_text.markdown(f"🔍 **Scanning {account_name}** - Mapping to WAF pillars...")
-                    scan_results = apply_waf_mapping(scan_results)
-                
-                # AI Analysis
-                if enable_ai:
-                    status_text.markdown(f"🔍 **Scanning {account_name}** - Running AI analysis...")
-                    scan_results = apply_ai_analysis(scan_results)
-                
-                results[account_id] = scan_results
-                
-            else:
-                # DEMO MODE - Generate sample data
-                import random
-                
-                findings = []
-                for i in range(random.randint(20, 60)):
-                    findings.append({
-                        'title': f'Sample Finding {i+1}',
-                        'severity': random.choice(['CRITICAL', 'HIGH', 'MEDIUM', 'LOW']),
-                        'service': random.choice(['EC2', 'S3', 'RDS', 'VPC', 'IAM', 'Lambda']),
-                        'resource': f'resource-{i+1}',
-                        'description': f'Sample finding description for {account_name}'
-                    })
-                
-                demo_results = {
-                    'account_name': account_name,
-                    'account_id': account_id,
-                    'findings': findings,
-                    'resources': {'ec2': 10, 's3': 5, 'rds': 3},
-                    'scan_time': datetime.now().isoformat(),
-                    'mode': 'Demo'
-                }
-                
-                # Apply enhancements even in demo mode
-                if enable_waf_mapping:
-                    demo_results = apply_waf_mapping(demo_results)
-                
-                if enable_ai:
-                    demo_results = apply_ai_analysis(demo_results)
-                
-                results[account_id] = demo_results
+            for future in done:
+                job = running.pop(future)
+                account_name, account_id = _account_identity(job['account'])
+                try:
+                    results[account_id] = future.result()
+                    status_text.markdown(
+                        f"✅ **{account_name}** - Complete "
+                        f"({len(results[account_id].get('findings', []))} findings)"
+                    )
+                except Exception as e:
+                    st.error(f"❌ Failed to scan {account_name}: {str(e)}")
+                    results[account_id] = _failed_account_result(account_name, account_id, str(e))
             
-            status_text.markdown(f"✅ **{account_name}** - Complete ({len(results[account_id].get('findings', []))} findings)")
+            # Per-account timeouts - the clock starts when the job leaves the queue
+            for future, job in list(running.items()):
+                if job['deadline'] is None:
+                    if job['started'].is_set():
+                        job['deadline'] = now + account_timeout
+                    continue
+                if now >= job['deadline']:
+                    # A running future can't be cancelled; the job stops at its
+                    # next service boundary and frees its worker slot
+                    running.pop(future)
+                    job['cancelled'].set()
+                    account_name, account_id = _account_identity(job['account'])
+                    st.warning(f"⏱️ {account_name} exceeded the {account_timeout}s scan timeout")
+                    results[account_id] = _failed_account_result(
+                        account_name, account_id,
+                        f"Scan timed out after {account_timeout} seconds", status='Timed Out'
+                    )
             
-        except Exception as e:
-            st.error(f"❌ Failed to scan {account_name}: {str(e)}")
-            results[account_id] = {
-                'account_name': account_name,
-                'account_id': account_id,
-                'error': str(e),
-                'status': 'Failed',
-                'findings': []
-            }
+            completed = total_accounts - len(running)
+            progress_bar.progress(int((completed / total_accounts) * 100))
+            if running:
+                in_flight = [job['status'].text for job in running.values()
+                             if job['started'].is_set() and job['status'].text]
+                status_text.markdown(
+                    f"🔍 **{completed}/{total_accounts} accounts complete**"
+                    + ("\n\n" + "\n\n".join(in_flight) if in_flight else "")
+                )
+    finally:
+        # Timed-out workers finish their in-flight service call before
+        # stopping; don't block the page on them
+        executor.shutdown(wait=False, cancel_futures=True)
     
     # Final progress
     progress_bar.progress(100)
     
+    # Present accounts in selection order rather than completion order
+    ordered_ids = [_account_identity(account)[1] for account in accounts]
+    results = {account_id: results[account_id] for account_id in ordered_ids if account_id in results}
+    
     # Cross-account analysis
     if cross_account_analysis and enable_ai:
         status_text.markdown("🤖 Running cross-account pattern detection...")
@@ -1022,8 +1235,117 @@ def run_enhanced_multi_account_scan(selected_accounts, scan_depth, waf_pillars,
     display_multi_account_results(results)
 
 
-def scan_real_aws_account_enhanced(account, depth, pillars, region, status_text):
-    """Scan a real AWS account across 37+ services for 92% WAF coverage"""
+def _check_resource(result, findings, resource_type, resource_id, region, config, check, check_name=''):
+    """
+    Run check(findings) for one resource. During an incremental scan (the
+    result carries an 'incremental_state'), an unchanged resource's previous
+    findings are reused. Pass check_name when more than one service scan
+    checks the same resource.
+    """
+    state = result.get('incremental_state')
+    run_incremental_check(state, findings, resource_type, resource_id, region, config, check,
+                          check_name=check_name)
+
+
+SCAN_RESULT_TTL_SECONDS = 300  # 5 min cache for Live mode
+SECURITY_HUB_FAILED_THRESHOLD = 50
+
+
+def _skipped_check(result, service, error):
+    """
+    Record a check that could not run (throttled, access denied, ...).
+
+    The scan carries on without it, but its service's output is then
+    incomplete and is kept out of the shared scan cache.
+    """
+    result.setdefault('skipped_checks', []).append(f"{service}: {str(error)[:100]}")
+
+
+def _check_set_version(func):
+    """Short hash of a scanner's source, so editing its checks retires cached results"""
+    try:
+        source = inspect.getsource(func).encode('utf-8')
+    except (OSError, TypeError):
+        source = func.__code__.co_code
+    return hashlib.sha256(source).hexdigest()[:12]
+
+
+def cached_service_scan(service, version=1, global_scope=False, ttl_seconds=SCAN_RESULT_TTL_SECONDS):
+    """
+    Share a per-service scan's output through the disk-backed scan cache.
+
+    The wrapped scanner takes (session, [region,] result, status_text,
+    account_name) and appends to result['findings'] / result['resources'].
+    Its additions are cached under (account, region, service, version,
+    scanning principal), so repeat scans by the same role within the TTL
+    reuse one scan while a differently privileged caller never sees it.
+
+    The cache version combines ``version`` with a hash of the scanner's
+    source: any edit to the scanner retires its cached results. Bump
+    ``version`` by hand only when a change outside the function (a helper
+    it calls) alters its checks.
+
+    Incremental scans bypass the cache; results with a service error or a
+    skipped check (see _skipped_check) are not stored.
+    """
+    def decorator(func):
+        cache_version = f"{version}.{_check_set_version(func)}"
+
+        @wraps(func)
+        def wrapper(session, *args):
+            region = None if global_scope else args[0]
+            result, status_text, account_name = args[-3:]
+            account_id = result.get('account_id')
+            principal = result.get('principal_arn')
+            if (not account_id or account_id == 'N/A' or not principal
+                    or result.get('incremental_state') is not None):
+                return func(session, *args)
+
+            computed = []
+
+            def scan():
+                partial = {**result, 'findings': [], 'resources': {}, 'skipped_checks': []}
+                func(session, *args[:-3], partial, status_text, account_name)
+                computed.append(True)
+                return {'findings': partial['findings'], 'resources': partial['resources'],
+                        'skipped_checks': partial['skipped_checks']}
+
+            def cacheable(scanned):
+                if scanned['skipped_checks']:
+                    return False
+                return not any(isinstance(r, dict) and 'error' in r for r in scanned['resources'].values())
+
+            try:
+                cache = get_scan_cache()
+            except Exception:
+                return func(session, *args)
+            scanned = cache.get_or_compute(
+                scan_cache_key(account_id, region, service, cache_version, principal), scan,
+                ttl_seconds=ttl_seconds, cacheable=cacheable
+            )
+            if not computed:
+                status_text.markdown(f"🔍 **{account_name}** - {service}: using results cached in the last "
+                                     f"{ttl_seconds // 60} min")
+            result['findings'].extend(scanned['findings'])
+            result['resources'].update(scanned['resources'])
+            if scanned['skipped_checks']:
+                result.setdefault('skipped_checks', []).extend(scanned['skipped_checks'])
+        return wrapper
+    return decorator
+
+
+def scan_real_aws_account_enhanced(account, depth, pillars, region, status_text, session=None,
+                                   incremental=False, cancelled=None):
+    """
+    Scan a real AWS account across 37+ services for 92% WAF coverage.
+    
+    Pass ``session`` to reuse credentials already resolved for the account
+    (the multi-account scheduler does this); otherwise one is created here.
+    With ``incremental`` set, resource fingerprints from the previous scan
+    are loaded from the local database and unchanged resources are not
+    re-checked. Once ``cancelled`` (a threading.Event) is set, services
+    that have not started yet are skipped.
+    """
     import boto3
     from botocore.exceptions import ClientError, NoCredentialsError
     
@@ -1040,8 +1362,9 @@ def scan_real_aws_account_enhanced(account, depth, pillars, region, status_text)
     
     try:
         # Create AWS session
-        status_text.markdown(f"🔍 **{account_name}** - Creating AWS session...")
-        session = create_session_for_account(account)
+        if session is None:
+            status_text.markdown(f"🔍 **{account_name}** - Creating AWS session...")
+            session = create_session_for_account(account)
         
         if not session:
             raise Exception("Could not create AWS session - check credentials")
@@ -1051,6 +1374,7 @@ def scan_real_aws_account_enhanced(account, depth, pillars, region, status_text)
             sts = session.client('sts')
             identity = sts.get_caller_identity()
             result['account_id'] = identity['Account']
+            result['principal_arn'] = identity['Arn']
             status_text.markdown(f"🔍 **{account_name}** - Connected to account {result['account_id']}")
         except Exception as e:
             raise Exception(f"Session verification failed: {str(e)}")
@@ -1061,15 +1385,54 @@ def scan_real_aws_account_enhanced(account, depth, pillars, region, status_text)
         total_services = len(services)
         status_text.markdown(f"🔍 **{account_name}** - Scanning {total_services} AWS services...")
         
-        # Scan each service with individual error handling
-        for idx, service in enumerate(services):
-            try:
-                scan_service(session, service, region, result, status_text, account_name)
-            except Exception as service_error:
+        # Scan services concurrently on the async scan engine - API calls are
+        # paced per endpoint by its token buckets
+        engine_config = AsyncConfig.from_app_config()
+        engine_config.max_workers = max(1, min(engine_config.max_workers, SERVICE_SCAN_WORKERS, total_services))
+        engine = AsyncScanner(engine_config)
+        throttled_session = ThrottledSession(session, engine.throttler)
+        
+        def on_service_complete(service, _, service_error):
+            if service_error is not None:
                 # Log error but continue with other services
                 result['resources'][service] = {'error': str(service_error)[:200], 'count': 0}
                 status_text.markdown(f"⚠️ **{account_name}** - {service} scan failed: {str(service_error)[:50]}...")
-
+        
+        fingerprint_db = None
+        if incremental:
+            from waf_database import WAFDatabase
+            fingerprint_db = WAFDatabase()
+            state = IncrementalScanState.load(fingerprint_db, 'integrated', result['account_id'])
+            if state.last_scan_time:
+                # Lets unchanged KMS keys and DynamoDB tables in the scan region
+                # be carried forward; everything else deep is re-checked
+                state.set_change_feed(
+                    config_changed_resources(session, [region], state.last_scan_time), [region]
+                )
+            # Kept on this scan's result, where the per-resource checks find it
+            result['incremental_state'] = state
+        
+        def run_service(service):
+            if cancelled is not None and cancelled.is_set():
+                return
+            scan_service(throttled_session, service, region, result, status_text, account_name)
+        
+        jobs = [(service, lambda service=service: run_service(service)) for service in services]
+        try:
+            run_async(engine.run_jobs(jobs, on_service_complete))
+        finally:
+            engine.shutdown()
+            state = result.pop('incremental_state', None)
+        
+        if cancelled is not None and cancelled.is_set():
+            # Partial results: keep them out of the fingerprint store
+            result['status'] = 'Timed Out'
+            status_text.markdown(f"⏱️ **{account_name}** - Scan cancelled after timeout")
+            return result
+        
+        if state is not None:
+            state.save(fingerprint_db)
+            result['incremental_stats'] = state.stats()
         
         status_text.markdown(f"✅ **{account_name}** - Scan complete: {len(result['findings'])} findings from {len(result['resources'])} services")
         
@@ -1121,51 +1484,53 @@ def get_services_by_scan_depth(depth):
         return standard_services
 
 
-@st.cache_data(ttl=300, show_spinner=False)  # 5 min cache for Live mode
+@cached_service_scan('RDS')
 def scan_rds_service(session, region, result, status_text, account_name):
     """Scan RDS databases"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning RDS databases...")
         rds = session.client('rds', region_name=region)
-        databases_response = rds.describe_db_instances()
-        databases = databases_response.get('DBInstances', [])
-        db_count = len(databases)
+        db_count = 0
         
-        for db in databases:
+        for db in iter_paginated(rds, 'describe_db_instances', 'DBInstances[]'):
+            db_count += 1
             db_id = db.get('DBInstanceIdentifier')
+
+            def check(findings):
+                # Check Multi-AZ
+                if not db.get('MultiAZ', False):
+                    findings.append({
+                        'title': 'RDS database not configured for Multi-AZ',
+                        'severity': 'MEDIUM',
+                        'service': 'RDS',
+                        'resource': db_id,
+                        'description': f"Database '{db_id}' is not configured for Multi-AZ deployment",
+                        'pillar': 'Reliability'
+                    })
             
-            # Check Multi-AZ
-            if not db.get('MultiAZ', False):
-                result['findings'].append({
-                    'title': 'RDS database not configured for Multi-AZ',
-                    'severity': 'MEDIUM',
-                    'service': 'RDS',
-                    'resource': db_id,
-                    'description': f"Database '{db_id}' is not configured for Multi-AZ deployment",
-                    'pillar': 'Reliability'
-                })
-            
-            # Check encryption
-            if not db.get('StorageEncrypted', False):
-                result['findings'].append({
-                    'title': 'RDS database storage not encrypted',
-                    'severity': 'HIGH',
-                    'service': 'RDS',
-                    'resource': db_id,
-                    'description': f"Database '{db_id}' does not have storage encryption enabled",
-                    'pillar': 'Security'
-                })
+                # Check encryption
+                if not db.get('StorageEncrypted', False):
+                    findings.append({
+                        'title': 'RDS database storage not encrypted',
+                        'severity': 'HIGH',
+                        'service': 'RDS',
+                        'resource': db_id,
+                        'description': f"Database '{db_id}' does not have storage encryption enabled",
+                        'pillar': 'Security'
+                    })
             
-            # Check backup retention
-            if db.get('BackupRetentionPeriod', 0) < 7:
-                result['findings'].append({
-                    'title': 'RDS backup retention period too short',
-                    'severity': 'MEDIUM',
-                    'service': 'RDS',
-                    'resource': db_id,
-                    'description': f"Database '{db_id}' backup retention is {db.get('BackupRetentionPeriod')} days (recommend 7+)",
-                    'pillar': 'Reliability'
-                })
+                # Check backup retention
+                if db.get('BackupRetentionPeriod', 0) < 7:
+                    findings.append({
+                        'title': 'RDS backup retention period too short',
+                        'severity': 'MEDIUM',
+                        'service': 'RDS',
+                        'resource': db_id,
+                        'description': f"Database '{db_id}' backup retention is {db.get('BackupRetentionPeriod')} days (recommend 7+)",
+                        'pillar': 'Reliability'
+                    })
+
+            _check_resource(result, result['findings'], 'AWS::RDS::DBInstance', db_id, region, db, check)
         
         result['resources']['RDS'] = {'count': db_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {db_count} RDS databases")
@@ -1173,7 +1538,7 @@ def scan_rds_service(session, region, result, status_text, account_name):
         result['resources']['RDS'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('VPC')
 def scan_vpc_service(session, region, result, status_text, account_name):
     """Scan VPC and Security Groups"""
     try:
@@ -1181,35 +1546,37 @@ def scan_vpc_service(session, region, result, status_text, account_name):
         ec2 = session.client('ec2', region_name=region)
         
         # VPCs
-        vpcs_response = ec2.describe_vpcs()
-        vpc_count = len(vpcs_response.get('Vpcs', []))
+        vpc_count = sum(1 for _ in iter_paginated(ec2, 'describe_vpcs', 'Vpcs[]'))
         
         # Security Groups
-        sg_response = ec2.describe_security_groups()
-        security_groups = sg_response.get('SecurityGroups', [])
-        sg_count = len(security_groups)
+        sg_count = 0
         
-        for sg in security_groups:
+        for sg in iter_paginated(ec2, 'describe_security_groups', 'SecurityGroups[]'):
+            sg_count += 1
             sg_id = sg.get('GroupId')
             sg_name = sg.get('GroupName')
-            
-            # Check for overly permissive rules
-            for rule in sg.get('IpPermissions', []):
-                for ip_range in rule.get('IpRanges', []):
-                    if ip_range.get('CidrIp') == '0.0.0.0/0':
-                        from_port = rule.get('FromPort', 'all')
-                        to_port = rule.get('ToPort', 'all')
-                        protocol = rule.get('IpProtocol', 'all')
+
+            def check(findings):
+                # Check for overly permissive rules
+                for rule in sg.get('IpPermissions', []):
+                    for ip_range in rule.get('IpRanges', []):
+                        if ip_range.get('CidrIp') == '0.0.0.0/0':
+                            from_port = rule.get('FromPort', 'all')
+                            to_port = rule.get('ToPort', 'all')
+                            protocol = rule.get('IpProtocol', 'all')
                         
-                        severity = 'CRITICAL' if from_port in [22, 3389, 1433, 3306, 5432] else 'HIGH'
-                        result['findings'].append({
-                            'title': 'Security group allows unrestricted access (0.0.0.0/0)',
-                            'severity': severity,
-                            'service': 'VPC',
-                            'resource': f"{sg_id} ({sg_name})",
-                            'description': f"Security group '{sg_name}' allows {protocol} traffic from anywhere on ports {from_port}-{to_port}",
-                            'pillar': 'Security'
-                        })
+                            severity = 'CRITICAL' if from_port in [22, 3389, 1433, 3306, 5432] else 'HIGH'
+                            findings.append({
+                                'title': 'Security group allows unrestricted access (0.0.0.0/0)',
+                                'severity': severity,
+                                'service': 'VPC',
+                                'resource': f"{sg_id} ({sg_name})",
+                                'description': f"Security group '{sg_name}' allows {protocol} traffic from anywhere on ports {from_port}-{to_port}",
+                                'pillar': 'Security'
+                            })
+
+            _check_resource(result, result['findings'], 'AWS::EC2::SecurityGroup', sg_id, region, sg,
+                            check, check_name='vpc')
         
         result['resources']['VPC'] = {'count': vpc_count, 'security_groups': sg_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {vpc_count} VPCs, {sg_count} security groups")
@@ -1217,7 +1584,7 @@ def scan_vpc_service(session, region, result, status_text, account_name):
         result['resources']['VPC'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('IAM', global_scope=True)
 def scan_iam_service(session, result, status_text, account_name):
     """Scan IAM users and policies"""
     try:
@@ -1225,41 +1592,44 @@ def scan_iam_service(session, result, status_text, account_name):
         iam = session.client('iam')
         
         # Users
-        users_response = iam.list_users()
-        users = users_response.get('Users', [])
-        user_count = len(users)
+        user_count = 0
         
-        for user in users[:20]:
+        for user in iter_paginated(iam, 'list_users', 'Users[]'):
+            user_count += 1
             username = user.get('UserName')
-            try:
-                # Check MFA
-                mfa_devices = iam.list_mfa_devices(UserName=username)
-                if not mfa_devices.get('MFADevices'):
-                    result['findings'].append({
-                        'title': 'IAM user without MFA enabled',
-                        'severity': 'HIGH',
-                        'service': 'IAM',
-                        'resource': username,
-                        'description': f"User '{username}' does not have MFA enabled",
-                        'pillar': 'Security'
-                    })
-                
-                # Check for access keys
-                access_keys = iam.list_access_keys(UserName=username)
-                for key in access_keys.get('AccessKeyMetadata', []):
-                    import datetime
-                    age_days = (datetime.datetime.now(datetime.timezone.utc) - key['CreateDate']).days
-                    if age_days > 90:
-                        result['findings'].append({
-                            'title': 'IAM access key older than 90 days',
-                            'severity': 'MEDIUM',
+
+            def check(findings):
+                try:
+                    # Check MFA
+                    mfa_devices = iam.list_mfa_devices(UserName=username)
+                    if not mfa_devices.get('MFADevices'):
+                        findings.append({
+                            'title': 'IAM user without MFA enabled',
+                            'severity': 'HIGH',
                             'service': 'IAM',
-                            'resource': f"{username}/{key['AccessKeyId']}",
-                            'description': f"Access key is {age_days} days old (recommend rotation every 90 days)",
+                            'resource': username,
+                            'description': f"User '{username}' does not have MFA enabled",
                             'pillar': 'Security'
                         })
-            except:
-                pass
+                
+                    # Check for access keys
+                    for key in iter_paginated(iam, 'list_access_keys', 'AccessKeyMetadata[]', UserName=username):
+                        import datetime
+                        age_days = (datetime.datetime.now(datetime.timezone.utc) - key['CreateDate']).days
+                        if age_days > 90:
+                            findings.append({
+                                'title': 'IAM access key older than 90 days',
+                                'severity': 'MEDIUM',
+                                'service': 'IAM',
+                                'resource': f"{username}/{key['AccessKeyId']}",
+                                'description': f"Access key is {age_days} days old (recommend rotation every 90 days)",
+                                'pillar': 'Security'
+                            })
+                except Exception as e:
+                    _skipped_check(result, 'IAM', e)
+
+            _check_resource(result, result['findings'], 'AWS::IAM::User', username, 'global',
+                            user, check)
         
         result['resources']['IAM'] = {'count': user_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {user_count} IAM users")
@@ -1267,29 +1637,34 @@ def scan_iam_service(session, result, status_text, account_name):
         result['resources']['IAM'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('Lambda')
 def scan_lambda_service(session, region, result, status_text, account_name):
     """Scan Lambda functions"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning Lambda functions...")
         lambda_client = session.client('lambda', region_name=region)
-        functions_response = lambda_client.list_functions()
-        functions = functions_response.get('Functions', [])
-        lambda_count = len(functions)
-        
-        for func in functions:
-            # Check runtime
-            runtime = func.get('Runtime', '')
-            deprecated_runtimes = ['python2', 'python3.6', 'python3.7', 'nodejs10', 'nodejs12', 'dotnetcore2', 'ruby2.5']
-            if any(deprecated in runtime for deprecated in deprecated_runtimes):
-                result['findings'].append({
-                    'title': 'Lambda function using deprecated runtime',
-                    'severity': 'HIGH',
-                    'service': 'Lambda',
-                    'resource': func.get('FunctionName'),
-                    'description': f"Function uses deprecated runtime {runtime}",
-                    'pillar': 'Security'
-                })
+        lambda_count = 0
+        
+        for func in iter_paginated(lambda_client, 'list_functions', 'Functions[]'):
+            lambda_count += 1
+            func_name = func.get('FunctionName')
+
+            def check(findings):
+                # Check runtime
+                runtime = func.get('Runtime', '')
+                deprecated_runtimes = ['python2', 'python3.6', 'python3.7', 'nodejs10', 'nodejs12', 'dotnetcore2', 'ruby2.5']
+                if any(deprecated in runtime for deprecated in deprecated_runtimes):
+                    findings.append({
+                        'title': 'Lambda function using deprecated runtime',
+                        'severity': 'HIGH',
+                        'service': 'Lambda',
+                        'resource': func.get('FunctionName'),
+                        'description': f"Function uses deprecated runtime {runtime}",
+                        'pillar': 'Security'
+                    })
+
+            _check_resource(result, result['findings'], 'AWS::Lambda::Function', func_name, region, func,
+                            check)
         
         result['resources']['Lambda'] = {'count': lambda_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {lambda_count} Lambda functions")
@@ -1297,45 +1672,49 @@ def scan_lambda_service(session, region, result, status_text, account_name):
         result['resources']['Lambda'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('DynamoDB')
 def scan_dynamodb_service(session, region, result, status_text, account_name):
     """Scan DynamoDB tables"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning DynamoDB tables...")
         dynamodb = session.client('dynamodb', region_name=region)
-        tables_response = dynamodb.list_tables()
-        tables = tables_response.get('TableNames', [])
-        table_count = len(tables)
+        table_count = 0
         
-        for table_name in tables[:10]:
-            try:
-                table_desc = dynamodb.describe_table(TableName=table_name)
-                table = table_desc.get('Table', {})
+        for table_name in iter_paginated(dynamodb, 'list_tables', 'TableNames[]'):
+            table_count += 1
+
+            def check(findings):
+                try:
+                    table_desc = dynamodb.describe_table(TableName=table_name)
+                    table = table_desc.get('Table', {})
                 
-                # Check encryption
-                if not table.get('SSEDescription'):
-                    result['findings'].append({
-                        'title': 'DynamoDB table not encrypted',
-                        'severity': 'HIGH',
-                        'service': 'DynamoDB',
-                        'resource': table_name,
-                        'description': f"Table '{table_name}' does not have encryption enabled",
-                        'pillar': 'Security'
-                    })
+                    # Check encryption
+                    if not table.get('SSEDescription'):
+                        findings.append({
+                            'title': 'DynamoDB table not encrypted',
+                            'severity': 'HIGH',
+                            'service': 'DynamoDB',
+                            'resource': table_name,
+                            'description': f"Table '{table_name}' does not have encryption enabled",
+                            'pillar': 'Security'
+                        })
                 
-                # Check point-in-time recovery
-                continuous_backups = dynamodb.describe_continuous_backups(TableName=table_name)
-                if continuous_backups.get('ContinuousBackupsDescription', {}).get('PointInTimeRecoveryDescription', {}).get('PointInTimeRecoveryStatus') != 'ENABLED':
-                    result['findings'].append({
-                        'title': 'DynamoDB point-in-time recovery not enabled',
-                        'severity': 'MEDIUM',
-                        'service': 'DynamoDB',
-                        'resource': table_name,
-                        'description': f"Table '{table_name}' does not have point-in-time recovery enabled",
-                        'pillar': 'Reliability'
-                    })
-            except:
-                pass
+                    # Check point-in-time recovery
+                    continuous_backups = dynamodb.describe_continuous_backups(TableName=table_name)
+                    if continuous_backups.get('ContinuousBackupsDescription', {}).get('PointInTimeRecoveryDescription', {}).get('PointInTimeRecoveryStatus') != 'ENABLED':
+                        findings.append({
+                            'title': 'DynamoDB point-in-time recovery not enabled',
+                            'severity': 'MEDIUM',
+                            'service': 'DynamoDB',
+                            'resource': table_name,
+                            'description': f"Table '{table_name}' does not have point-in-time recovery enabled",
+                            'pillar': 'Reliability'
+                        })
+                except Exception as e:
+                    _skipped_check(result, 'DynamoDB', e)
+
+            _check_resource(result, result['findings'], 'AWS::DynamoDB::Table', table_name,
+                            region, table_name, check)
         
         result['resources']['DynamoDB'] = {'count': table_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {table_count} DynamoDB tables")
@@ -1343,15 +1722,13 @@ def scan_dynamodb_service(session, region, result, status_text, account_name):
         result['resources']['DynamoDB'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('CloudWatch')
 def scan_cloudwatch_service(session, region, result, status_text, account_name):
     """Scan CloudWatch alarms"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning CloudWatch alarms...")
         cloudwatch = session.client('cloudwatch', region_name=region)
-        alarms_response = cloudwatch.describe_alarms()
-        alarms = alarms_response.get('MetricAlarms', [])
-        alarm_count = len(alarms)
+        alarm_count = sum(1 for _ in iter_paginated(cloudwatch, 'describe_alarms', 'MetricAlarms[]'))
         
         if alarm_count == 0:
             result['findings'].append({
@@ -1369,14 +1746,13 @@ def scan_cloudwatch_service(session, region, result, status_text, account_name):
         result['resources']['CloudWatch'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('CloudTrail')
 def scan_cloudtrail_service(session, region, result, status_text, account_name):
     """Scan CloudTrail trails"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning CloudTrail trails...")
         cloudtrail = session.client('cloudtrail', region_name=region)
-        trails_response = cloudtrail.describe_trails()
-        trails = trails_response.get('trailList', [])
+        trails = list(iter_paginated(cloudtrail, 'describe_trails', 'trailList[]'))
         trail_count = len(trails)
         
         if trail_count == 0:
@@ -1403,8 +1779,8 @@ def scan_cloudtrail_service(session, region, result, status_text, account_name):
                             'description': f"Trail '{trail_name}' exists but is not actively logging events",
                             'pillar': 'Security'
                         })
-                except:
-                    pass
+                except Exception as e:
+                    _skipped_check(result, 'CloudTrail', e)
         
         result['resources']['CloudTrail'] = {'count': trail_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {trail_count} CloudTrail trails")
@@ -1412,39 +1788,43 @@ def scan_cloudtrail_service(session, region, result, status_text, account_name):
         result['resources']['CloudTrail'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('KMS')
 def scan_kms_service(session, region, result, status_text, account_name):
     """Scan KMS encryption keys"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning KMS keys...")
         kms = session.client('kms', region_name=region)
-        keys_response = kms.list_keys()
-        keys = keys_response.get('Keys', [])
-        key_count = len(keys)
+        key_count = 0
         
-        for key in keys[:20]:
+        for key in iter_paginated(kms, 'list_keys', 'Keys[]'):
+            key_count += 1
             key_id = key.get('KeyId')
-            try:
-                key_metadata = kms.describe_key(KeyId=key_id)
-                key_data = key_metadata.get('KeyMetadata', {})
+
+            def check(findings):
+                try:
+                    key_metadata = kms.describe_key(KeyId=key_id)
+                    key_data = key_metadata.get('KeyMetadata', {})
                 
-                # Check key rotation
-                if key_data.get('KeyState') == 'Enabled' and key_data.get('Origin') == 'AWS_KMS':
-                    try:
-                        rotation_status = kms.get_key_rotation_status(KeyId=key_id)
-                        if not rotation_status.get('KeyRotationEnabled'):
-                            result['findings'].append({
-                                'title': 'KMS key rotation not enabled',
-                                'severity': 'MEDIUM',
-                                'service': 'KMS',
-                                'resource': key_data.get('KeyId'),
-                                'description': f"KMS key {key_data.get('KeyId')[:20]}... does not have automatic rotation enabled",
-                                'pillar': 'Security'
-                            })
-                    except:
-                        pass
-            except:
-                pass
+                    # Check key rotation
+                    if key_data.get('KeyState') == 'Enabled' and key_data.get('Origin') == 'AWS_KMS':
+                        try:
+                            rotation_status = kms.get_key_rotation_status(KeyId=key_id)
+                            if not rotation_status.get('KeyRotationEnabled'):
+                                findings.append({
+                                    'title': 'KMS key rotation not enabled',
+                                    'severity': 'MEDIUM',
+                                    'service': 'KMS',
+                                    'resource': key_data.get('KeyId'),
+                                    'description': f"KMS key {key_data.get('KeyId')[:20]}... does not have automatic rotation enabled",
+                                    'pillar': 'Security'
+                                })
+                        except Exception as e:
+                            _skipped_check(result, 'KMS', e)
+                except Exception as e:
+                    _skipped_check(result, 'KMS', e)
+
+            _check_resource(result, result['findings'], 'AWS::KMS::Key', key_id, region,
+                            key, check)
         
         result['resources']['KMS'] = {'count': key_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {key_count} KMS keys")
@@ -1452,7 +1832,7 @@ def scan_kms_service(session, region, result, status_text, account_name):
         result['resources']['KMS'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('ELB')
 def scan_elb_service(session, region, result, status_text, account_name):
     """Scan Elastic Load Balancers"""
     try:
@@ -1460,11 +1840,10 @@ def scan_elb_service(session, region, result, status_text, account_name):
         elbv2 = session.client('elbv2', region_name=region)
         
         # ALB/NLB
-        lbs_response = elbv2.describe_load_balancers()
-        load_balancers = lbs_response.get('LoadBalancers', [])
-        lb_count = len(load_balancers)
+        lb_count = 0
         
-        for lb in load_balancers:
+        for lb in iter_paginated(elbv2, 'describe_load_balancers', 'LoadBalancers[]'):
+            lb_count += 1
             lb_arn = lb.get('LoadBalancerArn')
             lb_name = lb.get('LoadBalancerName')
             
@@ -1487,15 +1866,13 @@ def scan_elb_service(session, region, result, status_text, account_name):
         result['resources']['ELB'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('ECS')
 def scan_ecs_service(session, region, result, status_text, account_name):
     """Scan ECS clusters"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning ECS clusters...")
         ecs = session.client('ecs', region_name=region)
-        clusters_response = ecs.list_clusters()
-        cluster_arns = clusters_response.get('clusterArns', [])
-        cluster_count = len(cluster_arns)
+        cluster_count = sum(1 for _ in iter_paginated(ecs, 'list_clusters', 'clusterArns[]'))
         
         result['resources']['ECS'] = {'count': cluster_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {cluster_count} ECS clusters")
@@ -1503,16 +1880,16 @@ def scan_ecs_service(session, region, result, status_text, account_name):
         result['resources']['ECS'] = {'error': str(e)[:100]}
 
 
+@cached_service_scan('Auto Scaling')
 def scan_autoscaling_service(session, region, result, status_text, account_name):
     """Scan Auto Scaling groups"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning Auto Scaling groups...")
         autoscaling = session.client('autoscaling', region_name=region)
-        asgs_response = autoscaling.describe_auto_scaling_groups()
-        asgs = asgs_response.get('AutoScalingGroups', [])
-        asg_count = len(asgs)
+        asg_count = 0
         
-        for asg in asgs:
+        for asg in iter_paginated(autoscaling, 'describe_auto_scaling_groups', 'AutoScalingGroups[]'):
+            asg_count += 1
             asg_name = asg.get('AutoScalingGroupName')
             azs = asg.get('AvailabilityZones', [])
             
@@ -1533,29 +1910,32 @@ def scan_autoscaling_service(session, region, result, status_text, account_name)
         result['resources']['Auto Scaling'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('EBS')
 def scan_ebs_service(session, region, result, status_text, account_name):
     """Scan EBS volumes"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning EBS volumes...")
         ec2 = session.client('ec2', region_name=region)
-        volumes_response = ec2.describe_volumes()
-        volumes = volumes_response.get('Volumes', [])
-        volume_count = len(volumes)
+        volume_count = 0
         
-        for volume in volumes:
+        for volume in iter_paginated(ec2, 'describe_volumes', 'Volumes[]'):
+            volume_count += 1
             volume_id = volume.get('VolumeId')
-            
-            # Check encryption
-            if not volume.get('Encrypted'):
-                result['findings'].append({
-                    'title': 'EBS volume not encrypted',
-                    'severity': 'HIGH',
-                    'service': 'EBS',
-                    'resource': volume_id,
-                    'description': f"EBS volume '{volume_id}' is not encrypted",
-                    'pillar': 'Security'
-                })
+
+            def check(findings):
+                # Check encryption
+                if not volume.get('Encrypted'):
+                    findings.append({
+                        'title': 'EBS volume not encrypted',
+                        'severity': 'HIGH',
+                        'service': 'EBS',
+                        'resource': volume_id,
+                        'description': f"EBS volume '{volume_id}' is not encrypted",
+                        'pillar': 'Security'
+                    })
+
+            _check_resource(result, result['findings'], 'AWS::EC2::Volume', volume_id, region, volume,
+                            check)
         
         result['resources']['EBS'] = {'count': volume_count}
         status_text.markdown(f"🔍 **{account_name}** - Found {volume_count} EBS volumes")
@@ -1563,17 +1943,16 @@ def scan_ebs_service(session, region, result, status_text, account_name):
         result['resources']['EBS'] = {'error': str(e)[:100]}
 
 
-@st.cache_data(ttl=300, show_spinner=False)
+@cached_service_scan('Secrets Manager')
 def scan_secrets_manager_service(session, region, result, status_text, account_name):
     """Scan Secrets Manager secrets"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning Secrets Manager...")
         secretsmanager = session.client('secretsmanager', region_name=region)
-        secrets_response = secretsmanager.list_secrets()
-        secrets = secrets_response.get('SecretList', [])
-        secret_count = len(secrets)
+        secret_count = 0
         
-        for secret in secrets:
+        for secret in iter_paginated(secretsmanager, 'list_secrets', 'SecretList[]'):
+            secret_count += 1
             secret_name = secret.get('Name')
             
             # Check rotation
@@ -1593,35 +1972,35 @@ def scan_secrets_manager_service(session, region, result, status_text, account_n
         result['resources']['Secrets Manager'] = {'error': str(e)[:100]}
 
 
+@cached_service_scan('Config')
 def scan_config_service(session, region, result, status_text, account_name):
     """Scan AWS Config"""
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning AWS Config...")
         config = session.client('config', region_name=region)
         
-        # Check if Config is enabled
-        try:
-            recorders = config.describe_configuration_recorders()
-            recorder_count = len(recorders.get('ConfigurationRecorders', []))
-            
-            if recorder_count == 0:
-                result['findings'].append({
-                    'title': 'AWS Config not enabled',
-                    'severity': 'HIGH',
-                    'service': 'Config',
-                    'resource': 'Account',
-                    'description': 'AWS Config is not enabled - configuration tracking is essential for compliance',
-                    'pillar': 'Operational Excellence'
-                })
-            
-            result['resources']['Config'] = {'recorders': recorder_count}
-            status_text.markdown(f"🔍 **{account_name}** - AWS Config: {recorder_count} recorders")
-        except:
-            result['resources']['Config'] = {'status': 'Not enabled'}
+        # Check if Config is enabled - no recorders means not enabled; an
+        # API error (throttled, denied) is reported as a service error
+        recorders = config.describe_configuration_recorders()
+        recorder_count = len(recorders.get('ConfigurationRecorders', []))
+        
+        if recorder_count == 0:
+            result['findings'].append({
+                'title': 'AWS Config not enabled',
+                'severity': 'HIGH',
+                'service': 'Config',
+                'resource': 'Account',
+                'description': 'AWS Config is not enabled - configuration tracking is essential for compliance',
+                'pillar': 'Operational Excellence'
+            })
+        
+        result['resources']['Config'] = {'recorders': recorder_count}
+        status_text.markdown(f"🔍 **{account_name}** - AWS Config: {recorder_count} recorders")
     except Exception as e:
         result['resources']['Config'] = {'error': str(e)[:100]}
 
 
+@cached_service_scan('GuardDuty')
 def scan_guardduty_service(session, region, result, status_text, account_name):
     """Scan GuardDuty"""
     try:
@@ -1629,8 +2008,7 @@ def scan_guardduty_service(session, region, result, status_text, account_name):
         guardduty = session.client('guardduty', region_name=region)
         
         # Check if GuardDuty is enabled
-        detectors = guardduty.list_detectors()
-        detector_ids = detectors.get('DetectorIds', [])
+        detector_ids = list(iter_paginated(guardduty, 'list_detectors', 'DetectorIds[]'))
         
         if len(detector_ids) == 0:
             result['findings'].append({
@@ -1644,8 +2022,10 @@ def scan_guardduty_service(session, region, result, status_text, account_name):
         else:
             # Check findings
             for detector_id in detector_ids:
-                findings = guardduty.list_findings(DetectorId=detector_id, FindingCriteria={'Criterion': {'severity': {'Gte': 7}}})
-                high_findings_count = len(findings.get('FindingIds', []))
+                high_findings_count = sum(1 for _ in iter_paginated(
+                    guardduty, 'list_findings', 'FindingIds[]',
+                    DetectorId=detector_id, FindingCriteria={'Criterion': {'severity': {'Gte': 7}}}
+                ))
                 
                 if high_findings_count > 0:
                     result['findings'].append({
@@ -1663,33 +2043,20 @@ def scan_guardduty_service(session, region, result, status_text, account_name):
         result['resources']['GuardDuty'] = {'error': str(e)[:100]}
 
 
+@cached_service_scan('Security Hub')
 def scan_securityhub_service(session, region, result, status_text, account_name):
     """Scan Security Hub"""
+    from botocore.exceptions import ClientError
     try:
         status_text.markdown(f"🔍 **{account_name}** - Scanning Security Hub...")
         securityhub = session.client('securityhub', region_name=region)
         
         # Check if Security Hub is enabled
         try:
-            hub = securityhub.describe_hub()
-            
-            # Get security score
-            findings = securityhub.get_findings(Filters={'ComplianceStatus': [{'Value': 'FAILED', 'Comparison': 'EQUALS'}]})
-            failed_count = len(findings.get('Findings', []))
-            
-            if failed_count > 50:
-                result['findings'].append({
-                    'title': 'Security Hub has many failed findings',
-                    'severity': 'HIGH',
-                    'service': 'Security Hub',
-                    'resource': 'Account',
-                    'description': f"Security Hub has {failed_count} failed compliance findings",
-                    'pillar': 'Security'
-                })
-            
-            result['resources']['Security Hub'] = {'enabled': True, 'failed_findings': failed_count}
-            status_text.markdown(f"🔍 **{account_name}** - Security Hub: {failed_count} failed findings")
-        except:
+            securityhub.describe_hub()
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'InvalidAccessException':
+                raise
             result['findings'].append({
                 'title': 'Security Hub not enabled',
                 'severity': 'HIGH',
@@ -1699,6 +2066,26 @@ def scan_securityhub_service(session, region, result, status_text, account_name)
                 'pillar': 'Security'
             })
             result['resources']['Security Hub'] = {'enabled': False}
+            return
+        
+        # Only the threshold matters, so stop paging once it is crossed
+        failed_count = sum(1 for _ in islice(iter_paginated(
+            securityhub, 'get_findings', 'Findings[]',
+            Filters={'ComplianceStatus': [{'Value': 'FAILED', 'Comparison': 'EQUALS'}]}
+        ), SECURITY_HUB_FAILED_THRESHOLD + 1))
+        
+        if failed_count > SECURITY_HUB_FAILED_THRESHOLD:
+            result['findings'].append({
+                'title': 'Security Hub has many failed findings',
+                'severity': 'HIGH',
+                'service': 'Security Hub',
+                'resource': 'Account',
+                'description': f"Security Hub has more than {SECURITY_HUB_FAILED_THRESHOLD} failed compliance findings",
+                'pillar': 'Security'
+            })
+        
+        result['resources']['Security Hub'] = {'enabled': True, 'failed_findings': failed_count}
+        status_text.markdown(f"🔍 **{account_name}** - Security Hub: {failed_count} failed findings")
     except Exception as e:
         result['resources']['Security Hub'] = {'error': str(e)[:100]}
 
@@ -1707,6 +2094,7 @@ def scan_securityhub_service(session, region, result, status_text, account_name)
 # EC2 AND S3 SERVICE SCANNERS (ADDED - WERE MISSING)
 # ============================================================================
 
+@cached_service_scan('EC2')
 def scan_ec2_service(session, region, result, status_text, account_name):
     """Scan EC2 instances for security issues"""
     from botocore.exceptions import ClientError
@@ -1716,87 +2104,97 @@ def scan_ec2_service(session, region, result, status_text, account_name):
         ec2 = session.client('ec2', region_name=region)
         
         # Get all instances
-        instances = ec2.describe_instances()
         instance_count = 0
         findings = []
         
-        for reservation in instances.get('Reservations', []):
+        for reservation in iter_paginated(ec2, 'describe_instances', 'Reservations[]'):
             for instance in reservation.get('Instances', []):
                 instance_count += 1
                 instance_id = instance.get('InstanceId', 'N/A')
-                state = instance.get('State', {}).get('Name', 'unknown')
+
+                # Attached volumes are identified by ID in the payload, and a volume's
+                # encryption cannot change, so the fingerprint covers the volume lookup
+                def check(findings):
+                    state = instance.get('State', {}).get('Name', 'unknown')
                 
-                # Only check running instances
-                if state != 'running':
-                    continue
+                    # Only check running instances
+                    if state != 'running':
+                        return
                 
-                # Check for public IP
-                if instance.get('PublicIpAddress'):
-                    findings.append({
-                        'title': 'EC2 Instance with Public IP',
-                        'severity': 'MEDIUM',
-                        'service': 'EC2',
-                        'resource': instance_id,
-                        'description': f'Instance {instance_id} has a public IP address ({instance["PublicIpAddress"]}) assigned'
-                    })
+                    # Check for public IP
+                    if instance.get('PublicIpAddress'):
+                        findings.append({
+                            'title': 'EC2 Instance with Public IP',
+                            'severity': 'MEDIUM',
+                            'service': 'EC2',
+                            'resource': instance_id,
+                            'description': f'Instance {instance_id} has a public IP address ({instance["PublicIpAddress"]}) assigned'
+                        })
                 
-                # Check for IMDSv1 (less secure)
-                metadata_options = instance.get('MetadataOptions', {})
-                if metadata_options.get('HttpTokens') != 'required':
-                    findings.append({
-                        'title': 'EC2 Instance using IMDSv1',
-                        'severity': 'MEDIUM',
-                        'service': 'EC2',
-                        'resource': instance_id,
-                        'description': f'Instance {instance_id} allows IMDSv1 (HttpTokens not required). Recommend enforcing IMDSv2.'
-                    })
+                    # Check for IMDSv1 (less secure)
+                    metadata_options = instance.get('MetadataOptions', {})
+                    if metadata_options.get('HttpTokens') != 'required':
+                        findings.append({
+                            'title': 'EC2 Instance using IMDSv1',
+                            'severity': 'MEDIUM',
+                            'service': 'EC2',
+                            'resource': instance_id,
+                            'description': f'Instance {instance_id} allows IMDSv1 (HttpTokens not required). Recommend enforcing IMDSv2.'
+                        })
                 
-                # Check for unencrypted EBS root volume
-                for block_device in instance.get('BlockDeviceMappings', []):
-                    if block_device.get('Ebs'):
-                        volume_id = block_device['Ebs'].get('VolumeId')
-                        try:
-                            vol_response = ec2.describe_volumes(VolumeIds=[volume_id])
-                            for vol in vol_response.get('Volumes', []):
-                                if not vol.get('Encrypted', False):
-                                    findings.append({
-                                        'title': 'Unencrypted EBS Volume',
-                                        'severity': 'HIGH',
-                                        'service': 'EC2',
-                                        'resource': volume_id,
-                                        'description': f'EBS volume {volume_id} attached to {instance_id} is not encrypted'
-                                    })
-                        except ClientError:
-                            pass
+                    # Check for unencrypted EBS root volume
+                    for block_device in instance.get('BlockDeviceMappings', []):
+                        if block_device.get('Ebs'):
+                            volume_id = block_device['Ebs'].get('VolumeId')
+                            try:
+                                vol_response = ec2.describe_volumes(VolumeIds=[volume_id])
+                                for vol in vol_response.get('Volumes', []):
+                                    if not vol.get('Encrypted', False):
+                                        findings.append({
+                                            'title': 'Unencrypted EBS Volume',
+                                            'severity': 'HIGH',
+                                            'service': 'EC2',
+                                            'resource': volume_id,
+                                            'description': f'EBS volume {volume_id} attached to {instance_id} is not encrypted'
+                                        })
+                            except ClientError as e:
+                                _skipped_check(result, 'EC2', e)
                 
-                # Check for missing detailed monitoring
-                if instance.get('Monitoring', {}).get('State') != 'enabled':
-                    findings.append({
-                        'title': 'EC2 Detailed Monitoring Disabled',
-                        'severity': 'LOW',
-                        'service': 'EC2',
-                        'resource': instance_id,
-                        'description': f'Instance {instance_id} does not have detailed monitoring enabled'
-                    })
+                    # Check for missing detailed monitoring
+                    if instance.get('Monitoring', {}).get('State') != 'enabled':
+                        findings.append({
+                            'title': 'EC2 Detailed Monitoring Disabled',
+                            'severity': 'LOW',
+                            'service': 'EC2',
+                            'resource': instance_id,
+                            'description': f'Instance {instance_id} does not have detailed monitoring enabled'
+                        })
+
+                _check_resource(result, findings, 'AWS::EC2::Instance', instance_id, region,
+                                instance, check)
         
         # Check security groups for overly permissive rules
         try:
-            security_groups = ec2.describe_security_groups()
-            for sg in security_groups.get('SecurityGroups', []):
+            for sg in iter_paginated(ec2, 'describe_security_groups', 'SecurityGroups[]'):
                 sg_id = sg.get('GroupId', 'N/A')
-                for rule in sg.get('IpPermissions', []):
-                    for ip_range in rule.get('IpRanges', []):
-                        if ip_range.get('CidrIp') == '0.0.0.0/0':
-                            port = rule.get('FromPort', 'All')
-                            findings.append({
-                                'title': 'Security Group Open to Internet',
-                                'severity': 'HIGH' if port in [22, 3389, 3306, 5432] else 'MEDIUM',
-                                'service': 'EC2',
-                                'resource': sg_id,
-                                'description': f'Security group {sg_id} allows inbound traffic from 0.0.0.0/0 on port {port}'
-                            })
-        except ClientError:
-            pass
+
+                def check(findings):
+                    for rule in sg.get('IpPermissions', []):
+                        for ip_range in rule.get('IpRanges', []):
+                            if ip_range.get('CidrIp') == '0.0.0.0/0':
+                                port = rule.get('FromPort', 'All')
+                                findings.append({
+                                    'title': 'Security Group Open to Internet',
+                                    'severity': 'HIGH' if port in [22, 3389, 3306, 5432] else 'MEDIUM',
+                                    'service': 'EC2',
+                                    'resource': sg_id,
+                                    'description': f'Security group {sg_id} allows inbound traffic from 0.0.0.0/0 on port {port}'
+                                })
+
+                _check_resource(result, findings, 'AWS::EC2::SecurityGroup', sg_id, region, sg, check,
+                                check_name='ec2')
+        except ClientError as e:
+            _skipped_check(result, 'EC2', e)
         
         result['resources']['EC2'] = {'count': instance_count, 'issues': findings}
         result['findings'].extend(findings)
@@ -1808,6 +2206,7 @@ def scan_ec2_service(session, region, result, status_text, account_name):
         result['resources']['EC2'] = {'error': str(e), 'count': 0}
 
 
+@cached_service_scan('S3', global_scope=True)
 def scan_s3_service(session, result, status_text, account_name):
     """Scan S3 buckets for security issues"""
     from botocore.exceptions import ClientError
@@ -1823,79 +2222,87 @@ def scan_s3_service(session, result, status_text, account_name):
         
         for bucket in buckets.get('Buckets', []):
             bucket_name = bucket['Name']
-            
-            try:
-                # Check bucket encryption
+
+            def check(findings):
                 try:
-                    s3.get_bucket_encryption(Bucket=bucket_name)
-                except ClientError as e:
-                    if 'ServerSideEncryptionConfigurationNotFoundError' in str(e):
-                        findings.append({
-                            'title': 'S3 Bucket Without Default Encryption',
-                            'severity': 'HIGH',
-                            'service': 'S3',
-                            'resource': bucket_name,
-                            'description': f'Bucket {bucket_name} does not have default encryption enabled'
-                        })
+                    # Check bucket encryption
+                    try:
+                        s3.get_bucket_encryption(Bucket=bucket_name)
+                    except ClientError as e:
+                        if 'ServerSideEncryptionConfigurationNotFoundError' in str(e):
+                            findings.append({
+                                'title': 'S3 Bucket Without Default Encryption',
+                                'severity': 'HIGH',
+                                'service': 'S3',
+                                'resource': bucket_name,
+                                'description': f'Bucket {bucket_name} does not have default encryption enabled'
+                            })
+                        else:
+                            _skipped_check(result, 'S3', e)
                 
-                # Check bucket versioning
-                try:
-                    versioning = s3.get_bucket_versioning(Bucket=bucket_name)
-                    if versioning.get('Status') != 'Enabled':
-                        findings.append({
-                            'title': 'S3 Bucket Without Versioning',
-                            'severity': 'MEDIUM',
-                            'service': 'S3',
-                            'resource': bucket_name,
-                            'description': f'Bucket {bucket_name} does not have versioning enabled'
-                        })
-                except ClientError:
-                    pass
+                    # Check bucket versioning
+                    try:
+                        versioning = s3.get_bucket_versioning(Bucket=bucket_name)
+                        if versioning.get('Status') != 'Enabled':
+                            findings.append({
+                                'title': 'S3 Bucket Without Versioning',
+                                'severity': 'MEDIUM',
+                                'service': 'S3',
+                                'resource': bucket_name,
+                                'description': f'Bucket {bucket_name} does not have versioning enabled'
+                            })
+                    except ClientError as e:
+                        _skipped_check(result, 'S3', e)
                 
-                # Check public access block
-                try:
-                    public_access = s3.get_public_access_block(Bucket=bucket_name)
-                    config = public_access.get('PublicAccessBlockConfiguration', {})
-                    if not all([
-                        config.get('BlockPublicAcls'),
-                        config.get('IgnorePublicAcls'),
-                        config.get('BlockPublicPolicy'),
-                        config.get('RestrictPublicBuckets')
-                    ]):
-                        findings.append({
-                            'title': 'S3 Bucket Public Access Not Fully Blocked',
-                            'severity': 'HIGH',
-                            'service': 'S3',
-                            'resource': bucket_name,
-                            'description': f'Bucket {bucket_name} does not have all public access blocks enabled'
-                        })
-                except ClientError as e:
-                    if 'NoSuchPublicAccessBlockConfiguration' in str(e):
-                        findings.append({
-                            'title': 'S3 Bucket Missing Public Access Block',
-                            'severity': 'CRITICAL',
-                            'service': 'S3',
-                            'resource': bucket_name,
-                            'description': f'Bucket {bucket_name} has no public access block configuration'
-                        })
+                    # Check public access block
+                    try:
+                        public_access = s3.get_public_access_block(Bucket=bucket_name)
+                        config = public_access.get('PublicAccessBlockConfiguration', {})
+                        if not all([
+                            config.get('BlockPublicAcls'),
+                            config.get('IgnorePublicAcls'),
+                            config.get('BlockPublicPolicy'),
+                            config.get('RestrictPublicBuckets')
+                        ]):
+                            findings.append({
+                                'title': 'S3 Bucket Public Access Not Fully Blocked',
+                                'severity': 'HIGH',
+                                'service': 'S3',
+                                'resource': bucket_name,
+                                'description': f'Bucket {bucket_name} does not have all public access blocks enabled'
+                            })
+                    except ClientError as e:
+                        if 'NoSuchPublicAccessBlockConfiguration' in str(e):
+                            findings.append({
+                                'title': 'S3 Bucket Missing Public Access Block',
+                                'severity': 'CRITICAL',
+                                'service': 'S3',
+                                'resource': bucket_name,
+                                'description': f'Bucket {bucket_name} has no public access block configuration'
+                            })
+                        else:
+                            _skipped_check(result, 'S3', e)
                 
-                # Check bucket logging
-                try:
-                    logging = s3.get_bucket_logging(Bucket=bucket_name)
-                    if not logging.get('LoggingEnabled'):
-                        findings.append({
-                            'title': 'S3 Bucket Logging Disabled',
-                            'severity': 'LOW',
-                            'service': 'S3',
-                            'resource': bucket_name,
-                            'description': f'Bucket {bucket_name} does not have access logging enabled'
-                        })
-                except ClientError:
-                    pass
+                    # Check bucket logging
+                    try:
+                        logging = s3.get_bucket_logging(Bucket=bucket_name)
+                        if not logging.get('LoggingEnabled'):
+                            findings.append({
+                                'title': 'S3 Bucket Logging Disabled',
+                                'severity': 'LOW',
+                                'service': 'S3',
+                                'resource': bucket_name,
+                                'description': f'Bucket {bucket_name} does not have access logging enabled'
+                            })
+                    except ClientError as e:
+                        _skipped_check(result, 'S3', e)
                     
-            except ClientError as e:
-                # Skip buckets we can't access (cross-region, etc.)
-                pass
+                except ClientError as e:
+                    # Skip buckets we can't access (cross-region, etc.)
+                    _skipped_check(result, 'S3', e)
+
+            _check_resource(result, findings, 'AWS::S3::Bucket', bucket_name, 'global',
+                            bucket, check)
         
         result['resources']['S3'] = {'count': bucket_count, 'issues': findings}
         result['findings'].extend(findings)
@@ -1968,60 +2375,57 @@ def scan_service(session, service, region, result, status_text, account_name):
 
 
 def create_session_for_account(account):
-    """Create AWS session for an account based on connection type"""
-    import boto3
+    """
+    Create AWS session for an account based on connection type.
+    
+    Sessions come from the process-wide credential broker, so repeated
+    scans of an account reuse its cached (auto-refreshing) AssumeRole
+    credentials and its boto3 clients.
+    """
     import streamlit as st
+    from credential_broker import get_credential_broker
+    
+    broker = get_credential_broker()
     
     try:
         connection_type = account.get('connection_type', account.get('auth_method', 'access_key'))
+        region = account.get('region', 'us-east-1')
         
         if connection_type == 'organizations':
             # Organizations - use credentials from account
             if 'credentials' in account:
-                session = boto3.Session(
-                    aws_access_key_id=account['credentials']['access_key'],
-                    aws_secret_access_key=account['credentials']['secret_key'],
-                    region_name=account.get('region', 'us-east-1')
+                session = broker.get_static_session(
+                    account['credentials']['access_key'],
+                    account['credentials']['secret_key'],
+                    region_name=region
                 )
             else:
                 return None
                 
         elif connection_type == 'assume_role':
-            # AssumeRole - need to assume the role
+            # AssumeRole - assumed once per role and refreshed before expiry
             if 'multi_hub_access_key' in st.session_state:
-                base_session = boto3.Session(
-                    aws_access_key_id=st.session_state.multi_hub_access_key,
-                    aws_secret_access_key=st.session_state.multi_hub_secret_key
+                base_session = broker.get_static_session(
+                    st.session_state.multi_hub_access_key,
+                    st.session_state.multi_hub_secret_key
                 )
                 
-                # Import assume_role function
-                from aws_connector import assume_role
-                
-                assumed_creds = assume_role(
-                    base_session,
+                session = broker.get_session(
                     account['role_arn'],
-                    account.get('external_id'),
+                    external_id=account.get('external_id'),
+                    region_name=region,
+                    base_session=base_session,
                     session_name="WAFScan"
                 )
-                
-                if assumed_creds:
-                    session = boto3.Session(
-                        aws_access_key_id=assumed_creds.access_key_id,
-                        aws_secret_access_key=assumed_creds.secret_access_key,
-                        aws_session_token=assumed_creds.session_token,
-                        region_name=account.get('region', 'us-east-1')
-                    )
-                else:
-                    return None
             else:
                 return None
                 
         else:
             # Manual credentials (access_key)
-            session = boto3.Session(
-                aws_access_key_id=account.get('access_key'),
-                aws_secret_access_key=account.get('secret_key'),
-                region_name=account.get('region', 'us-east-1')
+            session = broker.get_static_session(
+                account.get('access_key'),
+                account.get('secret_key'),
+                region_name=region
             )
         
         return session
@@ -1,6 +1,6 @@
 """
 Architecture Workflow Engine - Streamlit Cloud Compatible with AWS Cost Analysis
-Includes AWS Pricing API integration for 3-year cost projections, ROI, and TCO
+Uses the local AWS price catalog for 3-year cost projections, ROI, and TCO
 
 Enhanced workflow: Draft → WAF Review → Stakeholder Review → Approval → 
                    Cost Analysis → CI/CD Integration → Deployed
@@ -8,13 +8,14 @@ Enhanced workflow: Draft → WAF Review → Stakeholder Review → Approval →
 
 import streamlit as st
 import json
-import boto3
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from dataclasses import dataclass, asdict, field
 import uuid
 
+from price_catalog import get_price_catalog
+
 # ============================================================================
 # ENUMS & CONSTANTS
 # ============================================================================
@@ -326,88 +327,21 @@ class ArchitectureDesign:
 # ============================================================================
 
 class AWSPricingCalculator:
-    """Calculate AWS costs using Pricing API"""
-    
-    # Default pricing (when API unavailable - approximate USD/month)
-    DEFAULT_PRICING = {
-        'EC2': {
-            't3.micro': 7.59,
-            't3.small': 15.18,
-            't3.medium': 30.37,
-            't3.large': 60.74,
-            't3.xlarge': 121.47,
-            't3.2xlarge': 242.94,
-            'm5.large': 70.08,
-            'm5.xlarge': 140.16,
-            'm5.2xlarge': 280.32,
-            'c5.large': 62.05,
-            'c5.xlarge': 124.10,
-            'r5.large': 91.98,
-            'r5.xlarge': 183.96
-        },
-        'RDS': {
-            'db.t3.micro': 12.41,
-            'db.t3.small': 24.82,
-            'db.t3.medium': 49.64,
-            'db.t3.large': 99.28,
-            'db.m5.large': 124.10,
-            'db.m5.xlarge': 248.20,
-            'db.m5.2xlarge': 496.40
-        },
-        'EKS': {'cluster': 73.00},  # Per cluster
-        'ALB': {'alb': 16.20},  # Per ALB
-        'NLB': {'nlb': 16.20},  # Per NLB
-        'NAT Gateway': {'nat': 32.40},  # Per NAT Gateway
-        'VPC': {'vpc': 0.00},  # Free
-        'S3': {'standard': 0.023},  # Per GB/month
-        'Lambda': {'invocations': 0.20},  # Per 1M requests
-        'DynamoDB': {'wcu': 0.47, 'rcu': 0.09},  # Per unit/month
-        'CloudFront': {'data_transfer': 0.085},  # Per GB
-        'API Gateway': {'requests': 3.50},  # Per 1M requests
-        'CloudWatch': {'metrics': 0.30},  # Per custom metric
-        'CloudTrail': {'trail': 2.00},  # Per trail
-        'GuardDuty': {'events': 4.80},  # Per 1M events
-        'WAF': {'waf': 5.00}  # Per web ACL
-    }
+    """Calculate AWS costs from the local price catalog"""
+    
+    # Fallback monthly prices for instance types missing from the catalog
+    DEFAULT_EC2_MONTHLY = 100.0
+    DEFAULT_RDS_MONTHLY = 150.0
     
     def __init__(self, region: str = 'us-east-1'):
         """Initialize pricing calculator"""
         self.region = region
-        self.pricing_client = None
-        
-        # Try to initialize boto3 pricing client
-        try:
-            self.pricing_client = boto3.client('pricing', region_name='us-east-1')
-        except Exception as e:
-            st.warning(f"AWS Pricing API unavailable, using default pricing: {str(e)}")
+        self.catalog = get_price_catalog()
     
     def get_ec2_price(self, instance_type: str, quantity: int = 1) -> ServiceCost:
         """Get EC2 instance pricing"""
-        monthly_price = self.DEFAULT_PRICING['EC2'].get(instance_type, 100.0)
-        
-        # Try AWS Pricing API
-        if self.pricing_client:
-            try:
-                response = self.pricing_client.get_products(
-                    ServiceCode='AmazonEC2',
-                    Filters=[
-                        {'Type': 'TERM_MATCH', 'Field': 'instanceType', 'Value': instance_type},
-                        {'Type': 'TERM_MATCH', 'Field': 'location', 'Value': 'US East (N. Virginia)'},
-                        {'Type': 'TERM_MATCH', 'Field': 'operatingSystem', 'Value': 'Linux'},
-                        {'Type': 'TERM_MATCH', 'Field': 'tenancy', 'Value': 'Shared'},
-                        {'Type': 'TERM_MATCH', 'Field': 'preInstalledSw', 'Value': 'NA'}
-                    ],
-                    MaxResults=1
-                )
-                
-                if response['PriceList']:
-                    price_data = json.loads(response['PriceList'][0])
-                    on_demand = price_data['terms']['OnDemand']
-                    price_dimensions = list(on_demand.values())[0]['priceDimensions']
-                    hourly_price = float(list(price_dimensions.values())[0]['pricePerUnit']['USD'])
-                    monthly_price = hourly_price * 730  # 730 hours/month average
-            except Exception as e:
-                pass  # Fall back to default pricing
+        monthly_price = self.catalog.monthly('AmazonEC2', instance_type, self.region,
+                                             default=self.DEFAULT_EC2_MONTHLY)
         
         total_monthly = monthly_price * quantity
         
@@ -425,7 +359,8 @@ class AWSPricingCalculator:
     
     def get_rds_price(self, instance_type: str, multi_az: bool = False, quantity: int = 1) -> ServiceCost:
         """Get RDS instance pricing"""
-        monthly_price = self.DEFAULT_PRICING['RDS'].get(instance_type, 150.0)
+        monthly_price = self.catalog.monthly('AmazonRDS', instance_type, self.region,
+                                             default=self.DEFAULT_RDS_MONTHLY)
         
         if multi_az:
             monthly_price *= 2  # Multi-AZ doubles the cost
@@ -449,7 +384,7 @@ class AWSPricingCalculator:
         config = config or {}
         
         if service == 'EKS':
-            monthly_price = self.DEFAULT_PRICING['EKS']['cluster']
+            monthly_price = self.catalog.monthly('AmazonEKS', 'cluster', self.region)
             return ServiceCost(
                 service_name='EKS',
                 instance_type='Cluster',
@@ -462,7 +397,7 @@ class AWSPricingCalculator:
             )
         
         elif service == 'ALB' or service == 'Application Load Balancer':
-            monthly_price = self.DEFAULT_PRICING['ALB']['alb']
+            monthly_price = self.catalog.monthly('ElasticLoadBalancing', 'alb', self.region)
             quantity = config.get('count', 1)
             return ServiceCost(
                 service_name='ALB',
@@ -477,7 +412,7 @@ class AWSPricingCalculator:
         
         elif service == 'S3':
             storage_gb = config.get('storage_gb', 1000)
-            monthly_price = storage_gb * self.DEFAULT_PRICING['S3']['standard']
+            monthly_price = storage_gb * self.catalog.monthly('AmazonS3', 'standard', self.region)
             return ServiceCost(
                 service_name='S3',
                 instance_type=f'{storage_gb} GB',